@@ -295,6 +295,8 @@ from .type import (
     GraphQLSkipDirective,
     GraphQLDeferDirective,
     GraphQLStreamDirective,
+    GraphQLTimeoutDirective,
+    GraphQLCachedDirective,
     GraphQLDeprecatedDirective,
     GraphQLSpecifiedByDirective,
     GraphQLOneOfDirective,
@@ -380,6 +382,7 @@ from .type import (
     GraphQLCompositeType,
     GraphQLAbstractType,
     GraphQLWrappingType,
+    CompletionKind,
     GraphQLNullableType,
     GraphQLNullableInputType,
     GraphQLNullableOutputType,
@@ -397,6 +400,7 @@ from .type import (
     GraphQLField,
     GraphQLFieldMap,
     GraphQLFieldResolver,
+    GraphQLFieldBatchResolver,
     GraphQLInputField,
     GraphQLInputFieldMap,
     GraphQLInputFieldOutType,
@@ -404,6 +408,7 @@ from .type import (
     GraphQLScalarValueParser,
     GraphQLScalarLiteralParser,
     GraphQLScalarOutputValueCoercer,
+    GraphQLScalarOutputValuesCoercer,
     GraphQLScalarInputValueCoercer,
     GraphQLScalarInputLiteralCoercer,
     GraphQLScalarValueToLiteral,
@@ -489,20 +494,42 @@ from .validation import (
 # Execute GraphQL documents.
 from .execution import (
     AbortedGraphQLExecutionError,
+    SynchronousExecutionError,
     execute,
     execute_root_selection_set,
     execute_subscription_event,
     execute_sync,
+    compile_operation,
+    execute_compiled_operation,
     default_field_resolver,
     default_type_resolver,
+    default_entity_id,
+    default_field_cache_key,
+    get_source_id,
     get_argument_values,
     get_directive_values,
     get_variable_values,
+    encode_json,
+    encode_result,
+    write_result,
     # Types
     AsyncWorkFinishedInfo,
     ExecutionHooks,
     VariableValues,
     Executor,
+    BreadthFirstExecutor,
+    JitExecutor,
+    SyncExecutor,
+    CompiledOperation,
+    ListChunk,
+    RawJSON,
+    SingleFlight,
+    ResponseCache,
+    ResponseCacheBackend,
+    LRUResponseCacheBackend,
+    CacheHints,
+    CachedResponse,
+    FieldCache,
     ExecutionResult,
     ExperimentalIncrementalExecutionResults,
     InitialIncrementalExecutionResult,
@@ -568,8 +595,13 @@ __all__ = [
     "ArgumentNode",
     "AsyncWorkFinishedInfo",
     "BooleanValueNode",
+    "BreadthFirstExecutor",
     "BreakingChange",
     "BreakingChangeType",
+    "CacheHints",
+    "CachedResponse",
+    "CompiledOperation",
+    "CompletionKind",
     "ConstArgumentNode",
     "ConstDirectiveNode",
     "ConstListValueNode",
@@ -599,6 +631,7 @@ __all__ = [
     "ExecutionResult",
     "Executor",
     "ExperimentalIncrementalExecutionResults",
+    "FieldCache",
     "FieldDefinitionNode",
     "FieldNode",
     "FieldsOnCorrectTypeRule",
@@ -618,6 +651,7 @@ __all__ = [
     "GraphQLArgumentKwargs",
     "GraphQLArgumentMap",
     "GraphQLBoolean",
+    "GraphQLCachedDirective",
     "GraphQLCompositeType",
     "GraphQLDefaultInput",
     "GraphQLDeferDirective",
@@ -634,6 +668,7 @@ __all__ = [
     "GraphQLErrorExtensions",
     "GraphQLExecuteFn",
     "GraphQLField",
+    "GraphQLFieldBatchResolver",
     "GraphQLFieldKwargs",
     "GraphQLFieldMap",
     "GraphQLFieldResolver",
@@ -675,6 +710,7 @@ __all__ = [
     "GraphQLScalarInputValueCoercer",
     "GraphQLScalarLiteralParser",
     "GraphQLScalarOutputValueCoercer",
+    "GraphQLScalarOutputValuesCoercer",
     "GraphQLScalarSerializer",
     "GraphQLScalarType",
     "GraphQLScalarTypeKwargs",
@@ -688,6 +724,7 @@ __all__ = [
     "GraphQLString",
     "GraphQLSubscribeFn",
     "GraphQLSyntaxError",
+    "GraphQLTimeoutDirective",
     "GraphQLType",
     "GraphQLTypeResolver",
     "GraphQLUnionType",
@@ -706,12 +743,15 @@ __all__ = [
     "InterfaceTypeDefinitionNode",
     "InterfaceTypeExtensionNode",
     "IntrospectionQuery",
+    "JitExecutor",
     "KnownArgumentNamesRule",
     "KnownDirectivesRule",
     "KnownFragmentNamesRule",
     "KnownOperationTypesRule",
     "KnownTypeNamesRule",
+    "LRUResponseCacheBackend",
     "Lexer",
+    "ListChunk",
     "ListTypeNode",
     "ListValueNode",
     "Location",
@@ -744,6 +784,7 @@ __all__ = [
     "PossibleFragmentSpreadsRule",
     "PossibleTypeExtensionsRule",
     "ProvidedRequiredArgumentsRule",
+    "RawJSON",
     "ResolvedDirective",
     "ResolvedDirectiveArgument",
     "ResolvedEnumValue",
@@ -752,6 +793,8 @@ __all__ = [
     "ResolvedInputField",
     "ResolvedNamedType",
     "ResolvedSchemaElement",
+    "ResponseCache",
+    "ResponseCacheBackend",
     "ResponsePath",
     "RootSelectionSetExecutor",
     "SDLValidationRule",
@@ -768,11 +811,14 @@ __all__ = [
     "SelectionNode",
     "SelectionSetNode",
     "SingleFieldSubscriptionsRule",
+    "SingleFlight",
     "Source",
     "SourceLocation",
     "StreamDirectiveOnListField",
     "StringValueNode",
     "SubsequentIncrementalExecutionResult",
+    "SyncExecutor",
+    "SynchronousExecutionError",
     "Thunk",
     "ThunkCollection",
     "ThunkMapping",
@@ -850,13 +896,19 @@ __all__ = [
     "build_schema",
     "coerce_input_literal",
     "coerce_input_value",
+    "compile_operation",
     "concat_ast",
     "create_source_event_stream",
+    "default_entity_id",
+    "default_field_cache_key",
     "default_field_resolver",
     "default_harness",
     "default_type_resolver",
     "do_types_overlap",
+    "encode_json",
+    "encode_result",
     "execute",
+    "execute_compiled_operation",
     "execute_root_selection_set",
     "execute_subscription_event",
     "execute_sync",
@@ -871,6 +923,7 @@ __all__ = [
     "get_named_type",
     "get_nullable_type",
     "get_operation_ast",
+    "get_source_id",
     "get_variable_values",
     "graphql",
     "graphql_sync",
@@ -958,4 +1011,5 @@ __all__ = [
     "version_info_js",
     "version_js",
     "visit",
+    "write_result",
 ]
@@ -34,6 +34,7 @@ from .values import (
 from .execute import (
     create_source_event_stream,
     execute,
+    execute_compiled_operation,
     execute_root_selection_set,
     execute_subscription_event,
     experimental_execute_incrementally,
@@ -48,15 +49,41 @@ from .execute import (
     Middleware,
     RootSelectionSetExecutor,
 )
+from .blocking_resolver import blocking_resolver
+from .breadth_first_executor import BreadthFirstExecutor
+from .compile_operation import CompiledField, CompiledOperation, compile_operation
+from .jit_executor import JitExecutor
+from .sync_executor import SyncExecutor, SynchronousExecutionError
+from .lazy_resolve_info import LazyResolveInfo, get_resolve_info, lazy_resolve_info
+from .list_chunk import ListChunk
+from .raw_json import RawJSON
+from .single_flight import SingleFlight
+from .response_cache import (
+    CacheHints,
+    CachedResponse,
+    LRUResponseCacheBackend,
+    ResponseCache,
+    ResponseCacheBackend,
+    default_entity_id,
+)
+from .source_id import get_source_id
+from .field_cache import FieldCache, default_field_cache_key
+from .json_encoder import encode_json, encode_result, write_result
 
 __all__ = [
     "AbortedGraphQLExecutionError",
     "AsyncWorkFinishedInfo",
+    "BreadthFirstExecutor",
+    "CacheHints",
+    "CachedResponse",
+    "CompiledField",
+    "CompiledOperation",
     "CompletedResult",
     "ExecutionHooks",
     "ExecutionResult",
     "Executor",
     "ExperimentalIncrementalExecutionResults",
+    "FieldCache",
     "FormattedExecutionResult",
     "FormattedIncrementalDeferResult",
     "FormattedIncrementalResult",
@@ -68,24 +95,45 @@ __all__ = [
     "IncrementalResult",
     "IncrementalStreamResult",
     "InitialIncrementalExecutionResult",
+    "JitExecutor",
+    "LRUResponseCacheBackend",
+    "LazyResolveInfo",
+    "ListChunk",
     "Middleware",
     "MiddlewareManager",
     "PendingResult",
+    "RawJSON",
+    "ResponseCache",
+    "ResponseCacheBackend",
     "RootSelectionSetExecutor",
+    "SingleFlight",
     "SubsequentIncrementalExecutionResult",
+    "SyncExecutor",
+    "SynchronousExecutionError",
     "VariableValues",
+    "blocking_resolver",
+    "compile_operation",
     "create_source_event_stream",
+    "default_entity_id",
+    "default_field_cache_key",
     "default_field_resolver",
     "default_type_resolver",
+    "encode_json",
+    "encode_result",
     "execute",
+    "execute_compiled_operation",
     "execute_root_selection_set",
     "execute_subscription_event",
     "execute_sync",
     "experimental_execute_incrementally",
     "get_argument_values",
     "get_directive_values",
+    "get_resolve_info",
+    "get_source_id",
     "get_variable_values",
+    "lazy_resolve_info",
     "map_async_iterable",
     "map_source_to_response_event",
     "subscribe",
+    "write_result",
 ]
@@ -0,0 +1,40 @@
+"""Resolvers running in worker threads"""
+
+from __future__ import annotations
+
+from functools import wraps
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from ..type import GraphQLResolveInfo
+
+__all__ = ["blocking_resolver"]
+
+T = TypeVar("T")
+
+
+def blocking_resolver(resolver: T) -> T:
+    """Mark a field resolver as blocking.
+
+    Marked resolvers are run in a worker thread when the operation is executed
+    asynchronously, so that they do not block the event loop, and independent
+    blocking fields can be resolved at the same time. The thread pool and the
+    maximum number of resolvers running at the same time per operation can be
+    configured with the ``thread_pool`` and ``max_blocking_resolvers`` arguments
+    of the executor. The resolvers are run in a copy of the current context, and
+    can check the abort signal of the resolve info to stop early.
+
+    When the operation is executed synchronously, marked resolvers are simply
+    called directly.
+    """
+
+    @wraps(resolver)  # type: ignore
+    def run_blocking_resolver(
+        source: Any, info: GraphQLResolveInfo, **args: Any
+    ) -> Any:
+        run_blocking = info.async_helpers.run_blocking
+        if run_blocking is None:
+            return resolver(source, info, **args)  # type: ignore
+        return run_blocking(resolver, source, info, **args)
+
+    return run_blocking_resolver  # type: ignore
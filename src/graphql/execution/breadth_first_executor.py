@@ -0,0 +1,423 @@
+"""Executor resolving lists of objects level by level"""
+
+from __future__ import annotations
+
+from inspect import iscoroutine
+from typing import TYPE_CHECKING, Any, cast
+
+from ..pyutils import Path, is_iterable
+from ..type import (
+    GraphQLResolveInfo,
+    GraphQLStreamDirective,
+    get_nullable_type,
+    is_leaf_type,
+    is_list_type,
+    is_object_type,
+)
+from .compile_operation import CompiledField
+from .executor import default_field_resolver, to_nodes
+from .incremental import IncrementalExecutor
+from .lazy_resolve_info import LazyResolveInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ..pyutils import AwaitableOrValue, UndefinedType
+    from ..type import GraphQLNullableType, GraphQLObjectType, GraphQLOutputType
+    from .collect_fields import FieldDetailsList
+    from .incremental.incremental_executor import DeliveryGroupMap
+
+__all__ = ["BreadthFirstExecutor"]
+
+# The objects of one level that have the same type and the same field details,
+# together with their paths.
+LevelObjects = tuple["GraphQLObjectType", "FieldDetailsList", list[tuple[Any, Path]]]
+
+
+class BreadthFirstExecutor(IncrementalExecutor):
+    """Executor resolving the fields of lists of objects level by level.
+
+    The default executor completes the items of a list depth-first, i.e. all fields
+    of the first item and their subfields are resolved before the fields of the
+    second item. This executor first resolves the fields of a list of objects
+    breadth-first: each field is resolved for all objects of the same level at once,
+    then the same is done with the objects returned by these fields, and so on.
+    Batch resolvers are called once for all objects of a level, not only for the
+    items of one list. The resolved values are then completed as usual, so the
+    result, the error paths and the null propagation are the same as with the
+    default executor.
+
+    Leaf fields read with the default field resolver are not resolved in advance,
+    since nothing would be gained. Objects are only resolved in advance if their
+    type is known without checking, i.e. objects of abstract types or of object
+    types with an ``is_type_of`` function are resolved normally, and so are awaited
+    values, streamed lists and the fields of deferred fragments.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # The resolved values per field details and source, together with the
+        # source, the return type, the resolve info and a possible error.
+        self._resolved_fields: dict[
+            tuple[int, int],
+            tuple[Any, GraphQLOutputType, GraphQLResolveInfo, Any, Exception | None],
+        ] = {}
+        # The lists that have been resolved together with an enclosing list.
+        self._resolved_lists: dict[int, Any] = {}
+
+    def has_batched_fields(self, object_type: GraphQLObjectType) -> bool:
+        """Check whether the given object type has fields with batch resolvers.
+
+        Always false, since this executor calls batch resolvers for whole levels.
+        """
+        return False
+
+    def complete_iterable_value(
+        self,
+        item_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        items: Iterable[Any],
+        position_context: DeliveryGroupMap | None,
+    ) -> AwaitableOrValue[list[Any]]:
+        """Complete an iterable value after resolving its objects breadth-first."""
+        resolved_lists = self._resolved_lists
+        object_type = get_nullable_type(item_type)
+        if (
+            (resolved_lists and resolved_lists.pop(id(items), None) is not None)
+            or not is_object_type(object_type)
+            or object_type.is_type_of
+            or self.get_stream_usage(field_details_list, path) is not None
+        ):
+            return super().complete_iterable_value(
+                item_type, field_details_list, info, path, items, position_context
+            )
+        if not isinstance(items, list | tuple):
+            items = list(items)
+        keys, list_ids = self.resolve_levels(
+            object_type, field_details_list, items, path
+        )
+        try:
+            completed = super().complete_iterable_value(
+                item_type, field_details_list, info, path, items, position_context
+            )
+        except Exception:
+            self.discard_resolved(keys, list_ids)
+            raise
+        if self.is_awaitable(completed):
+
+            async def await_completed() -> list[Any]:
+                try:
+                    return await completed
+                finally:
+                    self.discard_resolved(keys, list_ids)
+
+            return await_completed()
+        self.discard_resolved(keys, list_ids)
+        return completed
+
+    def execute_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_details_list: FieldDetailsList,
+        path: Path,
+        position_context: DeliveryGroupMap | None,
+    ) -> AwaitableOrValue[Any] | UndefinedType:
+        """Resolve the field on the given source object.
+
+        Completes the value that has already been resolved if available.
+        """
+        resolved = self._resolved_fields.pop(
+            (id(field_details_list[0]), id(source)), None
+        )
+        if resolved is None or resolved[0] is not source:
+            return super().execute_field(
+                parent_type, source, field_details_list, path, position_context
+            )
+        _source, return_type, info, result, error = resolved
+        if error is not None:
+            self.handle_field_error(error, return_type, field_details_list, path)
+            return None
+        try:
+            if self.is_awaitable(result):
+                return self.complete_awaitable_value(
+                    return_type,
+                    field_details_list,
+                    info,
+                    path,
+                    result,
+                    position_context,
+                )
+            completed = self.complete_value(
+                return_type,
+                field_details_list,
+                info,
+                path,
+                result,
+                position_context,
+            )
+            if self.is_awaitable(completed):
+
+                async def await_completed() -> Any:
+                    try:
+                        return await completed
+                    except Exception as raw_error:
+                        self.handle_field_error(
+                            raw_error, return_type, field_details_list, path
+                        )
+                        return None
+
+                return await_completed()
+        except Exception as raw_error:
+            self.handle_field_error(raw_error, return_type, field_details_list, path)
+            return None
+        return completed
+
+    def get_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> CompiledField | None:
+        """Get the field definition and the resolver for the given field."""
+        compiled_operation = self.compiled_operation
+        if compiled_operation is not None:
+            return compiled_operation.get_field(parent_type, field_name)
+        field_def = self.schema.get_field(parent_type, field_name)
+        if not field_def:
+            return None
+        resolve_fn = field_def.resolve or self.field_resolver
+        if self.middleware_manager:
+            resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+        return CompiledField(field_def, resolve_fn)
+
+    def resolve_levels(
+        self,
+        object_type: GraphQLObjectType,
+        field_details_list: FieldDetailsList,
+        items: list[Any] | tuple[Any, ...],
+        path: Path,
+    ) -> tuple[list[tuple[int, int]], list[int]]:
+        """Resolve the fields of the given list items level by level.
+
+        Returns the keys of the resolved values and the ids of the resolved lists,
+        so that they can be discarded after the list has been completed.
+        """
+        is_awaitable = self.is_awaitable
+        resolved_fields = self._resolved_fields
+        keys: list[tuple[int, int]] = []
+        list_ids: list[int] = []
+        level: list[LevelObjects] = [
+            (
+                object_type,
+                field_details_list,
+                [
+                    (item, path.add_key(index, None))
+                    for index, item in enumerate(items)
+                    if item is not None
+                    and not isinstance(item, Exception)
+                    and not is_awaitable(item)
+                ],
+            )
+        ]
+        while level:
+            next_level: dict[tuple[GraphQLObjectType, int], LevelObjects] = {}
+            for parent_type, parent_field_details_list, objects in level:
+                if not objects:
+                    continue
+                grouped_field_set = self.collect_subfields(
+                    parent_type, parent_field_details_list
+                ).grouped_field_set
+                for response_name, sub_field_details_list in grouped_field_set.items():
+                    first_field_details = sub_field_details_list[0]
+                    if first_field_details.defer_usage is not None:
+                        continue
+                    field = self.get_field(
+                        parent_type, first_field_details.node.name.value
+                    )
+                    if field is None:
+                        continue
+                    field_def, resolve_fn = field
+                    try:
+                        args = self.get_argument_values(field_def, first_field_details)
+                    except Exception:  # noqa: S112
+                        # the error will be reported when executing the field
+                        continue
+                    return_type = field_def.type
+                    nullable_type = get_nullable_type(return_type)
+                    batch_resolve = field_def.batch_resolve
+                    if (
+                        resolve_fn is default_field_resolver
+                        and batch_resolve is None
+                        and is_leaf_type(nullable_type)
+                    ):
+                        # nothing to gain from reading plain values in advance
+                        continue
+                    field_nodes = to_nodes(sub_field_details_list)
+                    is_lazy = getattr(
+                        resolve_fn, "lazy_resolve_info", False
+                    ) and is_leaf_type(nullable_type)
+                    field_details_id = id(first_field_details)
+                    batched_values: Any = None
+                    if batch_resolve is not None:
+                        first_path = Path(
+                            objects[0][1], response_name, parent_type.name
+                        )
+                        batched_values = self.call_batch_resolver(
+                            batch_resolve,
+                            parent_type,
+                            [source for source, _path in objects],
+                            self.build_resolve_info(
+                                field_def, field_nodes, parent_type, first_path
+                            ),
+                            args,
+                        )
+                    for index, (source, source_path) in enumerate(objects):
+                        key = field_details_id, id(source)
+                        if key in resolved_fields:
+                            # the same object may appear more than once
+                            continue
+                        field_path = Path(source_path, response_name, parent_type.name)
+                        info = (
+                            cast(
+                                "GraphQLResolveInfo",
+                                LazyResolveInfo(
+                                    self,
+                                    field_def,
+                                    sub_field_details_list,
+                                    parent_type,
+                                    field_path,
+                                ),
+                            )
+                            if is_lazy
+                            else self.build_resolve_info(
+                                field_def, field_nodes, parent_type, field_path
+                            )
+                        )
+                        error: Exception | None = None
+                        result: Any = None
+                        if batch_resolve is not None:
+                            if isinstance(batched_values, Exception):
+                                error = batched_values
+                            elif is_awaitable(batched_values):
+                                result = get_batched_value(batched_values, index)
+                            else:
+                                result = batched_values[index]
+                        else:
+                            try:
+                                result = (
+                                    resolve_fn(source, info, **args)
+                                    if field_def.cache is None
+                                    else self.resolve_cached_field(
+                                        field_def.cache, resolve_fn, source, info, args
+                                    )
+                                )
+                            except Exception as raw_error:
+                                error = raw_error
+                        if not (
+                            error is not None
+                            or result is None
+                            or is_leaf_type(nullable_type)
+                            or isinstance(result, Exception)
+                            or is_awaitable(result)
+                        ):
+                            result = self.add_to_level(
+                                next_level,
+                                nullable_type,
+                                sub_field_details_list,
+                                result,
+                                field_path,
+                                list_ids,
+                            )
+                        resolved_fields[key] = (
+                            source,
+                            return_type,
+                            info,
+                            result,
+                            error,
+                        )
+                        keys.append(key)
+            level = list(next_level.values())
+        return keys, list_ids
+
+    def add_to_level(
+        self,
+        level: dict[tuple[GraphQLObjectType, int], LevelObjects],
+        return_type: GraphQLNullableType,
+        field_details_list: FieldDetailsList,
+        result: Any,
+        path: Path,
+        list_ids: list[int],
+    ) -> Any:
+        """Add the objects of a resolved value to the given level.
+
+        Returns the resolved value, which is converted to a list if necessary.
+        """
+        if is_list_type(return_type):
+            item_type = get_nullable_type(return_type.of_type)
+            if (
+                not is_object_type(item_type)
+                or item_type.is_type_of
+                or not is_iterable(result)
+                or is_streamed(field_details_list)
+            ):
+                return result
+            if not isinstance(result, list | tuple):
+                result = list(result)
+            list_id = id(result)
+            self._resolved_lists[list_id] = result
+            list_ids.append(list_id)
+            is_awaitable = self.is_awaitable
+            objects = get_level_objects(level, item_type, field_details_list)
+            objects.extend(
+                (item, path.add_key(index, None))
+                for index, item in enumerate(result)
+                if item is not None
+                and not isinstance(item, Exception)
+                and not is_awaitable(item)
+            )
+        elif is_object_type(return_type) and not return_type.is_type_of:
+            get_level_objects(level, return_type, field_details_list).append(
+                (result, path)
+            )
+        return result
+
+    def discard_resolved(
+        self, keys: list[tuple[int, int]], list_ids: list[int]
+    ) -> None:
+        """Discard resolved values and lists that have not been completed."""
+        resolved_fields = self._resolved_fields
+        for key in keys:
+            resolved = resolved_fields.pop(key, None)
+            if resolved is not None and iscoroutine(resolved[3]):
+                resolved[3].close()
+        resolved_lists = self._resolved_lists
+        for list_id in list_ids:
+            resolved_lists.pop(list_id, None)
+
+
+def get_level_objects(
+    level: dict[tuple[GraphQLObjectType, int], LevelObjects],
+    object_type: GraphQLObjectType,
+    field_details_list: FieldDetailsList,
+) -> list[tuple[Any, Path]]:
+    """Get the objects of the given type and field details in the given level."""
+    key = object_type, id(field_details_list)
+    level_objects = level.get(key)
+    if level_objects is None:
+        level_objects = level[key] = object_type, field_details_list, []
+    return level_objects[2]
+
+
+def is_streamed(field_details_list: FieldDetailsList) -> bool:
+    """Check whether the given fields may be streamed."""
+    stream_name = GraphQLStreamDirective.name
+    return any(
+        directive.name.value == stream_name
+        for field_details in field_details_list
+        for directive in field_details.node.directives or ()
+    )
+
+
+async def get_batched_value(values: Any, index: int) -> Any:
+    """Get the value with the given index from awaitable batched values."""
+    return (await values)[index]
@@ -0,0 +1,370 @@
+"""Compile operations into reusable execution plans"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from ..language import (
+    FragmentSpreadNode,
+    InlineFragmentNode,
+    ListValueNode,
+    ObjectValueNode,
+    VariableNode,
+)
+from ..type import assert_valid_schema
+from .collect_fields import collect_fields, collect_subfields
+from .executor import (
+    default_field_resolver,
+    get_executable_definitions,
+    get_middleware_manager,
+    is_shareable,
+)
+from .values import get_argument_values
+
+if TYPE_CHECKING:
+    from ..error import GraphQLError
+    from ..language import (
+        DirectiveNode,
+        DocumentNode,
+        FragmentDefinitionNode,
+        OperationDefinitionNode,
+        SelectionSetNode,
+        ValueNode,
+    )
+    from ..type import (
+        GraphQLField,
+        GraphQLFieldResolver,
+        GraphQLObjectType,
+        GraphQLSchema,
+    )
+    from .collect_fields import CollectedFields, FieldDetails, FragmentDetails
+    from .executor import Middleware
+    from .middleware import MiddlewareManager
+    from .values import VariableValues
+
+__all__ = ["CompiledField", "CompiledOperation", "compile_operation"]
+
+
+class CompiledField(NamedTuple):
+    """A field definition together with its prepared resolver function."""
+
+    field_def: GraphQLField
+    resolve_fn: GraphQLFieldResolver
+
+
+class CompiledOperation:
+    """An execution plan for an operation that can be reused across requests.
+
+    The plan captures everything that does not depend on the request: the selected
+    operation, its fragments, the collected field groups per runtime type, the field
+    definitions with their resolvers (already wrapped by the middleware), and the
+    coerced values of arguments that are given as literals.
+
+    Parts of the plan are computed when they are first needed and are never changed
+    afterwards. Selection sets whose ``@skip``, ``@include`` or ``@defer`` directives
+    depend on variables, or which spread fragments with arguments, are not memoized
+    in the plan, but collected dynamically for each execution.
+
+    Use :func:`~graphql.execution.compile_operation` to create a plan and
+    :func:`~graphql.execution.execute_compiled_operation` to execute it.
+    """
+
+    __slots__ = (
+        "_argument_values",
+        "_collected_subfields",
+        "_fields",
+        "_plan_field_details",
+        "_root_fields",
+        "_static_selection_sets",
+        "document",
+        "field_resolver",
+        "fragment_definitions",
+        "fragments",
+        "hide_suggestions",
+        "middleware_manager",
+        "operation",
+        "schema",
+    )
+
+    schema: GraphQLSchema
+    document: DocumentNode
+    operation: OperationDefinitionNode
+    fragment_definitions: dict[str, FragmentDefinitionNode]
+    fragments: dict[str, FragmentDetails]
+    field_resolver: GraphQLFieldResolver
+    middleware_manager: MiddlewareManager | None
+    hide_suggestions: bool
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        operation: OperationDefinitionNode,
+        fragment_definitions: dict[str, FragmentDefinitionNode],
+        fragments: dict[str, FragmentDetails],
+        field_resolver: GraphQLFieldResolver,
+        middleware_manager: MiddlewareManager | None = None,
+        hide_suggestions: bool = False,
+    ) -> None:
+        self.schema = schema
+        self.document = document
+        self.operation = operation
+        self.fragment_definitions = fragment_definitions
+        self.fragments = fragments
+        self.field_resolver = field_resolver
+        self.middleware_manager = middleware_manager
+        self.hide_suggestions = hide_suggestions
+        self._root_fields: dict[GraphQLObjectType, CollectedFields] = {}
+        self._collected_subfields: dict[tuple, CollectedFields] = {}
+        # The ids of all field details owned by memoized collected fields. These
+        # are kept alive by the plan, so their ids can be safely used as keys.
+        self._plan_field_details: set[int] = set()
+        self._static_selection_sets: dict[int, bool] = {}
+        self._fields: dict[tuple[GraphQLObjectType, str], CompiledField | None] = {}
+        self._argument_values: dict[tuple[int, int], dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        name = self.operation.name
+        return f"<{self.__class__.__name__} {name.value if name else '(anonymous)'}>"
+
+    def collect_root_fields(
+        self, root_type: GraphQLObjectType, variable_values: VariableValues
+    ) -> CollectedFields:
+        """Get the collected root fields of the operation.
+
+        The root fields are memoized if their collection does not depend on the
+        variable values, otherwise they are collected dynamically.
+        """
+        collected_fields = self._root_fields.get(root_type)
+        if collected_fields is not None:
+            return collected_fields
+        collected_fields = collect_fields(
+            self.schema,
+            self.fragments,
+            variable_values,
+            root_type,
+            self.operation,
+            self.hide_suggestions,
+        )
+        if self.is_static_selection_set(self.operation.selection_set):
+            collected_fields = self.memoize(
+                self._root_fields, root_type, collected_fields
+            )
+        return collected_fields
+
+    def collect_subfields(
+        self,
+        key: tuple,
+        return_type: GraphQLObjectType,
+        field_details_list: list[FieldDetails],
+        variable_values: VariableValues,
+    ) -> CollectedFields:
+        """Get the collected subfields for the given runtime type and field group.
+
+        The given key must be built from the return type and the ids of the field
+        details. The subfields are memoized if the field details are owned by this
+        plan and their collection does not depend on the variable values, otherwise
+        they are collected dynamically.
+        """
+        collected_subfields = self._collected_subfields
+        collected_fields = collected_subfields.get(key)
+        if collected_fields is not None:
+            return collected_fields
+        collected_fields = collect_subfields(
+            self.schema,
+            self.fragments,
+            variable_values,
+            self.operation,
+            return_type,
+            field_details_list,
+            self.hide_suggestions,
+        )
+        plan_field_details = self._plan_field_details
+        is_static_selection_set = self.is_static_selection_set
+        if all(
+            id(field_details) in plan_field_details
+            and (
+                field_details.node.selection_set is None
+                or is_static_selection_set(field_details.node.selection_set)
+            )
+            for field_details in field_details_list
+        ):
+            collected_fields = self.memoize(collected_subfields, key, collected_fields)
+        return collected_fields
+
+    def memoize(
+        self, cache: dict[Any, CollectedFields], key: Any, fields: CollectedFields
+    ) -> CollectedFields:
+        """Memoize the given collected fields and take ownership of them."""
+        memoized_fields = cache.setdefault(key, fields)
+        # another thread may have memoized the same fields concurrently
+        if memoized_fields is fields:  # pragma: no branch
+            self._plan_field_details.update(
+                id(field_details)
+                for field_details_list in fields.grouped_field_set.values()
+                for field_details in field_details_list
+            )
+        return memoized_fields
+
+    def is_static_selection_set(self, selection_set: SelectionSetNode) -> bool:
+        """Check whether collecting the given selection set needs no variables."""
+        static_selection_sets = self._static_selection_sets
+        key = id(selection_set)
+        is_static = static_selection_sets.get(key)
+        if is_static is None:
+            is_static = not selection_set_depends_on_variables(
+                selection_set, self.fragment_definitions, set()
+            )
+            static_selection_sets[key] = is_static
+        return is_static
+
+    def get_field(
+        self, parent_type: GraphQLObjectType, field_name: str
+    ) -> CompiledField | None:
+        """Get the field definition and the prepared resolver for the given field."""
+        fields = self._fields
+        key = parent_type, field_name
+        try:
+            return fields[key]
+        except KeyError:
+            pass
+        field_def = self.schema.get_field(parent_type, field_name)
+        if field_def is None:
+            compiled_field = None
+        else:
+            resolve_fn = field_def.resolve or self.field_resolver
+            middleware_manager = self.middleware_manager
+            if middleware_manager:
+                resolve_fn = middleware_manager.get_field_resolver(resolve_fn)
+            compiled_field = CompiledField(field_def, resolve_fn)
+        fields[key] = compiled_field
+        return compiled_field
+
+    def get_argument_values(
+        self,
+        field_def: GraphQLField,
+        field_details: FieldDetails,
+        variable_values: VariableValues,
+    ) -> dict[str, Any]:
+        """Get the coerced argument values for the given field.
+
+        The argument values are memoized if they are all given as literals or taken
+        from default values and can be shared between resolver calls, otherwise they
+        are coerced dynamically.
+        """
+        node = field_details.node
+        argument_values = self._argument_values
+        key = id(field_def), id(node)
+        args = argument_values.get(key)
+        if args is not None:
+            return args
+        args = get_argument_values(
+            field_def,
+            node,
+            variable_values,
+            field_details.fragment_variable_values,
+            self.hide_suggestions,
+        )
+        if (
+            not field_details.fragment_variable_values
+            and not any(value_has_variables(arg.value) for arg in node.arguments or ())
+            and is_shareable(args)
+        ):
+            argument_values[key] = args
+        return args
+
+
+def compile_operation(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    operation_name: str | None = None,
+    field_resolver: GraphQLFieldResolver | None = None,
+    middleware: Middleware | None = None,
+    hide_suggestions: bool = False,
+) -> CompiledOperation | list[GraphQLError]:
+    """Compile an operation into an execution plan.
+
+    Selects the operation with the given name from the validated document and
+    prepares a :class:`~graphql.execution.CompiledOperation` that can be executed
+    many times with different variables, root and context values via
+    :func:`~graphql.execution.execute_compiled_operation`.
+
+    The given field resolver and middleware are applied to the resolvers when the
+    plan is compiled. If no valid plan can be created, a list of errors is returned.
+    """
+    # If the schema used for execution is invalid, raise an error.
+    assert_valid_schema(schema)
+
+    middleware_manager = get_middleware_manager(middleware)
+
+    definitions = get_executable_definitions(schema, document, operation_name)
+    if isinstance(definitions, list):
+        return definitions  # errors
+
+    operation, fragment_definitions, fragments = definitions
+
+    return CompiledOperation(
+        schema,
+        document,
+        operation,
+        fragment_definitions,
+        fragments,
+        field_resolver or default_field_resolver,
+        middleware_manager,
+        hide_suggestions,
+    )
+
+
+def selection_set_depends_on_variables(
+    selection_set: SelectionSetNode,
+    fragment_definitions: dict[str, FragmentDefinitionNode],
+    visited_fragment_names: set[str],
+) -> bool:
+    """Check whether collecting the fields of a selection set needs variables.
+
+    This is the case if directives of the selections (or of the selections in the
+    spread fragments) use variables, or if fragments with arguments are spread.
+    The selection sets of the collected fields themselves are not considered.
+    """
+    for selection in selection_set.selections:
+        if selection.directives and directives_have_variables(selection.directives):
+            return True
+        if isinstance(selection, FragmentSpreadNode):
+            if selection.arguments:
+                return True
+            fragment_name = selection.name.value
+            if fragment_name in visited_fragment_names:
+                continue
+            visited_fragment_names.add(fragment_name)
+            fragment = fragment_definitions.get(fragment_name)
+            if fragment is not None and selection_set_depends_on_variables(
+                fragment.selection_set, fragment_definitions, visited_fragment_names
+            ):
+                return True
+        elif isinstance(
+            selection, InlineFragmentNode
+        ) and selection_set_depends_on_variables(
+            selection.selection_set, fragment_definitions, visited_fragment_names
+        ):
+            return True
+    return False
+
+
+def directives_have_variables(directives: tuple[DirectiveNode, ...]) -> bool:
+    """Check whether any of the given directives uses variables in its arguments."""
+    return any(
+        value_has_variables(argument.value)
+        for directive in directives
+        for argument in directive.arguments or ()
+    )
+
+
+def value_has_variables(value_node: ValueNode) -> bool:
+    """Check whether the given value node contains any variables."""
+    if isinstance(value_node, VariableNode):
+        return True
+    if isinstance(value_node, ListValueNode):
+        return any(value_has_variables(value) for value in value_node.values)
+    if isinstance(value_node, ObjectValueNode):
+        return any(value_has_variables(field.value) for field in value_node.fields)
+    return False
@@ -40,6 +40,7 @@ from .values import get_argument_values
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Awaitable
+    from concurrent.futures import ThreadPoolExecutor
     from typing import TypeAlias, TypeGuard
 
     from ..language import DocumentNode
@@ -49,7 +50,9 @@ if TYPE_CHECKING:
         GraphQLSchema,
         GraphQLTypeResolver,
     )
+    from .compile_operation import CompiledOperation
     from .middleware import MiddlewareManager
+    from .response_cache import CacheHints
 
 __all__ = [
     "AsyncWorkFinishedInfo",
@@ -61,6 +64,7 @@ __all__ = [
     "default_field_resolver",
     "default_type_resolver",
     "execute",
+    "execute_compiled_operation",
     "execute_root_selection_set",
     "execute_subscription_event",
     "execute_sync",
@@ -115,6 +119,15 @@ def execute(  # noqa: PLR0913
     hide_suggestions: bool = False,
     abort_signal: AbortSignal | None = None,
     hooks: ExecutionHooks | None = None,
+    thread_pool: ThreadPoolExecutor | None = None,
+    max_blocking_resolvers: int | None = None,
+    max_concurrent_resolvers: int | None = None,
+    eager_awaiting: bool = False,
+    timeout: float | None = None,
+    read_ahead: int | None = None,
+    yield_every_items: int | None = None,
+    yield_every_seconds: float | None = None,
+    cache_hints: CacheHints | None = None,
     **custom_context_args: Any,
 ) -> AwaitableOrValue[ExecutionResult]:
     """Execute a GraphQL operation.
@@ -131,6 +144,41 @@ def execute(  # noqa: PLR0913
     If an operation that defers or streams data is executed with this function,
     it will throw an error instead. Use `experimental_execute_incrementally` if
     you want to support incremental delivery.
+
+    The following arguments tune the execution of asynchronous operations:
+
+    :arg thread_pool:
+      The thread pool used to run resolvers marked with
+      :func:`~graphql.execution.blocking_resolver`. If not provided, the default
+      executor of the event loop is used.
+    :arg max_blocking_resolvers:
+      The maximum number of blocking resolvers of the operation that may run in
+      worker threads at the same time
+    :arg max_concurrent_resolvers:
+      The maximum number of awaitables returned by resolvers of the operation that
+      may be awaited at the same time
+    :arg eager_awaiting:
+      Whether the awaitables of sibling fields and list items are started as eager
+      tasks that run synchronously until they block (needs Python 3.12 or newer)
+    :arg timeout:
+      The time budget of the execution in seconds. Awaitable values returned by
+      resolvers that have not settled when the time budget is exceeded are cancelled
+      and reported as located timeout errors. Single fields can get their own time
+      budgets with the ``timeout`` of the field definition, or with the ``@timeout``
+      directive if the schema declares it (see :meth:`Executor.get_timeout`).
+    :arg read_ahead:
+      The number of items of async iterables that may still be completing while
+      the next item is read. If not provided, all items are read before they are
+      completed.
+    :arg yield_every_items:
+      The number of items of long lists after which the completion gives control
+      back to the event loop
+    :arg yield_every_seconds:
+      The number of seconds of completion work on long lists after which the
+      completion gives control back to the event loop
+    :arg cache_hints:
+      The :class:`~graphql.execution.CacheHints` recording the types, entities and
+      max ages of the response, as used by the :class:`~graphql.execution.ResponseCache`
     """
     if schema.get_directive("defer") or schema.get_directive("stream"):
         raise GraphQLError(UNEXPECTED_EXPERIMENTAL_DIRECTIVES)
@@ -154,8 +202,100 @@ def execute(  # noqa: PLR0913
         hide_suggestions=hide_suggestions,
         abort_signal=abort_signal,
         hooks=hooks,
+        thread_pool=thread_pool,
+        max_blocking_resolvers=max_blocking_resolvers,
+        max_concurrent_resolvers=max_concurrent_resolvers,
+        eager_awaiting=eager_awaiting,
+        timeout=timeout,
+        read_ahead=read_ahead,
+        yield_every_items=yield_every_items,
+        yield_every_seconds=yield_every_seconds,
+        cache_hints=cache_hints,
+        **custom_context_args,
+    )
+    return assert_single_result(result)
+
+
+def execute_compiled_operation(  # noqa: PLR0913
+    compiled_operation: CompiledOperation,
+    root_value: Any = None,
+    context_value: Any = None,
+    variable_values: dict[str, Any] | None = None,
+    type_resolver: GraphQLTypeResolver | None = None,
+    max_coercion_errors: int = 50,
+    enable_early_execution: bool = False,
+    executor_class: type[Executor] | None = None,
+    is_awaitable: Callable[[Any], TypeGuard[Awaitable]] | None = None,
+    is_async_iterable: Callable[[Any], TypeGuard[AsyncIterable]] | None = None,
+    abort_signal: AbortSignal | None = None,
+    hooks: ExecutionHooks | None = None,
+    thread_pool: ThreadPoolExecutor | None = None,
+    max_blocking_resolvers: int | None = None,
+    max_concurrent_resolvers: int | None = None,
+    eager_awaiting: bool = False,
+    timeout: float | None = None,
+    read_ahead: int | None = None,
+    yield_every_items: int | None = None,
+    yield_every_seconds: float | None = None,
+    cache_hints: CacheHints | None = None,
+    **custom_context_args: Any,
+) -> AwaitableOrValue[ExecutionResult]:
+    """Execute a compiled GraphQL operation.
+
+    Works like :func:`~graphql.execution.execute`, but reuses the execution plan
+    created by :func:`~graphql.execution.compile_operation`, which already contains
+    the selected operation, the field resolver and the middleware.
+
+    The arguments tuning the execution of asynchronous operations are the same as
+    for :func:`~graphql.execution.execute` as well.
+
+    This function does not support incremental delivery (`@defer` and `@stream`).
+    """
+    schema = compiled_operation.schema
+    if schema.get_directive("defer") or schema.get_directive("stream"):
+        raise GraphQLError(UNEXPECTED_EXPERIMENTAL_DIRECTIVES)
+
+    if executor_class is None:
+        executor_class = IncrementalExecutor
+
+    # If a valid executor cannot be created due to incorrect arguments,
+    # a "Response" with only errors is returned.
+    executor = executor_class.build_from_compiled_operation(
+        compiled_operation,
+        root_value,
+        context_value,
+        variable_values,
+        type_resolver,
+        None,
+        max_coercion_errors,
+        enable_early_execution,
+        is_awaitable,
+        is_async_iterable,
+        abort_signal=abort_signal,
+        hooks=hooks,
+        thread_pool=thread_pool,
+        max_blocking_resolvers=max_blocking_resolvers,
+        max_concurrent_resolvers=max_concurrent_resolvers,
+        eager_awaiting=eager_awaiting,
+        timeout=timeout,
+        read_ahead=read_ahead,
+        yield_every_items=yield_every_items,
+        yield_every_seconds=yield_every_seconds,
+        cache_hints=cache_hints,
         **custom_context_args,
     )
+
+    # Return early errors if executor failed.
+    if isinstance(executor, list):
+        return ExecutionResult(None, errors=executor)
+
+    return assert_single_result(executor.execute_operation())
+
+
+def assert_single_result(
+    result: AwaitableOrValue[ExecutionResult | ExperimentalIncrementalExecutionResults],
+) -> AwaitableOrValue[ExecutionResult]:
+    """Assert that the result of an execution is a single payload."""
     if isinstance(result, ExecutionResult):
         return result
     if isinstance(result, ExperimentalIncrementalExecutionResults):
@@ -189,6 +329,15 @@ def experimental_execute_incrementally(  # noqa: PLR0913
     hide_suggestions: bool = False,
     abort_signal: AbortSignal | None = None,
     hooks: ExecutionHooks | None = None,
+    thread_pool: ThreadPoolExecutor | None = None,
+    max_blocking_resolvers: int | None = None,
+    max_concurrent_resolvers: int | None = None,
+    eager_awaiting: bool = False,
+    timeout: float | None = None,
+    read_ahead: int | None = None,
+    yield_every_items: int | None = None,
+    yield_every_seconds: float | None = None,
+    cache_hints: CacheHints | None = None,
     **custom_context_args: Any,
 ) -> AwaitableOrValue[ExecutionResult | ExperimentalIncrementalExecutionResults]:
     """Execute GraphQL operation incrementally (internal implementation).
@@ -200,6 +349,9 @@ def experimental_execute_incrementally(  # noqa: PLR0913
     This function returns an awaitable that is either a single ExecutionResult or
     an ExperimentalIncrementalExecutionResults object, containing an `initial_result`
     and a stream of `subsequent_results`.
+
+    The arguments tuning the execution of asynchronous operations are the same as
+    for :func:`~graphql.execution.execute`.
     """
     if executor_class is None:
         executor_class = IncrementalExecutor
@@ -224,6 +376,15 @@ def experimental_execute_incrementally(  # noqa: PLR0913
         hide_suggestions=hide_suggestions,
         abort_signal=abort_signal,
         hooks=hooks,
+        thread_pool=thread_pool,
+        max_blocking_resolvers=max_blocking_resolvers,
+        max_concurrent_resolvers=max_concurrent_resolvers,
+        eager_awaiting=eager_awaiting,
+        timeout=timeout,
+        read_ahead=read_ahead,
+        yield_every_items=yield_every_items,
+        yield_every_seconds=yield_every_seconds,
+        cache_hints=cache_hints,
         **custom_context_args,
     )
 
@@ -239,7 +400,7 @@ def assume_not_awaitable(_value: Any) -> TypeGuard[Awaitable]:
     return False
 
 
-def execute_sync(
+def execute_sync(  # noqa: PLR0913
     schema: GraphQLSchema,
     document: DocumentNode,
     root_value: Any = None,
@@ -255,6 +416,7 @@ def execute_sync(
     hide_suggestions: bool = False,
     abort_signal: AbortSignal | None = None,
     hooks: ExecutionHooks | None = None,
+    cache_hints: CacheHints | None = None,
 ) -> ExecutionResult:
     """Execute a GraphQL operation synchronously.
 
@@ -264,6 +426,11 @@ def execute_sync(
     that all field resolvers are also synchronous.
 
     Set check_sync to True to still run checks that no awaitable values are returned.
+
+    Pass :class:`~graphql.execution.CacheHints` as ``cache_hints`` to record the
+    types, entities and max ages of the response. The other arguments of
+    :func:`~graphql.execution.execute` tuning the execution of asynchronous
+    operations are not accepted, since they have no effect on synchronous execution.
     """
     is_awaitable = (
         cast("Callable[[Any], TypeGuard[Awaitable]]", check_sync)
@@ -289,6 +456,7 @@ def execute_sync(
         hide_suggestions=hide_suggestions,
         abort_signal=abort_signal,
         hooks=hooks,
+        cache_hints=cache_hints,
     )
 
     # Assert that the execution was synchronous.
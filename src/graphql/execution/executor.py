@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+from array import array
 from asyncio import (
     FIRST_COMPLETED,
+    CancelledError,
+    Semaphore,
     ensure_future,
     gather,
     get_running_loop,
     iscoroutine,
+    sleep,
     wait,
 )
+from collections import deque
 from collections.abc import (
+    AsyncGenerator,
     AsyncIterable,
     AsyncIterator,
     Awaitable,
@@ -19,17 +25,28 @@ from collections.abc import (
     Iterator,
     Mapping,
     Sequence,
+    Sized,
 )
 from contextlib import suppress
+from contextvars import copy_context
 from copy import copy
+from enum import Enum
+from functools import partial
+from inspect import getattr_static
+from itertools import chain
+from operator import attrgetter, methodcaller
+from time import monotonic, perf_counter
+from types import FunctionType, NoneType
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     NamedTuple,
     TypeVar,
     cast,
 )
+from weakref import WeakKeyDictionary
 
 from ..error import GraphQLError, located_error
 from ..language import (
@@ -46,6 +63,7 @@ from ..pyutils import (
     RefMap,
     Undefined,
     async_reduce,
+    eager_gather_with_cancel,
     gather_with_cancel,
     inspect,
     is_iterable,
@@ -57,8 +75,10 @@ from ..pyutils.is_awaitable import (
     is_awaitable as default_is_awaitable,
 )
 from ..type import (
+    CompletionKind,
     GraphQLAbstractType,
     GraphQLField,
+    GraphQLFieldBatchResolver,
     GraphQLFieldResolver,
     GraphQLLeafType,
     GraphQLList,
@@ -68,11 +88,11 @@ from ..type import (
     GraphQLResolveInfoHelpers,
     GraphQLSchema,
     GraphQLStreamDirective,
+    GraphQLTimeoutDirective,
     GraphQLTypeResolver,
     assert_valid_schema,
-    is_abstract_type,
+    get_nullable_type,
     is_leaf_type,
-    is_list_type,
     is_non_null_type,
     is_object_type,
 )
@@ -89,7 +109,10 @@ from .collect_fields import (
     collect_subfields,
 )
 from .get_variable_signature import get_variable_signature
+from .lazy_resolve_info import LazyResolveInfo, get_resolve_info, lazy_resolve_info
+from .list_chunk import ListChunk
 from .middleware import MiddlewareManager
+from .raw_json import RawJSON
 from .types import ExecutionResult, ExperimentalIncrementalExecutionResults
 from .values import (
     VariableValues,
@@ -100,10 +123,14 @@ from .values import (
 
 if TYPE_CHECKING:
     from asyncio import Future
+    from concurrent.futures import ThreadPoolExecutor
     from typing import TypeAlias, TypeGuard
 
     from ..pyutils import UndefinedType
+    from .compile_operation import CompiledOperation
+    from .field_cache import FieldCache
     from .get_variable_signature import GraphQLVariableSignature
+    from .response_cache import CacheHints
 
 __all__ = [
     "AsyncWorkFinishedInfo",
@@ -121,6 +148,29 @@ TContext = TypeVar("TContext")
 
 suppress_exceptions = suppress(Exception)
 
+# The methods of the executor that get the paths of fields
+METHODS_GETTING_PATHS = (
+    "execute_field",
+    "complete_value",
+    "complete_leaf_value",
+    "handle_field_error",
+)
+
+# Values of these types can be coerced without checking whether they are null,
+# callable, awaitable or exceptions, which is the case for most leaf values.
+PLAIN_TYPES = frozenset((str, int, float, bool))
+
+# Argument values of these types can be shared between resolver calls.
+# Note that this includes bool values, since bool is a subclass of int.
+IMMUTABLE_TYPES = (str, int, float, Enum, NoneType)
+
+# Completion kinds as globals, which are faster to look up than enum members.
+NON_NULL_COMPLETION = CompletionKind.NON_NULL
+LIST_COMPLETION = CompletionKind.LIST
+LEAF_COMPLETION = CompletionKind.LEAF
+ABSTRACT_COMPLETION = CompletionKind.ABSTRACT
+OBJECT_COMPLETION = CompletionKind.OBJECT
+
 UNEXPECTED_MULTIPLE_PAYLOADS = (
     "Executing this GraphQL operation would unexpectedly produce multiple payloads"
     " (due to @defer or @stream directive)"
@@ -133,6 +183,12 @@ DEFER_NOT_SUPPORTED_ON_SUBSCRIPTIONS = (
 
 Middleware: TypeAlias = tuple | list | MiddlewareManager | None
 
+# Accessors are called with the source value, the resolve info and the arguments.
+FieldAccessor: TypeAlias = Callable[[Any, "GraphQLResolveInfo", dict[str, Any]], Any]
+
+# Whether the schemas have fields with a timeout or a maximum concurrency.
+_schema_field_limits: WeakKeyDictionary[GraphQLSchema, bool] = WeakKeyDictionary()
+
 
 class StreamUsage(NamedTuple):
     """Stream directive usage information"""
@@ -205,6 +261,64 @@ class CollectedErrors:
         return None in error_positions
 
 
+class AbortWatcher:
+    """Watcher cancelling tracked tasks when the abort signal is triggered.
+
+    Instead of waiting for the abort signal separately for every awaited result,
+    a single task waits for the signal on behalf of all tracked tasks. This task
+    is only kept while tracked tasks are pending. Without an abort signal, the
+    tasks are only tracked, so that they can be timed out.
+
+    For internal use only.
+    """
+
+    __slots__ = "_abort_signal", "_tasks", "_waiter"
+
+    _abort_signal: AbortSignal | None
+    _tasks: dict[Future[Any], Future[bool]]
+    _waiter: Future[Any] | None
+
+    def __init__(self, abort_signal: AbortSignal | None) -> None:
+        self._abort_signal = abort_signal
+        self._tasks = {}
+        self._waiter = None
+
+    def track(self, awaitable: Awaitable[T]) -> tuple[Future[T], Future[bool]]:
+        """Run the awaitable as a task that is cancelled when aborted.
+
+        Returns the task together with a future that is resolved with False when
+        the task is done, or with True when the task has timed out before. Awaiting
+        this future instead of the task itself makes it possible to tell apart the
+        awaiting task being cancelled from the task being cancelled.
+        """
+        task = ensure_future(awaitable)
+        settled = task.get_loop().create_future()
+        self._tasks[task] = settled
+        task.add_done_callback(self._discard)
+        abort_signal = self._abort_signal
+        if abort_signal is not None and self._waiter is None:
+            waiter = ensure_future(abort_signal.wait())
+            waiter.add_done_callback(self._cancel_tasks)
+            self._waiter = waiter
+        return task, settled
+
+    def _discard(self, task: Future[Any]) -> None:
+        """Stop tracking the given task and stop waiting if none are left."""
+        tasks = self._tasks
+        settled = tasks.pop(task)
+        if not settled.done():
+            settled.set_result(False)
+        if not tasks and self._waiter is not None:
+            self._waiter.cancel()
+            self._waiter = None
+
+    def _cancel_tasks(self, waiter: Future[Any]) -> None:
+        """Cancel all tracked tasks after the abort signal has been triggered."""
+        if not waiter.cancelled():
+            for task in list(self._tasks):
+                task.cancel()
+
+
 class Executor(Generic[TContext]):
     """Executor for a validated GraphQL operation.
 
@@ -234,6 +348,7 @@ class Executor(Generic[TContext]):
     enable_early_execution: bool
     hide_suggestions: bool
     abort_signal: AbortSignal | None
+    abort_watcher: AbortWatcher
     hooks: ExecutionHooks | None
     async_helpers: GraphQLResolveInfoHelpers
     collected_errors: CollectedErrors
@@ -241,7 +356,18 @@ class Executor(Generic[TContext]):
     background_futures: set[Future[Any]]
     async_work_finished_hook_task: Future[None] | None
     middleware_manager: MiddlewareManager | None
+    compiled_operation: CompiledOperation | None
     error_propagation: bool
+    thread_pool: ThreadPoolExecutor | None
+    max_blocking_resolvers: int | None
+    max_concurrent_resolvers: int | None
+    eager_awaiting: bool
+    read_ahead: int | None
+    yield_every_items: int | None
+    yield_every_seconds: float | None
+    cache_hints: CacheHints | None
+    deadline: float | None
+    gather_awaitables: Callable[..., Awaitable[list[Any]]]
 
     is_awaitable: Callable[[Any], TypeGuard[Awaitable]] = staticmethod(
         default_is_awaitable  # type: ignore
@@ -250,6 +376,18 @@ class Executor(Generic[TContext]):
         default_is_async_iterable  # type: ignore
     )
 
+    # Whether the paths of fields can be built lazily. This is not done if one of
+    # the methods getting these paths has been overridden, since the overrides may
+    # expect complete paths, unless the subclass sets this flag explicitly.
+    lazy_paths: ClassVar[bool] = True
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+        if "lazy_paths" not in cls.__dict__:
+            cls.lazy_paths = cls.lazy_paths and not any(
+                name in cls.__dict__ for name in METHODS_GETTING_PATHS
+            )
+
     def __init__(  # noqa: PLR0913
         self,
         schema: GraphQLSchema,
@@ -269,6 +407,16 @@ class Executor(Generic[TContext]):
         hide_suggestions: bool = False,
         abort_signal: AbortSignal | None = None,
         hooks: ExecutionHooks | None = None,
+        compiled_operation: CompiledOperation | None = None,
+        thread_pool: ThreadPoolExecutor | None = None,
+        max_blocking_resolvers: int | None = None,
+        max_concurrent_resolvers: int | None = None,
+        eager_awaiting: bool = False,
+        timeout: float | None = None,
+        read_ahead: int | None = None,
+        yield_every_items: int | None = None,
+        yield_every_seconds: float | None = None,
+        cache_hints: CacheHints | None = None,
     ) -> None:
         self.schema = schema
         self.fragment_definitions = fragment_definitions
@@ -284,10 +432,33 @@ class Executor(Generic[TContext]):
         self.hide_suggestions = hide_suggestions
         self.abort_signal = abort_signal
         self.hooks = hooks
+        self.thread_pool = thread_pool
+        self.max_blocking_resolvers = max_blocking_resolvers
+        self.max_concurrent_resolvers = max_concurrent_resolvers
+        self.eager_awaiting = eager_awaiting
+        # The number of items of async iterables that are read ahead while the
+        # completion of items that have already been read is still pending.
+        self.read_ahead = read_ahead
+        # Completing long lists synchronously gives control back to the event loop
+        # after the given number of items or seconds of completion work.
+        self.yield_every_items = yield_every_items
+        self.yield_every_seconds = yield_every_seconds
+        # The object types, entities and max ages are recorded for caching.
+        self.cache_hints = cache_hints
+        # The time budget of the operation is turned into a monotonic deadline.
+        self.deadline = None if timeout is None else monotonic() + timeout
+        # Awaitables that are awaited together are either wrapped in tasks right
+        # away, or started as eager tasks where these are available.
+        self.gather_awaitables = (
+            eager_gather_with_cancel if eager_awaiting else gather_with_cancel
+        )
         self.async_helpers = GraphQLResolveInfoHelpers(
-            gather=self.gather_async_work, track=self.track_async_work
+            gather=self.gather_async_work,
+            track=self.track_async_work,
+            run_blocking=self.run_blocking,
         )
         self.middleware_manager = middleware_manager
+        self.compiled_operation = compiled_operation
         self.error_propagation = not any(
             directive.name.value == GraphQLDisableErrorPropagationDirective.name
             for directive in operation.directives or ()
@@ -301,8 +472,54 @@ class Executor(Generic[TContext]):
         self.pending_incremental_futures = set()
         self.background_futures = set()
         self.async_work_finished_hook_task = None
+        self.abort_watcher = AbortWatcher(abort_signal)
+        # Limits the number of blocking resolvers running at the same time.
+        self._blocking_semaphore = (
+            None
+            if max_blocking_resolvers is None
+            else Semaphore(max_blocking_resolvers)
+        )
+        # Limit the number of awaitable results of resolvers awaited at the same
+        # time for the whole operation and for fields with a maximum concurrency.
+        self._resolver_semaphore = (
+            None
+            if max_concurrent_resolvers is None
+            else Semaphore(max_concurrent_resolvers)
+        )
+        self._field_semaphores: RefMap[GraphQLField, Semaphore] = RefMap()
         self._relevant_sub_fields: dict[tuple, CollectedFields] = {}
+        # The accessors used instead of the default field resolver per class of
+        # the source values and field name.
+        self._field_accessors: dict[tuple[type, str], FieldAccessor] = {}
+        # The object types having fields with batch resolvers.
+        self._batched_types: dict[GraphQLObjectType, bool] = {}
+        # The values of batched fields that have been resolved for a whole list,
+        # per field details and source, together with the source and its index.
+        self._batched_values: dict[tuple[int, int], tuple[Any, Any, int]] = {}
+        # The coerced argument values per field definition and field details, and
+        # whether they contain lists or dicts that need to be copied for every use.
+        # The field details are kept in the values so that their ids stay valid.
+        self._argument_values: dict[
+            tuple[int, int], tuple[FieldDetails, dict[str, Any], bool]
+        ] = {}
         self._stream_usages: RefMap[FieldDetailsList, StreamUsage] = RefMap()
+        # The time budgets set with the timeout directive per field node, if the
+        # schema declares this directive with the expected argument at all.
+        timeout_directive = schema.get_directive(GraphQLTimeoutDirective.name)
+        seconds_arg = (
+            timeout_directive.args.get("seconds") if timeout_directive else None
+        )
+        self._directive_timeouts: RefMap[FieldNode, float | None] | None = (
+            RefMap() if seconds_arg and str(seconds_arg.type) == "Float!" else None
+        )
+        # Whether awaiting the results of resolvers can be limited in time or in
+        # concurrency at all, so that the fields need not be checked otherwise.
+        self._limits_awaiting = (
+            self.deadline is not None
+            or self._directive_timeouts is not None
+            or self._resolver_semaphore is not None
+            or has_field_limits(schema)
+        )
 
     @classmethod
     def build(  # noqa: PLR0913
@@ -324,6 +541,15 @@ class Executor(Generic[TContext]):
         hide_suggestions: bool = False,
         abort_signal: AbortSignal | None = None,
         hooks: ExecutionHooks | None = None,
+        thread_pool: ThreadPoolExecutor | None = None,
+        max_blocking_resolvers: int | None = None,
+        max_concurrent_resolvers: int | None = None,
+        eager_awaiting: bool = False,
+        timeout: float | None = None,
+        read_ahead: int | None = None,
+        yield_every_items: int | None = None,
+        yield_every_seconds: float | None = None,
+        cache_hints: CacheHints | None = None,
         **custom_args: Any,
     ) -> list[GraphQLError] | Executor:
         """Build an executor
@@ -338,59 +564,13 @@ class Executor(Generic[TContext]):
         # If the schema used for execution is invalid, raise an error.
         assert_valid_schema(schema)
 
-        operation: OperationDefinitionNode | None = None
-        fragment_definitions: dict[str, FragmentDefinitionNode] = {}
-        fragments: dict[str, FragmentDetails] = {}
-        fragment_variable_signature_errors: list[GraphQLError] = []
-        middleware_manager: MiddlewareManager | None = None
-        if middleware is not None:
-            if isinstance(middleware, (list, tuple)):
-                middleware_manager = MiddlewareManager(*middleware)
-            elif isinstance(middleware, MiddlewareManager):
-                middleware_manager = middleware
-            else:
-                msg = (
-                    "Middleware must be passed as a list or tuple of functions"
-                    " or objects, or as a single MiddlewareManager object."
-                    f" Got {inspect(middleware)} instead."
-                )
-                raise TypeError(msg)
-
-        for definition in document.definitions:
-            if isinstance(definition, OperationDefinitionNode):
-                if operation_name is None:
-                    if operation:
-                        return [
-                            GraphQLError(
-                                "Must provide operation name"
-                                " if query contains multiple operations."
-                            )
-                        ]
-                    operation = definition
-                elif definition.name and definition.name.value == operation_name:
-                    operation = definition
-            elif isinstance(definition, FragmentDefinitionNode):
-                fragment_definitions[definition.name.value] = definition
-                variable_signatures: dict[str, GraphQLVariableSignature] | None = None
-                if definition.variable_definitions:
-                    variable_signatures = {}
-                    for var_def in definition.variable_definitions:
-                        signature = get_variable_signature(schema, var_def)
-                        if isinstance(signature, GraphQLError):
-                            fragment_variable_signature_errors.append(signature)
-                            continue
-                        variable_signatures[signature.name] = signature
-                fragments[definition.name.value] = FragmentDetails(
-                    definition, variable_signatures
-                )
+        middleware_manager = get_middleware_manager(middleware)
 
-        if not operation:
-            if operation_name is not None:
-                return [GraphQLError(f"Unknown operation named '{operation_name}'.")]
-            return [GraphQLError("Must provide an operation.")]
+        definitions = get_executable_definitions(schema, document, operation_name)
+        if isinstance(definitions, list):
+            return definitions  # errors
 
-        if fragment_variable_signature_errors:
-            return fragment_variable_signature_errors
+        operation, fragment_definitions, fragments = definitions
 
         variable_values = get_variable_values(
             schema,
@@ -421,6 +601,94 @@ class Executor(Generic[TContext]):
             hide_suggestions=hide_suggestions,
             abort_signal=abort_signal,
             hooks=hooks,
+            thread_pool=thread_pool,
+            max_blocking_resolvers=max_blocking_resolvers,
+            max_concurrent_resolvers=max_concurrent_resolvers,
+            eager_awaiting=eager_awaiting,
+            timeout=timeout,
+            read_ahead=read_ahead,
+            yield_every_items=yield_every_items,
+            yield_every_seconds=yield_every_seconds,
+            cache_hints=cache_hints,
+            **custom_args,
+        )
+
+    @classmethod
+    def build_from_compiled_operation(  # noqa: PLR0913
+        cls,
+        compiled_operation: CompiledOperation,
+        root_value: Any = None,
+        context_value: Any = None,
+        raw_variable_values: dict[str, Any] | None = None,
+        type_resolver: GraphQLTypeResolver | None = None,
+        subscribe_field_resolver: GraphQLFieldResolver | None = None,
+        max_coercion_errors: int = 50,
+        enable_early_execution: bool = False,
+        is_awaitable: Callable[[Any], TypeGuard[Awaitable]] | None = None,
+        is_async_iterable: Callable[[Any], TypeGuard[AsyncIterable]] | None = None,
+        abort_signal: AbortSignal | None = None,
+        hooks: ExecutionHooks | None = None,
+        thread_pool: ThreadPoolExecutor | None = None,
+        max_blocking_resolvers: int | None = None,
+        max_concurrent_resolvers: int | None = None,
+        eager_awaiting: bool = False,
+        timeout: float | None = None,
+        read_ahead: int | None = None,
+        yield_every_items: int | None = None,
+        yield_every_seconds: float | None = None,
+        cache_hints: CacheHints | None = None,
+        **custom_args: Any,
+    ) -> list[GraphQLError] | Executor:
+        """Build an executor for a compiled operation.
+
+        Constructs an Executor object that executes the given compiled operation
+        with the given variable values, reusing the execution plan.
+
+        For internal use only.
+        """
+        schema = compiled_operation.schema
+        operation = compiled_operation.operation
+        hide_suggestions = compiled_operation.hide_suggestions
+
+        variable_values = get_variable_values(
+            schema,
+            operation.variable_definitions or (),
+            raw_variable_values or {},
+            max_errors=max_coercion_errors,
+            hide_suggestions=hide_suggestions,
+        )
+
+        if isinstance(variable_values, list):
+            return variable_values  # errors
+
+        return cls(
+            schema,
+            compiled_operation.fragment_definitions,
+            compiled_operation.fragments,
+            root_value,
+            context_value,
+            operation,
+            variable_values,
+            compiled_operation.field_resolver,
+            type_resolver or default_type_resolver,
+            subscribe_field_resolver or default_field_resolver,
+            enable_early_execution,
+            compiled_operation.middleware_manager,
+            is_awaitable,
+            is_async_iterable,
+            hide_suggestions=hide_suggestions,
+            abort_signal=abort_signal,
+            hooks=hooks,
+            compiled_operation=compiled_operation,
+            thread_pool=thread_pool,
+            max_blocking_resolvers=max_blocking_resolvers,
+            max_concurrent_resolvers=max_concurrent_resolvers,
+            eager_awaiting=eager_awaiting,
+            timeout=timeout,
+            read_ahead=read_ahead,
+            yield_every_items=yield_every_items,
+            yield_every_seconds=yield_every_seconds,
+            cache_hints=cache_hints,
             **custom_args,
         )
 
@@ -473,14 +741,7 @@ class Executor(Generic[TContext]):
                 raise GraphQLError(msg, operation)  # noqa: TRY301
             root_value = self.root_value
 
-            collected_fields = collect_fields(
-                schema,
-                self.fragments,
-                self.variable_values,
-                root_type,
-                operation,
-                self.hide_suggestions,
-            )
+            collected_fields = self.collect_root_fields(root_type)
 
             grouped_field_set, new_defer_usages, _forbidden = collected_fields
 
@@ -524,6 +785,22 @@ class Executor(Generic[TContext]):
 
         return self.finish(self.build_response(data))
 
+    def collect_root_fields(self, root_type: GraphQLObjectType) -> CollectedFields:
+        """Collect the root fields of the operation."""
+        compiled_operation = self.compiled_operation
+        if compiled_operation is not None:
+            return compiled_operation.collect_root_fields(
+                root_type, self.variable_values
+            )
+        return collect_fields(
+            self.schema,
+            self.fragments,
+            self.variable_values,
+            root_type,
+            self.operation,
+            self.hide_suggestions,
+        )
+
     def execute_collected_root_fields(
         self,
         root_type: GraphQLObjectType,
@@ -583,6 +860,9 @@ class Executor(Generic[TContext]):
         Implements the "Executing selection sets" section of the spec
         for fields that must be executed serially.
         """
+        cache_hints = self.cache_hints
+        if cache_hints is not None:
+            cache_hints.record(parent_type, source_value, grouped_field_set)
         is_awaitable = self.is_awaitable
         abort_signal = self.abort_signal
 
@@ -591,17 +871,27 @@ class Executor(Generic[TContext]):
             field_item: tuple[str, FieldDetailsList],
         ) -> AwaitableOrValue[dict[str, Any]]:
             response_name, field_details_list = field_item
-            field_path = Path(path, response_name, parent_type.name)
             if abort_signal is not None and abort_signal.aborted:
                 # Reject the whole operation rather than serially completing the
                 # remaining fields with located abort errors.
                 raise self.abort_error()
-            result = self.execute_field(
-                parent_type,
-                source_value,
-                field_details_list,
-                field_path,
-                position_context,
+            result = (
+                self.execute_field_at(
+                    parent_type,
+                    source_value,
+                    field_details_list,
+                    path,
+                    response_name,
+                    position_context,
+                )
+                if self.lazy_paths
+                else self.execute_field(
+                    parent_type,
+                    source_value,
+                    field_details_list,
+                    Path(path, response_name, parent_type.name),
+                    position_context,
+                )
             )
             if result is Undefined:
                 return results
@@ -631,19 +921,33 @@ class Executor(Generic[TContext]):
         Implements the "Executing selection sets" section of the spec
         for fields that may be executed in parallel.
         """
+        cache_hints = self.cache_hints
+        if cache_hints is not None:
+            cache_hints.record(parent_type, source_value, grouped_field_set)
         results: dict[str, Any] = {}
         is_awaitable = self.is_awaitable
         awaitable_fields: list[str] = []
         append_awaitable = awaitable_fields.append
+        lazy_paths = self.lazy_paths
         try:
             for response_name, field_details_list in grouped_field_set.items():
-                field_path = Path(path, response_name, parent_type.name)
-                result = self.execute_field(
-                    parent_type,
-                    source_value,
-                    field_details_list,
-                    field_path,
-                    position_context,
+                result = (
+                    self.execute_field_at(
+                        parent_type,
+                        source_value,
+                        field_details_list,
+                        path,
+                        response_name,
+                        position_context,
+                    )
+                    if lazy_paths
+                    else self.execute_field(
+                        parent_type,
+                        source_value,
+                        field_details_list,
+                        Path(path, response_name, parent_type.name),
+                        position_context,
+                    )
                 )
                 if result is not Undefined:
                     results[response_name] = result
@@ -666,20 +970,26 @@ class Executor(Generic[TContext]):
         # field, which is possibly a coroutine object. Return a coroutine object that
         # will yield this same map, but with any coroutines awaited in parallel and
         # replaced with the values they yielded.
-        async def get_results() -> dict[str, Any]:
-            if len(awaitable_fields) == 1:
-                # If there is only one field, avoid the overhead of parallelization.
-                field = awaitable_fields[0]
-                results[field] = await results[field]
-            else:
-                awaited_results = await gather_with_cancel(
-                    *(results[field] for field in awaitable_fields)
-                )
-                results.update(zip(awaitable_fields, awaited_results, strict=True))
+        return self.await_field_results(results, awaitable_fields)
 
-            return results
+    async def await_field_results(
+        self, results: dict[str, Any], awaitable_fields: list[str]
+    ) -> dict[str, Any]:
+        """Await the given awaitable fields in the results.
+
+        For internal use only.
+        """
+        if len(awaitable_fields) == 1:
+            # If there is only one field, avoid the overhead of parallelization.
+            field = awaitable_fields[0]
+            results[field] = await results[field]
+        else:
+            awaited_results = await self.gather_awaitables(
+                *(results[field] for field in awaitable_fields)
+            )
+            results.update(zip(awaitable_fields, awaited_results, strict=True))
 
-        return get_results()
+        return results
 
     def execute_field(
         self,
@@ -697,55 +1007,118 @@ class Executor(Generic[TContext]):
         calling its resolve function, then calls complete_value to await coroutine
         objects, coercing scalars, or execute the sub-selection-set for objects.
         """
+        return self.execute_field_at(
+            parent_type,
+            source,
+            field_details_list,
+            path.prev,
+            path.key,  # type: ignore
+            position_context,
+            path,
+        )
+
+    def execute_field_at(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_details_list: FieldDetailsList,
+        parent_path: Path | None,
+        response_name: str,
+        position_context: TContext | None,
+        path: Path | None = None,
+    ) -> AwaitableOrValue[Any] | UndefinedType:
+        """Resolve the field with the given response name on the given source object.
+
+        Like :meth:`execute_field`, but gets the path of the parent object instead of
+        the path of the field. The path of the field is only built when it is needed,
+        which is not the case when leaf values are resolved without errors by
+        resolvers that accept lazily built resolve info.
+
+        For internal use only.
+        """
         first_field_details = field_details_list[0]
-        first_field_node = first_field_details.node
-        field_name = first_field_node.name.value
-        field_def = self.schema.get_field(parent_type, field_name)
-        if not field_def:
-            return Undefined
+        field_name = first_field_details.node.name.value
+        compiled_operation = self.compiled_operation
+        if compiled_operation is None:
+            field_def = self.schema.get_field(parent_type, field_name)
+            if not field_def:
+                return Undefined
 
-        return_type = field_def.type
-        resolve_fn = field_def.resolve or self.field_resolver
+            resolve_fn = field_def.resolve or self.field_resolver
 
-        if self.middleware_manager:
-            resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+            if self.middleware_manager:
+                resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+        else:
+            compiled_field = compiled_operation.get_field(parent_type, field_name)
+            if compiled_field is None:
+                return Undefined
+            field_def, resolve_fn = compiled_field
 
-        info = self.build_resolve_info(
-            field_def, to_nodes(field_details_list), parent_type, path
-        )
+        return_type = field_def.type
+
+        if getattr(resolve_fn, "lazy_resolve_info", False) and is_leaf_type(
+            get_nullable_type(return_type)
+        ):
+            # The resolve info of leaf fields is only needed to report errors,
+            # so it can be built lazily if the resolver does not need it either,
+            # and the same applies to the path of the field.
+            lazy_info = (
+                LazyResolveInfo(
+                    self,
+                    field_def,
+                    field_details_list,
+                    parent_type,
+                    parent_path,
+                    response_name,
+                )
+                if path is None
+                else LazyResolveInfo(
+                    self, field_def, field_details_list, parent_type, path
+                )
+            )
+            info = cast("GraphQLResolveInfo", lazy_info)
+        else:
+            lazy_info = None
+            if path is None:
+                path = Path(parent_path, response_name, parent_type.name)
+            info = self.build_resolve_info(
+                field_def, to_nodes(field_details_list), parent_type, path
+            )
 
         # Get the resolve function, regardless of if its result is normal or abrupt
         # (error).
         try:
             # Build a dictionary of arguments from the field.arguments AST, using the
             # variables scope to fulfill any variable references.
-            args = get_argument_values(
+            args = self.get_argument_values(field_def, first_field_details)
+
+            result = self.resolve_field_value(
                 field_def,
-                first_field_node,
-                self.variable_values,
-                first_field_details.fragment_variable_values,
-                self.hide_suggestions,
+                resolve_fn,
+                field_details_list,
+                parent_type,
+                source,
+                info,
+                args,
             )
 
-            # Note that contrary to the JavaScript implementation, we pass the context
-            # value as part of the resolve info.
-            result = resolve_fn(source, info, **args)
-
             if self.is_awaitable(result):
                 return self.complete_awaitable_value(
                     return_type,
                     field_details_list,
                     info,
-                    path,
+                    path or lazy_info.path,  # type: ignore
                     result,
                     position_context,
                 )
 
+            # Completing a leaf value does not need the path, and never returns
+            # an awaitable.
             completed = self.complete_value(
                 return_type,
                 field_details_list,
                 info,
-                path,
+                path,  # type: ignore
                 result,
                 position_context,
             )
@@ -759,7 +1132,7 @@ class Executor(Generic[TContext]):
                             raw_error,
                             return_type,
                             field_details_list,
-                            path,
+                            path or lazy_info.path,  # type: ignore
                         )
                         return None
 
@@ -770,12 +1143,100 @@ class Executor(Generic[TContext]):
                 raw_error,
                 return_type,
                 field_details_list,
-                path,
+                path or lazy_info.path,  # type: ignore
             )
             return None
 
         return completed
 
+    def resolve_field_value(
+        self,
+        field_def: GraphQLField,
+        resolve_fn: GraphQLFieldResolver,
+        field_details_list: FieldDetailsList,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        info: GraphQLResolveInfo,
+        args: dict[str, Any],
+    ) -> Any:
+        """Resolve the value of a field on the given source object.
+
+        The value is taken from the batch resolver or the cache of the field if it
+        has one. Otherwise, it is read with an accessor specialized for the class of
+        the source object if the default field resolver is used, or it is returned
+        by the given resolve function. The value may be awaitable.
+
+        For internal use only.
+        """
+        batch_resolve = field_def.batch_resolve
+        if batch_resolve is not None:
+            return self.resolve_batched_field(
+                batch_resolve,
+                field_details_list,
+                parent_type,
+                source,
+                get_resolve_info(info),
+                args,
+            )
+        if field_def.cache is not None:
+            return self.resolve_cached_field(
+                field_def.cache, resolve_fn, source, info, args
+            )
+        if resolve_fn is default_field_resolver:
+            # Read the value with an accessor specialized for the source class.
+            accessors = self._field_accessors
+            key = source.__class__, field_details_list[0].node.name.value
+            accessor = accessors.get(key)
+            if accessor is None:
+                accessor = accessors[key] = get_field_accessor(*key)
+            return accessor(source, info, args)
+        # Note that contrary to the JavaScript implementation, we pass the
+        # context value as part of the resolve info.
+        return resolve_fn(source, info, **args)
+
+    def get_argument_values(
+        self, field_def: GraphQLField, field_details: FieldDetails
+    ) -> dict[str, Any]:
+        """Get the coerced argument values of the given field.
+
+        Since the variable values do not change during the execution, the argument
+        values are memoized, so that they are not coerced again for every item when
+        resolving lists of values. Argument values that are given as literals are
+        also memoized across executions if a compiled operation is executed.
+        Every call returns a new dictionary with copies of the lists and dicts in the
+        argument values, so that resolvers changing them do not affect other calls.
+        Argument values containing other mutable objects are not memoized.
+
+        For internal use only.
+        """
+        argument_values = self._argument_values
+        key = id(field_def), id(field_details)
+        memoized = argument_values.get(key)
+        if memoized is not None:
+            args = memoized[1]
+            return copy_containers(args) if memoized[2] else args.copy()
+        compiled_operation = self.compiled_operation
+        args = (
+            get_argument_values(
+                field_def,
+                field_details.node,
+                self.variable_values,
+                field_details.fragment_variable_values,
+                self.hide_suggestions,
+            )
+            if compiled_operation is None
+            else compiled_operation.get_argument_values(
+                field_def, field_details, self.variable_values
+            )
+        )
+        if is_shareable(args):
+            has_containers = not all(
+                isinstance(value, IMMUTABLE_TYPES) for value in args.values()
+            )
+            argument_values[key] = field_details, args, has_containers
+            return copy_containers(args) if has_containers else args.copy()
+        return args
+
     def build_resolve_info(
         self,
         field_def: GraphQLField,
@@ -860,11 +1321,16 @@ class Executor(Generic[TContext]):
         if isinstance(result, Exception):
             raise result
 
+        # The kind of completion is a class attribute of the type. The inner type and
+        # the output coercion function are read from the type itself, so that
+        # replacing the latter after creating the type still takes effect.
+        completion_kind = return_type.completion_kind
+
         # If field type is NonNull, complete for inner type, and throw field error if
         # result is null.
-        if is_non_null_type(return_type):
+        if completion_kind is NON_NULL_COMPLETION:
             completed = self.complete_value(
-                return_type.of_type,
+                return_type.of_type,  # type: ignore
                 field_details_list,
                 info,
                 path,
@@ -883,10 +1349,19 @@ class Executor(Generic[TContext]):
         if result is None or result is Undefined:
             return None
 
-        # If field type is List, complete each item in the list with inner type
-        if is_list_type(return_type):
-            return self.complete_list_value(
-                return_type,
+        # If result value is already serialized, pass it through if allowed.
+        if isinstance(result, RawJSON):
+            return self.complete_raw_json_value(info, result)
+
+        # If field type is a leaf type, Scalar or Enum, coerce to a valid value,
+        # returning null if coercion is not possible.
+        if completion_kind is LEAF_COMPLETION:
+            return self.complete_leaf_value(return_type, result)  # type: ignore
+
+        # If field type is Object, execute and complete all sub-selections.
+        if completion_kind is OBJECT_COMPLETION:
+            return self.complete_object_value(
+                return_type,  # type: ignore
                 field_details_list,
                 info,
                 path,
@@ -894,16 +1369,10 @@ class Executor(Generic[TContext]):
                 position_context,
             )
 
-        # If field type is a leaf type, Scalar or Enum, coerce to a valid value,
-        # returning null if coercion is not possible.
-        if is_leaf_type(return_type):
-            return self.complete_leaf_value(return_type, result)
-
-        # If field type is an abstract type, Interface or Union, determine the runtime
-        # Object type and complete for that type.
-        if is_abstract_type(return_type):
-            return self.complete_abstract_value(
-                return_type,
+        # If field type is List, complete each item in the list with inner type
+        if completion_kind is LIST_COMPLETION:
+            return self.complete_list_value(
+                return_type,  # type: ignore
                 field_details_list,
                 info,
                 path,
@@ -911,10 +1380,11 @@ class Executor(Generic[TContext]):
                 position_context,
             )
 
-        # If field type is Object, execute and complete all sub-selections.
-        if is_object_type(return_type):
-            return self.complete_object_value(
-                return_type,
+        # If field type is an abstract type, Interface or Union, determine the runtime
+        # Object type and complete for that type.
+        if completion_kind is ABSTRACT_COMPLETION:
+            return self.complete_abstract_value(
+                return_type,  # type: ignore
                 field_details_list,
                 info,
                 path,
@@ -929,7 +1399,26 @@ class Executor(Generic[TContext]):
         )  # pragma: no cover
         raise TypeError(msg)  # pragma: no cover
 
-    async def with_abort_signal(self, awaitable: Awaitable[T]) -> T:
+    def complete_raw_json_value(
+        self, info: GraphQLResolveInfo, result: RawJSON
+    ) -> RawJSON:
+        """Complete a value that has already been serialized to JSON.
+
+        The value is passed through unchanged if the field allows this.
+        """
+        parent_type, field_name = info.parent_type, info.field_name
+        field_def = self.schema.get_field(parent_type, field_name)
+        if field_def is None or not field_def.allow_raw_json:
+            msg = (
+                f"Field '{parent_type}.{field_name}'"
+                " does not allow pre-serialized JSON values."
+            )
+            raise TypeError(msg)
+        return result
+
+    async def with_abort_signal(
+        self, awaitable: Awaitable[T], info: GraphQLResolveInfo | None = None
+    ) -> T:
         """Await a value, but cancel immediately if the abort signal is triggered.
 
         This wraps awaitables returned by resolvers (and awaitable list items) so
@@ -940,27 +1429,92 @@ class Executor(Generic[TContext]):
         If the abort signal fires before the awaitable settles, the underlying
         awaitable is cancelled and the abort reason is raised (an exception reason
         is raised as is, any other value is reported as an unexpected error value).
+        The awaitables are run as tasks that are cancelled by an abort watcher
+        shared by the whole execution, so that the signal is only waited for once.
+
+        If the resolve info of the field is passed, the time budget of the field is
+        applied as well (see :meth:`get_timeout`). When it is exceeded before the
+        awaitable settles, the awaitable is cancelled and a timeout error is raised.
         """
         abort_signal = self.abort_signal
-        if abort_signal is None:
+        timeout = None if info is None else self.get_timeout(info)
+        if timeout is None and abort_signal is None:
             return await awaitable
-        task = ensure_future(awaitable)
-        if not abort_signal.aborted:
-            abort = ensure_future(abort_signal.wait())
+        if abort_signal is None or not abort_signal.aborted:
+            task, settled = self.abort_watcher.track(awaitable)
+            timer = (
+                None
+                if timeout is None
+                else task.get_loop().call_later(timeout, set_timed_out, settled)
+            )
             try:
-                await wait({task, abort}, return_when=FIRST_COMPLETED)
+                timed_out = await settled
+            except CancelledError:
+                # the awaiting task has been cancelled, not the awaited one
+                task.cancel()
+                raise
             finally:
-                if not abort.done():
-                    abort.cancel()
-            if not abort_signal.aborted:
-                return task.result()
-        # The abort signal fired (possibly in the same tick the task settled);
-        # discard any task result and reject with the abort reason.
+                if timer is not None:
+                    timer.cancel()
+            if abort_signal is None or not abort_signal.aborted:
+                # prefer a result that has been settled in the tick of the timeout
+                if not timed_out or task.done():
+                    return task.result()
+                task.cancel()
+                info = cast("GraphQLResolveInfo", info)
+                msg = f"Field '{info.parent_type}.{info.field_name}' timed out."
+                raise TimeoutError(msg)
+            # The abort signal fired (possibly in the same tick the task settled);
+            # discard any task result or error and reject with the abort reason.
+            if not task.cancelled():
+                task.exception()
+            raise self.abort_error()
+        task = ensure_future(awaitable)
         task.cancel()
         with suppress(BaseException):
             await task
         raise self.abort_error()
 
+    def get_timeout(self, info: GraphQLResolveInfo) -> float | None:
+        """Get the time budget for awaiting a value of the given field in seconds.
+
+        This is the smallest of the timeout set on the field definition, the
+        timeout set with the ``@timeout`` directive on the field in the operation,
+        and the time remaining until the deadline of the operation. Returns None if
+        there is no time budget.
+
+        The ``@timeout`` directive is not one of the specified directives, so it is
+        only taken into account if the schema declares it, either by adding
+        :data:`~graphql.type.GraphQLTimeoutDirective` to its directives, or with
+        ``directive @timeout(seconds: Float!) on FIELD`` in its SDL.
+        """
+        if not self._limits_awaiting:
+            return None
+        field_def = self.schema.get_field(info.parent_type, info.field_name)
+        timeout = None if field_def is None else field_def.timeout
+        directive_timeouts = self._directive_timeouts
+        if directive_timeouts is not None:
+            # validation only allows the same arguments on merged fields, so it is
+            # safe to only check the first field node for the timeout directive
+            field_node = info.field_nodes[0]
+            if field_node in directive_timeouts:
+                seconds = directive_timeouts[field_node]
+            else:
+                values = get_directive_values(
+                    GraphQLTimeoutDirective, field_node, self.variable_values
+                )
+                seconds = directive_timeouts[field_node] = (
+                    None if values is None else values["seconds"]
+                )
+            if seconds is not None and (timeout is None or seconds < timeout):
+                timeout = seconds
+        deadline = self.deadline
+        if deadline is not None:
+            remaining = max(deadline - monotonic(), 0)
+            if timeout is None or remaining < timeout:
+                timeout = remaining
+        return timeout
+
     def abort_error(self) -> Exception:
         """Return the exception to raise when execution has been aborted.
 
@@ -1097,7 +1651,7 @@ class Executor(Generic[TContext]):
         When one of the values fails, the others are cancelled and settled before
         the error is propagated, so that no asynchronous work is orphaned.
         """
-        return gather_with_cancel(*values)
+        return self.gather_awaitables(*values)
 
     def run_async_work_finished_hook(self) -> None:
         """Run the hook signaling that all asynchronous work has finished.
@@ -1127,20 +1681,84 @@ class Executor(Generic[TContext]):
         # keep a reference to the task so that it is not garbage collected
         self.async_work_finished_hook_task = ensure_future(wait_and_run_hook())
 
-    def cancellable_iterable(self, iterable: AsyncIterable[T]) -> AsyncIterable[T]:
-        """Wrap an async iterable so pending iteration is cancelled on abort.
+    def limit_concurrency(
+        self, awaitable: Awaitable[T], info: GraphQLResolveInfo
+    ) -> Awaitable[T]:
+        """Limit the number of awaitable results of resolvers awaited at once.
 
-        When the abort signal is triggered, any pending ``__anext__`` call returns
-        immediately by raising the abort reason. This mirrors the JavaScript
-        ``cancellableIterable``; GraphQL-core needs no ``AbortSignalListener``
-        class since :meth:`with_abort_signal` already provides the cancellation
-        mechanism.
+        If a maximum number of concurrent resolvers has been set for the operation
+        or the field has a maximum concurrency, returns an awaitable that waits in
+        line until the given awaitable can be awaited without exceeding the limits.
+        Otherwise, the given awaitable is returned unchanged.
         """
-        if self.abort_signal is None:
-            return iterable
-        with_abort_signal = self.with_abort_signal
-        iterator = iterable.__aiter__()
-
+        if not self._limits_awaiting:
+            return awaitable
+        semaphores: list[Semaphore] = []
+        field_def = self.schema.get_field(info.parent_type, info.field_name)
+        if field_def is not None and field_def.max_concurrency is not None:
+            field_semaphores = self._field_semaphores
+            semaphore = field_semaphores.get(field_def)
+            if semaphore is None:
+                semaphore = field_semaphores[field_def] = Semaphore(
+                    field_def.max_concurrency
+                )
+            semaphores.append(semaphore)
+        # acquire the semaphore of the operation last to not block other fields
+        if self._resolver_semaphore is not None:
+            semaphores.append(self._resolver_semaphore)
+        if not semaphores:
+            return awaitable
+        return await_with_semaphores(awaitable, semaphores)
+
+    def run_blocking(
+        self, fn: Callable[..., T], /, *args: Any, **kwargs: Any
+    ) -> AwaitableOrValue[T]:
+        """Run a blocking function in a worker thread if possible.
+
+        Returns an awaitable for the result of the function if it can be run in a
+        worker thread. If there is no running event loop or the executor does not
+        accept awaitable values, the function is called directly instead.
+        """
+        try:
+            get_running_loop()
+        except RuntimeError:
+            return fn(*args, **kwargs)
+        result = self.run_in_thread(partial(copy_context().run, fn, *args, **kwargs))
+        if not self.is_awaitable(result):
+            result.close()
+            return fn(*args, **kwargs)
+        return result
+
+    async def run_in_thread(self, call: Callable[[], T]) -> T:
+        """Run the given call in a worker thread of the thread pool.
+
+        If a maximum number of blocking resolvers has been set, the call waits until
+        it can be run without exceeding this number. Waiting calls are cancelled
+        like other awaitable results of resolvers when the execution is aborted.
+
+        For internal use only.
+        """
+        loop = get_running_loop()
+        semaphore = self._blocking_semaphore
+        if semaphore is None:
+            return await loop.run_in_executor(self.thread_pool, call)
+        async with semaphore:
+            return await loop.run_in_executor(self.thread_pool, call)
+
+    def cancellable_iterable(self, iterable: AsyncIterable[T]) -> AsyncIterable[T]:
+        """Wrap an async iterable so pending iteration is cancelled on abort.
+
+        When the abort signal is triggered, any pending ``__anext__`` call returns
+        immediately by raising the abort reason. This mirrors the JavaScript
+        ``cancellableIterable``; GraphQL-core needs no ``AbortSignalListener``
+        class since :meth:`with_abort_signal` already provides the cancellation
+        mechanism.
+        """
+        if self.abort_signal is None:
+            return iterable
+        with_abort_signal = self.with_abort_signal
+        iterator = iterable.__aiter__()
+
         class CancellableAsyncIterator:
             def __aiter__(self) -> AsyncIterator[T]:
                 return self
@@ -1166,7 +1784,9 @@ class Executor(Generic[TContext]):
     ) -> Any:
         """Complete an awaitable value."""
         try:
-            resolved = await self.with_abort_signal(result)
+            resolved = await self.with_abort_signal(
+                self.limit_concurrency(result, info), info
+            )
             completed = self.complete_value(
                 return_type,
                 field_details_list,
@@ -1262,7 +1882,15 @@ class Executor(Generic[TContext]):
         """Complete an async iterator.
 
         Complete an async iterator value by completing the result and calling
-        recursively until all the results are completed.
+        recursively until all the results are completed. The items of list chunks
+        yielded by the async iterator are completed as if yielded one by one, but
+        leaf values are completed in bulk where possible.
+
+        If the executor reads ahead, the completion of items that is pending is
+        run in tasks, and items are read ahead while at most the given number of
+        items are still being completed. Otherwise, all items are read first.
+        If the execution is cancelled while reading, these tasks are cancelled
+        and the async iterator is closed.
         """
         is_awaitable = self.is_awaitable
         complete_list_item_value = self.complete_list_item_value
@@ -1272,6 +1900,17 @@ class Executor(Generic[TContext]):
         awaitable_indices: list[int] = []
         append_awaitable = awaitable_indices.append
         stream_usage = self.get_stream_usage(field_details_list, path)
+        # the items of list chunks can be completed in bulk if they are leaf values
+        leaf_item_type: GraphQLLeafType | None = None
+        if stream_usage is None:
+            nullable_item_type = get_nullable_type(item_type)
+            if is_leaf_type(nullable_item_type):
+                leaf_item_type = nullable_item_type
+        read_ahead = self.read_ahead
+        # the tasks completing items while reading ahead
+        pending: set[Future[Any]] = set()
+        # the remaining items of a list chunk
+        chunk_items: deque[Any] = deque()
         try:
             early_return = async_iterator.aclose  # type: ignore[attr-defined]
         except AttributeError:
@@ -1285,7 +1924,9 @@ class Executor(Generic[TContext]):
                     and self.handle_stream(
                         index,
                         path,
-                        async_iterator,
+                        prepend_items(chunk_items, async_iterator)
+                        if chunk_items
+                        else async_iterator,
                         True,
                         stream_usage,
                         info,
@@ -1294,16 +1935,37 @@ class Executor(Generic[TContext]):
                 ):
                     break
 
-                item_path = path.add_key(index, None)
-                try:
-                    item = await anext(async_iterator)
-                except StopAsyncIteration:
-                    break
-                except Exception as raw_error:
-                    raise located_error(
-                        raw_error, to_nodes(field_details_list), path.as_list()
-                    ) from raw_error
-
+                if chunk_items:
+                    item = chunk_items.popleft()
+                else:
+                    while read_ahead is not None and len(pending) > read_ahead:
+                        done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                        for task in done:
+                            # raise errors that have been propagated to the list
+                            task.result()
+                    try:
+                        item = await anext(async_iterator)
+                    except StopAsyncIteration:
+                        break
+                    except Exception as raw_error:
+                        raise located_error(
+                            raw_error, to_nodes(field_details_list), path.as_list()
+                        ) from raw_error
+                    if isinstance(item, ListChunk):
+                        iterator = iter(item.items)
+                        if leaf_item_type is not None:
+                            item = self.complete_leaf_list_items(
+                                leaf_item_type, iterator, completed_results
+                            )
+                            index = len(completed_results)
+                            if item is Undefined:
+                                continue
+                            # complete the remaining items normally
+                            chunk_items.append(item)
+                        chunk_items.extend(iterator)
+                        continue
+
+                item_path = Path(path, index, None)
                 if is_awaitable(item):
                     append_completed(
                         complete_awaitable_list_item_value(
@@ -1315,9 +1977,7 @@ class Executor(Generic[TContext]):
                             position_context,
                         )
                     )
-                    append_awaitable(index)
-
-                elif complete_list_item_value(
+                elif not complete_list_item_value(
                     item,
                     completed_results,
                     item_type,
@@ -1326,7 +1986,15 @@ class Executor(Generic[TContext]):
                     item_path,
                     position_context,
                 ):
-                    append_awaitable(index)
+                    index += 1
+                    continue
+
+                append_awaitable(index)
+                if read_ahead is not None:
+                    task = completed_results[index] = ensure_future(
+                        completed_results[index]
+                    )
+                    pending.add(task)
 
                 index += 1
         except Exception:
@@ -1340,23 +2008,22 @@ class Executor(Generic[TContext]):
                     [completed_results[index] for index in awaitable_indices]
                 )
             raise
+        except BaseException:
+            # The execution has been cancelled: cancel the completion of the items
+            # that have been read ahead and wait until it is settled, and close the
+            # async iterator.
+            for task in pending:
+                task.cancel()
+            if early_return is not None:  # pragma: no branch
+                with suppress_exceptions:
+                    await early_return()
+            await gather(*pending, return_exceptions=True)
+            raise
 
         if not awaitable_indices:
             return completed_results
 
-        if len(awaitable_indices) == 1:
-            # If there is only one index, avoid the overhead of parallelization.
-            index = awaitable_indices[0]
-            completed_results[index] = await completed_results[index]
-        else:
-            awaited_results = await gather_with_cancel(
-                *(completed_results[index] for index in awaitable_indices)
-            )
-            for index, sub_result in zip(
-                awaitable_indices, awaited_results, strict=True
-            ):
-                completed_results[index] = sub_result
-        return completed_results
+        return await self.await_completed_items(completed_results, awaitable_indices)
 
     def complete_list_value(
         self,
@@ -1411,6 +2078,106 @@ class Executor(Generic[TContext]):
         position_context: TContext | None,
     ) -> AwaitableOrValue[list[Any]]:
         """Complete an iterable value."""
+        stream_usage = self.get_stream_usage(field_details_list, path)
+        leaf_item_type: GraphQLLeafType | None = None
+        if stream_usage is None:
+            nullable_item_type = get_nullable_type(item_type)
+            if is_leaf_type(nullable_item_type):
+                leaf_item_type = nullable_item_type
+                coerce_output_values = getattr(
+                    leaf_item_type, "coerce_output_values", None
+                )
+                if coerce_output_values is not None and (
+                    isinstance(items, list | tuple) or is_array_like(items)
+                ):
+                    # if coercion fails, coerce the items separately below
+                    with suppress_exceptions:
+                        return coerce_output_values(items)
+            elif is_object_type(nullable_item_type) and self.has_batched_fields(
+                nullable_item_type
+            ):
+                if not isinstance(items, list | tuple):
+                    items = list(items)
+                prefetched = self.prefetch_batched_fields(
+                    nullable_item_type, field_details_list, items, path
+                )
+                if prefetched:
+                    return self.complete_prefetched_iterable_items(
+                        prefetched,
+                        item_type,
+                        field_details_list,
+                        info,
+                        path,
+                        items,
+                        position_context,
+                    )
+        return self.complete_iterable_items(
+            item_type,
+            field_details_list,
+            info,
+            path,
+            items,
+            stream_usage,
+            leaf_item_type,
+            position_context,
+        )
+
+    def complete_prefetched_iterable_items(
+        self,
+        prefetched: list[tuple[Any, list[tuple[int, int]]]],
+        item_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        items: list[Any] | tuple[Any, ...],
+        position_context: TContext | None,
+    ) -> AwaitableOrValue[list[Any]]:
+        """Complete the items of a list whose batched subfields have been prefetched.
+
+        The prefetched values that have not been used are discarded when the list
+        has been completed, e.g. because the completion failed at an earlier item.
+        """
+        try:
+            completed = self.complete_iterable_items(
+                item_type,
+                field_details_list,
+                info,
+                path,
+                items,
+                None,
+                None,
+                position_context,
+            )
+        except Exception:
+            self.discard_batched_values(prefetched)
+            raise
+        if self.is_awaitable(completed):
+
+            async def await_completed() -> list[Any]:
+                try:
+                    return await completed
+                finally:
+                    self.discard_batched_values(prefetched)
+
+            return await_completed()
+        self.discard_batched_values(prefetched)
+        return completed
+
+    def complete_iterable_items(
+        self,
+        item_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        items: Iterable[Any],
+        stream_usage: StreamUsage | None,
+        leaf_item_type: GraphQLLeafType | None,
+        position_context: TContext | None,
+    ) -> AwaitableOrValue[list[Any]]:
+        """Complete the items of an iterable value.
+
+        For internal use only.
+        """
         # This is specified as a simple map, however we're optimizing the path
         # where the list contains no awaitable routine objects by avoiding creating
         # another awaitable object.
@@ -1421,10 +2188,32 @@ class Executor(Generic[TContext]):
         append_completed = completed_results.append
         awaitable_indices: list[int] = []
         append_awaitable = awaitable_indices.append
-        stream_usage = self.get_stream_usage(field_details_list, path)
-        iterator = iter(items)
+        iterator: Iterator[Any] = iter(items)
         index = 0
         try:
+            if leaf_item_type is not None:
+                item = self.complete_leaf_list_items(
+                    leaf_item_type, iterator, completed_results
+                )
+                if item is Undefined:
+                    return completed_results
+                # complete the remaining items normally
+                iterator = chain((item,), iterator)
+                index = len(completed_results)
+            if stream_usage is None and self.yields_cooperatively(items):
+                cooperative_completion = self.complete_iterable_items_cooperatively(
+                    item_type,
+                    field_details_list,
+                    info,
+                    path,
+                    iterator,
+                    completed_results,
+                    position_context,
+                )
+                if is_awaitable(cooperative_completion):
+                    return cooperative_completion
+                # the executor does not accept awaitable values
+                cooperative_completion.close()
             while True:
                 if (
                     stream_usage
@@ -1448,7 +2237,7 @@ class Executor(Generic[TContext]):
 
                 # No need to modify the info object containing the path,
                 # since from here on it is not ever accessed by resolver functions.
-                item_path = path.add_key(index, None)
+                item_path = Path(path, index, None)
 
                 if is_awaitable(item):
                     append_completed(
@@ -1488,22 +2277,347 @@ class Executor(Generic[TContext]):
         if not awaitable_indices:
             return completed_results
 
-        async def get_completed_results() -> list[Any]:
-            if len(awaitable_indices) == 1:
-                # If there is only one index, avoid the overhead of parallelization.
-                index = awaitable_indices[0]
-                completed_results[index] = await completed_results[index]
-            else:
-                awaited_results = await gather_with_cancel(
-                    *(completed_results[index] for index in awaitable_indices)
-                )
-                for index, sub_result in zip(
-                    awaitable_indices, awaited_results, strict=True
+        return self.await_completed_items(completed_results, awaitable_indices)
+
+    async def complete_iterable_items_cooperatively(
+        self,
+        item_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        iterator: Iterator[Any],
+        completed_results: list[Any],
+        position_context: TContext | None,
+    ) -> list[Any]:
+        """Complete the remaining items of an iterable, yielding to the event loop.
+
+        The items are completed like in :meth:`complete_iterable_value`, but the
+        control is given back to the event loop whenever the configured number of
+        items has been completed or the configured time has been spent completing
+        items since the last time, so that other tasks are not starved. If the
+        execution has been aborted in the meantime, the completion is stopped.
+        """
+        is_awaitable = self.is_awaitable
+        complete_list_item_value = self.complete_list_item_value
+        complete_awaitable_list_item_value = self.complete_awaitable_list_item_value
+        append_completed = completed_results.append
+        awaitable_indices: list[int] = []
+        append_awaitable = awaitable_indices.append
+        abort_signal = self.abort_signal
+        yield_every_items = self.yield_every_items
+        yield_every_seconds = self.yield_every_seconds
+        index = len(completed_results)
+        count = 0
+        started = perf_counter()
+        try:
+            for item in iterator:
+                if (yield_every_items is not None and count >= yield_every_items) or (
+                    yield_every_seconds is not None
+                    and perf_counter() - started >= yield_every_seconds
+                ):
+                    await sleep(0)
+                    if abort_signal is not None and abort_signal.aborted:
+                        raise self.abort_error()  # noqa: TRY301
+                    count = 0
+                    started = perf_counter()
+
+                item_path = Path(path, index, None)
+
+                if is_awaitable(item):
+                    append_completed(
+                        complete_awaitable_list_item_value(
+                            item,
+                            item_type,
+                            field_details_list,
+                            info,
+                            item_path,
+                            position_context,
+                        )
+                    )
+                    append_awaitable(index)
+
+                elif complete_list_item_value(
+                    item,
+                    completed_results,
+                    item_type,
+                    field_details_list,
+                    info,
+                    item_path,
+                    position_context,
                 ):
-                    completed_results[index] = sub_result
+                    append_awaitable(index)
+
+                index += 1
+                count += 1
+        except Exception:
+            maybe_awaitables = [completed_results[index] for index in awaitable_indices]
+            maybe_awaitables.extend(collect_iterator_awaitables(iterator, is_awaitable))
+            if maybe_awaitables:
+                self.settle_in_background(maybe_awaitables)
+            raise
+
+        if not awaitable_indices:
             return completed_results
 
-        return get_completed_results()
+        return await self.await_completed_items(completed_results, awaitable_indices)
+
+    async def await_completed_items(
+        self, completed_results: list[Any], awaitable_indices: list[int]
+    ) -> list[Any]:
+        """Await the completed list items at the given indices and return the list."""
+        if len(awaitable_indices) == 1:
+            # If there is only one index, avoid the overhead of parallelization.
+            index = awaitable_indices[0]
+            completed_results[index] = await completed_results[index]
+        else:
+            awaited_results = await self.gather_awaitables(
+                *(completed_results[index] for index in awaitable_indices)
+            )
+            for index, sub_result in zip(
+                awaitable_indices, awaited_results, strict=True
+            ):
+                completed_results[index] = sub_result
+        return completed_results
+
+    def yields_cooperatively(self, items: Iterable[Any]) -> bool:
+        """Check whether the completion of the given items yields to the event loop.
+
+        This is the case if yielding has been configured, the list is not known to
+        be too small for yielding, and there is a running event loop.
+        """
+        yield_every_items = self.yield_every_items
+        if self.yield_every_seconds is None and (
+            yield_every_items is None
+            or (isinstance(items, Sized) and len(items) <= yield_every_items)
+        ):
+            return False
+        try:
+            get_running_loop()
+        except RuntimeError:
+            return False
+        return True
+
+    def complete_leaf_list_items(
+        self,
+        item_type: GraphQLLeafType,
+        iterator: Iterator[Any],
+        completed_results: list[Any],
+    ) -> Any:
+        """Complete the items of a list of leaf values in bulk.
+
+        Coerces the items and adds them to the completed results until an item is
+        found that must be completed normally, because it is null, awaitable, an
+        error or cannot be coerced. Returns that item, or Undefined if all items
+        have been completed.
+        """
+        coerce_output_value = item_type.coerce_output_value
+        is_awaitable = self.is_awaitable
+        append_completed = completed_results.append
+        for item in iterator:
+            if item.__class__ not in PLAIN_TYPES and (
+                item is None
+                or item is Undefined
+                or isinstance(item, Exception)
+                or is_awaitable(item)
+            ):
+                return item
+            try:
+                completed = coerce_output_value(item)
+            except Exception:
+                return item
+            if completed is None or completed is Undefined:
+                return item
+            append_completed(completed)
+        return Undefined
+
+    def has_batched_fields(self, object_type: GraphQLObjectType) -> bool:
+        """Check whether the given object type has fields with batch resolvers."""
+        batched_types = self._batched_types
+        has_batched_fields = batched_types.get(object_type)
+        if has_batched_fields is None:
+            has_batched_fields = batched_types[object_type] = any(
+                field.batch_resolve is not None for field in object_type.fields.values()
+            )
+        return has_batched_fields
+
+    def prefetch_batched_fields(
+        self,
+        object_type: GraphQLObjectType,
+        field_details_list: FieldDetailsList,
+        items: list[Any] | tuple[Any, ...],
+        path: Path,
+    ) -> list[tuple[Any, list[tuple[int, int]]]]:
+        """Resolve the batched subfields of the given list items.
+
+        Calls the batch resolver of each selected subfield once for all items of
+        the list, so that the values are already available when the subfields of
+        the items are executed. Fields in deferred fragments are not prefetched.
+        Returns the values of the batch resolvers with the keys under which they
+        have been stored for the items.
+        """
+        is_awaitable = self.is_awaitable
+        indices = [
+            index
+            for index, item in enumerate(items)
+            if item is not None
+            and not isinstance(item, Exception)
+            and not is_awaitable(item)
+        ]
+        prefetched: list[tuple[Any, list[tuple[int, int]]]] = []
+        if not indices:
+            return prefetched
+        sources = [items[index] for index in indices]
+        batched_values = self._batched_values
+        grouped_field_set = self.collect_subfields(
+            object_type, field_details_list
+        ).grouped_field_set
+        fields = object_type.fields
+        for response_name, sub_field_details_list in grouped_field_set.items():
+            first_field_details = sub_field_details_list[0]
+            if first_field_details.defer_usage is not None:
+                continue
+            field_def = fields.get(first_field_details.node.name.value)
+            if field_def is None or field_def.batch_resolve is None:
+                continue
+            info = self.build_resolve_info(
+                field_def,
+                to_nodes(sub_field_details_list),
+                object_type,
+                Path(path.add_key(indices[0]), response_name, object_type.name),
+            )
+            try:
+                args = self.get_argument_values(field_def, first_field_details)
+            except Exception:  # noqa: S112
+                # the error will be reported when executing the field
+                continue
+            values = self.call_batch_resolver(
+                field_def.batch_resolve, object_type, sources, info, args
+            )
+            field_details_id = id(first_field_details)
+            keys = [(field_details_id, id(source)) for source in sources]
+            for index, (key, source) in enumerate(zip(keys, sources, strict=True)):
+                batched_values[key] = source, values, index
+            prefetched.append((values, keys))
+        return prefetched
+
+    def discard_batched_values(
+        self, prefetched: list[tuple[Any, list[tuple[int, int]]]]
+    ) -> None:
+        """Discard prefetched values of batched fields that have not been used.
+
+        If the awaitable values of a batch resolver have not been used for any item,
+        they are settled in the background, so that their errors are observed.
+        """
+        batched_values = self._batched_values
+        is_awaitable = self.is_awaitable
+        unused_awaitables: list[Awaitable[Any]] = []
+        for values, keys in prefetched:
+            unused = 0
+            for key in keys:
+                batched = batched_values.get(key)
+                if batched is not None and batched[1] is values:
+                    del batched_values[key]
+                    unused += 1
+            if unused == len(keys) and is_awaitable(values):
+                unused_awaitables.append(values)
+        if unused_awaitables:
+            self.settle_in_background(unused_awaitables)
+
+    def resolve_cached_field(
+        self,
+        field_cache: FieldCache,
+        resolve_fn: GraphQLFieldResolver,
+        source: Any,
+        info: GraphQLResolveInfo,
+        args: dict[str, Any],
+    ) -> Any:
+        """Resolve the value of a field using the given field cache.
+
+        Returns the cached value if available, otherwise calls the resolver and
+        caches its result.
+        """
+        key = field_cache.get_key(source, args)
+        if key is None:
+            return resolve_fn(source, info, **args)
+        cached_value = field_cache.get(key)
+        if cached_value is not Undefined:
+            return cached_value
+        result = resolve_fn(source, info, **args)
+        if self.is_awaitable(result):
+            awaitable_result = result
+
+            async def await_result() -> Any:
+                value = await awaitable_result
+                if not isinstance(value, Exception):
+                    field_cache.set(key, value)
+                return value
+
+            return await_result()
+        if not isinstance(result, Exception):
+            field_cache.set(key, result)
+        return result
+
+    def resolve_batched_field(
+        self,
+        batch_resolve: GraphQLFieldBatchResolver,
+        field_details_list: FieldDetailsList,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        info: GraphQLResolveInfo,
+        args: dict[str, Any],
+    ) -> Any:
+        """Resolve the value of a field with a batch resolver for the given source.
+
+        Uses the value that has been prefetched for the source if available,
+        otherwise calls the batch resolver with the given source only.
+        """
+        batched = self._batched_values.pop(
+            (id(field_details_list[0]), id(source)), None
+        )
+        if batched is None or batched[0] is not source:
+            values = self.call_batch_resolver(
+                batch_resolve, parent_type, [source], info, args
+            )
+            index = 0
+        else:
+            _source, values, index = batched
+        if isinstance(values, Exception):
+            raise values
+        if self.is_awaitable(values):
+
+            async def get_value() -> Any:
+                return (await values)[index]
+
+            return get_value()
+        return values[index]
+
+    def call_batch_resolver(
+        self,
+        batch_resolve: GraphQLFieldBatchResolver,
+        parent_type: GraphQLObjectType,
+        sources: list[Any],
+        info: GraphQLResolveInfo,
+        args: dict[str, Any],
+    ) -> Any:
+        """Call a batch resolver and check its result.
+
+        Returns the list of values, an awaitable for that list, or the error.
+        """
+        count = len(sources)
+        try:
+            values = batch_resolve(sources, info, **args)
+            if self.is_awaitable(values):
+
+                async def await_values() -> Any:
+                    return check_batched_values(
+                        await values, count, parent_type, info.field_name
+                    )
+
+                # shared by all sources, so it must be a future
+                return ensure_future(await_values()) if count > 1 else await_values()
+            return check_batched_values(values, count, parent_type, info.field_name)
+        except Exception as error:
+            return error
 
     def complete_list_item_value(
         self,
@@ -1572,7 +2686,9 @@ class Executor(Generic[TContext]):
     ) -> Any:
         """Complete an awaitable list item value."""
         try:
-            resolved = await self.with_abort_signal(item)
+            resolved = await self.with_abort_signal(
+                self.limit_concurrency(item, info), info
+            )
             completed = self.complete_value(
                 item_type,
                 field_details_list,
@@ -1624,37 +2740,41 @@ class Executor(Generic[TContext]):
         Complete a value of an abstract type by determining the runtime object type of
         that value, then complete the value for that type.
         """
-        resolve_type_fn = return_type.resolve_type or self.type_resolver
-        runtime_type = resolve_type_fn(result, info, return_type)
-
-        if self.is_awaitable(runtime_type):
-
-            async def await_complete_object_value() -> Any:
-                value = self.complete_object_value(
-                    self.ensure_valid_runtime_type(
-                        await self.with_abort_signal(runtime_type),  # type: ignore
-                        return_type,
-                        field_details_list,
-                        info,
-                        result,
-                    ),
+        cache_resolved_types = return_type.cache_resolved_types
+        if cache_resolved_types:
+            resolved_type = self.schema.get_resolved_type(return_type, result.__class__)
+            if resolved_type is not None:
+                return self.complete_object_value(
+                    resolved_type,
                     field_details_list,
                     info,
                     path,
                     result,
                     position_context,
                 )
-                if self.is_awaitable(value):
-                    return await value
-                return value  # pragma: no cover
 
-            return await_complete_object_value()
+        resolve_type_fn = return_type.resolve_type or self.type_resolver
+        runtime_type = resolve_type_fn(result, info, return_type)
+
+        if self.is_awaitable(runtime_type):
+            return self.complete_awaitable_abstract_value(
+                runtime_type,
+                return_type,
+                field_details_list,
+                info,
+                path,
+                result,
+                position_context,
+            )
         runtime_type = cast("str | None", runtime_type)
 
+        object_type = self.ensure_valid_runtime_type(
+            runtime_type, return_type, field_details_list, info, result
+        )
+        if cache_resolved_types:
+            self.cache_resolved_type(return_type, result, object_type)
         return self.complete_object_value(
-            self.ensure_valid_runtime_type(
-                runtime_type, return_type, field_details_list, info, result
-            ),
+            object_type,
             field_details_list,
             info,
             path,
@@ -1662,6 +2782,55 @@ class Executor(Generic[TContext]):
             position_context,
         )
 
+    async def complete_awaitable_abstract_value(
+        self,
+        runtime_type: Awaitable[str | None],
+        return_type: GraphQLAbstractType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+        position_context: TContext | None,
+    ) -> dict[str, Any]:
+        """Complete an abstract value with an awaitable runtime type."""
+        object_type = self.ensure_valid_runtime_type(
+            await self.with_abort_signal(runtime_type),
+            return_type,
+            field_details_list,
+            info,
+            result,
+        )
+        if return_type.cache_resolved_types:
+            self.cache_resolved_type(return_type, result, object_type)
+        value = self.complete_object_value(
+            object_type,
+            field_details_list,
+            info,
+            path,
+            result,
+            position_context,
+        )
+        if self.is_awaitable(value):
+            return await value
+        return cast("dict[str, Any]", value)  # pragma: no cover
+
+    def cache_resolved_type(
+        self,
+        abstract_type: GraphQLAbstractType,
+        result: Any,
+        runtime_type: GraphQLObjectType,
+    ) -> None:
+        """Remember the runtime type resolved for the class of the given value.
+
+        Mappings are not cached, since they usually carry their type name.
+
+        For internal use only.
+        """
+        if not isinstance(result, Mapping):
+            self.schema.cache_resolved_type(
+                abstract_type, result.__class__, runtime_type
+            )
+
     def ensure_valid_runtime_type(
         self,
         runtime_type_name: Any,
@@ -1734,24 +2903,15 @@ class Executor(Generic[TContext]):
             is_type_of = return_type.is_type_of(result, info)
 
             if self.is_awaitable(is_type_of):
-
-                async def execute_subfields_async() -> dict[str, Any]:
-                    if not await self.with_abort_signal(is_type_of):
-                        raise invalid_return_type_error(
-                            return_type, result, field_details_list
-                        )
-                    sub_fields = self.collect_and_execute_subfields(
-                        return_type,
-                        field_details_list,
-                        path,
-                        result,
-                        position_context,
-                    )
-                    if self.is_awaitable(sub_fields):
-                        return await sub_fields
-                    return cast("dict[str, Any]", sub_fields)  # pragma: no cover
-
-                return execute_subfields_async()
+                return self.complete_awaitable_object_value(
+                    is_type_of,
+                    return_type,
+                    field_details_list,
+                    info,
+                    path,
+                    result,
+                    position_context,
+                )
 
             if not is_type_of:
                 raise invalid_return_type_error(return_type, result, field_details_list)
@@ -1764,6 +2924,30 @@ class Executor(Generic[TContext]):
             position_context,
         )
 
+    async def complete_awaitable_object_value(
+        self,
+        is_type_of: Awaitable[bool],
+        return_type: GraphQLObjectType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+        position_context: TContext | None,
+    ) -> dict[str, Any]:
+        """Complete an Object value with an awaitable result of ``is_type_of()``."""
+        if not await self.with_abort_signal(is_type_of):
+            raise invalid_return_type_error(return_type, result, field_details_list)
+        sub_fields = self.collect_and_execute_subfields(
+            return_type,
+            field_details_list,
+            path,
+            result,
+            position_context,
+        )
+        if self.is_awaitable(sub_fields):
+            return await sub_fields
+        return cast("dict[str, Any]", sub_fields)  # pragma: no cover
+
     def collect_and_execute_subfields(
         self,
         return_type: GraphQLObjectType,
@@ -1827,24 +3011,174 @@ class Executor(Generic[TContext]):
         )
         collected_fields: CollectedFields | None = relevant_sub_fields.get(key)
         if collected_fields is None:
-            collected_fields = collect_subfields(
-                self.schema,
-                self.fragments,
-                self.variable_values,
-                self.operation,
-                return_type,
-                field_details_list,
-                self.hide_suggestions,
+            compiled_operation = self.compiled_operation
+            collected_fields = (
+                collect_subfields(
+                    self.schema,
+                    self.fragments,
+                    self.variable_values,
+                    self.operation,
+                    return_type,
+                    field_details_list,
+                    self.hide_suggestions,
+                )
+                if compiled_operation is None
+                else compiled_operation.collect_subfields(
+                    key, return_type, field_details_list, self.variable_values
+                )
             )
             relevant_sub_fields[key] = collected_fields
         return collected_fields
 
 
+class ExecutableDefinitions(NamedTuple):
+    """The operation to execute together with the fragments of the document."""
+
+    operation: OperationDefinitionNode
+    fragment_definitions: dict[str, FragmentDefinitionNode]
+    fragments: dict[str, FragmentDetails]
+
+
+def get_executable_definitions(
+    schema: GraphQLSchema, document: DocumentNode, operation_name: str | None
+) -> list[GraphQLError] | ExecutableDefinitions:
+    """Get the operation with the given name and the fragments of the document.
+
+    Returns a list of errors if the operation cannot be determined unambiguously
+    or if the variable signatures of the fragments are invalid.
+
+    For internal use only.
+    """
+    operation: OperationDefinitionNode | None = None
+    fragment_definitions: dict[str, FragmentDefinitionNode] = {}
+    fragments: dict[str, FragmentDetails] = {}
+    fragment_variable_signature_errors: list[GraphQLError] = []
+
+    for definition in document.definitions:
+        if isinstance(definition, OperationDefinitionNode):
+            if operation_name is None:
+                if operation:
+                    return [
+                        GraphQLError(
+                            "Must provide operation name"
+                            " if query contains multiple operations."
+                        )
+                    ]
+                operation = definition
+            elif definition.name and definition.name.value == operation_name:
+                operation = definition
+        elif isinstance(definition, FragmentDefinitionNode):
+            fragment_definitions[definition.name.value] = definition
+            variable_signatures: dict[str, GraphQLVariableSignature] | None = None
+            if definition.variable_definitions:
+                variable_signatures = {}
+                for var_def in definition.variable_definitions:
+                    signature = get_variable_signature(schema, var_def)
+                    if isinstance(signature, GraphQLError):
+                        fragment_variable_signature_errors.append(signature)
+                        continue
+                    variable_signatures[signature.name] = signature
+            fragments[definition.name.value] = FragmentDetails(
+                definition, variable_signatures
+            )
+
+    if not operation:
+        if operation_name is not None:
+            return [GraphQLError(f"Unknown operation named '{operation_name}'.")]
+        return [GraphQLError("Must provide an operation.")]
+
+    if fragment_variable_signature_errors:
+        return fragment_variable_signature_errors
+
+    return ExecutableDefinitions(operation, fragment_definitions, fragments)
+
+
+def get_middleware_manager(middleware: Middleware | None) -> MiddlewareManager | None:
+    """Get a middleware manager for the given middleware.
+
+    For internal use only.
+    """
+    if middleware is None:
+        return None
+    if isinstance(middleware, (list, tuple)):
+        return MiddlewareManager(*middleware)
+    if isinstance(middleware, MiddlewareManager):
+        return middleware
+    msg = (
+        "Middleware must be passed as a list or tuple of functions"
+        " or objects, or as a single MiddlewareManager object."
+        f" Got {inspect(middleware)} instead."
+    )
+    raise TypeError(msg)
+
+
+def has_field_limits(schema: GraphQLSchema) -> bool:
+    """Check whether the given schema has fields with a timeout or max concurrency.
+
+    The result is memoized per schema, so these settings of the fields should not
+    be changed after the schema has been used for execution.
+    """
+    has_limits = _schema_field_limits.get(schema)
+    if has_limits is None:
+        has_limits = _schema_field_limits[schema] = any(
+            field.timeout is not None or field.max_concurrency is not None
+            for type_ in schema.type_map.values()
+            if is_object_type(type_)
+            for field in type_.fields.values()
+        )
+    return has_limits
+
+
+def is_shareable(value: Any) -> bool:
+    """Check whether the given coerced value can be shared between resolver calls.
+
+    This is the case for immutable values and for lists and dicts containing only
+    such values, provided that these lists and dicts are copied for every call.
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, dict):
+        return all(is_shareable(item) for item in value.values())
+    if isinstance(value, list):
+        return all(is_shareable(item) for item in value)
+    return False
+
+
+def copy_containers(value: Any) -> Any:
+    """Copy the given value if it is a list or dict, including nested ones."""
+    if isinstance(value, dict):
+        return {key: copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_containers(item) for item in value]
+    return value
+
+
 def to_nodes(field_details_list: FieldDetailsList) -> list[FieldNode]:
     """Convert a field group to a list of field nodes."""
     return [field_details.node for field_details in field_details_list]
 
 
+def check_batched_values(
+    values: Any, count: int, parent_type: GraphQLObjectType, field_name: str
+) -> list[Any] | tuple[Any, ...]:
+    """Check that a batch resolver returned one value for each source."""
+    if not isinstance(values, list | tuple):
+        if not is_iterable(values):
+            msg = (
+                f"Batch resolver for field '{parent_type}.{field_name}'"
+                f" must return an iterable, but returned {inspect(values)}."
+            )
+            raise GraphQLError(msg)
+        values = list(values)
+    if len(values) != count:
+        msg = (
+            f"Batch resolver for field '{parent_type}.{field_name}'"
+            f" must return {count} values, but returned {len(values)}."
+        )
+        raise GraphQLError(msg)
+    return values
+
+
 def invalid_return_type_error(
     return_type: GraphQLObjectType, result: Any, field_details_list: FieldDetailsList
 ) -> GraphQLError:
@@ -1855,6 +3189,14 @@ def invalid_return_type_error(
     )
 
 
+def is_array_like(value: Any) -> bool:
+    """Check whether the given value is an array of numbers.
+
+    This includes arrays from the standard library and from NumPy.
+    """
+    return isinstance(value, array) or hasattr(value, "__array__")
+
+
 def collect_iterator_awaitables(
     iterator: Iterator[Any], is_awaitable: Callable[[Any], bool]
 ) -> list[Awaitable[Any]]:
@@ -1869,6 +3211,58 @@ def collect_iterator_awaitables(
     return awaitables
 
 
+async def await_with_semaphores(
+    awaitable: Awaitable[T], semaphores: list[Semaphore]
+) -> T:
+    """Await the given awaitable while holding all given semaphores.
+
+    If waiting for the semaphores is cancelled, a coroutine that has not been
+    started yet is closed, so that it does not need to be awaited any more.
+    """
+    acquired: list[Semaphore] = []
+    try:
+        try:
+            for semaphore in semaphores:
+                await semaphore.acquire()
+                acquired.append(semaphore)
+        except BaseException:
+            if iscoroutine(awaitable):
+                awaitable.close()
+            raise
+        return await awaitable
+    finally:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+
+
+async def prepend_items(
+    items: Iterable[Any], async_iterator: AsyncIterator[Any]
+) -> AsyncGenerator[Any, None]:
+    """Yield the given items, then the items of the given async iterator.
+
+    The async iterator is closed when the returned async generator is closed.
+    """
+    try:
+        for item in items:
+            yield item
+        while True:
+            try:
+                item = await anext(async_iterator)
+            except StopAsyncIteration:
+                break
+            yield item
+    finally:
+        aclose = getattr(async_iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def set_timed_out(settled: Future[bool]) -> None:
+    """Mark the given future of a tracked task as timed out if it is not settled."""
+    if not settled.done():
+        settled.set_result(True)
+
+
 def get_typename(value: Any) -> str | None:
     """Get the ``__typename`` property of the given value."""
     if isinstance(value, Mapping):
@@ -1892,6 +3286,9 @@ def default_type_resolver(
     First, See if the provided value has a ``__typename`` field defined, if so, use that
     value as name of the resolved type.
 
+    Then, use the type that has been bound to the class of the value or cached for it
+    (see :meth:`~graphql.type.GraphQLSchema.get_resolved_type`).
+
     Otherwise, test each possible type for the abstract type by calling
     :meth:`~graphql.type.GraphQLObjectType.is_type_of` for the object
     being coerced, returning the first type that matches.
@@ -1901,8 +3298,14 @@ def default_type_resolver(
     if isinstance(type_name, str):
         return type_name
 
+    # Then, look for a type bound to or cached for the class of the value.
+    schema = info.schema
+    resolved_type = schema.get_resolved_type(abstract_type, value.__class__)
+    if resolved_type is not None:
+        return resolved_type.name
+
     # Otherwise, test each possible type.
-    possible_types = info.schema.get_possible_types(abstract_type)
+    possible_types = schema.get_possible_types(abstract_type)
     is_awaitable = info.is_awaitable
     awaitable_is_type_of_results: list[Awaitable[bool]] = []
     append_awaitable_result = awaitable_is_type_of_results.append
@@ -1946,6 +3349,54 @@ def default_type_resolver(
     return None
 
 
+def get_field_accessor(source_class: type, field_name: str) -> FieldAccessor:
+    """Get a function resolving a field for source values of the given class.
+
+    The returned function is called with the source value, the resolve info and the
+    argument values, and resolves the field in the same way as the default field
+    resolver, but without checking the type of the source value.
+
+    If the field is a method defined in the class, the returned function calls it
+    directly, so methods must not be shadowed by attributes of the instances.
+    Items of mappings and other attributes are only called if they are callable,
+    since this can differ between the source values.
+    """
+    if issubclass(source_class, Mapping):
+        get_item = methodcaller("get", field_name)
+
+        def get_item_value(
+            source: Any, info: GraphQLResolveInfo, args: dict[str, Any]
+        ) -> Any:
+            value = get_item(source)
+            return value(get_resolve_info(info), **args) if callable(value) else value
+
+        return get_item_value
+
+    if isinstance(getattr_static(source_class, field_name, None), FunctionType):
+        method = getattr(source_class, field_name)
+
+        def call_method(
+            source: Any, info: GraphQLResolveInfo, args: dict[str, Any]
+        ) -> Any:
+            return method(source, get_resolve_info(info), **args)
+
+        return call_method
+
+    get_attribute = attrgetter(field_name)
+
+    def get_attribute_value(
+        source: Any, info: GraphQLResolveInfo, args: dict[str, Any]
+    ) -> Any:
+        try:
+            value = get_attribute(source)
+        except AttributeError:
+            return None
+        return value(get_resolve_info(info), **args) if callable(value) else value
+
+    return get_attribute_value
+
+
+@lazy_resolve_info
 def default_field_resolver(source: Any, info: GraphQLResolveInfo, **args: Any) -> Any:
     """Default field resolver.
 
@@ -1965,5 +3416,5 @@ def default_field_resolver(source: Any, info: GraphQLResolveInfo, **args: Any) -
         else getattr(source, field_name, None)
     )
     if callable(value):
-        return value(info, **args)
+        return value(get_resolve_info(info), **args)
     return value
@@ -0,0 +1,125 @@
+"""Caching of the results of field resolvers"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from json import dumps
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from ..pyutils import Undefined
+from .source_id import get_source_id
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+__all__ = ["FieldCache", "default_field_cache_key"]
+
+
+def default_field_cache_key(source: Any, args: dict[str, Any]) -> Hashable | None:
+    """Get the key for caching the result of a field resolver.
+
+    The key is made of the ``id`` of the source value (see
+    :func:`~graphql.execution.get_source_id`) and the arguments serialized as JSON.
+    A source value of None is accepted for root fields. Returns None if the result
+    cannot be cached, because the source value has no id or the arguments cannot be
+    serialized as JSON.
+    """
+    if source is None:
+        source_key = None
+    else:
+        source_key = get_source_id(source)
+        if source_key is None:
+            return None
+    if not args:
+        return source_key, None
+    try:
+        args_key = dumps(args, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return source_key, args_key
+
+
+class FieldCache:
+    """In-memory cache for the results of a field resolver.
+
+    An instance of this class can be passed as ``cache`` to a
+    :class:`~graphql.type.GraphQLField`. Before the resolver of the field is called,
+    the executor looks up the key given by ``get_key`` for the source value and the
+    arguments of the field, which defaults to :func:`default_field_cache_key`. If a
+    result is cached under this key, it is used without calling the resolver and its
+    middleware. Otherwise, the result of the resolver is cached for ``max_age``
+    seconds, unless it is an error. Results are not cached if the key is None.
+
+    If more than ``max_size`` results are cached, the least recently used result is
+    discarded. The numbers of cache hits and misses are counted in :attr:`hits` and
+    :attr:`misses`.
+
+    Since the keys do not identify the field, every field needs its own cache.
+    Cached results are shared by all executions, so they must not be modified, and
+    must not be iterators or generators that can only be consumed once. Since the
+    cache does not know the context value, the resolver must not return different
+    results for different users. The cache can be shared by executions running in
+    different threads, since its entries are only accessed while holding a lock.
+    """
+
+    __slots__ = "_entries", "_lock", "get_key", "hits", "max_age", "max_size", "misses"
+
+    max_age: float
+    max_size: int
+    get_key: Callable[[Any, dict[str, Any]], Hashable | None]
+    hits: int
+    misses: int
+
+    _entries: OrderedDict[Hashable, tuple[Any, float]]
+    _lock: Lock
+
+    def __init__(
+        self,
+        max_age: float,
+        max_size: int = 1000,
+        get_key: Callable[
+            [Any, dict[str, Any]], Hashable | None
+        ] = default_field_cache_key,
+    ) -> None:
+        self.max_age = max_age
+        self.max_size = max_size
+        self.get_key = get_key
+        self.hits = self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        """Get the result cached under the given key.
+
+        Returns Undefined if no result is cached under the key or if it expired.
+        """
+        entries = self._entries
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None:
+                if entry[1] > monotonic():
+                    entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[0]
+                del entries[key]
+            self.misses += 1
+        return Undefined
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache the given result under the given key."""
+        entries = self._entries
+        with self._lock:
+            entries.pop(key, None)
+            entries[key] = value, monotonic() + self.max_age
+            while len(entries) > self.max_size:
+                entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Discard all cached results."""
+        with self._lock:
+            self._entries.clear()
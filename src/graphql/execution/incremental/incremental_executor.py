@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from asyncio import ensure_future, gather
+from collections import deque
 from contextlib import suppress
 from copy import copy
 from typing import TYPE_CHECKING, Any, NamedTuple, cast
@@ -17,6 +18,7 @@ from ..executor import (
     collect_iterator_awaitables,
     to_nodes,
 )
+from ..list_chunk import ListChunk
 from .build_execution_plan import build_execution_plan
 from .computation import Computation
 from .incremental_publisher import IncrementalPublisher
@@ -638,19 +640,29 @@ class IncrementalExecutor(Executor[DeliveryGroupMap]):
 
         async def produce(queue: StreamItemQueue) -> None:
             index = initial_index
+            # the remaining items of a list chunk
+            chunk_items: deque[Any] = deque()
             while True:
-                try:
-                    item = (
-                        await anext(cast("AsyncIterator[Any]", iterator))
-                        if is_async
-                        else next(cast("Iterator[Any]", iterator))
-                    )
-                except (StopAsyncIteration, StopIteration):
-                    return
-                except Exception as raw_error:
-                    raise located_error(
-                        raw_error, to_nodes(field_details_list), stream_path.as_list()
-                    ) from raw_error
+                if chunk_items:
+                    item = chunk_items.popleft()
+                else:
+                    try:
+                        item = (
+                            await anext(cast("AsyncIterator[Any]", iterator))
+                            if is_async
+                            else next(cast("Iterator[Any]", iterator))
+                        )
+                    except (StopAsyncIteration, StopIteration):
+                        return
+                    except Exception as raw_error:
+                        raise located_error(
+                            raw_error,
+                            to_nodes(field_details_list),
+                            stream_path.as_list(),
+                        ) from raw_error
+                    if is_async and isinstance(item, ListChunk):
+                        chunk_items.extend(item.items)
+                        continue
 
                 item_path = stream_path.add_key(index, None)
 
@@ -0,0 +1,322 @@
+"""Executor generating specialized Python code"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+from weakref import WeakKeyDictionary
+
+from ..pyutils import Path, RefMap, Undefined
+from ..type import TypeNameMetaFieldDef, get_nullable_type, is_leaf_type
+from .executor import PLAIN_TYPES, default_field_resolver, to_nodes
+from .incremental import IncrementalExecutor
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    from ..pyutils import AwaitableOrValue
+    from ..type import GraphQLField, GraphQLObjectType, GraphQLSchema
+    from .collect_fields import FieldDetailsList, GroupedFieldSet
+    from .incremental.incremental_executor import DeliveryGroupMap
+
+__all__ = ["JitExecutor", "generate_execute_fields"]
+
+GeneratedExecuteFields: TypeAlias = Callable[..., "AwaitableOrValue[dict[str, Any]]"]
+
+# The signature of a grouped field set is the tuple of its response names together
+# with the names of the corresponding fields.
+FieldsSignature: TypeAlias = tuple[tuple[str, str], ...]
+
+# The generated code is shared between all executions of the same schema.
+_generated_code: WeakKeyDictionary[
+    GraphQLSchema, dict[tuple[GraphQLObjectType, FieldsSignature], Any]
+] = WeakKeyDictionary()
+
+
+class JitExecutor(IncrementalExecutor):
+    """Executor running generated code that is specialized for the operation.
+
+    For each grouped field set of the operation, this executor generates and
+    compiles a Python function that executes the fields of the set. Fields with a
+    leaf type, no arguments and no custom resolver are resolved and completed
+    inline, with the type checks already decided when generating the code, and
+    without creating a path or resolve info. The output coercion function is still
+    looked up on the leaf type when executing, since it can be replaced.
+    All other fields, i.e. fields with arguments, custom or batch resolvers, field
+    caches, pre-serialized JSON values or composite types, are executed normally.
+
+    Whether a field result needs to be awaited is still checked at runtime, since
+    the values read from the source may be awaitable even for fields without custom
+    resolvers, so the generated code handles both synchronous and asynchronous
+    results.
+
+    The generated functions are cached per schema, parent type and signature of the
+    grouped field set, and can therefore be reused across executions. The results
+    are the same as with the default executor.
+
+    Code is only generated when the default field resolver is used without any
+    middleware, otherwise the fields are executed normally.
+    """
+
+    uses_default_resolvers: bool
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.uses_default_resolvers = (
+            self.field_resolver is default_field_resolver
+            and self.middleware_manager is None
+        )
+        # Generated code per grouped field set shared with all sub-executors
+        self._generated_fields: RefMap[GroupedFieldSet, GeneratedExecuteFields] = (
+            RefMap()
+        )
+
+    def execute_fields(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Path | None,
+        grouped_field_set: GroupedFieldSet,
+        position_context: DeliveryGroupMap | None,
+    ) -> AwaitableOrValue[dict[str, Any]]:
+        """Execute the given fields concurrently using generated code."""
+        generated_fields = self._generated_fields
+        execute_fields = generated_fields.get(grouped_field_set)
+        if execute_fields is None:
+            if not (self.uses_default_resolvers and grouped_field_set):
+                return super().execute_fields(
+                    parent_type,
+                    source_value,
+                    path,
+                    grouped_field_set,
+                    position_context,
+                )
+            execute_fields = self.get_execute_fields(parent_type, grouped_field_set)
+            generated_fields[grouped_field_set] = execute_fields
+        cache_hints = self.cache_hints
+        if cache_hints is not None:
+            cache_hints.record(parent_type, source_value, grouped_field_set)
+        return execute_fields(
+            self,
+            parent_type,
+            source_value,
+            path,
+            grouped_field_set,
+            position_context,
+        )
+
+    def get_execute_fields(
+        self, parent_type: GraphQLObjectType, grouped_field_set: GroupedFieldSet
+    ) -> GeneratedExecuteFields:
+        """Get the generated code for executing the given grouped field set."""
+        schema = self.schema
+        signature = tuple(
+            (response_name, field_details_list[0].node.name.value)
+            for response_name, field_details_list in grouped_field_set.items()
+        )
+        key = parent_type, signature
+        try:
+            generated_code = _generated_code[schema]
+        except KeyError:
+            generated_code = _generated_code.setdefault(schema, {})
+        execute_fields = generated_code.get(key)
+        if execute_fields is None:
+            execute_fields = generated_code.setdefault(
+                key, generate_execute_fields(schema, parent_type, signature)
+            )
+        return execute_fields
+
+    def complete_resolved_value(
+        self,
+        parent_type: GraphQLObjectType,
+        field_def: GraphQLField,
+        field_details_list: FieldDetailsList,
+        path: Path,
+        result: Any,
+        position_context: DeliveryGroupMap | None,
+    ) -> AwaitableOrValue[Any]:
+        """Complete a leaf value that has been read by the generated code.
+
+        This is used if the value read from the source by the default field resolver
+        cannot be completed inline, because it must be called, awaited or reported
+        as an error. The field is known to have no arguments.
+        """
+        return_type = field_def.type
+        info = self.build_resolve_info(
+            field_def, to_nodes(field_details_list), parent_type, path
+        )
+        try:
+            if callable(result):
+                result = result(info)
+            if self.is_awaitable(result):
+                return self.complete_awaitable_value(
+                    return_type,
+                    field_details_list,
+                    info,
+                    path,
+                    result,
+                    position_context,
+                )
+            # completing a leaf value never returns an awaitable
+            return self.complete_value(
+                return_type,
+                field_details_list,
+                info,
+                path,
+                result,
+                position_context,
+            )
+        except Exception as raw_error:
+            self.handle_field_error(raw_error, return_type, field_details_list, path)
+            return None
+
+
+def generate_execute_fields(
+    schema: GraphQLSchema,
+    parent_type: GraphQLObjectType,
+    signature: FieldsSignature,
+) -> GeneratedExecuteFields:
+    """Generate a function executing a grouped field set with the given signature.
+
+    The signature is given as a tuple of pairs of response names and field names.
+    The generated function must be called with the executor, the parent type, the
+    source value, the path, the grouped field set and the position context, and
+    returns the results of the fields like :meth:`Executor.execute_fields`.
+    It assumes that the default field resolver is used without middleware.
+    """
+    type_name = parent_type.name
+    namespace: dict[str, Any] = {
+        "Mapping": Mapping,
+        "Path": Path,
+        "Undefined": Undefined,
+        "plain_types": PLAIN_TYPES,
+    }
+    field_list_names = [f"fields_{index}" for index in range(len(signature))]
+    lines = [
+        "def execute_fields(",
+        "    executor, parent_type, source, path, grouped_field_set, position_context",
+        "):",
+        "    results = {}",
+        "    awaitable_fields = []",
+        "    append_awaitable = awaitable_fields.append",
+        "    is_awaitable = executor.is_awaitable",
+        "    execute_field = executor.execute_field",
+        "    execute_field_at = executor.execute_field_at",
+        "    lazy_paths = executor.lazy_paths",
+        "    complete_resolved_value = executor.complete_resolved_value",
+        "    get = source.get if isinstance(source, Mapping) else None",
+        f"    ({', '.join(field_list_names)},) = grouped_field_set.values()",
+        "    try:",
+    ]
+    add_lines = lines.extend
+
+    for index, (response_name, field_name) in enumerate(signature):
+        field_list_name = field_list_names[index]
+        field_path = f"Path(path, {response_name!r}, {type_name!r})"
+        field_def = (
+            schema.get_field(parent_type, field_name)
+            if field_name.startswith("__")
+            else parent_type.fields.get(field_name)
+        )
+
+        if field_def is TypeNameMetaFieldDef:
+            add_lines([f"        results[{response_name!r}] = {type_name!r}"])
+            continue
+
+        return_type = field_def.type if field_def else None
+        nullable_type = get_nullable_type(return_type)
+        if (
+            field_def is None
+            or field_def.resolve is not None
+            or field_def.batch_resolve is not None
+            or field_def.cache is not None
+            or field_def.allow_raw_json
+            or field_def.args
+            or not is_leaf_type(nullable_type)
+        ):
+            add_lines(
+                [
+                    "        result = (",
+                    "            execute_field_at(",
+                    f"                parent_type, source, {field_list_name},"
+                    f" path, {response_name!r}, position_context",
+                    "            )",
+                    "            if lazy_paths",
+                    "            else execute_field(",
+                    f"                parent_type, source, {field_list_name},"
+                    f" {field_path}, position_context",
+                    "            )",
+                    "        )",
+                    "        if result is not Undefined:",
+                    f"            results[{response_name!r}] = result",
+                    "            if is_awaitable(result):",
+                    f"                append_awaitable({response_name!r})",
+                ]
+            )
+            continue
+
+        field_def_name = f"field_def_{index}"
+        leaf_type_name = f"leaf_type_{index}"
+        namespace[field_def_name] = field_def
+        namespace[leaf_type_name] = nullable_type
+        add_lines(
+            [
+                f"        value = get({field_name!r}) if get"
+                f" else getattr(source, {field_name!r}, None)",
+            ]
+        )
+        if nullable_type is return_type:
+            add_lines(
+                [
+                    "        if value is None:",
+                    f"            results[{response_name!r}] = None",
+                    "        else:",
+                ]
+            )
+            indent = " " * 12
+            is_invalid = "callable(value)"
+        else:
+            indent = " " * 8
+            is_invalid = "value is None or callable(value)"
+        add_lines(
+            indent + line
+            for line in (
+                "completed = None",
+                "if value.__class__ in plain_types or not (",
+                f"    {is_invalid}",
+                "    or isinstance(value, Exception)",
+                "    or is_awaitable(value)",
+                "):",
+                "    try:",
+                f"        completed = {leaf_type_name}.coerce_output_value(value)",
+                "    except Exception:",
+                "        pass",
+                "if completed is None or completed is Undefined:",
+                "    completed = complete_resolved_value(",
+                f"        parent_type, {field_def_name}, {field_list_name},",
+                f"        {field_path}, value, position_context",
+                "    )",
+                "    if is_awaitable(completed):",
+                f"        append_awaitable({response_name!r})",
+                f"results[{response_name!r}] = completed",
+            )
+        )
+
+    add_lines(
+        [
+            "    except Exception:",
+            "        if awaitable_fields:",
+            "            executor.settle_in_background(",
+            "                [results[field] for field in awaitable_fields]",
+            "            )",
+            "        raise",
+            "    if not awaitable_fields:",
+            "        return results",
+            "    return executor.await_field_results(results, awaitable_fields)",
+        ]
+    )
+
+    source = "\n".join(lines)
+    filename = f"<generated execute_fields for {type_name}>"
+    exec(compile(source, filename, "exec"), namespace)  # noqa: S102
+    return namespace["execute_fields"]
@@ -0,0 +1,411 @@
+"""Encoding of execution results as JSON"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from json.encoder import JSONEncoder, encode_basestring_ascii
+from math import isfinite
+from typing import TYPE_CHECKING, Any, Protocol
+
+from .raw_json import RawJSON
+from .types import (
+    CompletedResult,
+    ExecutionResult,
+    IncrementalDeferResult,
+    InitialIncrementalExecutionResult,
+    PendingResult,
+    SubsequentIncrementalExecutionResult,
+)
+
+if TYPE_CHECKING:
+    from typing import TypeAlias
+
+    from ..error import GraphQLError
+
+__all__ = [
+    "EncodableResult",
+    "WritableStream",
+    "encode_json",
+    "encode_result",
+    "encode_value",
+    "write_result",
+]
+
+EncodableResult: TypeAlias = (
+    "ExecutionResult | InitialIncrementalExecutionResult"
+    " | SubsequentIncrementalExecutionResult"
+)
+
+Flush: TypeAlias = "Callable[[], None] | None"
+
+# number of chunks after which the chunks are written when writing to a stream
+FLUSH_SIZE = 8192
+
+
+class WritableStream(Protocol):
+    """A stream that bytes can be written to"""
+
+    def write(self, data: bytes, /) -> Any:
+        """Write the given bytes to the stream."""
+
+
+def encode_json(value: Any) -> str:
+    """Encode the given value as compact JSON.
+
+    This can be used to encode the formatted result of an execution when fields may
+    have returned pre-serialized JSON. Values that are instances of
+    :class:`~graphql.execution.RawJSON` are spliced in as they are.
+    """
+    chunks: list[str] = []
+    encode_value(value, chunks)
+    return "".join(chunks)
+
+
+def encode_result(result: EncodableResult) -> bytes:
+    """Encode an execution result as compact JSON.
+
+    The result is encoded directly, without creating its formatted version first.
+    Initial and subsequent results of incremental execution are encoded as the
+    individual payloads, framing them is left to the transport.
+    """
+    chunks: list[str] = []
+    encode_result_object(result, chunks)
+    return "".join(chunks).encode("utf-8")
+
+
+def write_result(result: EncodableResult, stream: WritableStream) -> None:
+    """Write an execution result as compact JSON to a binary stream.
+
+    Like :func:`encode_result`, but the encoded result is written to the stream in
+    pieces, so that large results do not need to be held completely in memory.
+    """
+    chunks: list[str] = []
+    clear = chunks.clear
+    write = stream.write
+
+    def flush() -> None:
+        write("".join(chunks).encode("utf-8"))
+        clear()
+
+    encode_result_object(result, chunks, flush)
+    flush()
+
+
+def encode_result_object(
+    result: EncodableResult, chunks: list[str], flush: Flush = None
+) -> None:
+    """Encode an execution result of any kind."""
+    if isinstance(result, ExecutionResult):
+        encode_execution_result(result, chunks, flush)
+    elif isinstance(result, InitialIncrementalExecutionResult):
+        encode_initial_result(result, chunks, flush)
+    elif isinstance(result, SubsequentIncrementalExecutionResult):
+        encode_subsequent_result(result, chunks, flush)
+    else:
+        msg = f"Cannot encode {result.__class__.__name__} as an execution result."
+        raise TypeError(msg)
+
+
+def encode_execution_result(
+    result: ExecutionResult, chunks: list[str], flush: Flush = None
+) -> None:
+    """Encode the result of a non-incremental execution."""
+    append = chunks.append
+    append('{"data":')
+    encode_value(result.data, chunks, flush)
+    encode_errors(result.errors, chunks)
+    encode_extensions(result.extensions, chunks, flush)
+    append("}")
+
+
+def encode_initial_result(
+    result: InitialIncrementalExecutionResult, chunks: list[str], flush: Flush = None
+) -> None:
+    """Encode the initial result of an incremental execution."""
+    append = chunks.append
+    append('{"data":')
+    encode_value(result.data, chunks, flush)
+    encode_errors(result.errors, chunks)
+    append(',"pending":[')
+    encode_pending(result.pending, chunks)
+    append('],"hasNext":')
+    append("true" if result.has_next else "false")
+    encode_extensions(result.extensions, chunks, flush)
+    append("}")
+
+
+def encode_subsequent_result(
+    result: SubsequentIncrementalExecutionResult,
+    chunks: list[str],
+    flush: Flush = None,
+) -> None:
+    """Encode a subsequent result of an incremental execution."""
+    append = chunks.append
+    append('{"hasNext":')
+    append("true" if result.has_next else "false")
+    if result.pending:
+        append(',"pending":[')
+        encode_pending(result.pending, chunks)
+        append("]")
+    if result.incremental:
+        append(',"incremental":[')
+        first = True
+        for incremental in result.incremental:
+            if first:
+                first = False
+            else:
+                append(",")
+            if isinstance(incremental, IncrementalDeferResult):
+                append('{"data":')
+                encode_value(incremental.data, chunks, flush)
+            else:
+                append('{"items":')
+                encode_value(incremental.items, chunks, flush)
+            append(',"id":')
+            append(encode_basestring_ascii(incremental.id))
+            if incremental.sub_path is not None:
+                append(',"subPath":')
+                encode_value(incremental.sub_path, chunks)
+            encode_errors(incremental.errors, chunks)
+            encode_extensions(incremental.extensions, chunks, flush)
+            append("}")
+        append("]")
+    if result.completed:
+        append(',"completed":[')
+        encode_completed(result.completed, chunks)
+        append("]")
+    encode_extensions(result.extensions, chunks, flush)
+    append("}")
+
+
+def encode_pending(pending: list[PendingResult], chunks: list[str]) -> None:
+    """Encode the items of a list of pending results."""
+    append = chunks.append
+    first = True
+    for result in pending:
+        if first:
+            first = False
+        else:
+            append(",")
+        append('{"id":')
+        append(encode_basestring_ascii(result.id))
+        append(',"path":')
+        encode_value(result.path, chunks)
+        if result.label is not None:
+            append(',"label":')
+            append(encode_basestring_ascii(result.label))
+        append("}")
+
+
+def encode_completed(completed: list[CompletedResult], chunks: list[str]) -> None:
+    """Encode the items of a list of completed results."""
+    append = chunks.append
+    first = True
+    for result in completed:
+        if first:
+            first = False
+        else:
+            append(",")
+        append('{"id":')
+        append(encode_basestring_ascii(result.id))
+        encode_errors(result.errors, chunks)
+        append("}")
+
+
+def encode_errors(errors: list[GraphQLError] | None, chunks: list[str]) -> None:
+    """Encode a list of errors as a member of a result if there are errors.
+
+    The errors are formatted as described in the "Response Format, Errors" section
+    of the GraphQL specification.
+    """
+    if errors is None:
+        return
+    append = chunks.append
+    append(',"errors":[')
+    first = True
+    for error in errors:
+        if first:
+            first = False
+        else:
+            append(",")
+        append('{"message":')
+        append(encode_basestring_ascii(error.message or "An unknown error occurred."))
+        locations = error.locations
+        if locations is not None:
+            append(',"locations":[')
+            append(
+                ",".join(
+                    f'{{"line":{location.line},"column":{location.column}}}'
+                    for location in locations
+                )
+            )
+            append("]")
+        if error.path is not None:
+            append(',"path":')
+            encode_value(error.path, chunks)
+        if error.extensions:
+            append(',"extensions":')
+            encode_value(error.extensions, chunks)
+        append("}")
+    append("]")
+
+
+def encode_extensions(
+    extensions: dict[str, Any] | None, chunks: list[str], flush: Flush
+) -> None:
+    """Encode extensions as a member of a result if there are extensions."""
+    if extensions is not None:
+        chunks.append(',"extensions":')
+        encode_value(extensions, chunks, flush)
+
+
+def encode_value(value: Any, chunks: list[str], flush: Flush = None) -> None:
+    """Encode a value as compact JSON, appending the encoded chunks to a list.
+
+    Values that are instances of :class:`~graphql.execution.RawJSON` are spliced
+    in as they are. Values without such instances are encoded with the fast encoder
+    of the standard library, unless a flush function is passed.
+
+    If a flush function is passed, it is called whenever the list of chunks has
+    grown above a certain size, and is expected to consume and clear the chunks.
+    """
+    if flush is None:
+        try:
+            chunks.append(encode_standard_value(value))
+        except RawJSONFoundError:
+            pass
+        else:
+            return
+    encode_any_value(value, chunks, flush)
+
+
+class RawJSONFoundError(Exception):
+    """Raised when the standard encoder finds a RawJSON value"""
+
+
+def encode_default(value: Any) -> Any:
+    """Handle values which the standard encoder cannot encode."""
+    if isinstance(value, RawJSON):
+        raise RawJSONFoundError
+    if isinstance(value, Mapping):
+        return dict(value)
+    msg = f"Object of type {value.__class__.__name__} is not JSON serializable."
+    raise TypeError(msg)
+
+
+encode_standard_value: Callable[[Any], str] = JSONEncoder(
+    separators=(",", ":"), allow_nan=False, default=encode_default
+).encode
+
+
+def encode_any_value(value: Any, chunks: list[str], flush: Flush = None) -> None:
+    """Encode any value as compact JSON, appending the encoded chunks to a list.
+
+    There are fast paths for dicts, lists and leaf values of the basic types, other
+    values are handled by :func:`encode_other_value`.
+    """
+    append = chunks.append
+    cls = value.__class__
+    if cls is dict:
+        append("{")
+        first = True
+        for key, item in value.items():
+            if first:
+                first = False
+            else:
+                append(",")
+            append(
+                encode_basestring_ascii(key)
+                if key.__class__ is str
+                else encode_key(key)
+            )
+            append(":")
+            cls = item.__class__
+            if cls is str:
+                append(encode_basestring_ascii(item))
+            elif item is None:
+                append("null")
+            elif item is True:
+                append("true")
+            elif item is False:
+                append("false")
+            elif cls is int:
+                append(int.__repr__(item))
+            else:
+                encode_any_value(item, chunks, flush)
+        append("}")
+        if flush is not None and len(chunks) > FLUSH_SIZE:
+            flush()
+    elif cls is list:
+        append("[")
+        first = True
+        for item in value:
+            if first:
+                first = False
+            else:
+                append(",")
+            cls = item.__class__
+            if cls is str:
+                append(encode_basestring_ascii(item))
+            elif cls is int:
+                append(int.__repr__(item))
+            elif item is None:
+                append("null")
+            else:
+                encode_any_value(item, chunks, flush)
+        append("]")
+        if flush is not None and len(chunks) > FLUSH_SIZE:
+            flush()
+    elif cls is str:
+        append(encode_basestring_ascii(value))
+    elif value is None:
+        append("null")
+    elif value is True:
+        append("true")
+    elif value is False:
+        append("false")
+    elif cls is int:
+        append(int.__repr__(value))
+    elif cls is float:
+        append(encode_float(value))
+    elif cls is RawJSON:
+        append(value.json)
+    else:
+        encode_other_value(value, chunks, flush)
+
+
+def encode_other_value(value: Any, chunks: list[str], flush: Flush = None) -> None:
+    """Encode a value that is not handled by the fast paths as compact JSON."""
+    if isinstance(value, RawJSON):
+        chunks.append(value.json)
+    elif isinstance(value, str):
+        chunks.append(encode_basestring_ascii(value))
+    elif isinstance(value, int):
+        chunks.append(int.__repr__(value))
+    elif isinstance(value, float):
+        chunks.append(encode_float(value))
+    elif isinstance(value, Mapping):
+        encode_any_value(dict(value), chunks, flush)
+    elif isinstance(value, tuple):
+        encode_any_value(list(value), chunks, flush)
+    else:
+        msg = f"Object of type {value.__class__.__name__} is not JSON serializable."
+        raise TypeError(msg)
+
+
+def encode_key(key: Any) -> str:
+    """Encode a key of a mapping that is not a string like the standard encoder."""
+    if isinstance(key, str):
+        return encode_basestring_ascii(key)
+    if key is None or isinstance(key, bool | int | float):
+        return encode_basestring_ascii(encode_standard_value(key))
+    msg = f"keys must be str, int, float, bool or None, not {key.__class__.__name__}"
+    raise TypeError(msg)
+
+
+def encode_float(value: float) -> str:
+    """Encode a float as JSON."""
+    if not isfinite(value):
+        msg = f"Out of range float values are not JSON compliant: {value!r}"
+        raise ValueError(msg)
+    return float.__repr__(value)
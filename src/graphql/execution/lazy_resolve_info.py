@@ -0,0 +1,110 @@
+"""Lazily built resolve info"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from ..pyutils import Path
+
+if TYPE_CHECKING:
+    from ..type import GraphQLField, GraphQLObjectType, GraphQLResolveInfo
+    from .collect_fields import FieldDetailsList
+    from .executor import Executor
+
+__all__ = ["LazyResolveInfo", "get_resolve_info", "lazy_resolve_info"]
+
+T = TypeVar("T")
+
+
+class LazyResolveInfo:
+    """Resolve info that is only built when it is actually used.
+
+    Field resolvers that have been marked with :func:`lazy_resolve_info` get an
+    object of this class instead of a :class:`~graphql.type.GraphQLResolveInfo`.
+    The field name is available directly. When any other attribute is accessed,
+    the complete resolve info is built and the attribute is taken from there.
+
+    If a response name is given, the given path is the path of the parent object,
+    and the path of the field is only built when it is needed.
+
+    Note that contrary to the complete resolve info, this object is not a tuple.
+    The complete resolve info can be retrieved with :func:`get_resolve_info`.
+    """
+
+    __slots__ = (
+        "_executor",
+        "_field_def",
+        "_field_details_list",
+        "_parent_type",
+        "_path",
+        "_resolve_info",
+        "_response_name",
+        "field_name",
+    )
+
+    field_name: str
+
+    def __init__(
+        self,
+        executor: Executor,
+        field_def: GraphQLField,
+        field_details_list: FieldDetailsList,
+        parent_type: GraphQLObjectType,
+        path: Path | None,
+        response_name: str | None = None,
+    ) -> None:
+        self.field_name = field_details_list[0].node.name.value
+        self._executor = executor
+        self._field_def = field_def
+        self._field_details_list = field_details_list
+        self._parent_type = parent_type
+        self._path = path
+        self._response_name = response_name
+        self._resolve_info: GraphQLResolveInfo | None = None
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self._parent_type.name}.{self.field_name}>"
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve_info, name)
+
+    @property
+    def path(self) -> Path:
+        """Get the path of the field, building it if necessary."""
+        response_name = self._response_name
+        if response_name is None:
+            return self._path  # type: ignore
+        path = self._path = Path(self._path, response_name, self._parent_type.name)
+        self._response_name = None
+        return path
+
+    @property
+    def resolve_info(self) -> GraphQLResolveInfo:
+        """Get the complete resolve info, building it if necessary."""
+        resolve_info = self._resolve_info
+        if resolve_info is None:
+            resolve_info = self._resolve_info = self._executor.build_resolve_info(
+                self._field_def,
+                [field_details.node for field_details in self._field_details_list],
+                self._parent_type,
+                self.path,
+            )
+        return resolve_info
+
+
+def lazy_resolve_info(resolver: T) -> T:
+    """Mark a field resolver or middleware as accepting lazily built resolve info.
+
+    Marked resolvers get a :class:`LazyResolveInfo` instead of a complete
+    :class:`~graphql.type.GraphQLResolveInfo` if the field has a leaf type. This
+    avoids building the resolve info for resolvers that only use the field name
+    or do not use the resolve info at all. Resolvers wrapped by middleware only
+    get the lazy resolve info if all middleware has been marked as well.
+    """
+    resolver.lazy_resolve_info = True  # type: ignore
+    return resolver
+
+
+def get_resolve_info(info: GraphQLResolveInfo | LazyResolveInfo) -> GraphQLResolveInfo:
+    """Get the complete resolve info from a possibly lazy resolve info."""
+    return info.resolve_info if isinstance(info, LazyResolveInfo) else info
@@ -0,0 +1,34 @@
+"""Chunks of list items"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+__all__ = ["ListChunk"]
+
+
+class ListChunk:
+    """A chunk of consecutive items of a list resolved as an async iterable.
+
+    Async iterables returned by resolvers of list fields can yield such chunks
+    instead of single items, e.g. one chunk for every page fetched from a paged
+    remote API. The executor recognises the chunks and completes their items as if
+    they had been yielded one by one, but needs to await only one item of the async
+    iterable per chunk. Chunks are also recognised in streamed lists.
+
+    Note that chunks are only recognised when they are yielded by async iterables,
+    and that they cannot be nested.
+    """
+
+    __slots__ = ("items",)
+
+    items: Sequence[Any]
+
+    def __init__(self, items: Iterable[Any]) -> None:
+        self.items = items if isinstance(items, list | tuple) else list(items)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.items!r})"
@@ -48,11 +48,19 @@ class MiddlewareManager:
         if self._middleware_resolvers is None:
             return field_resolver
         if field_resolver not in self._cached_resolvers:
-            self._cached_resolvers[field_resolver] = reduce(
+            middleware_resolvers = self._middleware_resolvers
+            chained_resolver = reduce(
                 lambda chained_fns, next_fn: partial(next_fn, chained_fns),
-                self._middleware_resolvers,
+                middleware_resolvers,
                 field_resolver,
             )
+            # the lazy resolve info can only be used if all functions accept it
+            if getattr(field_resolver, "lazy_resolve_info", False) and all(
+                getattr(resolver, "lazy_resolve_info", False)
+                for resolver in middleware_resolvers
+            ):
+                chained_resolver.lazy_resolve_info = True  # type: ignore
+            self._cached_resolvers[field_resolver] = chained_resolver
         return self._cached_resolvers[field_resolver]
 
 
@@ -0,0 +1,44 @@
+"""Keys identifying requests for executing query operations"""
+
+from __future__ import annotations
+
+from json import dumps
+from typing import TYPE_CHECKING, Any
+
+from ..language import OperationType
+from ..utilities.get_operation_ast import get_operation_ast
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from ..language import DocumentNode
+    from ..type import GraphQLSchema
+
+__all__ = ["get_operation_key"]
+
+
+def get_operation_key(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    variable_values: dict[str, Any] | None,
+    operation_name: str | None,
+    scope: Hashable,
+) -> Hashable | None:
+    """Get a key identifying a request for executing a query operation.
+
+    The key is made of the schema, the document, the operation name, the variable
+    values serialized as JSON and the given scope. Returns None if the operation is
+    not a query operation or cannot be found in the document, or if the variable
+    values cannot be serialized as JSON.
+    """
+    operation = get_operation_ast(document, operation_name)
+    if operation is None or operation.operation is not OperationType.QUERY:
+        return None
+    try:
+        variables = dumps(variable_values, sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    # use the source of parsed documents, which is much faster to hash
+    loc = document.loc
+    fingerprint = document if loc is None else loc.source.body
+    return schema, fingerprint, operation_name, variables, scope
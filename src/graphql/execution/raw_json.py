@@ -0,0 +1,34 @@
+"""Pre-serialized JSON values"""
+
+from __future__ import annotations
+
+__all__ = ["RawJSON"]
+
+
+class RawJSON:
+    """A value that has already been serialized to JSON.
+
+    Resolvers of fields that have been defined with ``allow_raw_json=True`` can
+    return such a value instead of a value that needs to be completed. The executor
+    then passes it through as the value of the field without any further completion
+    or validation, and the JSON encoders splice it into the encoded result.
+
+    Note that the JSON is not checked, it must be valid and must match the type of
+    the field and the selection set of the query.
+    """
+
+    __slots__ = ("json",)
+
+    json: str
+
+    def __init__(self, json: str | bytes) -> None:
+        self.json = json if isinstance(json, str) else json.decode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.json!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RawJSON) and self.json == other.json
+
+    def __hash__(self) -> int:
+        return hash(self.json)
@@ -0,0 +1,345 @@
+"""Caching of complete execution results"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from contextlib import suppress
+from itertools import chain
+from time import monotonic
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, cast
+
+from ..pyutils import RefSet, is_awaitable
+from .execute import execute
+from .operation_key import get_operation_key
+from .source_id import get_source_id
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from ..language import DocumentNode
+    from ..pyutils import AwaitableOrValue
+    from ..type import GraphQLObjectType, GraphQLSchema
+    from .collect_fields import GroupedFieldSet
+    from .types import ExecutionResult
+
+__all__ = [
+    "CacheHints",
+    "CachedResponse",
+    "LRUResponseCacheBackend",
+    "ResponseCache",
+    "ResponseCacheBackend",
+    "default_entity_id",
+]
+
+
+def default_entity_id(_type: GraphQLObjectType, source: Any) -> Any:
+    """Get the ``id`` of the given source value of the given object type.
+
+    The object type is not used, the id is determined with :func:`get_source_id`.
+    """
+    return get_source_id(source)
+
+
+class CacheHints:
+    """Cache hints recorded while executing an operation.
+
+    An instance of this class can be passed as ``cache_hints`` to
+    :func:`~graphql.execution.execute`. The executor then records the names of the
+    object types of all objects whose fields are executed in :attr:`types`, and the
+    pairs of type names and ids of these objects in :attr:`entities`, skipping the
+    objects without id. Ids that are callable or not hashable are ignored, and so
+    are errors raised while determining the ids. The smallest ``max_age`` of all
+    executed fields is recorded in :attr:`max_age`, which stays None if no field
+    has a max age.
+
+    The ids of the objects are determined with the given function, which is called
+    with the object type and the source value, and defaults to
+    :func:`default_entity_id`.
+    """
+
+    __slots__ = "_recorded_field_sets", "entities", "get_entity_id", "max_age", "types"
+
+    types: set[str]
+    entities: set[tuple[str, Any]]
+    max_age: float | None
+    get_entity_id: Callable[[GraphQLObjectType, Any], Any]
+
+    _recorded_field_sets: RefSet[GroupedFieldSet]
+
+    def __init__(
+        self,
+        get_entity_id: Callable[[GraphQLObjectType, Any], Any] = default_entity_id,
+    ) -> None:
+        self.types = set()
+        self.entities = set()
+        self.max_age = None
+        self.get_entity_id = get_entity_id
+        self._recorded_field_sets = RefSet()
+
+    def record(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        grouped_field_set: GroupedFieldSet,
+    ) -> None:
+        """Record that the given fields are executed on the given object.
+
+        For internal use only.
+        """
+        type_name = parent_type.name
+        self.types.add(type_name)
+        # objects whose id cannot be determined or is not hashable are treated
+        # like objects without id
+        with suppress(Exception):
+            entity_id = self.get_entity_id(parent_type, source_value)
+            if entity_id is not None and not callable(entity_id):
+                self.entities.add((type_name, entity_id))
+        recorded_field_sets = self._recorded_field_sets
+        if grouped_field_set in recorded_field_sets:
+            return
+        recorded_field_sets.add(grouped_field_set)
+        fields = parent_type.fields
+        max_age = self.max_age
+        for field_details_list in grouped_field_set.values():
+            field_def = fields.get(field_details_list[0].node.name.value)
+            if field_def is not None:
+                field_max_age = field_def.max_age
+                if field_max_age is not None and (
+                    max_age is None or field_max_age < max_age
+                ):
+                    max_age = field_max_age
+        self.max_age = max_age
+
+
+class CachedResponse(NamedTuple):
+    """A cached execution result.
+
+    The result expires when the :func:`~time.monotonic` clock reaches ``expires``.
+    The tags are the names of the object types and the pairs of type names and ids
+    of the entities contained in the result.
+    """
+
+    result: ExecutionResult
+    expires: float
+    tags: frozenset[Hashable]
+
+
+class ResponseCacheBackend(Protocol):
+    """Storage for the responses cached by a :class:`ResponseCache`."""
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Get the cached response with the given key, if any."""
+
+    def set(self, key: Hashable, response: CachedResponse) -> None:
+        """Store the given response with the given key."""
+
+    def delete(self, key: Hashable) -> None:
+        """Delete the cached response with the given key, if any."""
+
+    def invalidate(self, tag: Hashable) -> None:
+        """Delete all cached responses with the given tag."""
+
+
+class LRUResponseCacheBackend:
+    """In-memory storage keeping the most recently used responses.
+
+    If more than ``max_size`` responses are stored, the least recently used
+    response is discarded.
+    """
+
+    __slots__ = "_responses", "_tagged_keys", "max_size"
+
+    max_size: int
+
+    _responses: OrderedDict[Hashable, CachedResponse]
+    _tagged_keys: dict[Hashable, set[Hashable]]
+
+    def __init__(self, max_size: int = 1000) -> None:
+        self.max_size = max_size
+        self._responses = OrderedDict()
+        self._tagged_keys = {}
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def get(self, key: Hashable) -> CachedResponse | None:
+        """Get the cached response with the given key, if any."""
+        response = self._responses.get(key)
+        if response is not None:
+            self._responses.move_to_end(key)
+        return response
+
+    def set(self, key: Hashable, response: CachedResponse) -> None:
+        """Store the given response with the given key."""
+        responses = self._responses
+        self.delete(key)
+        responses[key] = response
+        tagged_keys = self._tagged_keys
+        for tag in response.tags:
+            keys = tagged_keys.get(tag)
+            if keys is None:
+                tagged_keys[tag] = {key}
+            else:
+                keys.add(key)
+        while len(responses) > self.max_size:
+            self.delete(next(iter(responses)))
+
+    def delete(self, key: Hashable) -> None:
+        """Delete the cached response with the given key, if any."""
+        response = self._responses.pop(key, None)
+        if response is None:
+            return
+        tagged_keys = self._tagged_keys
+        for tag in response.tags:
+            keys = tagged_keys[tag]
+            keys.discard(key)
+            if not keys:
+                del tagged_keys[tag]
+
+    def invalidate(self, tag: Hashable) -> None:
+        """Delete all cached responses with the given tag."""
+        for key in list(self._tagged_keys.get(tag, ())):
+            self.delete(key)
+
+
+class ResponseCache:
+    """Cache for the complete results of query operations.
+
+    The results of the query operations executed with :meth:`execute` are cached
+    by schema, document, operation name, variable values and cache scope. The
+    cache scope must tell apart all requests that may get different results,
+    e.g. by including the id of the user for queries that are not public.
+    Results with errors, results of other operations and results of operations
+    with variable values that cannot be serialized as JSON are not cached. Cached
+    results are returned as they are, so they must not be modified.
+
+    A result is cached for the smallest ``max_age`` of all fields executed for it,
+    or for ``default_max_age`` if none of these fields has a max age. Results are
+    not cached if this gives no max age, or a max age that is not positive.
+
+    While executing an operation, the executor records the object types and the
+    entities contained in the result (see :class:`CacheHints`), so that the cached
+    results can be invalidated by type with :meth:`invalidate_type` and by entity
+    with :meth:`invalidate_entity`. The entities are identified by the type name
+    and the id given by ``get_entity_id``, which defaults to
+    :func:`default_entity_id`.
+
+    The results are stored in the given backend, by default an in-memory
+    :class:`LRUResponseCacheBackend`.
+    """
+
+    __slots__ = "_invalidations", "backend", "default_max_age", "get_entity_id"
+
+    backend: ResponseCacheBackend
+    default_max_age: float | None
+    get_entity_id: Callable[[GraphQLObjectType, Any], Any]
+
+    _invalidations: int
+
+    def __init__(
+        self,
+        backend: ResponseCacheBackend | None = None,
+        default_max_age: float | None = None,
+        get_entity_id: Callable[[GraphQLObjectType, Any], Any] = default_entity_id,
+    ) -> None:
+        self.backend = LRUResponseCacheBackend() if backend is None else backend
+        self.default_max_age = default_max_age
+        self.get_entity_id = get_entity_id
+        # counts the invalidations, so that results that have been executed while
+        # the cache was invalidated are not stored, since they could be outdated
+        self._invalidations = 0
+
+    def execute(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        root_value: Any = None,
+        context_value: Any = None,
+        variable_values: dict[str, Any] | None = None,
+        operation_name: str | None = None,
+        cache_scope: Hashable = None,
+        **execute_args: Any,
+    ) -> AwaitableOrValue[ExecutionResult]:
+        """Execute a GraphQL operation or get its result from the cache.
+
+        Takes the same arguments as :func:`~graphql.execution.execute`, plus the
+        cache scope telling apart requests that may get different results.
+        Returns the cached result directly, otherwise the result of the execution.
+        """
+        key = get_operation_key(
+            schema, document, variable_values, operation_name, cache_scope
+        )
+        if key is None:
+            return execute(
+                schema,
+                document,
+                root_value,
+                context_value,
+                variable_values,
+                operation_name,
+                **execute_args,
+            )
+
+        backend = self.backend
+        cached_response = backend.get(key)
+        if cached_response is not None:
+            if cached_response.expires > monotonic():
+                return cached_response.result
+            backend.delete(key)
+
+        cache_hints = CacheHints(self.get_entity_id)
+        invalidations = self._invalidations
+        result = execute(
+            schema,
+            document,
+            root_value,
+            context_value,
+            variable_values,
+            operation_name,
+            cache_hints=cache_hints,
+            **execute_args,
+        )
+
+        if is_awaitable(result):
+            awaitable_result = result
+
+            async def await_result() -> ExecutionResult:
+                awaited_result = await awaitable_result
+                if self._invalidations == invalidations:
+                    self.store(key, awaited_result, cache_hints)
+                return awaited_result
+
+            return await_result()
+
+        result = cast("ExecutionResult", result)
+        self.store(key, result, cache_hints)
+        return result
+
+    def store(
+        self, key: Hashable, result: ExecutionResult, cache_hints: CacheHints
+    ) -> None:
+        """Store the given result if it can be cached.
+
+        For internal use only.
+        """
+        if result.errors:
+            return
+        max_age = cache_hints.max_age
+        if max_age is None:
+            max_age = self.default_max_age
+            if max_age is None:
+                return
+        if max_age <= 0:
+            return
+        tags = frozenset(chain(cache_hints.types, cache_hints.entities))
+        self.backend.set(key, CachedResponse(result, monotonic() + max_age, tags))
+
+    def invalidate_type(self, type_name: str) -> None:
+        """Invalidate all cached results containing objects of the given type."""
+        self._invalidations += 1
+        self.backend.invalidate(type_name)
+
+    def invalidate_entity(self, type_name: str, entity_id: Any) -> None:
+        """Invalidate all cached results containing the given entity."""
+        self._invalidations += 1
+        self.backend.invalidate((type_name, entity_id))
@@ -0,0 +1,224 @@
+"""Single-flight execution of identical concurrent operations"""
+
+from __future__ import annotations
+
+from asyncio import FIRST_COMPLETED, CancelledError, ensure_future, wait
+from typing import TYPE_CHECKING, Any, cast
+
+from ..pyutils import AbortController, is_awaitable
+from .aborted_graphql_execution_error import AbortedGraphQLExecutionError
+from .execute import execute
+from .operation_key import get_operation_key
+
+if TYPE_CHECKING:
+    from asyncio import Future
+    from collections.abc import Hashable
+
+    from ..language import DocumentNode
+    from ..pyutils import AbortSignal
+    from ..type import GraphQLSchema
+    from .types import ExecutionResult
+
+__all__ = ["SharedExecution", "SingleFlight"]
+
+
+class SharedExecution:
+    """An execution shared by all requests waiting for its result.
+
+    For internal use only.
+    """
+
+    __slots__ = "abort_controller", "task", "waiters"
+
+    abort_controller: AbortController
+    task: Future[ExecutionResult]
+    waiters: int
+
+    def __init__(
+        self, task: Future[ExecutionResult], abort_controller: AbortController
+    ) -> None:
+        self.task = task
+        self.abort_controller = abort_controller
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share the execution of identical concurrent query operations.
+
+    Requests executed through :meth:`execute` while an identical request is still
+    being executed do not start an execution of their own, but wait for the result
+    of the running execution. All of these requests receive the same
+    :class:`~graphql.ExecutionResult` object, or the same raised exception, so the
+    results must not be modified. Requests are identical when they have the same
+    schema, document, operation name, variable values and context key. As soon as
+    the execution has finished, the next request starts a new execution again.
+
+    Since the root value, the context value and all other arguments of the shared
+    execution are taken from the request that started it, the context key must tell
+    apart all requests that need to be executed separately, e.g. by including the
+    authorization scope of the user. Only query operations are shared. Mutations and
+    subscriptions, operations that cannot be found in the document and variable
+    values that cannot be serialized as JSON are always executed separately.
+
+    Every request can pass its own abort signal. When the signal is triggered, the
+    request stops waiting and an :class:`AbortedGraphQLExecutionError` is raised,
+    while the shared execution continues for the other waiting requests. Likewise,
+    cancelling a request only stops its own waiting. The shared execution is only
+    aborted or cancelled if no requests are waiting for it any more.
+    """
+
+    __slots__ = ("_executions",)
+
+    _executions: dict[Hashable, SharedExecution]
+
+    def __init__(self) -> None:
+        self._executions = {}
+
+    async def execute(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        root_value: Any = None,
+        context_value: Any = None,
+        variable_values: dict[str, Any] | None = None,
+        operation_name: str | None = None,
+        context_key: Hashable = None,
+        abort_signal: AbortSignal | None = None,
+        **execute_args: Any,
+    ) -> ExecutionResult:
+        """Execute a GraphQL operation, sharing identical concurrent executions.
+
+        Takes the same arguments as :func:`~graphql.execution.execute`, plus the
+        context key telling apart requests that must not share their execution.
+        """
+        key = self.get_key(
+            schema, document, variable_values, operation_name, context_key
+        )
+        if key is None:
+            result = execute(
+                schema,
+                document,
+                root_value,
+                context_value,
+                variable_values,
+                operation_name,
+                abort_signal=abort_signal,
+                **execute_args,
+            )
+            return (
+                await result
+                if is_awaitable(result)
+                else cast("ExecutionResult", result)
+            )
+
+        executions = self._executions
+        execution = executions.get(key)
+        if execution is None:
+            abort_controller = AbortController()
+            result = execute(
+                schema,
+                document,
+                root_value,
+                context_value,
+                variable_values,
+                operation_name,
+                abort_signal=abort_controller.signal,
+                **execute_args,
+            )
+            if not is_awaitable(result):
+                return cast("ExecutionResult", result)
+            execution = SharedExecution(ensure_future(result), abort_controller)
+            executions[key] = execution
+            execution.task.add_done_callback(
+                lambda _task: self.discard_execution(key, execution)
+            )
+
+        return await self.wait_for_execution(key, execution, abort_signal)
+
+    def get_key(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variable_values: dict[str, Any] | None,
+        operation_name: str | None,
+        context_key: Hashable,
+    ) -> Hashable | None:
+        """Get the key identifying the given request.
+
+        Returns None if the request must not share its execution with others.
+        """
+        return get_operation_key(
+            schema, document, variable_values, operation_name, context_key
+        )
+
+    async def wait_for_execution(
+        self,
+        key: Hashable,
+        execution: SharedExecution,
+        abort_signal: AbortSignal | None,
+    ) -> ExecutionResult:
+        """Wait for the result of the given shared execution.
+
+        For internal use only.
+        """
+        task = execution.task
+        execution.waiters += 1
+        if abort_signal is None:
+            abort_waiter = None
+            awaitables: tuple[Future[Any], ...] = (task,)
+        else:
+            abort_waiter = ensure_future(abort_signal.wait())
+            awaitables = task, abort_waiter
+        try:
+            await wait(awaitables, return_when=FIRST_COMPLETED)
+        except CancelledError:
+            if self.leave_execution(key, execution, None):
+                # nobody will retrieve the error of the aborted execution
+                task.add_done_callback(retrieve_exception)
+            raise
+        finally:
+            if abort_waiter is not None:
+                abort_waiter.cancel()
+
+        if task.done():
+            execution.waiters -= 1
+            return task.result()
+
+        reason = abort_signal.reason  # type: ignore
+        if self.leave_execution(key, execution, reason):
+            # the shared execution has been aborted with the same reason
+            return await task
+        raise AbortedGraphQLExecutionError(reason, task)
+
+    def leave_execution(
+        self, key: Hashable, execution: SharedExecution, reason: Any
+    ) -> bool:
+        """Stop waiting for the given shared execution.
+
+        Returns True if no other requests are waiting for the execution any more.
+        In this case, the execution is aborted with the given reason and will not
+        be shared with further requests.
+
+        For internal use only.
+        """
+        execution.waiters -= 1
+        if execution.waiters:
+            return False
+        self.discard_execution(key, execution)
+        execution.abort_controller.abort(reason)
+        return True
+
+    def discard_execution(self, key: Hashable, execution: SharedExecution) -> None:
+        """Stop sharing the given execution with further requests.
+
+        For internal use only.
+        """
+        executions = self._executions
+        if executions.get(key) is execution:
+            del executions[key]
+
+
+def retrieve_exception(task: Future[Any]) -> None:
+    """Retrieve the exception of a task, so that it is not reported as unhandled."""
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,21 @@
+"""Getting the ids of source values"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+__all__ = ["get_source_id"]
+
+
+def get_source_id(source: Any) -> Any:
+    """Get the ``id`` of the given source value.
+
+    The id is looked up as a key if the source value is a mapping and as an
+    attribute otherwise, like the default field resolver does. Returns None if the
+    source value has no id or if its id is callable, e.g. a method.
+    """
+    source_id = (
+        source.get("id") if isinstance(source, Mapping) else getattr(source, "id", None)
+    )
+    return None if callable(source_id) else source_id
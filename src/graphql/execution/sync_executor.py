@@ -0,0 +1,222 @@
+"""Executor for purely synchronous execution"""
+
+from __future__ import annotations
+
+from inspect import iscoroutine
+from typing import TYPE_CHECKING, Any, NoReturn
+
+from ..pyutils import Path, Undefined
+from .executor import Executor
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Iterable
+
+    from ..type import (
+        GraphQLAbstractType,
+        GraphQLObjectType,
+        GraphQLOutputType,
+        GraphQLResolveInfo,
+    )
+    from .collect_fields import FieldDetailsList, GroupedFieldSet
+
+__all__ = ["SyncExecutor", "SynchronousExecutionError"]
+
+
+class SynchronousExecutionError(RuntimeError):
+    """Error raised when a synchronous execution encounters asynchronous values."""
+
+
+class SyncExecutor(Executor[None]):
+    """Executor for operations that are executed purely synchronously.
+
+    This executor can be passed as ``executor_class`` to :func:`execute_sync` or
+    :func:`graphql_sync` when all resolvers, type resolvers and ``is_type_of``
+    functions return their results directly. Since it never needs to await
+    anything, it does not keep track of awaitable values and does not create
+    coroutines while completing the fields, which makes the execution faster.
+
+    If the values are checked for being awaitable (e.g. by passing ``check_sync``),
+    the execution is stopped with a :class:`SynchronousExecutionError` as soon as
+    an awaitable value or an asynchronous iterable is encountered. Like the base
+    executor, this executor ignores the ``@defer`` and ``@stream`` directives.
+    """
+
+    # The overridden handle_field_error() does not need complete paths.
+    lazy_paths = True
+
+    def execute_fields_serially(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Path | None,
+        grouped_field_set: GroupedFieldSet,
+        position_context: None,
+    ) -> dict[str, Any]:
+        """Execute the given fields serially."""
+        abort_signal = self.abort_signal
+        if abort_signal is None:
+            return self.execute_fields(
+                parent_type, source_value, path, grouped_field_set, position_context
+            )
+        results: dict[str, Any] = {}
+        for response_name, field_details_list in grouped_field_set.items():
+            if abort_signal.aborted:
+                raise self.abort_error()
+            results.update(
+                self.execute_fields(
+                    parent_type,
+                    source_value,
+                    path,
+                    {response_name: field_details_list},
+                    position_context,
+                )
+            )
+        return results
+
+    def execute_fields(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Path | None,
+        grouped_field_set: GroupedFieldSet,
+        position_context: None,
+    ) -> dict[str, Any]:
+        """Execute the given fields one after the other."""
+        cache_hints = self.cache_hints
+        if cache_hints is not None:
+            cache_hints.record(parent_type, source_value, grouped_field_set)
+        results: dict[str, Any] = {}
+        if self.lazy_paths:
+            execute_field_at = self.execute_field_at
+            for response_name, field_details_list in grouped_field_set.items():
+                result = execute_field_at(
+                    parent_type,
+                    source_value,
+                    field_details_list,
+                    path,
+                    response_name,
+                    position_context,
+                )
+                if result is not Undefined:
+                    results[response_name] = result
+        else:
+            execute_field = self.execute_field
+            for response_name, field_details_list in grouped_field_set.items():
+                result = execute_field(
+                    parent_type,
+                    source_value,
+                    field_details_list,
+                    Path(path, response_name, parent_type.name),
+                    position_context,
+                )
+                if result is not Undefined:
+                    results[response_name] = result
+        return results
+
+    def handle_field_error(
+        self,
+        raw_error: Exception,
+        return_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        path: Path,
+    ) -> None:
+        """Handle error properly according to the field type.
+
+        Errors caused by asynchronous values are not handled, but re-raised.
+        """
+        if isinstance(raw_error, SynchronousExecutionError):
+            raise raw_error
+        super().handle_field_error(raw_error, return_type, field_details_list, path)
+
+    def get_stream_usage(
+        self, field_details_list: FieldDetailsList, path: Path
+    ) -> None:
+        """Get stream usage.
+
+        Always returns None, since this executor ignores the ``@stream`` directive.
+        """
+        return
+
+    def yields_cooperatively(self, items: Iterable[Any]) -> bool:
+        """Check whether the completion of the given items yields to the event loop.
+
+        Always returns False, since this executor never yields to the event loop.
+        """
+        return False
+
+    def complete_awaitable_value(
+        self,
+        return_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+        position_context: None,
+    ) -> NoReturn:
+        """Raise an error for an awaitable field value."""
+        raise_asynchronous_value_error(result, info)
+
+    def complete_async_iterator_value(
+        self,
+        item_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        async_iterator: AsyncIterator[Any],
+        position_context: None,
+    ) -> NoReturn:
+        """Raise an error for an asynchronous iterable field value."""
+        raise_asynchronous_value_error(async_iterator, info)
+
+    def complete_awaitable_list_item_value(
+        self,
+        item: Any,
+        item_type: GraphQLOutputType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        item_path: Path,
+        position_context: None,
+    ) -> NoReturn:
+        """Raise an error for an awaitable list item value."""
+        raise_asynchronous_value_error(item, info)
+
+    def complete_awaitable_abstract_value(
+        self,
+        runtime_type: Awaitable[str | None],
+        return_type: GraphQLAbstractType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+        position_context: None,
+    ) -> NoReturn:
+        """Raise an error for an awaitable runtime type of an abstract value."""
+        raise_asynchronous_value_error(runtime_type, info)
+
+    def complete_awaitable_object_value(
+        self,
+        is_type_of: Awaitable[bool],
+        return_type: GraphQLObjectType,
+        field_details_list: FieldDetailsList,
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+        position_context: None,
+    ) -> NoReturn:
+        """Raise an error for an awaitable result of ``is_type_of()``."""
+        raise_asynchronous_value_error(is_type_of, info)
+
+
+def raise_asynchronous_value_error(value: Any, info: GraphQLResolveInfo) -> NoReturn:
+    """Raise an error for an asynchronous value encountered in the given field.
+
+    Coroutines are closed, so that they do not need to be awaited any more.
+    """
+    if iscoroutine(value):
+        value.close()
+    msg = (
+        "GraphQL execution failed to complete synchronously:"
+        f" field '{info.parent_type}.{info.field_name}'"
+        " returned an asynchronous value."
+    )
+    raise SynchronousExecutionError(msg)
@@ -298,9 +298,12 @@ def get_argument_values(
     of argument AST nodes.
     """
     coerced_values: dict[str, Any] = {}
+    arg_defs = type_def.args
+    if not arg_defs:
+        return coerced_values
     arg_node_map = {arg.name.value: arg for arg in node.arguments or []}
 
-    for name, arg_def in type_def.args.items():
+    for name, arg_def in arg_defs.items():
         coerce_argument(
             coerced_values,
             node,
@@ -18,8 +18,10 @@ from .type import (
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterable, Awaitable, Callable, Collection
+    from concurrent.futures import ThreadPoolExecutor
     from typing import TypeGuard
 
+    from .execution import CacheHints
     from .language import DocumentNode, Source
     from .pyutils import AbortSignal, AwaitableOrValue
     from .validation import ASTValidationRule
@@ -48,6 +50,15 @@ async def graphql(  # noqa: PLR0913
     rules: Collection[type[ASTValidationRule]] | None = None,
     max_errors: int | None = None,
     harness: GraphQLHarness = default_harness,
+    thread_pool: ThreadPoolExecutor | None = None,
+    max_blocking_resolvers: int | None = None,
+    max_concurrent_resolvers: int | None = None,
+    eager_awaiting: bool = False,
+    timeout: float | None = None,
+    read_ahead: int | None = None,
+    yield_every_items: int | None = None,
+    yield_every_seconds: float | None = None,
+    cache_hints: CacheHints | None = None,
 ) -> ExecutionResult:
     """Execute a GraphQL operation asynchronously.
 
@@ -114,7 +125,53 @@ async def graphql(  # noqa: PLR0913
     :arg harness:
       A custom set of parse/validate/execute/subscribe functions to use when
       fulfilling the operation. Defaults to ``default_harness``.
+    :arg thread_pool:
+      The thread pool used to run resolvers marked with
+      :func:`~graphql.execution.blocking_resolver`. If not provided, the default
+      executor of the event loop is used.
+    :arg max_blocking_resolvers:
+      The maximum number of blocking resolvers that may run in worker threads at
+      the same time
+    :arg max_concurrent_resolvers:
+      The maximum number of awaitables returned by resolvers that may be awaited at
+      the same time
+    :arg eager_awaiting:
+      Whether the awaitables of sibling fields and list items are started as eager
+      tasks that run synchronously until they block (needs Python 3.12 or newer)
+    :arg timeout:
+      The time budget of the execution in seconds. Awaitable values returned by
+      resolvers that have not settled when the time budget is exceeded are cancelled
+      and reported as located timeout errors, while the rest of the response is
+      still completed.
+    :arg read_ahead:
+      The number of items of async iterables that may still be completing while
+      the next item is read
+    :arg yield_every_items:
+      The number of items of long lists after which the completion gives control
+      back to the event loop
+    :arg yield_every_seconds:
+      The number of seconds of completion work on long lists after which the
+      completion gives control back to the event loop
+    :arg cache_hints:
+      The :class:`~graphql.execution.CacheHints` recording the types, entities and
+      max ages of the response
+
+    The arguments tuning the execution are only passed on to the execute function
+    of the harness if they have been set, so that custom execute functions without
+    these options can still be used.
     """
+    execute_args = get_execute_args(
+        thread_pool=thread_pool,
+        max_blocking_resolvers=max_blocking_resolvers,
+        max_concurrent_resolvers=max_concurrent_resolvers,
+        eager_awaiting=eager_awaiting,
+        timeout=timeout,
+        read_ahead=read_ahead,
+        yield_every_items=yield_every_items,
+        yield_every_seconds=yield_every_seconds,
+        cache_hints=cache_hints,
+    )
+
     # Always return asynchronously for a consistent API.
     result = graphql_impl(
         schema,
@@ -137,6 +194,7 @@ async def graphql(  # noqa: PLR0913
         rules,
         max_errors,
         harness,
+        execute_args,
     )
 
     if default_is_awaitable(result):
@@ -175,6 +233,7 @@ def graphql_sync(  # noqa: PLR0913
     rules: Collection[type[ASTValidationRule]] | None = None,
     max_errors: int | None = None,
     harness: GraphQLHarness = default_harness,
+    cache_hints: CacheHints | None = None,
 ) -> ExecutionResult:
     """Execute a GraphQL operation synchronously.
 
@@ -184,6 +243,11 @@ def graphql_sync(  # noqa: PLR0913
     are also synchronous.
 
     Set check_sync to True to still run checks that no awaitable values are returned.
+
+    Pass :class:`~graphql.execution.CacheHints` as ``cache_hints`` to record the
+    types, entities and max ages of the response. The other arguments of
+    :func:`graphql` tuning the execution of asynchronous operations are not
+    accepted, since they have no effect on synchronous execution.
     """
     is_awaitable = (
         cast("Callable[[Any], TypeGuard[Awaitable]]", check_sync)
@@ -212,6 +276,7 @@ def graphql_sync(  # noqa: PLR0913
         rules,
         max_errors,
         harness,
+        get_execute_args(cache_hints=cache_hints),
     )
 
     # Assert that the execution was synchronous.
@@ -223,6 +288,18 @@ def graphql_sync(  # noqa: PLR0913
     return cast("ExecutionResult", result)
 
 
+def get_execute_args(**args: Any) -> dict[str, Any]:
+    """Get the arguments tuning the execution that have been set.
+
+    For internal use only.
+    """
+    return {
+        name: value
+        for name, value in args.items()
+        if value is not None and value is not False
+    }
+
+
 def graphql_impl(  # noqa: PLR0913
     schema: GraphQLSchema,
     source: str | Source,
@@ -244,6 +321,7 @@ def graphql_impl(  # noqa: PLR0913
     rules: Collection[type[ASTValidationRule]] | None = None,
     max_errors: int | None = None,
     harness: GraphQLHarness = default_harness,
+    execute_args: dict[str, Any] | None = None,
 ) -> AwaitableOrValue[ExecutionResult]:
     """Execute a query, return asynchronously only if necessary."""
     # Validate Schema
@@ -275,6 +353,7 @@ def graphql_impl(  # noqa: PLR0913
             is_async_iterable,
             hide_suggestions=hide_suggestions,
             abort_signal=abort_signal,
+            **(execute_args or {}),
         )
 
     def validate_and_execute(
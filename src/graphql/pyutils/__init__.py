@@ -11,6 +11,7 @@ These functions are not part of the module interface and are subject to change.
 from .abort_signal import AbortController, AbortError, AbortSignal
 from .async_reduce import async_reduce
 from .gather_with_cancel import gather_with_cancel
+from .eager_gather_with_cancel import eager_gather_with_cancel
 from .convert_case import camel_to_snake, snake_to_camel
 from .cached_property import cached_property
 from .description import (
@@ -57,6 +58,7 @@ __all__ = [
     "cached_property",
     "camel_to_snake",
     "did_you_mean",
+    "eager_gather_with_cancel",
     "gather_with_cancel",
     "group_by",
     "identity_func",
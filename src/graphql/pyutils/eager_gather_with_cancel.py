@@ -0,0 +1,115 @@
+"""Run awaitables concurrently, starting them eagerly."""
+
+from __future__ import annotations
+
+import asyncio
+from asyncio import Future, Task, gather, get_running_loop, isfuture
+from types import CoroutineType, GeneratorType
+from typing import TYPE_CHECKING, Any
+
+from .gather_with_cancel import gather_with_cancel
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+__all__ = ["eager_gather_with_cancel"]
+
+# The factory for eager tasks is only available in Python 3.12 and newer.
+eager_task_factory: Callable[..., Task[Any]] | None = getattr(
+    asyncio, "eager_task_factory", None
+)
+
+
+async def eager_gather_with_cancel(*awaitables: Awaitable[Any]) -> list[Any]:
+    """Run awaitable objects in the sequence concurrently, starting them eagerly.
+
+    This behaves like `gather_with_cancel`, but instead of scheduling every
+    awaitable as a task, the awaitables are started one after the other as eager
+    tasks that run synchronously until they actually block. Awaitables that
+    complete without blocking therefore return their results right away, without
+    waiting for the event loop to run them. Awaitables that are already futures
+    are simply awaited.
+
+    The first raised exception is immediately propagated to the task that awaits
+    on this function. The awaitables in the sequence after the failing one are not
+    started anymore, but closed, and all pending awaitables are cancelled. This also
+    happens when the awaiting task is cancelled.
+
+    Eager tasks are only available in Python 3.12 and newer. In older versions,
+    this function falls back to `gather_with_cancel`. The awaitables are not stepped
+    manually instead, because their first steps would then run in the awaiting task,
+    confusing `asyncio.timeout()`, task groups and everything else that relies on
+    the current task.
+    """
+    if eager_task_factory is not None:  # pragma: no cover
+        return await gather_eager_tasks(awaitables)
+    return await gather_with_cancel(*awaitables)
+
+
+async def gather_eager_tasks(  # pragma: no cover
+    awaitables: tuple[Awaitable[Any], ...],
+) -> list[Any]:
+    """Run the given awaitables as eager tasks and gather their results."""
+    results: list[Any] = [None] * len(awaitables)
+    futures: list[Future[Any]] = []
+    indices: list[int] = []
+    append_future = futures.append
+    append_index = indices.append
+    started = 0
+    try:
+        for index, awaitable in enumerate(awaitables):
+            started += 1
+            if isfuture(awaitable):
+                append_future(awaitable)
+                append_index(index)
+                continue
+            future = run_as_eager_task(awaitable, results, index)
+            if future is not None:
+                append_future(future)
+                append_index(index)
+
+        if futures:
+            awaited_results = await gather(*futures)
+            for index, result in zip(indices, awaited_results, strict=True):
+                results[index] = result
+    except BaseException:
+        for awaitable in awaitables[started:]:
+            if isfuture(awaitable):
+                append_future(awaitable)
+            elif isinstance(awaitable, (CoroutineType, GeneratorType)):
+                awaitable.close()
+        await cancel_futures(futures)
+        raise
+
+    return results
+
+
+def run_as_eager_task(  # pragma: no cover
+    awaitable: Awaitable[Any], results: list[Any], index: int
+) -> Future[Any] | None:
+    """Run the given awaitable as an eager task.
+
+    If the awaitable completes without blocking, its result is stored in the
+    results under the given index, otherwise the task is returned.
+    """
+    task = eager_task_factory(  # type: ignore[misc]
+        get_running_loop(),
+        awaitable if isinstance(awaitable, CoroutineType) else await_(awaitable),
+    )
+    if not task.done():
+        return task
+    results[index] = task.result()
+    return None
+
+
+async def await_(awaitable: Awaitable[Any]) -> Any:  # pragma: no cover
+    """Await the given awaitable."""
+    return await awaitable
+
+
+async def cancel_futures(futures: list[Future[Any]]) -> None:  # pragma: no cover
+    """Cancel all pending futures and wait until they are settled."""
+    for future in futures:
+        if not future.done():
+            future.cancel()
+    await gather(*futures, return_exceptions=True)
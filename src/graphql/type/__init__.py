@@ -89,6 +89,7 @@ from .definition import (
     GraphQLCompositeType,
     GraphQLAbstractType,
     GraphQLWrappingType,
+    CompletionKind,
     GraphQLNullableType,
     GraphQLNullableInputType,
     GraphQLNullableOutputType,
@@ -112,6 +113,7 @@ from .definition import (
     GraphQLScalarValueParser,
     GraphQLScalarLiteralParser,
     GraphQLScalarOutputValueCoercer,
+    GraphQLScalarOutputValuesCoercer,
     GraphQLScalarInputValueCoercer,
     GraphQLScalarInputLiteralCoercer,
     GraphQLScalarValueToLiteral,
@@ -130,6 +132,7 @@ from .definition import (
     GraphQLUnionTypeKwargs,
     # Resolvers
     GraphQLFieldResolver,
+    GraphQLFieldBatchResolver,
     GraphQLTypeResolver,
     GraphQLIsTypeOfFn,
     GraphQLResolveInfo,
@@ -150,6 +153,8 @@ from .directives import (
     GraphQLSkipDirective,
     GraphQLDeferDirective,
     GraphQLStreamDirective,
+    GraphQLTimeoutDirective,
+    GraphQLCachedDirective,
     GraphQLDeprecatedDirective,
     GraphQLSpecifiedByDirective,
     GraphQLOneOfDirective,
@@ -195,12 +200,14 @@ __all__ = [
     "DEFAULT_DEPRECATION_REASON",
     "GRAPHQL_MAX_INT",
     "GRAPHQL_MIN_INT",
+    "CompletionKind",
     "GraphQLAbstractType",
     "GraphQLArgument",
     "GraphQLArgument",
     "GraphQLArgumentKwargs",
     "GraphQLArgumentMap",
     "GraphQLBoolean",
+    "GraphQLCachedDirective",
     "GraphQLCompositeType",
     "GraphQLDefaultInput",
     "GraphQLDeferDirective",
@@ -214,6 +221,7 @@ __all__ = [
     "GraphQLEnumValueMap",
     "GraphQLEnumValuesDefinition",
     "GraphQLField",
+    "GraphQLFieldBatchResolver",
     "GraphQLFieldKwargs",
     "GraphQLFieldMap",
     "GraphQLFieldResolver",
@@ -252,6 +260,7 @@ __all__ = [
     "GraphQLScalarInputValueCoercer",
     "GraphQLScalarLiteralParser",
     "GraphQLScalarOutputValueCoercer",
+    "GraphQLScalarOutputValuesCoercer",
     "GraphQLScalarSerializer",
     "GraphQLScalarType",
     "GraphQLScalarTypeKwargs",
@@ -263,6 +272,7 @@ __all__ = [
     "GraphQLSpecifiedByDirective",
     "GraphQLStreamDirective",
     "GraphQLString",
+    "GraphQLTimeoutDirective",
     "GraphQLType",
     "GraphQLTypeResolver",
     "GraphQLUnionType",
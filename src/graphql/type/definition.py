@@ -7,6 +7,7 @@ from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
+    ClassVar,
     Generic,
     NamedTuple,
     TypedDict,
@@ -59,6 +60,7 @@ from ..utilities.value_from_ast_untyped import value_from_ast_untyped
 from .assert_name import assert_enum_value_name, assert_name
 
 if TYPE_CHECKING:
+    from ..execution.field_cache import FieldCache
     from ..execution.get_variable_signature import GraphQLVariableSignature
     from ..execution.values import VariableValues
     from .schema import GraphQLSchema
@@ -70,6 +72,7 @@ if TYPE_CHECKING:
 
 
 __all__ = [
+    "CompletionKind",
     "GraphQLAbstractType",
     "GraphQLArgument",
     "GraphQLArgumentKwargs",
@@ -83,6 +86,7 @@ __all__ = [
     "GraphQLEnumValueMap",
     "GraphQLEnumValuesDefinition",
     "GraphQLField",
+    "GraphQLFieldBatchResolver",
     "GraphQLFieldKwargs",
     "GraphQLFieldMap",
     "GraphQLFieldResolver",
@@ -115,6 +119,7 @@ __all__ = [
     "GraphQLScalarInputValueCoercer",
     "GraphQLScalarLiteralParser",
     "GraphQLScalarOutputValueCoercer",
+    "GraphQLScalarOutputValuesCoercer",
     "GraphQLScalarSerializer",
     "GraphQLScalarType",
     "GraphQLScalarTypeKwargs",
@@ -178,6 +183,25 @@ __all__ = [
 ]
 
 
+class CompletionKind(Enum):
+    """Kinds of completion of values of output types
+
+    Every type class declares the kind of completion that the executor needs to apply
+    to its values, so that it does not need to check the type class for every value.
+
+    The inner type of wrapping types and the output coercion function of leaf types
+    are not cached together with the kind, since they are already available as the
+    attributes ``of_type`` and ``coerce_output_value`` of the type, and the latter
+    may be replaced after the type has been created.
+    """
+
+    NON_NULL = "non-null"
+    LIST = "list"
+    LEAF = "leaf"
+    ABSTRACT = "abstract"
+    OBJECT = "object"
+
+
 class GraphQLType:
     """Base class for all GraphQL types"""
 
@@ -185,6 +209,8 @@ class GraphQLType:
     # are not really important for the schema definition, and it would make caching
     # properties slower or more complicated.
 
+    completion_kind: ClassVar[CompletionKind | None] = None
+
 
 # There are predicates for each kind of GraphQL type.
 
@@ -328,6 +354,7 @@ def resolve_thunk(thunk: Thunk[T]) -> T:
 # Deprecated in favor of GraphQLScalarOutputValueCoercer, will be removed in v3.4
 GraphQLScalarSerializer: TypeAlias = Callable[[Any], Any]
 GraphQLScalarOutputValueCoercer: TypeAlias = Callable[[Any], Any]
+GraphQLScalarOutputValuesCoercer: TypeAlias = Callable[[Any], list[Any]]
 # Deprecated in favor of GraphQLScalarInputValueCoercer, will be removed in v3.4
 GraphQLScalarValueParser: TypeAlias = Callable[[Any], Any]
 GraphQLScalarInputValueCoercer: TypeAlias = Callable[[Any], Any]
@@ -350,6 +377,7 @@ class GraphQLScalarTypeKwargs(GraphQLNamedTypeKwargs, total=False):
     coerce_input_literal: GraphQLScalarInputLiteralCoercer | None
     value_to_literal: GraphQLScalarValueToLiteral | None
     specified_by_url: str | None
+    coerce_output_values: GraphQLScalarOutputValuesCoercer | None
 
 
 class GraphQLScalarType(GraphQLNamedType):
@@ -379,8 +407,20 @@ class GraphQLScalarType(GraphQLNamedType):
 
         odd_type = GraphQLScalarType('Odd', coerce_output_value=coerce_odd)
 
+    A scalar type can also provide a ``coerce_output_values`` function that coerces
+    all values of a list at once. It is called with lists, tuples and array-like
+    values such as ``array.array`` or NumPy arrays, and must return a list with the
+    coerced values. If any of the values cannot be coerced, it should raise an
+    error; the values are then coerced one by one to report the errors. Since this
+    function must coerce the values in the same way as ``coerce_output_value``, it
+    is only used as long as ``coerce_output_value`` is the function that was set
+    when setting ``coerce_output_values``. Scalar types derived with a different
+    ``coerce_output_value`` should therefore also get a matching or no function
+    for coercing all values at once.
     """
 
+    completion_kind = CompletionKind.LEAF
+
     specified_by_url: str | None
     ast_node: ScalarTypeDefinitionNode | None
     extension_ast_nodes: tuple[ScalarTypeExtensionNode, ...]
@@ -390,6 +430,10 @@ class GraphQLScalarType(GraphQLNamedType):
     coerce_input_literal: GraphQLScalarInputLiteralCoercer | None
     value_to_literal: GraphQLScalarValueToLiteral | None
 
+    _coerce_output_values: tuple[
+        GraphQLScalarOutputValuesCoercer | None, GraphQLScalarOutputValueCoercer
+    ]
+
     def __init__(
         self,
         name: str,
@@ -405,6 +449,7 @@ class GraphQLScalarType(GraphQLNamedType):
         extensions: dict[str, Any] | None = None,
         ast_node: ScalarTypeDefinitionNode | None = None,
         extension_ast_nodes: Collection[ScalarTypeExtensionNode] | None = None,
+        coerce_output_values: GraphQLScalarOutputValuesCoercer | None = None,
     ) -> None:
         super().__init__(
             name=name,
@@ -444,6 +489,7 @@ class GraphQLScalarType(GraphQLNamedType):
             )
             raise TypeError(msg)
         self.specified_by_url = specified_by_url
+        self.coerce_output_values = coerce_output_values
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.name!r}>"
@@ -451,6 +497,30 @@ class GraphQLScalarType(GraphQLNamedType):
     def __str__(self) -> str:
         return self.name
 
+    @property
+    def coerce_output_values(self) -> GraphQLScalarOutputValuesCoercer | None:
+        """Get the function coercing all output values of a list at once.
+
+        Returns None if there is no such function, or if ``coerce_output_value`` has
+        been replaced after setting it.
+        """
+        coerce_output_values, coerce_output_value = self._coerce_output_values
+        return (
+            coerce_output_values
+            if coerce_output_value is self.coerce_output_value
+            else None
+        )
+
+    @coerce_output_values.setter
+    def coerce_output_values(
+        self, coerce_output_values: GraphQLScalarOutputValuesCoercer | None
+    ) -> None:
+        """Set the function coercing all output values of a list at once.
+
+        The function is only used together with the current ``coerce_output_value``.
+        """
+        self._coerce_output_values = coerce_output_values, self.coerce_output_value
+
     @staticmethod
     def serialize(value: Any) -> Any:
         """Serializes an internal value to include in a response.
@@ -506,6 +576,7 @@ class GraphQLScalarType(GraphQLNamedType):
             coerce_input_literal=self.coerce_input_literal,
             value_to_literal=self.value_to_literal,
             specified_by_url=self.specified_by_url,
+            coerce_output_values=self.coerce_output_values,
         )
 
     def __copy__(self) -> GraphQLScalarType:  # pragma: no cover
@@ -535,6 +606,12 @@ class GraphQLFieldKwargs(TypedDict, total=False):
     args: GraphQLArgumentMap | None
     resolve: GraphQLFieldResolver | None
     subscribe: GraphQLFieldResolver | None
+    batch_resolve: GraphQLFieldBatchResolver | None
+    allow_raw_json: bool
+    max_concurrency: int | None
+    timeout: float | None
+    max_age: float | None
+    cache: FieldCache | None
     description: str | None
     deprecation_reason: str | None
     extensions: dict[str, Any]
@@ -542,12 +619,51 @@ class GraphQLFieldKwargs(TypedDict, total=False):
 
 
 class GraphQLField:  # noqa: PLW1641
-    """Definition of a GraphQL field"""
+    """Definition of a GraphQL field
+
+    Instead of a resolver that is called for every source value, a field can have
+    a batch resolver that is called with a list of source values, the resolve info
+    and the arguments, and returns a list with one value for each source value or
+    an awaitable for such a list. When the values of a list are completed, the
+    batch resolver is called only once for all values of the list. The resolve
+    info passed to the batch resolver is then the one for the first source value.
+    Note that batch resolvers are not wrapped by middleware.
+
+    If ``allow_raw_json`` is set, the resolvers of the field can also return an
+    instance of :class:`~graphql.execution.RawJSON` with the already serialized
+    value of the field. The executor passes such values through without completing
+    them, and :func:`~graphql.execution.encode_json` splices them into the result.
+
+    If ``max_concurrency`` is set, at most this number of awaitable values returned
+    by the resolvers of the field, including awaitable list items, are awaited at
+    the same time per operation. The other values wait in line until it is their
+    turn, so that their resolvers do not start running before.
+
+    If ``timeout`` is set, the executor stops waiting for awaitable values returned
+    by the resolvers of the field, including awaitable list items, after this number
+    of seconds. The awaited work is then cancelled and a located timeout error is
+    reported for the field, which becomes null if it is nullable. Whether a schema
+    has fields with ``max_concurrency`` or ``timeout`` is determined only once, so
+    these settings should not be changed after the schema has been executed.
+
+    If ``max_age`` is set, responses containing the field are cached by a
+    :class:`~graphql.execution.ResponseCache` for at most this number of seconds.
+
+    If ``cache`` is set, the results of the resolver of the field are cached in the
+    given :class:`~graphql.execution.FieldCache`, which is looked up before the
+    resolver and its middleware are called.
+    """
 
     type: GraphQLOutputType
     args: GraphQLArgumentMap
     resolve: GraphQLFieldResolver | None
     subscribe: GraphQLFieldResolver | None
+    batch_resolve: GraphQLFieldBatchResolver | None
+    allow_raw_json: bool
+    max_concurrency: int | None
+    timeout: float | None
+    max_age: float | None
+    cache: FieldCache | None
     description: str | None
     deprecation_reason: str | None
     extensions: dict[str, Any]
@@ -563,6 +679,12 @@ class GraphQLField:  # noqa: PLW1641
         deprecation_reason: str | None = None,
         extensions: dict[str, Any] | None = None,
         ast_node: FieldDefinitionNode | None = None,
+        batch_resolve: GraphQLFieldBatchResolver | None = None,
+        allow_raw_json: bool = False,
+        max_concurrency: int | None = None,
+        timeout: float | None = None,
+        max_age: float | None = None,
+        cache: FieldCache | None = None,
     ) -> None:
         if args:
             args = {
@@ -577,6 +699,12 @@ class GraphQLField:  # noqa: PLW1641
         self.args = args or {}
         self.resolve = resolve
         self.subscribe = subscribe
+        self.batch_resolve = batch_resolve
+        self.allow_raw_json = allow_raw_json
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.max_age = max_age
+        self.cache = cache
         self.description = description
         self.deprecation_reason = deprecation_reason
         self.extensions = extensions or {}
@@ -594,6 +722,12 @@ class GraphQLField:  # noqa: PLW1641
             and self.type == other.type
             and self.args == other.args
             and self.resolve == other.resolve
+            and self.batch_resolve == other.batch_resolve
+            and self.allow_raw_json == other.allow_raw_json
+            and self.max_concurrency == other.max_concurrency
+            and self.timeout == other.timeout
+            and self.max_age == other.max_age
+            and self.cache is other.cache
             and self.description == other.description
             and self.deprecation_reason == other.deprecation_reason
             and self.extensions == other.extensions
@@ -606,6 +740,12 @@ class GraphQLField:  # noqa: PLW1641
             args=self.args.copy() if self.args else None,
             resolve=self.resolve,
             subscribe=self.subscribe,
+            batch_resolve=self.batch_resolve,
+            allow_raw_json=self.allow_raw_json,
+            max_concurrency=self.max_concurrency,
+            timeout=self.timeout,
+            max_age=self.max_age,
+            cache=self.cache,
             deprecation_reason=self.deprecation_reason,
             description=self.description,
             extensions=self.extensions,
@@ -643,10 +783,15 @@ class GraphQLResolveInfoHelpers(NamedTuple):
     The ``track`` helper registers possibly awaitable values as pending
     asynchronous work of the execution, so that they are still settled and
     their errors observed when they would otherwise be abandoned.
+
+    The ``run_blocking`` helper calls a blocking function with the given arguments
+    in a worker thread of the execution if possible and returns an awaitable for
+    its result, otherwise it calls the function directly and returns its result.
     """
 
     gather: Callable[[Sequence[Awaitable[Any]]], Awaitable[list[Any]]]
     track: Callable[[Sequence[Any]], None]
+    run_blocking: Callable[..., AwaitableOrValue[Any]] | None = None
 
 
 try:
@@ -714,6 +859,8 @@ GraphQLFieldResolverWithoutArgs: TypeAlias = Callable[[Any, GraphQLResolveInfo],
 # Unfortunately there is currently no syntax to indicate optional or keyword
 # arguments in Python, so we also allow any other Callable as a workaround:
 GraphQLFieldResolver: TypeAlias = Callable[..., Any]
+# Batch resolvers get a list of sources and return a list with one value per source:
+GraphQLFieldBatchResolver: TypeAlias = Callable[..., Any]
 
 # Note: Contrary to the Javascript implementation of GraphQLTypeResolver,
 # the context is passed as part of the GraphQLResolveInfo:
@@ -873,6 +1020,7 @@ class GraphQLObjectTypeKwargs(GraphQLNamedTypeKwargs, total=False):
     fields: GraphQLFieldMap
     interfaces: tuple[GraphQLInterfaceType, ...]
     is_type_of: GraphQLIsTypeOfFn | None
+    source_classes: tuple[type, ...]
 
 
 class GraphQLObjectType(GraphQLNamedType):
@@ -901,9 +1049,19 @@ class GraphQLObjectType(GraphQLNamedType):
             'bestFriend': GraphQLField(PersonType)
         })
 
+    The Python classes of the source values that represent objects of this type can
+    be bound to the type with ``source_classes``. When values of these classes are
+    returned for an interface implemented by this type or for a union containing
+    this type, they are then resolved to this type by the default type resolver
+    without calling ``is_type_of`` on all possible types, and without calling the
+    ``resolve_type`` function of abstract types caching their resolved types. The
+    ``is_type_of`` function of this type is still checked if it is given.
     """
 
+    completion_kind = CompletionKind.OBJECT
+
     is_type_of: GraphQLIsTypeOfFn | None
+    source_classes: tuple[type, ...]
     ast_node: ObjectTypeDefinitionNode | None
     extension_ast_nodes: tuple[ObjectTypeExtensionNode, ...]
 
@@ -917,6 +1075,7 @@ class GraphQLObjectType(GraphQLNamedType):
         description: str | None = None,
         ast_node: ObjectTypeDefinitionNode | None = None,
         extension_ast_nodes: Collection[ObjectTypeExtensionNode] | None = None,
+        source_classes: Collection[type] | None = None,
     ) -> None:
         super().__init__(
             name=name,
@@ -928,6 +1087,7 @@ class GraphQLObjectType(GraphQLNamedType):
         self._fields = fields
         self._interfaces = interfaces
         self.is_type_of = is_type_of
+        self.source_classes = tuple(source_classes) if source_classes else ()
 
     def to_kwargs(self) -> GraphQLObjectTypeKwargs:
         """Get corresponding arguments."""
@@ -936,6 +1096,7 @@ class GraphQLObjectType(GraphQLNamedType):
             fields=self.fields.copy(),
             interfaces=self.interfaces,
             is_type_of=self.is_type_of,
+            source_classes=self.source_classes,
         )
 
     def __copy__(self) -> GraphQLObjectType:  # pragma: no cover
@@ -990,6 +1151,7 @@ class GraphQLInterfaceTypeKwargs(GraphQLNamedTypeKwargs, total=False):
     fields: GraphQLFieldMap
     interfaces: tuple[GraphQLInterfaceType, ...]
     resolve_type: GraphQLTypeResolver | None
+    cache_resolved_types: bool
 
 
 class GraphQLInterfaceType(GraphQLNamedType):
@@ -1005,9 +1167,18 @@ class GraphQLInterfaceType(GraphQLNamedType):
         EntityType = GraphQLInterfaceType('Entity', {
                 'name': GraphQLField(GraphQLString),
             })
+
+    If ``cache_resolved_types`` is set, the runtime object type resolved for a value
+    is cached for the Python class of the value, and used for all other values of
+    the same class. This should only be set if the runtime object type can be
+    determined from the class of the values alone. Values that are mappings are
+    never cached, since they can carry their own type name.
     """
 
+    completion_kind = CompletionKind.ABSTRACT
+
     resolve_type: GraphQLTypeResolver | None
+    cache_resolved_types: bool
     ast_node: InterfaceTypeDefinitionNode | None
     extension_ast_nodes: tuple[InterfaceTypeExtensionNode, ...]
 
@@ -1021,6 +1192,7 @@ class GraphQLInterfaceType(GraphQLNamedType):
         extensions: dict[str, Any] | None = None,
         ast_node: InterfaceTypeDefinitionNode | None = None,
         extension_ast_nodes: Collection[InterfaceTypeExtensionNode] | None = None,
+        cache_resolved_types: bool = False,
     ) -> None:
         super().__init__(
             name=name,
@@ -1032,6 +1204,7 @@ class GraphQLInterfaceType(GraphQLNamedType):
         self._fields = fields
         self._interfaces = interfaces
         self.resolve_type = resolve_type
+        self.cache_resolved_types = cache_resolved_types
 
     def to_kwargs(self) -> GraphQLInterfaceTypeKwargs:
         """Get corresponding arguments."""
@@ -1040,6 +1213,7 @@ class GraphQLInterfaceType(GraphQLNamedType):
             fields=self.fields.copy(),
             interfaces=self.interfaces,
             resolve_type=self.resolve_type,
+            cache_resolved_types=self.cache_resolved_types,
         )
 
     def __copy__(self) -> GraphQLInterfaceType:  # pragma: no cover
@@ -1093,6 +1267,7 @@ class GraphQLUnionTypeKwargs(GraphQLNamedTypeKwargs, total=False):
 
     types: tuple[GraphQLObjectType, ...]
     resolve_type: GraphQLTypeResolver | None
+    cache_resolved_types: bool
 
 
 class GraphQLUnionType(GraphQLNamedType):
@@ -1111,9 +1286,18 @@ class GraphQLUnionType(GraphQLNamedType):
                 return CatType()
 
         PetType = GraphQLUnionType('Pet', [DogType, CatType], resolve_type)
+
+    If ``cache_resolved_types`` is set, the runtime object type resolved for a value
+    is cached for the Python class of the value, and used for all other values of
+    the same class. This should only be set if the runtime object type can be
+    determined from the class of the values alone. Values that are mappings are
+    never cached, since they can carry their own type name.
     """
 
+    completion_kind = CompletionKind.ABSTRACT
+
     resolve_type: GraphQLTypeResolver | None
+    cache_resolved_types: bool
     ast_node: UnionTypeDefinitionNode | None
     extension_ast_nodes: tuple[UnionTypeExtensionNode, ...]
 
@@ -1126,6 +1310,7 @@ class GraphQLUnionType(GraphQLNamedType):
         extensions: dict[str, Any] | None = None,
         ast_node: UnionTypeDefinitionNode | None = None,
         extension_ast_nodes: Collection[UnionTypeExtensionNode] | None = None,
+        cache_resolved_types: bool = False,
     ) -> None:
         super().__init__(
             name=name,
@@ -1136,6 +1321,7 @@ class GraphQLUnionType(GraphQLNamedType):
         )
         self._types = types
         self.resolve_type = resolve_type
+        self.cache_resolved_types = cache_resolved_types
 
     def to_kwargs(self) -> GraphQLUnionTypeKwargs:
         """Get corresponding arguments."""
@@ -1143,6 +1329,7 @@ class GraphQLUnionType(GraphQLNamedType):
             super().to_kwargs(),  # type: ignore
             types=self.types,
             resolve_type=self.resolve_type,
+            cache_resolved_types=self.cache_resolved_types,
         )
 
     def __copy__(self) -> GraphQLUnionType:  # pragma: no cover
@@ -1221,6 +1408,8 @@ class GraphQLEnumType(GraphQLNamedType):
     be used as its internal value when the value is serialized.
     """
 
+    completion_kind = CompletionKind.LEAF
+
     ast_node: EnumTypeDefinitionNode | None
     extension_ast_nodes: tuple[EnumTypeExtensionNode, ...]
 
@@ -1725,6 +1914,8 @@ class GraphQLList(GraphQLWrappingType[GT_co]):
                 }
     """
 
+    completion_kind = CompletionKind.LIST
+
     def __init__(self, type_: GT_co) -> None:
         super().__init__(type_=type_)
 
@@ -1768,6 +1959,8 @@ class GraphQLNonNull(GraphQLWrappingType[GNT_co]):
     Note: the enforcement of non-nullability occurs within the executor.
     """
 
+    completion_kind = CompletionKind.NON_NULL
+
     def __init__(self, type_: GNT_co) -> None:
         super().__init__(type_=type_)
 
@@ -13,7 +13,7 @@ from .definition import (
     GraphQLInputType,
     GraphQLNonNull,
 )
-from .scalars import GraphQLBoolean, GraphQLInt, GraphQLString
+from .scalars import GraphQLBoolean, GraphQLFloat, GraphQLInt, GraphQLString
 
 if TYPE_CHECKING:
     from collections.abc import Collection
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 __all__ = [
     "DEFAULT_DEPRECATION_REASON",
     "DirectiveLocation",
+    "GraphQLCachedDirective",
     "GraphQLDeferDirective",
     "GraphQLDeprecatedDirective",
     "GraphQLDirective",
@@ -30,6 +31,7 @@ __all__ = [
     "GraphQLSkipDirective",
     "GraphQLSpecifiedByDirective",
     "GraphQLStreamDirective",
+    "GraphQLTimeoutDirective",
     "assert_directive",
     "is_directive",
     "is_specified_directive",
@@ -235,6 +237,41 @@ GraphQLStreamDirective = GraphQLDirective(
     },
 )
 
+# Used to limit the time spent waiting for the values of fields. This directive is
+# not one of the specified directives, so schemas need to declare it explicitly:
+GraphQLTimeoutDirective = GraphQLDirective(
+    name="timeout",
+    description="Directs the executor to stop waiting for the value of this field"
+    " after the given number of seconds.",
+    locations=[DirectiveLocation.FIELD],
+    args={
+        "seconds": GraphQLArgument(
+            GraphQLNonNull(GraphQLFloat),
+            description="Time budget in seconds.",
+        ),
+    },
+)
+
+# Used to cache the results of the resolvers of fields. This directive is not one
+# of the specified directives either, schemas need to declare it with the same args:
+GraphQLCachedDirective = GraphQLDirective(
+    name="cached",
+    description="Directs the executor to cache the results of the resolver"
+    " of this field.",
+    locations=[DirectiveLocation.FIELD_DEFINITION],
+    args={
+        "maxAge": GraphQLArgument(
+            GraphQLNonNull(GraphQLFloat),
+            description="Time in seconds for which a result is cached.",
+        ),
+        "maxSize": GraphQLArgument(
+            GraphQLNonNull(GraphQLInt),
+            description="Maximum number of cached results.",
+            default=GraphQLDefaultInput(value=1000),
+        ),
+    },
+)
+
 # Constant string used for default reason for a deprecation:
 DEFAULT_DEPRECATION_REASON = "No longer supported"
 
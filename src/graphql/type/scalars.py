@@ -50,6 +50,9 @@ GRAPHQL_MAX_INT = 2_147_483_647
 GRAPHQL_MIN_INT = -2_147_483_648
 """Minimum possible Int value as per GraphQL Spec (32-bit signed integer)"""
 
+# Integers up to this size can be converted to floats without loss of precision.
+MAX_SAFE_FLOAT_INT = 2**53
+
 
 def serialize_int(output_value: Any) -> int:
     if isinstance(output_value, bool):
@@ -96,6 +99,18 @@ def int_value_to_literal(value: Any) -> ConstValueNode | None:
     return None
 
 
+def serialize_ints(output_values: Any) -> list[int]:
+    values = to_list(output_values)
+    if values and not (
+        set(map(type, values)) == {int}
+        and min(values) >= GRAPHQL_MIN_INT
+        and max(values) <= GRAPHQL_MAX_INT
+    ):
+        msg = "Int cannot represent all values of the list."
+        raise GraphQLError(msg)
+    return values
+
+
 GraphQLInt = GraphQLScalarType(
     name="Int",
     description="The `Int` scalar type represents"
@@ -105,6 +120,7 @@ GraphQLInt = GraphQLScalarType(
     coerce_input_value=coerce_int,
     coerce_input_literal=parse_int_literal,
     value_to_literal=int_value_to_literal,
+    coerce_output_values=serialize_ints,
 )
 
 
@@ -148,6 +164,27 @@ def float_value_to_literal(value: Any) -> ConstValueNode | None:
     return None
 
 
+def serialize_floats(output_values: Any) -> list[float]:
+    values = to_list(output_values)
+    if values:
+        types = set(map(type, values))
+        if types != {float}:
+            # integers are only accepted if they can be converted without loss
+            if not (
+                types <= {float, int}
+                and min(values) >= -MAX_SAFE_FLOAT_INT
+                and max(values) <= MAX_SAFE_FLOAT_INT
+            ):
+                msg = "Float cannot represent all values of the list."
+                raise GraphQLError(msg)
+            values = list(map(float, values))
+        # the sum is not finite if any value is not finite (or if it overflows)
+        if not isfinite(sum(values)):
+            msg = "Float cannot represent all values of the list."
+            raise GraphQLError(msg)
+    return values
+
+
 GraphQLFloat = GraphQLScalarType(
     name="Float",
     description="The `Float` scalar type represents"
@@ -158,6 +195,7 @@ GraphQLFloat = GraphQLScalarType(
     coerce_input_value=coerce_float,
     coerce_input_literal=parse_float_literal,
     value_to_literal=float_value_to_literal,
+    coerce_output_values=serialize_floats,
 )
 
 
@@ -329,6 +367,11 @@ GraphQLID = GraphQLScalarType(
 )
 
 
+def to_list(values: Any) -> list[Any]:
+    """Convert a list, tuple or array-like value to a list of Python values."""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
 def coerce_int_from_number(value: float) -> int:
     if isinstance(value, float) and (not isfinite(value) or int(value) != value):
         msg = "Int cannot represent non-integer value: " + inspect(value)
@@ -132,6 +132,8 @@ class GraphQLSchema:
 
     _implementations_map: dict[str, InterfaceImplementations]
     _sub_type_map: dict[str, set[str]]
+    _bound_type_map: dict[tuple[str, type], GraphQLObjectType]
+    _resolved_type_map: dict[tuple[str, type], GraphQLObjectType]
     _validation_errors: list[GraphQLError] | None
 
     def __init__(
@@ -205,6 +207,10 @@ class GraphQLSchema:
 
         self._sub_type_map = {}
 
+        # Keep track of the object types bound to classes of values per abstract type.
+        bound_type_map: dict[tuple[str, type], GraphQLObjectType] = {}
+        self._bound_type_map = bound_type_map
+
         # Keep track of all implementations by interface name.
         implementations_map: dict[str, InterfaceImplementations] = {}
         self._implementations_map = implementations_map
@@ -253,6 +259,16 @@ class GraphQLSchema:
                             )
 
                         implementations.objects.append(named_type)
+                    for source_class in named_type.source_classes:
+                        bound_type_map[iface.name, source_class] = named_type
+            elif is_union_type(named_type):
+                for type_ in named_type.types:
+                    if is_object_type(type_):
+                        for source_class in type_.source_classes:
+                            bound_type_map[type_name, source_class] = type_
+
+        # Cache the runtime types resolved for classes of values of abstract types.
+        self._resolved_type_map = bound_type_map.copy()
 
     def to_kwargs(self) -> GraphQLSchemaKwargs:
         """Get corresponding arguments."""
@@ -361,6 +377,30 @@ class GraphQLSchema:
             self._sub_type_map[abstract_type.name] = types
         return maybe_sub_type.name in types
 
+    def get_resolved_type(
+        self, abstract_type: GraphQLAbstractType, value_class: type
+    ) -> GraphQLObjectType | None:
+        """Get the runtime type of values of the given class for an abstract type.
+
+        This is the possible type of the abstract type that has been bound to the
+        class with ``source_classes``, or the runtime type that has been cached for
+        the class with :meth:`cache_resolved_type`. Returns None if it is unknown.
+        """
+        return self._resolved_type_map.get((abstract_type.name, value_class))
+
+    def cache_resolved_type(
+        self,
+        abstract_type: GraphQLAbstractType,
+        value_class: type,
+        runtime_type: GraphQLObjectType,
+    ) -> None:
+        """Cache the runtime type resolved for values of the given class."""
+        self._resolved_type_map[abstract_type.name, value_class] = runtime_type
+
+    def clear_resolved_types(self) -> None:
+        """Clear the cached runtime types, keeping only the bound types."""
+        self._resolved_type_map = self._bound_type_map.copy()
+
     def get_directive(self, name: str) -> GraphQLDirective | None:
         """Get the directive with the given name."""
         for directive in self.directives:
@@ -10,6 +10,8 @@ from typing import (
     cast,
 )
 
+from ..execution.field_cache import FieldCache
+from ..execution.values import get_directive_values
 from ..language import (
     DirectiveDefinitionNode,
     DirectiveExtensionNode,
@@ -38,11 +40,13 @@ from ..language import (
     TypeNode,
     UnionTypeDefinitionNode,
     UnionTypeExtensionNode,
+    print_ast,
 )
 from ..pyutils import inspect, merge_kwargs
 from ..type import (
     GraphQLArgument,
     GraphQLArgumentMap,
+    GraphQLCachedDirective,
     GraphQLDefaultInput,
     GraphQLDeprecatedDirective,
     GraphQLDirective,
@@ -73,6 +77,7 @@ from ..type import (
     introspection_types,
     specified_scalar_types,
 )
+from .get_default_value_ast import get_default_value_ast
 from .map_schema_config import SchemaElementKind, map_schema_config
 
 if TYPE_CHECKING:
@@ -209,6 +214,11 @@ class ExtendSchemaImpl:
         if not is_schema_changed:
             return schema_kwargs
 
+        # Fields are only cached if the @cached directive of this library is declared.
+        caches_fields = declares_cached_directive(
+            schema_kwargs["directives"], directive_defs
+        )
+
         def config_mapper_map_fn(context: MappedSchemaContext) -> ConfigMapperMap:
             get_named_type = context.get_named_type
             set_named_type = context.set_named_type
@@ -312,6 +322,7 @@ class ExtendSchemaImpl:
                             else None,
                             args=build_argument_map(field.arguments),
                             deprecation_reason=get_deprecation_reason(field),
+                            cache=get_field_cache(field) if caches_fields else None,
                             ast_node=field,
                         )
                 return field_map
@@ -666,24 +677,67 @@ def get_deprecation_reason(
     | DirectiveExtensionNode,
 ) -> str | None:
     """Given a field or enum value node, get deprecation reason as string."""
-    from ..execution import get_directive_values
-
     deprecated = get_directive_values(GraphQLDeprecatedDirective, node)
     return deprecated["reason"] if deprecated else None
 
 
+def declares_cached_directive(
+    directives: Collection[GraphQLDirective],
+    directive_defs: Collection[DirectiveDefinitionNode],
+) -> bool:
+    """Check whether the @cached directive of this library is declared.
+
+    The directive can be declared as ``GraphQLCachedDirective`` or in SDL with the
+    same arguments, including their types and default values. Other directives with
+    the same name are not used for creating field caches.
+    """
+    name = GraphQLCachedDirective.name
+    expected_args = [
+        print_input_value_signature(arg_name, arg)
+        for arg_name, arg in GraphQLCachedDirective.args.items()
+    ]
+    for directive in directives:
+        if directive.name == name:
+            return (
+                directive is GraphQLCachedDirective
+                or [
+                    print_input_value_signature(arg_name, arg)
+                    for arg_name, arg in directive.args.items()
+                ]
+                == expected_args
+            )
+    for node in directive_defs:
+        if node.name.value == name:
+            return [
+                f"{arg.name.value}: {print_ast(arg.type)}"
+                + (f" = {print_ast(arg.default_value)}" if arg.default_value else "")
+                for arg in node.arguments or ()
+            ] == expected_args
+    return False
+
+
+def print_input_value_signature(name: str, arg: GraphQLArgument) -> str:
+    """Print the name, type and default value of an argument."""
+    default_value_ast = get_default_value_ast(arg)
+    return f"{name}: {arg.type}" + (
+        f" = {print_ast(default_value_ast)}" if default_value_ast else ""
+    )
+
+
+def get_field_cache(node: FieldDefinitionNode) -> FieldCache | None:
+    """Given a field node, get the field cache requested with @cached."""
+    cached = get_directive_values(GraphQLCachedDirective, node)
+    return FieldCache(cached["maxAge"], cached["maxSize"]) if cached else None
+
+
 def get_specified_by_url(
     node: ScalarTypeDefinitionNode | ScalarTypeExtensionNode,
 ) -> str | None:
     """Given a scalar node, return the string value for the specifiedByURL."""
-    from ..execution import get_directive_values
-
     specified_by_url = get_directive_values(GraphQLSpecifiedByDirective, node)
     return specified_by_url["url"] if specified_by_url else None
 
 
 def is_one_of(node: InputObjectTypeDefinitionNode) -> bool:
     """Given an input object node, returns if the node should be OneOf."""
-    from ..execution import get_directive_values
-
     return get_directive_values(GraphQLOneOfDirective, node) is not None
@@ -1,10 +1,30 @@
 import asyncio
 
-from graphql import ExecutionResult, build_schema, execute, parse
+from graphql import ExecutionResult, ListChunk, build_schema, execute, parse
 from graphql.pyutils import is_awaitable
 
-schema = build_schema("type Query { listField: [String] }")
+schema = build_schema(
+    """
+    type Query {
+      listField: [String], chunkedListField: [String], objectListField: [Item]
+    }
+    type Item { id: ID, name: String }
+    """
+)
 document = parse("{ listField }")
+chunked_document = parse("{ chunkedListField }")
+object_document = parse("{ objectListField { id name } }")
+
+
+class Item:
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    async def id(self, _info):
+        return str(self.index)
+
+    async def name(self, _info):
+        return "Sarah"
 
 
 class Data:
@@ -13,9 +33,19 @@ class Data:
         for index in range(1000):
             yield index
 
+    @staticmethod
+    async def chunkedListField(_info):
+        for index in range(0, 1000, 100):
+            yield ListChunk(range(index, index + 100))
+
+    @staticmethod
+    async def objectListField(_info):
+        for index in range(100):
+            yield Item(index)
+
 
-async def execute_async() -> ExecutionResult:
-    result = execute(schema, document, Data())
+async def execute_async(chunked: bool = False) -> ExecutionResult:
+    result = execute(schema, chunked_document if chunked else document, Data())
     assert is_awaitable(result)
     return await result
 
@@ -30,3 +60,57 @@ def test_execute_async_iterable_list_field(benchmark):
     loop.close()
     assert not result.errors
     assert result.data == {"listField": [str(index) for index in range(1000)]}
+
+
+def test_execute_async_iterable_chunked_list_field(benchmark):
+    loop = asyncio.events.new_event_loop()
+    asyncio.events.set_event_loop(loop)
+    result = benchmark(lambda: loop.run_until_complete(execute_async(chunked=True)))
+    asyncio.events.set_event_loop(None)
+    loop.close()
+    assert not result.errors
+    assert result.data == {"chunkedListField": [str(index) for index in range(1000)]}
+
+
+async def execute_object_list_async(
+    eager_awaiting: bool, read_ahead: int | None
+) -> ExecutionResult:
+    result = execute(
+        schema,
+        object_document,
+        Data(),
+        eager_awaiting=eager_awaiting,
+        read_ahead=read_ahead,
+    )
+    assert is_awaitable(result)
+    return await result
+
+
+def run_execute_object_list(
+    benchmark, eager_awaiting: bool, read_ahead: int | None = None
+) -> None:
+    loop = asyncio.events.new_event_loop()
+    asyncio.events.set_event_loop(loop)
+    result = benchmark(
+        lambda: loop.run_until_complete(
+            execute_object_list_async(eager_awaiting, read_ahead)
+        )
+    )
+    asyncio.events.set_event_loop(None)
+    loop.close()
+    assert not result.errors
+    assert result.data == {
+        "objectListField": [{"id": str(index), "name": "Sarah"} for index in range(100)]
+    }
+
+
+def test_execute_async_iterable_object_list_field(benchmark):
+    run_execute_object_list(benchmark, False)
+
+
+def test_execute_async_iterable_object_list_field_eagerly(benchmark):
+    run_execute_object_list(benchmark, True)
+
+
+def test_execute_async_iterable_object_list_field_reading_ahead(benchmark):
+    run_execute_object_list(benchmark, False, 10)
@@ -1,12 +1,19 @@
 import asyncio
+from typing import Any
 
 from graphql import (
+    ExecutionResult,
     GraphQLField,
+    GraphQLList,
     GraphQLObjectType,
     GraphQLSchema,
     GraphQLString,
+    execute,
     graphql,
+    parse,
 )
+from graphql.execution import JitExecutor
+from graphql.pyutils import AbortController, is_awaitable
 
 user = GraphQLObjectType(
     name="User",
@@ -54,3 +61,89 @@ def test_execute_basic_async(benchmark):
             "name": "Sarah",
         },
     }
+
+
+def test_execute_basic_async_jit(benchmark):
+    # Note: we are creating the async loop outside of the benchmark code so that
+    # the setup is not included in the benchmark timings
+    loop = asyncio.events.new_event_loop()
+    asyncio.events.set_event_loop(loop)
+    result = benchmark(
+        lambda: loop.run_until_complete(
+            graphql(schema, "query { user { id, name }}", executor_class=JitExecutor)
+        )
+    )
+    asyncio.events.set_event_loop(None)
+    loop.close()
+    assert not result.errors
+    assert result.data == {
+        "user": {
+            "id": "1",
+            "name": "Sarah",
+        },
+    }
+
+
+class Friend:
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    async def id(self, _info):
+        return str(self.index)
+
+    async def name(self, _info):
+        return "Sarah"
+
+
+friend = GraphQLObjectType(
+    name="Friend",
+    fields={
+        "id": GraphQLField(GraphQLString),
+        "name": GraphQLField(GraphQLString),
+    },
+)
+
+
+async def resolve_friends(_obj, _info):
+    return [Friend(index) for index in range(100)]
+
+
+friends_schema = GraphQLSchema(
+    query=GraphQLObjectType(
+        name="Query",
+        fields={"friends": GraphQLField(GraphQLList(friend), resolve=resolve_friends)},
+    )
+)
+
+friends_document = parse("query { friends { id, name }}")
+
+
+async def execute_friends(**kwargs: Any) -> ExecutionResult:
+    result = execute(friends_schema, friends_document, **kwargs)
+    assert is_awaitable(result)
+    return await result
+
+
+def run_execute_friends(benchmark, **kwargs: Any) -> None:
+    loop = asyncio.events.new_event_loop()
+    asyncio.events.set_event_loop(loop)
+    result = benchmark(lambda: loop.run_until_complete(execute_friends(**kwargs)))
+    asyncio.events.set_event_loop(None)
+    loop.close()
+    assert not result.errors
+    assert result.data == {
+        "friends": [{"id": str(index), "name": "Sarah"} for index in range(100)]
+    }
+
+
+def test_execute_async_fields_of_list_items(benchmark):
+    run_execute_friends(benchmark)
+
+
+def test_execute_async_fields_of_list_items_eagerly(benchmark):
+    run_execute_friends(benchmark, eager_awaiting=True)
+
+
+def test_execute_async_fields_of_list_items_with_abort_signal(benchmark):
+    # the signal is never triggered, this measures the overhead of watching it
+    run_execute_friends(benchmark, abort_signal=AbortController().signal)
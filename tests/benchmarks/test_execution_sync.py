@@ -1,10 +1,18 @@
+from array import array
+
 from graphql import (
     GraphQLField,
+    GraphQLFloat,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
     GraphQLObjectType,
     GraphQLSchema,
     GraphQLString,
+    GraphQLUnionType,
     graphql_sync,
 )
+from graphql.execution import BreadthFirstExecutor, JitExecutor, SyncExecutor
 
 user = GraphQLObjectType(
     name="User",
@@ -14,6 +22,14 @@ user = GraphQLObjectType(
     },
 )
 
+non_null_user = GraphQLObjectType(
+    name="NonNullUser",
+    fields={
+        "id": GraphQLField(GraphQLNonNull(GraphQLString)),
+        "name": GraphQLField(GraphQLNonNull(GraphQLString)),
+    },
+)
+
 
 def resolve_user(_obj, _info):
     return {
@@ -22,6 +38,34 @@ def resolve_user(_obj, _info):
     }
 
 
+users = [{"id": str(i), "name": f"User {i}"} for i in range(1000)]
+
+user_groups = [users[i : i + 10] for i in range(0, 1000, 10)]
+
+scores = list(range(10000))
+
+weights = array("d", (i / 8 for i in range(100000)))
+
+
+def make_is_type_of(cls):
+    return lambda obj, _info: isinstance(obj, cls)
+
+
+item_classes = [type(f"Item{i}", (), {"id": str(i)}) for i in range(30)]
+
+item_types = [
+    GraphQLObjectType(
+        cls.__name__,
+        {"id": GraphQLField(GraphQLString)},
+        is_type_of=make_is_type_of(cls),
+    )
+    for cls in item_classes
+]
+
+items = [item_classes[i % 30]() for i in range(1000)]
+
+items_query = "query { items { ... on Item29 { id } } }"
+
 schema = GraphQLSchema(
     query=GraphQLObjectType(
         name="Query",
@@ -29,7 +73,39 @@ schema = GraphQLSchema(
             "user": GraphQLField(
                 user,
                 resolve=resolve_user,
-            )
+            ),
+            "users": GraphQLField(
+                GraphQLList(user),
+                resolve=lambda _obj, _info: users,
+            ),
+            "userGroups": GraphQLField(
+                GraphQLNonNull(
+                    GraphQLList(
+                        GraphQLNonNull(GraphQLList(GraphQLNonNull(non_null_user)))
+                    )
+                ),
+                resolve=lambda _obj, _info: user_groups,
+            ),
+            "scores": GraphQLField(
+                GraphQLList(GraphQLNonNull(GraphQLInt)),
+                resolve=lambda _obj, _info: scores,
+            ),
+            "items": GraphQLField(
+                GraphQLList(GraphQLUnionType("Item", item_types)),
+                resolve=lambda _obj, _info: items,
+            ),
+            "cachedItems": GraphQLField(
+                GraphQLList(
+                    GraphQLUnionType(
+                        "CachedItem", item_types, cache_resolved_types=True
+                    )
+                ),
+                resolve=lambda _obj, _info: items,
+            ),
+            "weights": GraphQLField(
+                GraphQLList(GraphQLNonNull(GraphQLFloat)),
+                resolve=lambda _obj, _info: weights,
+            ),
         },
     )
 )
@@ -44,3 +120,133 @@ def test_execute_basic_sync(benchmark):
             "name": "Sarah",
         },
     }
+
+
+def test_execute_basic_sync_jit(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(
+            schema, "query { user { id, name }}", executor_class=JitExecutor
+        )
+    )
+    assert not result.errors
+    assert result.data == {
+        "user": {
+            "id": "1",
+            "name": "Sarah",
+        },
+    }
+
+
+def test_execute_basic_sync_sync_executor(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(
+            schema, "query { user { id, name }}", executor_class=SyncExecutor
+        )
+    )
+    assert not result.errors
+    assert result.data == {
+        "user": {
+            "id": "1",
+            "name": "Sarah",
+        },
+    }
+
+
+def test_execute_list_sync(benchmark):
+    result = benchmark(lambda: graphql_sync(schema, "query { users { id, name }}"))
+    assert not result.errors
+    assert result.data == {"users": users}
+
+
+def test_execute_list_sync_jit(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(
+            schema, "query { users { id, name }}", executor_class=JitExecutor
+        )
+    )
+    assert not result.errors
+    assert result.data == {"users": users}
+
+
+def test_execute_list_sync_breadth_first(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(
+            schema, "query { users { id, name }}", executor_class=BreadthFirstExecutor
+        )
+    )
+    assert not result.errors
+    assert result.data == {"users": users}
+
+
+def test_execute_list_sync_sync_executor(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(
+            schema, "query { users { id, name }}", executor_class=SyncExecutor
+        )
+    )
+    assert not result.errors
+    assert result.data == {"users": users}
+
+
+def test_execute_nested_non_null_list_sync(benchmark):
+    result = benchmark(lambda: graphql_sync(schema, "query { userGroups { id, name }}"))
+    assert not result.errors
+    assert result.data == {"userGroups": user_groups}
+
+
+def test_execute_nested_non_null_list_sync_sync_executor(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(
+            schema, "query { userGroups { id, name }}", executor_class=SyncExecutor
+        )
+    )
+    assert not result.errors
+    assert result.data == {"userGroups": user_groups}
+
+
+def test_execute_leaf_list_sync(benchmark):
+    result = benchmark(lambda: graphql_sync(schema, "query { scores }"))
+    assert not result.errors
+    assert result.data == {"scores": scores}
+
+
+def test_execute_leaf_list_sync_sync_executor(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(schema, "query { scores }", executor_class=SyncExecutor)
+    )
+    assert not result.errors
+    assert result.data == {"scores": scores}
+
+
+def test_execute_float_array_sync(benchmark):
+    result = benchmark(lambda: graphql_sync(schema, "query { weights }"))
+    assert not result.errors
+    assert result.data == {"weights": weights.tolist()}
+
+
+def test_execute_union_list_sync(benchmark):
+    result = benchmark(lambda: graphql_sync(schema, items_query))
+    assert not result.errors
+    assert len(result.data["items"]) == 1000
+
+
+def test_execute_union_list_sync_sync_executor(benchmark):
+    result = benchmark(
+        lambda: graphql_sync(schema, items_query, executor_class=SyncExecutor)
+    )
+    assert not result.errors
+    assert len(result.data["items"]) == 1000
+
+
+def test_execute_cached_union_list_sync(benchmark):
+    query = items_query.replace("items", "cachedItems")
+    result = benchmark(lambda: graphql_sync(schema, query))
+    assert not result.errors
+    assert len(result.data["cachedItems"]) == 1000
+
+
+def test_execute_cached_union_list_sync_sync_executor(benchmark):
+    query = items_query.replace("items", "cachedItems")
+    result = benchmark(lambda: graphql_sync(schema, query, executor_class=SyncExecutor))
+    assert not result.errors
+    assert len(result.data["cachedItems"]) == 1000
@@ -0,0 +1,35 @@
+"""Benchmarks for encoding execution results as JSON."""
+
+import json
+from io import BytesIO
+
+from graphql import ExecutionResult, encode_result, write_result
+
+users = [
+    {"id": str(i), "name": f"User {i}", "score": i / 8, "active": i % 2 == 0}
+    for i in range(10000)
+]
+
+result = ExecutionResult({"users": users})
+
+
+def test_encode_result(benchmark):
+    encoded = benchmark(lambda: encode_result(result))
+    assert json.loads(encoded) == result.formatted
+
+
+def test_write_result(benchmark):
+    def write():
+        stream = BytesIO()
+        write_result(result, stream)
+        return stream.getvalue()
+
+    encoded = benchmark(write)
+    assert json.loads(encoded) == result.formatted
+
+
+def test_json_dumps_formatted_result(benchmark):
+    encoded = benchmark(
+        lambda: json.dumps(result.formatted, separators=(",", ":")).encode()
+    )
+    assert json.loads(encoded) == result.formatted
@@ -12,6 +12,7 @@ from graphql.execution import (
     ExecutionResult,
     ExperimentalIncrementalExecutionResults,
     IncrementalStreamResult,
+    ListChunk,
     execute,
     experimental_execute_incrementally,
 )
@@ -915,6 +916,45 @@ def describe_execute_stream_directive():
             },
         ]
 
+    async def can_stream_list_chunks_of_an_async_iterable():
+        document = parse(
+            """
+            query {
+              friendList @stream(initialCount: 1) {
+                name
+                id
+              }
+            }
+            """
+        )
+
+        async def friend_list(_info):
+            yield ListChunk(friends[:2])
+            yield ListChunk([])
+            yield ListChunk(friends[2:])
+
+        result = await complete(document, {"friendList": friend_list})
+        assert result == [
+            {
+                "data": {"friendList": [{"name": "Luke", "id": "1"}]},
+                "pending": [{"id": "0", "path": ["friendList"]}],
+                "hasNext": True,
+            },
+            {
+                "incremental": [
+                    {
+                        "items": [
+                            {"name": "Han", "id": "2"},
+                            {"name": "Leia", "id": "3"},
+                        ],
+                        "id": "0",
+                    },
+                ],
+                "completed": [{"id": "0"}],
+                "hasNext": False,
+            },
+        ]
+
     async def negative_initial_count_throw_error_on_field_returning_async_iterable():
         """Negative initialCount throw error on field returning async iterable
 
@@ -640,3 +640,203 @@ def describe_execute_handles_synchronous_execution_of_abstract_types():
             " with value {'__typename': None}, received '[]',"
             " which is not a valid Object type name.",
         )
+
+
+resolved_types: list[str] = []
+
+
+def resolve_pet_type(obj: Any, _info: Any, _type: Any) -> str | None:
+    type_name = obj.__class__.__name__ if isinstance(obj, Dog | Cat) else None
+    resolved_types.append(type_name or obj.get("__typename"))
+    return type_name or obj.get("__typename")
+
+
+async def resolve_pet_type_async(obj: Any, info: Any, type_: Any) -> str | None:
+    return resolve_pet_type(obj, info, type_)
+
+
+def count_is_type_of(type_: type) -> Callable[[Any, Any], bool]:
+    """Get an is_type_of function for the given type that counts the calls."""
+
+    def is_type_of(obj: Any, _info: Any) -> bool:
+        resolved_types.append(type_.__name__)
+        return isinstance(obj, type_)
+
+    return is_type_of
+
+
+def build_pet_schema(
+    resolve_type: Any = None, is_type_of: Callable[[type], Any] | None = None
+) -> GraphQLSchema:
+    """Build a schema with a union of pets that caches resolved types."""
+    dog_type = GraphQLObjectType(
+        "Dog",
+        {"name": GraphQLField(GraphQLString)},
+        is_type_of=is_type_of(Dog) if is_type_of else None,
+    )
+    cat_type = GraphQLObjectType(
+        "Cat",
+        {"name": GraphQLField(GraphQLString)},
+        is_type_of=is_type_of(Cat) if is_type_of else None,
+    )
+    pet_type = GraphQLUnionType(
+        "Pet", [dog_type, cat_type], resolve_type, cache_resolved_types=True
+    )
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "pets": GraphQLField(
+                    GraphQLList(pet_type), resolve=lambda root, _info: root
+                )
+            },
+        )
+    )
+
+
+pets_query = "{ pets { ... on Dog { name } ... on Cat { name } } }"
+
+
+def describe_execute_caches_resolved_types():
+    @sync_and_async
+    async def caches_types_resolved_for_classes(sync):
+        schema = build_pet_schema(resolve_pet_type if sync else resolve_pet_type_async)
+        pets = [Dog("Odie", True), Cat("Garfield", False), Dog("Snoopy", True)]
+        resolved_types.clear()
+        result = await execute_query(sync, schema, pets_query, pets)
+        assert result == (
+            {"pets": [{"name": "Odie"}, {"name": "Garfield"}, {"name": "Snoopy"}]},
+            None,
+        )
+        # asynchronously, all types are resolved before the first one is cached
+        assert resolved_types == (["Dog", "Cat"] if sync else ["Dog", "Cat", "Dog"])
+
+        resolved_types.clear()
+        result = await execute_query(sync, schema, pets_query, pets)
+        assert result.errors is None
+        assert resolved_types == []
+
+    def caches_types_resolved_with_is_type_of():
+        schema = build_pet_schema(is_type_of=count_is_type_of)
+        pets = [Cat("Garfield", False), Cat("Tom", False), Cat("Felix", False)]
+        resolved_types.clear()
+        result = execute_sync(schema, parse(pets_query), pets)
+        assert result == (
+            {"pets": [{"name": "Garfield"}, {"name": "Tom"}, {"name": "Felix"}]},
+            None,
+        )
+        # the default type resolver checks Dog and Cat for the first pet,
+        # then only the is_type_of check of the cached type is called
+        assert resolved_types == ["Dog", "Cat", "Cat", "Cat", "Cat"]
+
+    def does_not_cache_types_resolved_for_mappings():
+        schema = build_pet_schema(resolve_pet_type)
+        pets = [{"__typename": "Dog", "name": "Odie"}, {"__typename": "Cat"}]
+        resolved_types.clear()
+        result = execute_sync(schema, parse(pets_query), pets)
+        assert result == ({"pets": [{"name": "Odie"}, {"name": None}]}, None)
+        assert resolved_types == ["Dog", "Cat"]
+
+    def does_not_cache_invalid_types():
+        schema = build_pet_schema(lambda *_args: "Human")
+        result = execute_sync(schema, parse(pets_query), [Dog("Odie", True)])
+        assert result == (
+            {"pets": [None]},
+            [
+                {
+                    "message": "Abstract type 'Pet' was resolved to a type 'Human'"
+                    " that does not exist inside the schema.",
+                    "locations": [(1, 3)],
+                    "path": ["pets", 0],
+                }
+            ],
+        )
+        pet_type = schema.get_type("Pet")
+        assert pet_type
+        assert schema.get_resolved_type(pet_type, Dog) is None  # type: ignore
+
+    def caches_types_per_schema():
+        schema = build_pet_schema(resolve_pet_type)
+        other_schema = build_pet_schema(resolve_pet_type)
+        resolved_types.clear()
+        for schema_ in (schema, other_schema):
+            result = execute_sync(schema_, parse(pets_query), [Dog("Odie", True)])
+            assert result == ({"pets": [{"name": "Odie"}]}, None)
+        assert resolved_types == ["Dog", "Dog"]
+
+
+def build_bound_schema(resolve_type: Any = None) -> GraphQLSchema:
+    """Build a schema with pet types bound to their classes."""
+    named_type = GraphQLInterfaceType("Named", {"name": GraphQLField(GraphQLString)})
+    dog_type = GraphQLObjectType(
+        "Dog",
+        {"name": GraphQLField(GraphQLString)},
+        interfaces=[named_type],
+        is_type_of=count_is_type_of(Dog),
+        source_classes=[Dog],
+    )
+    cat_type = GraphQLObjectType(
+        "Cat",
+        {"name": GraphQLField(GraphQLString)},
+        interfaces=[named_type],
+        source_classes=[Cat],
+    )
+    pet_type = GraphQLUnionType(
+        "Pet", [dog_type, cat_type], resolve_type, cache_resolved_types=True
+    )
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "pets": GraphQLField(
+                    GraphQLList(pet_type), resolve=lambda root, _info: root
+                ),
+                "named": GraphQLField(
+                    GraphQLList(named_type), resolve=lambda root, _info: root
+                ),
+            },
+        )
+    )
+
+
+def describe_execute_uses_classes_bound_to_types():
+    pets = [Dog("Odie", True), Cat("Garfield", False)]
+
+    def binds_classes_for_interfaces_and_unions():
+        schema = build_bound_schema()
+        named_type = schema.get_type("Named")
+        pet_type = schema.get_type("Pet")
+        dog_type = schema.get_type("Dog")
+        cat_type = schema.get_type("Cat")
+        assert schema.get_resolved_type(named_type, Dog) is dog_type  # type: ignore
+        assert schema.get_resolved_type(named_type, Cat) is cat_type  # type: ignore
+        assert schema.get_resolved_type(pet_type, Dog) is dog_type  # type: ignore
+        assert schema.get_resolved_type(pet_type, Cat) is cat_type  # type: ignore
+        assert schema.get_resolved_type(pet_type, dict) is None  # type: ignore
+
+    def resolves_bound_classes_with_the_default_type_resolver():
+        schema = build_bound_schema()
+        resolved_types.clear()
+        result = execute_sync(schema, parse("{ named { name } }"), pets)
+        assert result == ({"named": [{"name": "Odie"}, {"name": "Garfield"}]}, None)
+        # only the is_type_of check of the bound type is called
+        assert resolved_types == ["Dog"]
+
+    def resolves_bound_classes_without_calling_resolve_type():
+        schema = build_bound_schema(resolve_pet_type)
+        resolved_types.clear()
+        result = execute_sync(schema, parse(pets_query), pets)
+        assert result == ({"pets": [{"name": "Odie"}, {"name": "Garfield"}]}, None)
+        assert resolved_types == ["Dog"]
+
+    def keeps_bound_classes_when_clearing_cached_types():
+        schema = build_bound_schema(resolve_pet_type)
+        pet_type = schema.get_type("Pet")
+        dog_type = schema.get_type("Dog")
+        assert isinstance(pet_type, GraphQLUnionType)
+        assert isinstance(dog_type, GraphQLObjectType)
+        schema.cache_resolved_type(pet_type, dict, dog_type)
+        assert schema.get_resolved_type(pet_type, dict) is dog_type
+        schema.clear_resolved_types()
+        assert schema.get_resolved_type(pet_type, dict) is None
+        assert schema.get_resolved_type(pet_type, Dog) is dog_type
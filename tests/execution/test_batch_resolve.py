@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from graphql.execution import (
+    Executor,
+    ExperimentalIncrementalExecutionResults,
+    JitExecutor,
+    execute,
+    execute_sync,
+    experimental_execute_incrementally,
+)
+from graphql.language import parse
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+pytestmark = pytest.mark.anyio
+
+calls: list[tuple[list[Any], dict[str, Any]]] = []
+
+
+def batch_name(sources: list[Any], _info: Any, **args: Any) -> list[str]:
+    calls.append((sources, args))
+    suffix = args.get("suffix", "")
+    return [f"{source['name']}{suffix}" for source in sources]
+
+
+async def async_batch_name(sources: list[Any], info: Any, **args: Any) -> list[str]:
+    return batch_name(sources, info, **args)
+
+
+def batch_fail(sources: list[Any], _info: Any) -> list[Any]:
+    calls.append((sources, {}))
+    msg = "Batch error"
+    raise RuntimeError(msg)
+
+
+async def async_batch_fail(sources: list[Any], info: Any) -> list[Any]:
+    return batch_fail(sources, info)
+
+
+def batch_too_short(sources: list[Any], _info: Any) -> list[Any]:
+    return sources[1:]
+
+
+def batch_not_iterable(_sources: list[Any], _info: Any) -> Any:
+    return 42
+
+
+def batch_generator(sources: list[Any], _info: Any) -> Any:
+    return (len(source["name"]) for source in sources)
+
+
+item_type = GraphQLObjectType(
+    "Item",
+    {
+        "name": GraphQLField(
+            GraphQLString,
+            args={"suffix": GraphQLArgument(GraphQLString)},
+            batch_resolve=batch_name,
+        ),
+        "asyncName": GraphQLField(GraphQLString, batch_resolve=async_batch_name),
+        "fail": GraphQLField(GraphQLString, batch_resolve=batch_fail),
+        "asyncFail": GraphQLField(GraphQLString, batch_resolve=async_batch_fail),
+        "tooShort": GraphQLField(GraphQLString, batch_resolve=batch_too_short),
+        "notIterable": GraphQLField(GraphQLString, batch_resolve=batch_not_iterable),
+        "length": GraphQLField(GraphQLInt, batch_resolve=batch_generator),
+        "plain": GraphQLField(GraphQLString, resolve=lambda _source, _info: "plain"),
+        "nonNull": GraphQLField(GraphQLNonNull(GraphQLString)),
+    },
+)
+
+items = [{"name": "a"}, {"name": "b"}, {"name": "c"}]
+
+
+async def resolve_async_items(_source: Any, _info: Any) -> list[Any]:
+    return items
+
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        {
+            "items": GraphQLField(
+                GraphQLList(item_type), resolve=lambda *_args: [*items, None]
+            ),
+            "tupleItems": GraphQLField(
+                GraphQLList(GraphQLNonNull(item_type)),
+                resolve=lambda *_args: tuple(items),
+            ),
+            "iterItems": GraphQLField(
+                GraphQLList(item_type), resolve=lambda *_args: iter(items)
+            ),
+            "asyncItems": GraphQLField(
+                GraphQLList(item_type), resolve=resolve_async_items
+            ),
+            "noItems": GraphQLField(
+                GraphQLList(item_type), resolve=lambda *_args: [None]
+            ),
+            "item": GraphQLField(item_type, resolve=lambda *_args: items[0]),
+        },
+    )
+)
+
+
+def describe_batch_resolve():
+    def resolves_field_once_for_all_list_items():
+        calls.clear()
+        assert execute_sync(schema, parse("{ items { name plain } }")) == (
+            {
+                "items": [
+                    {"name": "a", "plain": "plain"},
+                    {"name": "b", "plain": "plain"},
+                    {"name": "c", "plain": "plain"},
+                    None,
+                ]
+            },
+            None,
+        )
+        assert calls == [(items, {})]
+
+    def passes_arguments_and_works_with_tuples_and_iterables():
+        for field in ("tupleItems", "iterItems"):
+            calls.clear()
+            assert execute_sync(
+                schema, parse(f'{{ {field} {{ name(suffix: "!") }} }}')
+            ) == (
+                {field: [{"name": "a!"}, {"name": "b!"}, {"name": "c!"}]},
+                None,
+            )
+            assert calls == [(items, {"suffix": "!"})]
+
+    def resolves_aliased_fields_separately():
+        calls.clear()
+        assert execute_sync(
+            schema, parse('{ items { name x: name(suffix: "x") } }')
+        ) == (
+            {
+                "items": [
+                    {"name": "a", "x": "ax"},
+                    {"name": "b", "x": "bx"},
+                    {"name": "c", "x": "cx"},
+                    None,
+                ]
+            },
+            None,
+        )
+        assert calls == [(items, {}), (items, {"suffix": "x"})]
+
+    def does_not_call_batch_resolver_without_sources():
+        calls.clear()
+        assert execute_sync(schema, parse("{ noItems { name } }")) == (
+            {"noItems": [None]},
+            None,
+        )
+        assert calls == []
+
+    def resolves_field_outside_of_lists_with_single_source():
+        calls.clear()
+        assert execute_sync(schema, parse("{ item { name } }")) == (
+            {"item": {"name": "a"}},
+            None,
+        )
+        assert calls == [([items[0]], {})]
+
+    def accepts_any_iterable_with_one_value_per_source():
+        assert execute_sync(schema, parse("{ items { length } }")) == (
+            {"items": [{"length": 1}, {"length": 1}, {"length": 1}, None]},
+            None,
+        )
+
+    def reports_batch_error_for_each_item():
+        calls.clear()
+        assert execute_sync(schema, parse("{ tupleItems { fail } }")) == (
+            {"tupleItems": [{"fail": None}, {"fail": None}, {"fail": None}]},
+            [
+                {
+                    "message": "Batch error",
+                    "locations": [(1, 16)],
+                    "path": ["tupleItems", index, "fail"],
+                }
+                for index in range(3)
+            ],
+        )
+        assert calls == [(items, {})]
+
+    def reports_wrong_number_of_values():
+        assert execute_sync(schema, parse("{ tupleItems { tooShort } }")) == (
+            {
+                "tupleItems": [
+                    {"tooShort": None},
+                    {"tooShort": None},
+                    {"tooShort": None},
+                ]
+            },
+            [
+                {
+                    "message": "Batch resolver for field 'Item.tooShort'"
+                    " must return 3 values, but returned 2.",
+                    "locations": [(1, 16)],
+                    "path": ["tupleItems", index, "tooShort"],
+                }
+                for index in range(3)
+            ],
+        )
+
+    def reports_values_that_are_not_iterable():
+        assert execute_sync(schema, parse("{ item { notIterable } }")) == (
+            {"item": {"notIterable": None}},
+            [
+                {
+                    "message": "Batch resolver for field 'Item.notIterable'"
+                    " must return an iterable, but returned 42.",
+                    "locations": [(1, 10)],
+                    "path": ["item", "notIterable"],
+                }
+            ],
+        )
+
+    def reports_invalid_arguments_when_executing_the_field():
+        calls.clear()
+        assert execute_sync(schema, parse("{ tupleItems { name(suffix: 1) } }")) == (
+            {"tupleItems": [{"name": None}, {"name": None}, {"name": None}]},
+            [
+                {
+                    "message": "Argument 'suffix' has invalid value:"
+                    " String cannot represent a non string value: 1",
+                    "locations": [(1, 29)],
+                    "path": ["tupleItems", index, "name"],
+                }
+                for index in range(3)
+            ],
+        )
+        assert calls == []
+
+    async def does_not_prefetch_deferred_fields():
+        calls.clear()
+        result = experimental_execute_incrementally(
+            schema, parse("{ tupleItems { ... @defer { name } } }")
+        )
+        assert isinstance(result, ExperimentalIncrementalExecutionResults)
+        patches = [result.initial_result.formatted] + [
+            patch.formatted async for patch in result.subsequent_results
+        ]
+        assert patches == [
+            {
+                "data": {"tupleItems": [{}, {}, {}]},
+                "pending": [
+                    {"id": str(index), "path": ["tupleItems", index]}
+                    for index in range(3)
+                ],
+                "hasNext": True,
+            },
+            {
+                "incremental": [
+                    {"id": str(index), "data": {"name": name}}
+                    for index, name in enumerate("abc")
+                ],
+                "completed": [{"id": str(index)} for index in range(3)],
+                "hasNext": False,
+            },
+        ]
+        assert calls == [([item], {}) for item in items]
+
+    async def resolves_fields_with_async_batch_resolvers():
+        calls.clear()
+        result = execute(schema, parse("{ asyncItems { asyncName } }"))
+        assert await result == (  # type: ignore
+            {
+                "asyncItems": [
+                    {"asyncName": "a"},
+                    {"asyncName": "b"},
+                    {"asyncName": "c"},
+                ]
+            },
+            None,
+        )
+        assert calls == [(items, {})]
+
+    async def resolves_single_field_with_async_batch_resolver():
+        result = execute(schema, parse("{ item { asyncName } }"))
+        assert await result == ({"item": {"asyncName": "a"}}, None)  # type: ignore
+
+    async def reports_errors_of_async_batch_resolvers():
+        calls.clear()
+        result = execute(schema, parse("{ asyncItems { asyncFail } }"))
+        assert await result == (  # type: ignore
+            {
+                "asyncItems": [
+                    {"asyncFail": None},
+                    {"asyncFail": None},
+                    {"asyncFail": None},
+                ]
+            },
+            [
+                {
+                    "message": "Batch error",
+                    "locations": [(1, 16)],
+                    "path": ["asyncItems", index, "asyncFail"],
+                }
+                for index in range(3)
+            ],
+        )
+        assert calls == [(items, {})]
+
+    def discards_prefetched_values_of_items_that_are_not_executed():
+        calls.clear()
+        executor = Executor.build(schema, parse("{ tupleItems { nonNull name } }"))
+        assert isinstance(executor, Executor)
+        assert executor.execute_operation() == (
+            {"tupleItems": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Item.nonNull.",
+                    "locations": [(1, 16)],
+                    "path": ["tupleItems", 0, "nonNull"],
+                }
+            ],
+        )
+        assert calls == [(items, {})]
+        assert not executor._batched_values  # noqa: SLF001
+
+    async def settles_async_batch_resolvers_of_items_that_are_not_executed():
+        calls.clear()
+        executor = Executor.build(schema, parse("{ tupleItems { nonNull asyncFail } }"))
+        assert isinstance(executor, Executor)
+        assert executor.execute_operation() == (
+            {"tupleItems": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Item.nonNull.",
+                    "locations": [(1, 16)],
+                    "path": ["tupleItems", 0, "nonNull"],
+                }
+            ],
+        )
+        assert not executor._batched_values  # noqa: SLF001
+        (background_future,) = executor.background_futures
+        # the error of the batch resolver is observed in the background
+        (error,) = await background_future
+        assert isinstance(error, RuntimeError)
+        assert str(error) == "Batch error"
+        assert calls == [(items, {})]
+
+    def works_with_jit_executor():
+        calls.clear()
+        assert execute_sync(
+            schema,
+            parse("{ tupleItems { name } }"),
+            executor_class=JitExecutor,
+        ) == ({"tupleItems": [{"name": "a"}, {"name": "b"}, {"name": "c"}]}, None)
+        assert calls == [(items, {})]
+
+
+def describe_batch_resolve_on_field():
+    def is_part_of_field_kwargs_and_equality():
+        field = GraphQLField(GraphQLString, batch_resolve=batch_name)
+        assert field.batch_resolve is batch_name
+        assert field.to_kwargs()["batch_resolve"] is batch_name
+        assert GraphQLField(**field.to_kwargs()) == field
+        assert field != GraphQLField(GraphQLString)
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+from asyncio import ensure_future, sleep, to_thread
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from threading import Barrier, Event, Lock, get_ident
+from typing import Any
+
+import pytest
+
+from graphql.execution import (
+    AbortedGraphQLExecutionError,
+    MiddlewareManager,
+    blocking_resolver,
+    execute,
+    execute_sync,
+)
+from graphql.language import parse
+from graphql.pyutils import AbortController
+from graphql.type import (
+    GraphQLField,
+    GraphQLObjectType,
+    GraphQLResolveInfoHelpers,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+pytestmark = pytest.mark.anyio
+
+request_id: ContextVar[str] = ContextVar("request_id", default="none")
+
+
+class Recorder:
+    """Record which threads resolved the fields and how many ran at once."""
+
+    def __init__(self, barrier: Barrier | None = None) -> None:
+        self.barrier = barrier
+        self.threads: list[int] = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = Lock()
+        self.started = Event()
+        self.release = Event()
+        self.release.set()
+
+    def resolve(self, _source: Any, info: Any) -> str:
+        with self.lock:
+            self.threads.append(get_ident())
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        self.started.set()
+        try:
+            if self.barrier is not None:
+                self.barrier.wait(timeout=5)
+            self.release.wait(timeout=5)
+            if info.field_name == "failing":
+                msg = "Blocking failure"
+                raise ValueError(msg)
+            return f"{info.field_name}:{request_id.get()}"
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def build_test_schema(recorder: Recorder) -> GraphQLSchema:
+    resolve = blocking_resolver(recorder.resolve)
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                name: GraphQLField(GraphQLString, resolve=resolve)
+                for name in ("a", "b", "c", "failing")
+            },
+        )
+    )
+
+
+def describe_blocking_resolver():
+    async def runs_blocking_resolvers_at_the_same_time_in_threads():
+        recorder = Recorder(Barrier(2))
+        schema = build_test_schema(recorder)
+        token = request_id.set("request")
+        try:
+            result = execute(schema, parse("{ a b }"))
+        finally:
+            request_id.reset(token)
+        assert await result == (  # type: ignore
+            {"a": "a:request", "b": "b:request"},
+            None,
+        )
+        assert len(recorder.threads) == 2
+        assert get_ident() not in recorder.threads
+
+    async def limits_the_number_of_blocking_resolvers_running_at_once():
+        recorder = Recorder()
+        schema = build_test_schema(recorder)
+        with ThreadPoolExecutor(4, thread_name_prefix="blocking") as thread_pool:
+            result = execute(
+                schema,
+                parse("{ a b c }"),
+                thread_pool=thread_pool,
+                max_blocking_resolvers=1,
+            )
+            assert await result == (  # type: ignore
+                {"a": "a:none", "b": "b:none", "c": "c:none"},
+                None,
+            )
+        assert len(recorder.threads) == 3
+        assert recorder.max_running == 1
+
+    async def reports_errors_of_blocking_resolvers():
+        schema = build_test_schema(Recorder())
+        result = execute(schema, parse("{ a failing }"))
+        assert await result == (  # type: ignore
+            {"a": "a:none", "failing": None},
+            [
+                {
+                    "message": "Blocking failure",
+                    "locations": [(1, 5)],
+                    "path": ["failing"],
+                }
+            ],
+        )
+
+    async def does_not_start_waiting_resolvers_after_abort():
+        recorder = Recorder()
+        recorder.release.clear()
+        schema = build_test_schema(recorder)
+        abort_controller = AbortController()
+        result = ensure_future(
+            execute(  # type: ignore
+                schema,
+                parse("{ a b }"),
+                max_blocking_resolvers=1,
+                abort_signal=abort_controller.signal,
+            )
+        )
+        assert await to_thread(recorder.started.wait, 5)
+        abort_controller.abort()
+        with pytest.raises(AbortedGraphQLExecutionError):
+            await result
+        recorder.release.set()
+        await sleep(0.01)
+        assert len(recorder.threads) == 1
+
+    async def works_with_middleware():
+        recorder = Recorder()
+        schema = build_test_schema(recorder)
+
+        async def middleware(next_: Any, *args: Any, **kwargs: Any) -> Any:
+            return f"<{await next_(*args, **kwargs)}>"
+
+        result = execute(
+            schema, parse("{ a }"), middleware=MiddlewareManager(middleware)
+        )
+        assert await result == ({"a": "<a:none>"}, None)  # type: ignore
+        assert get_ident() not in recorder.threads
+
+    async def calls_blocking_resolvers_directly_when_executing_synchronously():
+        recorder = Recorder()
+        schema = build_test_schema(recorder)
+        assert execute_sync(schema, parse("{ a b }")) == (
+            {"a": "a:none", "b": "b:none"},
+            None,
+        )
+        assert recorder.threads == [get_ident()] * 2
+
+    def calls_blocking_resolvers_directly_without_event_loop():
+        recorder = Recorder()
+        schema = build_test_schema(recorder)
+        assert execute(schema, parse("{ a }")) == ({"a": "a:none"}, None)
+        assert recorder.threads == [get_ident()]
+
+    def calls_blocking_resolvers_directly_without_helper():
+        recorder = Recorder()
+
+        class Info:
+            field_name = "a"
+            async_helpers = GraphQLResolveInfoHelpers(
+                gather=lambda _values: None,  # type: ignore
+                track=lambda _values: None,
+            )
+
+        assert blocking_resolver(recorder.resolve)(None, Info()) == "a:none"
+        assert recorder.threads == [get_ident()]
@@ -0,0 +1,584 @@
+from __future__ import annotations
+
+from inspect import CORO_CLOSED, getcoroutinestate
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from graphql.execution import (
+    BreadthFirstExecutor,
+    CompiledOperation,
+    ExecutionResult,
+    ExperimentalIncrementalExecutionResults,
+    compile_operation,
+    execute,
+    execute_compiled_operation,
+    execute_sync,
+    experimental_execute_incrementally,
+)
+from graphql.language import parse
+from graphql.pyutils import is_awaitable
+from graphql.utilities import build_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from graphql.type import GraphQLInterfaceType, GraphQLObjectType
+
+pytestmark = pytest.mark.anyio
+
+schema = build_schema(
+    """
+    interface Node {
+      id: ID!
+    }
+
+    type Query {
+      users: [User]
+      strictUsers: [User!]
+      user: User
+      nodes: [Node]
+    }
+
+    type User implements Node {
+      id: ID!
+      name: String
+      strict: String!
+      fail: String
+      asyncName: String
+      posts: [Post!]
+      bestPost: Post
+      friends(first: Int): [User]
+      noPost: Post!
+      tags: [String]
+    }
+
+    type Post implements Node {
+      id: ID!
+      title: String
+      likes: Int
+      author: User
+      asyncStrict: String!
+    }
+    """
+)
+
+user_type: GraphQLObjectType = schema.get_type("User")  # type: ignore
+post_type: GraphQLObjectType = schema.get_type("Post")  # type: ignore
+node_type: GraphQLInterfaceType = schema.get_type("Node")  # type: ignore
+node_type.resolve_type = lambda obj, *_args: type(obj).__name__
+# leaf fields with the default resolver are not resolved in advance
+user_type.fields["name"].resolve = lambda user, _info: user.name
+post_type.fields["title"].resolve = lambda post, _info: post.title
+user_type.fields["asyncName"].resolve = lambda user, _info: user.asyncName
+user_type.fields["fail"].resolve = lambda user, _info: user.fail
+
+
+async def resolve_async_strict(_post: Post, _info: Any) -> None:
+    return None
+
+
+post_type.fields["asyncStrict"].resolve = resolve_async_strict
+
+log: list[str] = []
+coroutines: list[Coroutine] = []
+
+
+class Post:
+    def __init__(self, id_: str, author: User | None = None) -> None:
+        self.id = id_
+        self._author = author
+
+    @property
+    def title(self) -> str:
+        log.append(f"title {self.id}")
+        return f"Post {self.id}"
+
+    @property
+    def author(self) -> User | None:
+        log.append(f"author {self.id}")
+        return self._author
+
+
+class User:
+    def __init__(
+        self, id_: str, strict: str | None = "strict", friends: Any = ()
+    ) -> None:
+        self.id = id_
+        self.strict = strict
+        self._friends = friends
+        self.noPost = None
+        self.tags = 42
+        self._posts = [Post(f"{id_}a", self), Post(f"{id_}b", self)]
+
+    @property
+    def name(self) -> str:
+        log.append(f"name {self.id}")
+        return f"User {self.id}"
+
+    @property
+    def fail(self) -> str:
+        msg = f"Failure {self.id}"
+        raise RuntimeError(msg)
+
+    @property
+    def asyncName(self) -> Any:
+        async def resolve() -> str:
+            log.append(f"asyncName {self.id}")
+            return f"Async {self.id}"
+
+        coroutine = resolve()
+        coroutines.append(coroutine)
+        return coroutine
+
+    @property
+    def posts(self) -> Any:
+        log.append(f"posts {self.id}")
+        # return a generator to check that it is iterated only once
+        return (post for post in self._posts)
+
+    @property
+    def bestPost(self) -> Post:
+        log.append(f"bestPost {self.id}")
+        return self._posts[0]
+
+    @property
+    def friends(self) -> Any:
+        log.append(f"friends {self.id}")
+        return self._friends
+
+
+def get_root() -> dict[str, Any]:
+    user1, user2 = User("1"), User("2")
+    user3 = User("3", strict=None, friends=[user1, None, user2, user1])
+    return {
+        "users": [user1, None, user2],
+        "strictUsers": [user1, user3],
+        "user": user3,
+        "nodes": [user1, user1._posts[1]],  # noqa: SLF001
+    }
+
+
+def execute_both(query: str, **kwargs: Any) -> ExecutionResult:
+    document = parse(query)
+    log.clear()
+    result = execute_sync(schema, document, get_root(), **kwargs)
+    default_log = log[:]
+    log.clear()
+    assert (
+        execute_sync(
+            schema,
+            document,
+            get_root(),
+            executor_class=BreadthFirstExecutor,
+            **kwargs,
+        )
+        == result
+    )
+    assert sorted(log) == sorted(default_log)
+    return result
+
+
+async def execute_both_async(query: str) -> ExecutionResult:
+    document = parse(query)
+    log.clear()
+    result = execute(schema, document, get_root())
+    if is_awaitable(result):
+        result = await result
+    default_log = log[:]
+    log.clear()
+    breadth_first_result = execute(
+        schema, document, get_root(), executor_class=BreadthFirstExecutor
+    )
+    if is_awaitable(breadth_first_result):
+        breadth_first_result = await breadth_first_result
+    assert breadth_first_result == result
+    assert sorted(log) == sorted(default_log)
+    return result  # type: ignore
+
+
+async def execute_incrementally(query: str, executor_class: Any) -> list[Any]:
+    result = experimental_execute_incrementally(
+        schema, parse(query), get_root(), executor_class=executor_class
+    )
+    if is_awaitable(result):
+        result = await result
+    assert isinstance(result, ExperimentalIncrementalExecutionResults)
+    return [result.initial_result.formatted] + [
+        patch.formatted async for patch in result.subsequent_results
+    ]
+
+
+def describe_breadth_first_executor():
+    def resolves_fields_level_by_level():
+        query = "{ users { name posts { title } } }"
+        result = execute_sync(
+            schema, parse(query), get_root(), executor_class=BreadthFirstExecutor
+        )
+        assert result == (
+            {
+                "users": [
+                    {
+                        "name": "User 1",
+                        "posts": [{"title": "Post 1a"}, {"title": "Post 1b"}],
+                    },
+                    None,
+                    {
+                        "name": "User 2",
+                        "posts": [{"title": "Post 2a"}, {"title": "Post 2b"}],
+                    },
+                ]
+            },
+            None,
+        )
+        assert log == [
+            "name 1",
+            "name 2",
+            "posts 1",
+            "posts 2",
+            "title 1a",
+            "title 1b",
+            "title 2a",
+            "title 2b",
+        ]
+        log.clear()
+        assert execute_sync(schema, parse(query), get_root()) == result
+        assert log == [
+            "name 1",
+            "posts 1",
+            "title 1a",
+            "title 1b",
+            "name 2",
+            "posts 2",
+            "title 2a",
+            "title 2b",
+        ]
+
+    def resolves_nested_objects_and_lists():
+        assert execute_both(
+            "{ users { bestPost { title author { name friends { name } } } } }"
+        ) == (
+            {
+                "users": [
+                    {
+                        "bestPost": {
+                            "title": "Post 1a",
+                            "author": {"name": "User 1", "friends": []},
+                        }
+                    },
+                    None,
+                    {
+                        "bestPost": {
+                            "title": "Post 2a",
+                            "author": {"name": "User 2", "friends": []},
+                        }
+                    },
+                ]
+            },
+            None,
+        )
+        assert log == [
+            "bestPost 1",
+            "bestPost 2",
+            "title 1a",
+            "title 2a",
+            "author 1a",
+            "author 2a",
+            "name 1",
+            "name 2",
+            "friends 1",
+            "friends 2",
+        ]
+
+    def keeps_error_paths_and_null_propagation():
+        assert execute_both("{ strictUsers { name strict fail } }") == (
+            {"strictUsers": None},
+            [
+                {
+                    "message": "Failure 1",
+                    "locations": [(1, 29)],
+                    "path": ["strictUsers", 0, "fail"],
+                },
+                {
+                    "message": "Cannot return null for non-nullable field User.strict.",
+                    "locations": [(1, 22)],
+                    "path": ["strictUsers", 1, "strict"],
+                },
+            ],
+        )
+        assert execute_both("{ user { friends { strict } } }") == (
+            {
+                "user": {
+                    "friends": [
+                        {"strict": "strict"},
+                        None,
+                        {"strict": "strict"},
+                        {"strict": "strict"},
+                    ]
+                }
+            },
+            None,
+        )
+
+    def resolves_objects_appearing_more_than_once():
+        assert execute_both("{ user { friends { bestPost { author { name } } } } }")
+
+    def resolves_abstract_types_normally():
+        assert execute_both(
+            "{ nodes { id ... on User { name } ... on Post { title } } }"
+        ) == (
+            {
+                "nodes": [
+                    {"id": "1", "name": "User 1"},
+                    {"id": "1b", "title": "Post 1b"},
+                ]
+            },
+            None,
+        )
+
+    def resolves_types_with_is_type_of_normally():
+        user_type.is_type_of = lambda obj, _info: isinstance(obj, User)
+        try:
+            assert execute_both("{ users { name } user { friends { name } } }")
+        finally:
+            user_type.is_type_of = None
+        post_type.is_type_of = lambda obj, _info: isinstance(obj, Post)
+        try:
+            assert execute_both("{ users { bestPost { title } posts { title } } }")
+        finally:
+            post_type.is_type_of = None
+
+    def uses_middleware_and_compiled_operations():
+        def middleware(next_: Any, *args: Any, **kwargs: Any) -> Any:
+            result = next_(*args, **kwargs)
+            return result.upper() if isinstance(result, str) else result
+
+        assert execute_both(
+            "{ users { name posts { title } } }", middleware=[middleware]
+        ) == (
+            {
+                "users": [
+                    {
+                        "name": "USER 1",
+                        "posts": [{"title": "POST 1A"}, {"title": "POST 1B"}],
+                    },
+                    None,
+                    {
+                        "name": "USER 2",
+                        "posts": [{"title": "POST 2A"}, {"title": "POST 2B"}],
+                    },
+                ]
+            },
+            None,
+        )
+
+        compiled_operation = compile_operation(
+            schema, parse("{ users { name unknown posts { title } } }")
+        )
+        assert isinstance(compiled_operation, CompiledOperation)
+        log.clear()
+        assert execute_compiled_operation(
+            compiled_operation, get_root(), executor_class=BreadthFirstExecutor
+        ) == (
+            {
+                "users": [
+                    {
+                        "name": "User 1",
+                        "posts": [{"title": "Post 1a"}, {"title": "Post 1b"}],
+                    },
+                    None,
+                    {
+                        "name": "User 2",
+                        "posts": [{"title": "Post 2a"}, {"title": "Post 2b"}],
+                    },
+                ]
+            },
+            None,
+        )
+        assert log[:4] == ["name 1", "name 2", "posts 1", "posts 2"]
+
+    def reports_unknown_fields_and_invalid_arguments_normally():
+        assert execute_both('{ users { unknown friends(first: "x") { name } } }')
+
+    def reports_errors_when_completing_resolved_values():
+        assert execute_both("{ users { noPost { title } } }") == (
+            {"users": [None, None, None]},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field User.noPost.",
+                    "locations": [(1, 11)],
+                    "path": ["users", index, "noPost"],
+                }
+                for index in (0, 2)
+            ],
+        )
+
+    def reports_errors_when_completing_nullable_resolved_values():
+        assert execute_both("{ users { tags } }") == (
+            {"users": [{"tags": None}, None, {"tags": None}]},
+            [
+                {
+                    "message": "Expected Iterable, but did not find one"
+                    " for field 'User.tags'.",
+                    "locations": [(1, 11)],
+                    "path": ["users", index, "tags"],
+                }
+                for index in (0, 2)
+            ],
+        )
+
+    async def reports_errors_when_completing_resolved_values_async():
+        assert await execute_both_async("{ users { bestPost { asyncStrict } } }") == (
+            {"users": [{"bestPost": None}, None, {"bestPost": None}]},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Post.asyncStrict.",
+                    "locations": [(1, 22)],
+                    "path": ["users", index, "bestPost", "asyncStrict"],
+                }
+                for index in (0, 2)
+            ],
+        )
+
+    def calls_batch_resolvers_once_per_level():
+        sources_per_call: list[list[str]] = []
+
+        def batch_likes(sources: list[Post], _info: Any) -> list[int]:
+            sources_per_call.append([source.id for source in sources])
+            return [len(source.id) for source in sources]
+
+        def batch_fail(_sources: list[Post], _info: Any) -> list[int]:
+            msg = "Batch error"
+            raise RuntimeError(msg)
+
+        likes_field = post_type.fields["likes"]
+        likes_field.batch_resolve = batch_likes
+        try:
+            result = execute_sync(
+                schema,
+                parse("{ users { posts { likes } } }"),
+                get_root(),
+                executor_class=BreadthFirstExecutor,
+            )
+            assert result == (
+                {
+                    "users": [
+                        {"posts": [{"likes": 2}, {"likes": 2}]},
+                        None,
+                        {"posts": [{"likes": 2}, {"likes": 2}]},
+                    ]
+                },
+                None,
+            )
+            assert sources_per_call == [["1a", "1b", "2a", "2b"]]
+            sources_per_call.clear()
+            assert execute_sync(
+                schema, parse("{ users { posts { likes } } }"), get_root()
+            ) == (result)
+            assert sources_per_call == [["1a", "1b"], ["2a", "2b"]]
+
+            likes_field.batch_resolve = batch_fail
+            assert execute_both("{ users { bestPost { likes } } }") == (
+                {
+                    "users": [
+                        {"bestPost": {"likes": None}},
+                        None,
+                        {"bestPost": {"likes": None}},
+                    ]
+                },
+                [
+                    {
+                        "message": "Batch error",
+                        "locations": [(1, 22)],
+                        "path": ["users", index, "bestPost", "likes"],
+                    }
+                    for index in (0, 2)
+                ],
+            )
+        finally:
+            likes_field.batch_resolve = None
+
+    async def calls_async_batch_resolvers_once_per_level():
+        sources_per_call: list[list[str]] = []
+
+        async def batch_likes(sources: list[Post], _info: Any) -> list[int]:
+            sources_per_call.append([source.id for source in sources])
+            return [len(source.id) for source in sources]
+
+        likes_field = post_type.fields["likes"]
+        likes_field.batch_resolve = batch_likes
+        try:
+            result = execute(
+                schema,
+                parse("{ users { posts { likes } } }"),
+                get_root(),
+                executor_class=BreadthFirstExecutor,
+            )
+            assert is_awaitable(result)
+            assert await result == (
+                {
+                    "users": [
+                        {"posts": [{"likes": 2}, {"likes": 2}]},
+                        None,
+                        {"posts": [{"likes": 2}, {"likes": 2}]},
+                    ]
+                },
+                None,
+            )
+            assert sources_per_call == [["1a", "1b", "2a", "2b"]]
+        finally:
+            likes_field.batch_resolve = None
+
+    async def resolves_async_fields():
+        assert await execute_both_async("{ users { asyncName posts { title } } }") == (
+            {
+                "users": [
+                    {
+                        "asyncName": "Async 1",
+                        "posts": [{"title": "Post 1a"}, {"title": "Post 1b"}],
+                    },
+                    None,
+                    {
+                        "asyncName": "Async 2",
+                        "posts": [{"title": "Post 2a"}, {"title": "Post 2b"}],
+                    },
+                ]
+            },
+            None,
+        )
+
+    async def closes_async_values_that_are_not_completed():
+        coroutines.clear()
+        result = execute(
+            schema,
+            parse("{ strictUsers { strict posts { title } asyncName } }"),
+            get_root(),
+            executor_class=BreadthFirstExecutor,
+        )
+        if is_awaitable(result):
+            result = await result
+        assert result == (
+            {"strictUsers": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field User.strict.",
+                    "locations": [(1, 17)],
+                    "path": ["strictUsers", 1, "strict"],
+                },
+            ],
+        )
+        # the value of the first item is settled in the background,
+        # but the value of the second item is not even completed
+        assert len(coroutines) == 2
+        assert getcoroutinestate(coroutines[1]) == CORO_CLOSED
+
+    async def resolves_deferred_and_streamed_fields_normally():
+        for query in (
+            "{ users { name ... @defer { posts { title } } } }",
+            "{ users { name posts @stream(initialCount: 1) { title } } }",
+            "{ users @stream(initialCount: 1) { name } }",
+        ):
+            log.clear()
+            result = await execute_incrementally(query, None)
+            assert await execute_incrementally(query, BreadthFirstExecutor) == result
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from asyncio import Event, Future, ensure_future, sleep
 from collections.abc import AsyncIterator, Awaitable
+from typing import Any
 
 import pytest
 
@@ -23,8 +24,9 @@ from graphql.execution import (
     experimental_execute_incrementally,
     subscribe,
 )
+from graphql.execution.executor import AbortWatcher
 from graphql.language import parse
-from graphql.pyutils import AbortController, AbortError, is_awaitable
+from graphql.pyutils import AbortController, AbortError, AbortSignal, is_awaitable
 
 pytestmark = [
     pytest.mark.anyio,
@@ -1236,3 +1238,142 @@ def describe_execute_cancellation():
         # wait for the partial result so that the cleanup has settled
         await exc_info.value.aborted_result
         assert return_called is True
+
+
+class CountingAbortSignal(AbortSignal):
+    """Abort signal counting how often it is waited for."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.waits = 0
+        self.waiting = 0
+
+    async def wait(self) -> Any:
+        self.waits += 1
+        self.waiting += 1
+        try:
+            return await super().wait()
+        finally:
+            self.waiting -= 1
+
+
+def describe_abort_watcher():
+    async def cancels_all_tracked_tasks_when_aborted():
+        abort_controller = AbortController()
+        signal = abort_controller.signal = CountingAbortSignal()
+        watcher = AbortWatcher(signal)
+        tasks = [watcher.track(Future[None]())[0] for _ in range(3)]
+        await sleep(0)
+        assert signal.waits == signal.waiting == 1
+
+        abort_controller.abort()
+        await sleep(0)
+        await sleep(0)
+        assert all(task.cancelled() for task in tasks)
+        assert signal.waiting == 0
+
+    async def stops_waiting_when_no_tasks_are_left():
+        signal = CountingAbortSignal()
+        watcher = AbortWatcher(signal)
+        task, settled = watcher.track(sleep(0, "done"))
+        await settled
+        assert task.result() == "done"
+        await sleep(0)
+        assert signal.waits == 1
+        assert signal.waiting == 0
+
+        task, settled = watcher.track(sleep(0, "again"))
+        await settled
+        assert task.result() == "again"
+        await sleep(0)
+        assert signal.waits == 2
+        assert signal.waiting == 0
+
+    async def waits_for_the_abort_signal_once_for_parallel_resolvers():
+        abort_controller = AbortController()
+        signal = abort_controller.signal = CountingAbortSignal()
+        started: list[str] = []
+
+        async def blocker(info):
+            started.append(info.path.key)
+            await Future()  # will never resolve
+
+        awaitable_result = execute(
+            schema,
+            parse("{ a: blocker b: blocker c: blocker d: blocker }"),
+            abort_signal=signal,
+            root_value={"blocker": blocker},
+        )
+        assert isinstance(awaitable_result, Awaitable)
+        task = ensure_future(awaitable_result)
+        while len(started) < 4:  # noqa: ASYNC110
+            await sleep(0)
+
+        # the signal is waited for once for the operation and once for all resolvers
+        assert signal.waits == 2
+        abort_controller.abort()
+        with pytest.raises(
+            AbortedGraphQLExecutionError, match="This operation was aborted"
+        ):
+            await task
+
+    async def cancels_resolvers_when_awaiting_them_is_cancelled():
+        abort_controller = AbortController()
+        started = Event()
+        cancelled = Event()
+
+        async def blocker(_info):
+            started.set()
+            try:
+                await Future()  # will never resolve
+            finally:
+                cancelled.set()
+
+        async def non_nullable_todo(_info):
+            await started.wait()
+
+        # the null bubbling to the root cancels awaiting the sibling field
+        result = await execute(  # type: ignore
+            schema,
+            parse("{ blocker nonNullableTodo { id } }"),
+            abort_signal=abort_controller.signal,
+            root_value={"blocker": blocker, "nonNullableTodo": non_nullable_todo},
+        )
+        assert result == (
+            None,
+            [
+                {
+                    "message": "Cannot return null"
+                    " for non-nullable field Query.nonNullableTodo.",
+                    "locations": [(1, 11)],
+                    "path": ["nonNullableTodo"],
+                }
+            ],
+        )
+        await cancelled.wait()
+        assert not abort_controller.signal.aborted
+
+    async def rejects_results_settling_in_the_tick_of_the_abort():
+        abort_controller = AbortController()
+        result: Future[str] = Future()
+        error: Future[str] = Future()
+
+        def resolve_todo(_info):
+            return {"id": result, "items": [error]}
+
+        awaitable_result = execute(
+            schema,
+            parse("{ todo { id items } }"),
+            abort_signal=abort_controller.signal,
+            root_value={"todo": resolve_todo},
+        )
+        assert isinstance(awaitable_result, Awaitable)
+        task = ensure_future(awaitable_result)
+        await sleep(0)
+        result.set_result("id")
+        error.set_exception(RuntimeError("Oops"))
+        abort_controller.abort()
+        with pytest.raises(
+            AbortedGraphQLExecutionError, match="This operation was aborted"
+        ):
+            await task
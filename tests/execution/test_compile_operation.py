@@ -0,0 +1,383 @@
+import pytest
+
+from graphql.error import GraphQLError
+from graphql.execution import (
+    CompiledField,
+    CompiledOperation,
+    ExecutionResult,
+    Executor,
+    compile_operation,
+    execute,
+    execute_compiled_operation,
+)
+from graphql.execution.collect_fields import collect_fields
+from graphql.execution.compile_operation import value_has_variables
+from graphql.execution.values import VariableValues
+from graphql.language import parse, parse_value
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLBoolean,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLInterfaceType,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+pytestmark = pytest.mark.anyio
+
+named_type = GraphQLInterfaceType("Named", {"name": GraphQLField(GraphQLString)})
+
+dog_type = GraphQLObjectType(
+    "Dog",
+    {
+        "name": GraphQLField(GraphQLString),
+        "barks": GraphQLField(GraphQLBoolean),
+    },
+    interfaces=[named_type],
+    is_type_of=lambda obj, _info: "barks" in obj,
+)
+
+cat_type = GraphQLObjectType(
+    "Cat",
+    {
+        "name": GraphQLField(GraphQLString),
+        "meows": GraphQLField(GraphQLBoolean),
+    },
+    interfaces=[named_type],
+    is_type_of=lambda obj, _info: "meows" in obj,
+)
+
+query_type = GraphQLObjectType(
+    "Query",
+    {
+        "pets": GraphQLField(GraphQLList(named_type)),
+        "echo": GraphQLField(
+            GraphQLString,
+            args={"value": GraphQLArgument(GraphQLString)},
+            resolve=lambda _obj, _info, value="default": value,
+        ),
+        "count": GraphQLField(GraphQLInt),
+    },
+)
+
+schema = GraphQLSchema(query_type, types=[dog_type, cat_type])
+
+root_value = {
+    "pets": [{"name": "Odie", "barks": True}, {"name": "Garfield", "meows": False}],
+    "count": 2,
+}
+
+
+def compile_document(source: str, **kwargs) -> CompiledOperation:
+    compiled_operation = compile_operation(schema, parse(source), **kwargs)
+    assert isinstance(compiled_operation, CompiledOperation)
+    return compiled_operation
+
+
+def describe_compile_operation():
+    def returns_errors_if_no_operation_can_be_selected():
+        document = parse("query A { count } query B { count }")
+        assert compile_operation(schema, document) == [
+            GraphQLError(
+                "Must provide operation name if query contains multiple operations."
+            )
+        ]
+        assert compile_operation(schema, document, "C") == [
+            GraphQLError("Unknown operation named 'C'.")
+        ]
+
+    def selects_the_operation_with_the_given_name():
+        compiled_operation = compile_document(
+            "query A { count } query B { pets { name } }", operation_name="B"
+        )
+        assert repr(compiled_operation) == "<CompiledOperation B>"
+        assert execute_compiled_operation(compiled_operation, root_value) == (
+            {"pets": [{"name": "Odie"}, {"name": "Garfield"}]},
+            None,
+        )
+
+    def has_a_representation_for_anonymous_operations():
+        assert repr(compile_document("{ count }")) == (
+            "<CompiledOperation (anonymous)>"
+        )
+
+    def produces_the_same_results_as_execute():
+        source = """
+            query ($value: String) {
+              pets {
+                name
+                ... on Dog { barks }
+                ...CatFields
+              }
+              literal: echo(value: "literal")
+              variable: echo(value: $value)
+              default: echo
+            }
+            fragment CatFields on Cat { meows }
+            """
+        compiled_operation = compile_document(source)
+        for variable_values in ({"value": "foo"}, {"value": "bar"}, None):
+            assert execute_compiled_operation(
+                compiled_operation, root_value, variable_values=variable_values
+            ) == execute(schema, parse(source), root_value, None, variable_values)
+
+    def memoizes_collected_fields_that_do_not_depend_on_variables():
+        compiled_operation = compile_document("{ pets { name } count }")
+        no_variables = VariableValues({}, {})
+        root_fields = compiled_operation.collect_root_fields(query_type, no_variables)
+        assert list(root_fields.grouped_field_set) == ["pets", "count"]
+        assert (
+            compiled_operation.collect_root_fields(query_type, no_variables)
+            is root_fields
+        )
+        pets_details_list = root_fields.grouped_field_set["pets"]
+        key = (dog_type, id(pets_details_list[0]))
+        sub_fields = compiled_operation.collect_subfields(
+            key, dog_type, pets_details_list, no_variables
+        )
+        assert list(sub_fields.grouped_field_set) == ["name"]
+        assert (
+            compiled_operation.collect_subfields(
+                key, dog_type, pets_details_list, no_variables
+            )
+            is sub_fields
+        )
+
+    def does_not_memoize_subfields_of_dynamic_field_details():
+        compiled_operation = compile_document("{ pets { name } }")
+        no_variables = VariableValues({}, {})
+        root_fields = collect_fields(
+            schema, {}, no_variables, query_type, compiled_operation.operation
+        )
+        pets_details_list = root_fields.grouped_field_set["pets"]
+        key = (dog_type, id(pets_details_list[0]))
+        sub_fields = compiled_operation.collect_subfields(
+            key, dog_type, pets_details_list, no_variables
+        )
+        assert list(sub_fields.grouped_field_set) == ["name"]
+        assert (
+            compiled_operation.collect_subfields(
+                key, dog_type, pets_details_list, no_variables
+            )
+            is not sub_fields
+        )
+
+    def collects_fields_with_variable_directives_dynamically():
+        compiled_operation = compile_document(
+            """
+            query ($withCount: Boolean!, $withName: Boolean!) {
+              count @include(if: $withCount)
+              pets { ...PetFields }
+            }
+            fragment PetFields on Named {
+              ... @skip(if: $withName) { __typename }
+              name @include(if: $withName)
+            }
+            """
+        )
+
+        def run(with_count: bool, with_name: bool) -> ExecutionResult:
+            return execute_compiled_operation(  # type: ignore
+                compiled_operation,
+                root_value,
+                variable_values={"withCount": with_count, "withName": with_name},
+            )
+
+        assert run(True, True) == (
+            {"count": 2, "pets": [{"name": "Odie"}, {"name": "Garfield"}]},
+            None,
+        )
+        assert run(False, False) == (
+            {"pets": [{"__typename": "Dog"}, {"__typename": "Cat"}]},
+            None,
+        )
+        assert run(True, False) == (
+            {
+                "count": 2,
+                "pets": [{"__typename": "Dog"}, {"__typename": "Cat"}],
+            },
+            None,
+        )
+
+    def collects_fields_of_fragments_with_arguments_dynamically():
+        source = """
+            query ($value: String) {
+              ...EchoFields(value: "literal")
+              ...EchoFields(value: $value)
+            }
+            fragment EchoFields($value: String) on Query {
+              echo(value: $value)
+            }
+            """
+        document = parse(source, experimental_fragment_arguments=True)
+        compiled_operation = compile_operation(schema, document)
+        assert isinstance(compiled_operation, CompiledOperation)
+        assert not compiled_operation.is_static_selection_set(
+            compiled_operation.operation.selection_set
+        )
+        assert execute_compiled_operation(
+            compiled_operation, variable_values={"value": "foo"}
+        ) == ({"echo": "literal"}, None)
+
+    def checks_whether_selection_sets_depend_on_variables():
+        compiled_operation = compile_document(
+            """
+            query ($withName: Boolean!) {
+              static: pets { ...StaticFields ...StaticFields }
+              spread: pets { ...DynamicFields }
+              inline: pets { ... { ... @include(if: $withName) { name } } }
+            }
+            fragment StaticFields on Named { name ...OtherStaticFields }
+            fragment OtherStaticFields on Named { ...StaticFields }
+            fragment DynamicFields on Named { ...OtherDynamicFields }
+            fragment OtherDynamicFields on Named { name @skip(if: $withName) }
+            """
+        )
+        is_static_selection_set = compiled_operation.is_static_selection_set
+        selection_set = compiled_operation.operation.selection_set
+        static, spread, inline = (
+            selection.selection_set  # type: ignore
+            for selection in selection_set.selections
+        )
+        assert is_static_selection_set(static)
+        assert not is_static_selection_set(spread)
+        assert not is_static_selection_set(inline)
+        assert is_static_selection_set(selection_set)
+        assert is_static_selection_set(selection_set)
+
+    def checks_whether_values_contain_variables():
+        def has_variables(source: str) -> bool:
+            return value_has_variables(parse_value(source))
+
+        assert not has_variables("1")
+        assert has_variables("$var")
+        assert not has_variables("[1, 2]")
+        assert has_variables("[1, $var]")
+        assert not has_variables("{a: 1, b: [2]}")
+        assert has_variables("{a: 1, b: [$var]}")
+
+    def returns_variable_coercion_errors():
+        compiled_operation = compile_document(
+            "query ($value: String!) { echo(value: $value) }"
+        )
+        result = execute_compiled_operation(compiled_operation)
+        assert result == (
+            None,
+            [
+                {
+                    "message": "Variable '$value' has invalid value: "
+                    "Expected a value of non-null type 'String!' to be provided.",
+                    "locations": [(1, 8)],
+                }
+            ],
+        )
+        assert execute_compiled_operation(
+            compiled_operation, variable_values={"value": "foo"}
+        ) == ({"echo": "foo"}, None)
+
+    def memoizes_only_arguments_given_as_literals():
+        compiled_operation = compile_document(
+            'query ($value: String) { a: echo(value: "a") b: echo(value: $value) }'
+        )
+        assert execute_compiled_operation(
+            compiled_operation, variable_values={"value": "b"}
+        ) == ({"a": "a", "b": "b"}, None)
+        assert execute_compiled_operation(
+            compiled_operation, variable_values={"value": "c"}
+        ) == ({"a": "a", "b": "c"}, None)
+        echo_field = query_type.fields["echo"]
+        a_details, b_details = (
+            field_details_list[0]
+            for field_details_list in compiled_operation.collect_root_fields(
+                query_type, VariableValues({}, {})
+            ).grouped_field_set.values()
+        )
+        variable_values = VariableValues({}, {"value": "b"})
+        get_argument_values = compiled_operation.get_argument_values
+        a_args = get_argument_values(echo_field, a_details, variable_values)
+        assert a_args == {"value": "a"}
+        assert get_argument_values(echo_field, a_details, variable_values) is a_args
+        b_args = get_argument_values(echo_field, b_details, variable_values)
+        assert b_args == {"value": "b"}
+        assert get_argument_values(echo_field, b_details, variable_values) is not b_args
+
+    def prepares_field_definitions_and_resolvers():
+        def custom_resolver(obj, info):
+            return obj.get(info.field_name)
+
+        def double_middleware(next_, *args, **kwargs):
+            return next_(*args, **kwargs) * 2
+
+        compiled_operation = compile_document(
+            "{ count }",
+            field_resolver=custom_resolver,
+            middleware=[double_middleware],
+        )
+        compiled_field = compiled_operation.get_field(query_type, "count")
+        assert isinstance(compiled_field, CompiledField)
+        assert compiled_field.field_def is query_type.fields["count"]
+        assert compiled_field.resolve_fn is not custom_resolver
+        assert compiled_operation.get_field(query_type, "count") is compiled_field
+        assert compiled_operation.get_field(query_type, "unknown") is None
+
+        assert execute_compiled_operation(compiled_operation, root_value) == (
+            {"count": 4},
+            None,
+        )
+
+    def ignores_unknown_fields():
+        compiled_operation = compile_document("{ count unknown }")
+        assert execute_compiled_operation(compiled_operation, root_value) == (
+            {"count": 2},
+            None,
+        )
+
+    def raises_for_invalid_middleware():
+        with pytest.raises(TypeError) as exc_info:
+            compile_operation(schema, parse("{ count }"), middleware={})  # type: ignore
+        assert str(exc_info.value) == (
+            "Middleware must be passed as a list or tuple of functions"
+            " or objects, or as a single MiddlewareManager object. Got {} instead."
+        )
+
+    def rejects_schemas_with_experimental_directives():
+        from graphql.type import GraphQLDeferDirective, specified_directives
+
+        schema_with_defer = GraphQLSchema(
+            query_type, directives=[*specified_directives, GraphQLDeferDirective]
+        )
+        compiled_operation = compile_operation(schema_with_defer, parse("{ count }"))
+        assert isinstance(compiled_operation, CompiledOperation)
+        with pytest.raises(GraphQLError):
+            execute_compiled_operation(compiled_operation)
+
+    def uses_a_custom_executor_class():
+        class TestExecutor(Executor):
+            def __init__(self, *args, **kwargs):
+                assert kwargs.pop("custom_arg", None) == "baz"
+                super().__init__(*args, **kwargs)
+
+        compiled_operation = compile_document("{ count }")
+        assert execute_compiled_operation(
+            compiled_operation,
+            root_value,
+            executor_class=TestExecutor,
+            custom_arg="baz",
+        ) == ({"count": 2}, None)
+
+    async def executes_asynchronous_resolvers():
+        async def resolve_count(_obj, _info):
+            return 3
+
+        async_query_type = GraphQLObjectType(
+            "Query", {"count": GraphQLField(GraphQLInt, resolve=resolve_count)}
+        )
+        compiled_operation = compile_operation(
+            GraphQLSchema(async_query_type), parse("{ count }")
+        )
+        assert isinstance(compiled_operation, CompiledOperation)
+        result = execute_compiled_operation(compiled_operation)
+        assert await result == ({"count": 3}, None)  # type: ignore
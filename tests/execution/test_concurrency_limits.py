@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from asyncio import CancelledError, Event, Semaphore, ensure_future, sleep
+from typing import Any
+
+import pytest
+
+from graphql.execution import AbortedGraphQLExecutionError, execute
+from graphql.execution.executor import await_with_semaphores, has_field_limits
+from graphql.language import parse
+from graphql.pyutils import AbortController
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+)
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.filterwarnings("error:coroutine .* was never awaited:RuntimeWarning"),
+]
+
+
+class Tracker:
+    """Track which resolvers have started and how many run at the same time."""
+
+    def __init__(self) -> None:
+        self.started: list[int] = []
+        self.running = 0
+        self.max_running = 0
+        self.release = Event()
+        self.release.set()
+
+    async def resolve(self, value: int) -> int:
+        self.started.append(value)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await sleep(0)
+            await self.release.wait()
+            return value
+        finally:
+            self.running -= 1
+
+
+def build_test_schema(
+    tracker: Tracker, other_tracker: Tracker | None = None
+) -> GraphQLSchema:
+    other = other_tracker or tracker
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "items": GraphQLField(
+                    GraphQLList(GraphQLInt),
+                    resolve=lambda *_args: [tracker.resolve(i) for i in range(10)],
+                ),
+                "limitedItems": GraphQLField(
+                    GraphQLList(GraphQLInt),
+                    resolve=lambda *_args: [tracker.resolve(i) for i in range(10)],
+                    max_concurrency=2,
+                ),
+                "otherItems": GraphQLField(
+                    GraphQLList(GraphQLInt),
+                    resolve=lambda *_args: [other.resolve(i) for i in range(10)],
+                ),
+                "value": GraphQLField(
+                    GraphQLInt, resolve=lambda *_args: tracker.resolve(42)
+                ),
+            },
+        )
+    )
+
+
+def describe_concurrency_limits():
+    async def does_not_limit_concurrency_by_default():
+        tracker = Tracker()
+        result = execute(build_test_schema(tracker), parse("{ items value }"))
+        assert await result == (  # type: ignore
+            {"items": list(range(10)), "value": 42},
+            None,
+        )
+        assert tracker.max_running == 11
+
+    async def limits_concurrent_resolvers_per_operation():
+        tracker = Tracker()
+        result = execute(
+            build_test_schema(tracker),
+            parse("{ items value }"),
+            max_concurrent_resolvers=3,
+        )
+        assert await result == (  # type: ignore
+            {"items": list(range(10)), "value": 42},
+            None,
+        )
+        assert tracker.max_running == 3
+
+    async def starts_waiting_resolvers_in_order():
+        tracker = Tracker()
+        result = execute(
+            build_test_schema(tracker), parse("{ items }"), max_concurrent_resolvers=1
+        )
+        assert await result == ({"items": list(range(10))}, None)  # type: ignore
+        assert tracker.started == list(range(10))
+        assert tracker.max_running == 1
+
+    async def limits_concurrent_resolvers_per_field():
+        tracker, other_tracker = Tracker(), Tracker()
+        result = execute(
+            build_test_schema(tracker, other_tracker),
+            parse("{ limitedItems otherItems }"),
+        )
+        assert await result == (  # type: ignore
+            {"limitedItems": list(range(10)), "otherItems": list(range(10))},
+            None,
+        )
+        assert tracker.max_running == 2
+        assert other_tracker.max_running == 10
+
+    async def combines_limits_per_field_and_per_operation():
+        tracker = Tracker()
+        result = execute(
+            build_test_schema(tracker),
+            parse("{ limitedItems otherItems }"),
+            max_concurrent_resolvers=4,
+        )
+        assert await result == (  # type: ignore
+            {"limitedItems": list(range(10)), "otherItems": list(range(10))},
+            None,
+        )
+        assert tracker.max_running == 4
+
+    async def does_not_start_waiting_resolvers_after_abort():
+        tracker = Tracker()
+        tracker.release.clear()
+        abort_controller = AbortController()
+        result = ensure_future(
+            execute(  # type: ignore
+                build_test_schema(tracker),
+                parse("{ items }"),
+                max_concurrent_resolvers=2,
+                abort_signal=abort_controller.signal,
+            )
+        )
+        while len(tracker.started) < 2:  # noqa: ASYNC110
+            await sleep(0)
+        abort_controller.abort()
+        with pytest.raises(AbortedGraphQLExecutionError):
+            await result
+        tracker.release.set()
+        for _ in range(5):
+            await sleep(0)
+        assert tracker.started == [0, 1]
+
+    async def cancels_waiting_for_other_awaitables():
+        semaphore = Semaphore(0)
+        future = ensure_future(sleep(0, "done"))
+        waiting = ensure_future(await_with_semaphores(future, [semaphore]))
+        await sleep(0)
+        waiting.cancel()
+        with pytest.raises(CancelledError):
+            await waiting
+        assert await future == "done"
+
+
+def describe_field_limits():
+    def checks_whether_the_schema_has_fields_with_limits():
+        tracker = Tracker()
+        assert has_field_limits(build_test_schema(tracker))
+        query_type = GraphQLObjectType("Query", {"value": GraphQLField(GraphQLInt)})
+        assert not has_field_limits(GraphQLSchema(query_type))
+        object_type = GraphQLObjectType(
+            "Object", {"value": GraphQLField(GraphQLInt, timeout=1)}
+        )
+        assert has_field_limits(GraphQLSchema(query_type, types=[object_type]))
+
+    async def does_not_look_up_fields_if_awaiting_is_not_limited():
+        looked_up: list[str] = []
+
+        class TrackingSchema(GraphQLSchema):
+            def get_field(self, parent_type: Any, field_name: str) -> Any:
+                looked_up.append(field_name)
+                return super().get_field(parent_type, field_name)
+
+        tracker = Tracker()
+        schema = TrackingSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "value": GraphQLField(
+                        GraphQLInt, resolve=lambda *_args: tracker.resolve(42)
+                    )
+                },
+            )
+        )
+        document = parse("{ value }")
+
+        assert await execute(schema, document) == ({"value": 42}, None)  # type: ignore
+        # looked up only when executing the field
+        assert looked_up == ["value"]
+
+        looked_up.clear()
+        result = execute(schema, document, max_concurrent_resolvers=1)
+        assert await result == ({"value": 42}, None)  # type: ignore
+        # also looked up for the timeout and for the concurrency limit
+        assert looked_up == ["value"] * 3
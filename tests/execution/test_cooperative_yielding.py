@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+from asyncio import ensure_future, sleep
+from typing import Any
+
+import pytest
+
+from graphql.execution import AbortedGraphQLExecutionError, ExecutionResult, execute
+from graphql.graphql import assume_not_awaitable
+from graphql.language import parse
+from graphql.pyutils import AbortController, is_awaitable
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+)
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.filterwarnings("error:coroutine .* was never awaited:RuntimeWarning"),
+]
+
+
+events: list[str] = []
+
+
+def resolve_value(item: Any, _info: Any) -> Any:
+    if isinstance(item, int):
+        events.append(f"item {item}")
+    return item
+
+
+async def resolve_async_value(item: Any, _info: Any) -> Any:
+    return item
+
+
+item_type = GraphQLObjectType(
+    "Item",
+    {
+        "value": GraphQLField(GraphQLInt, resolve=resolve_value),
+        "asyncValue": GraphQLField(GraphQLInt, resolve=resolve_async_value),
+    },
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        {
+            "items": GraphQLField(
+                GraphQLList(item_type), resolve=lambda root, _info: root
+            ),
+            "nonNullItems": GraphQLField(
+                GraphQLList(GraphQLNonNull(item_type)), resolve=lambda root, _info: root
+            ),
+            "values": GraphQLField(
+                GraphQLList(GraphQLInt), resolve=lambda root, _info: root
+            ),
+        },
+    )
+)
+
+
+async def count_ticks() -> None:
+    while True:
+        events.append("tick")
+        await sleep(0)
+
+
+async def execute_with_ticks(
+    items: Any, query: str = "{ items { value } }", **kwargs: Any
+) -> ExecutionResult:
+    events.clear()
+    ticker = ensure_future(count_ticks())
+    try:
+        result = execute(schema, parse(query), items, **kwargs)
+        if is_awaitable(result):
+            result = await result
+    finally:
+        ticker.cancel()
+    assert isinstance(result, ExecutionResult)
+    return result
+
+
+def describe_cooperative_yielding():
+    async def does_not_yield_by_default():
+        result = await execute_with_ticks(range(4))
+        assert result == ({"items": [{"value": i} for i in range(4)]}, None)
+        assert events == ["item 0", "item 1", "item 2", "item 3"]
+
+    async def yields_after_the_given_number_of_items():
+        result = await execute_with_ticks(range(5), yield_every_items=2)
+        assert result == ({"items": [{"value": i} for i in range(5)]}, None)
+        assert events == [
+            "item 0",
+            "item 1",
+            "tick",
+            "item 2",
+            "item 3",
+            "tick",
+            "item 4",
+        ]
+
+    async def yields_after_the_given_completion_time():
+        result = await execute_with_ticks(range(3), yield_every_seconds=0)
+        assert result == ({"items": [{"value": i} for i in range(3)]}, None)
+        assert events == ["tick", "item 0", "tick", "item 1", "tick", "item 2"]
+
+    async def does_not_yield_when_completing_short_lists():
+        result = execute(
+            schema, parse("{ items { value } }"), range(2), yield_every_items=2
+        )
+        assert result == ({"items": [{"value": 0}, {"value": 1}]}, None)
+
+    async def yields_when_completing_iterables_of_unknown_length():
+        items = iter(range(2))
+        result = await execute_with_ticks(items, yield_every_items=2)
+        assert result == ({"items": [{"value": 0}, {"value": 1}]}, None)
+        assert events == ["item 0", "item 1"]
+
+    async def completes_leaf_values_in_bulk_before_yielding():
+        result = await execute_with_ticks(
+            [1, 2, None, 4, 5], "{ values }", yield_every_items=1
+        )
+        assert result == ({"values": [1, 2, None, 4, 5]}, None)
+        assert events == ["tick", "tick"]
+
+    async def completes_awaitable_items_when_yielding():
+        async def get_item(value: int) -> int:
+            return value
+
+        result = await execute_with_ticks(
+            [get_item(0), 1, get_item(2)], yield_every_items=1
+        )
+        assert result == ({"items": [{"value": i} for i in range(3)]}, None)
+
+    async def completes_items_with_awaitable_fields_when_yielding():
+        result = await execute_with_ticks(
+            range(3), "{ items { value asyncValue } }", yield_every_items=1
+        )
+        assert result == (
+            {"items": [{"value": i, "asyncValue": i} for i in range(3)]},
+            None,
+        )
+
+    async def handles_errors_when_yielding():
+        async def get_item(value: int) -> int:
+            return value
+
+        result = await execute_with_ticks(
+            [0, None, get_item(2), get_item(3)],
+            "{ nonNullItems { value } }",
+            yield_every_items=1,
+        )
+        assert result == (
+            {"nonNullItems": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Query.nonNullItems.",
+                    "locations": [(1, 3)],
+                    "path": ["nonNullItems", 1],
+                }
+            ],
+        )
+        await sleep(0)
+
+    async def stops_yielding_when_aborted():
+        abort_controller = AbortController()
+
+        def resolve_value(item: Any, _info: Any) -> Any:
+            if item == 1:
+                abort_controller.abort(RuntimeError("Aborted"))
+            return item
+
+        schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "items": GraphQLField(
+                        GraphQLList(
+                            GraphQLObjectType(
+                                "Item",
+                                {
+                                    "value": GraphQLField(
+                                        GraphQLInt, resolve=resolve_value
+                                    )
+                                },
+                            )
+                        ),
+                        resolve=lambda root, _info: root,
+                    )
+                },
+            )
+        )
+        result = execute(
+            schema,
+            parse("{ items { value } }"),
+            range(5),
+            abort_signal=abort_controller.signal,
+            yield_every_items=2,
+        )
+        assert is_awaitable(result)
+        with pytest.raises(AbortedGraphQLExecutionError, match="Aborted"):
+            await result
+
+    def does_not_yield_without_running_event_loop():
+        result = execute(
+            schema, parse("{ items { value } }"), range(3), yield_every_items=1
+        )
+        assert result == ({"items": [{"value": i} for i in range(3)]}, None)
+
+    async def does_not_yield_if_awaitable_values_are_not_accepted():
+        result = execute(
+            schema,
+            parse("{ items { value } }"),
+            range(3),
+            is_awaitable=assume_not_awaitable,
+            yield_every_items=1,
+        )
+        assert result == ({"items": [{"value": i} for i in range(3)]}, None)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from inspect import isasyncgen
 
 import pytest
@@ -69,6 +70,49 @@ def describe_customize_execution():
             None,
         )
 
+    def passes_execution_options_to_the_executor():
+        query = parse("{ foo }")
+
+        schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {"foo": GraphQLField(GraphQLString, resolve=lambda *_args: "bar")},
+            )
+        )
+
+        executors: list[Executor] = []
+
+        class TestExecutor(Executor):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                executors.append(self)
+
+        thread_pool = ThreadPoolExecutor(1)
+        assert execute(
+            schema,
+            query,
+            executor_class=TestExecutor,
+            thread_pool=thread_pool,
+            max_blocking_resolvers=1,
+            max_concurrent_resolvers=2,
+            eager_awaiting=True,
+            timeout=10,
+            read_ahead=3,
+            yield_every_items=4,
+            yield_every_seconds=5,
+        ) == ({"foo": "bar"}, None)
+        thread_pool.shutdown()
+
+        executor = executors.pop()
+        assert executor.thread_pool is thread_pool
+        assert executor.max_blocking_resolvers == 1
+        assert executor.max_concurrent_resolvers == 2
+        assert executor.eager_awaiting is True
+        assert executor.deadline is not None
+        assert executor.read_ahead == 3
+        assert executor.yield_every_items == 4
+        assert executor.yield_every_seconds == 5
+
 
 def describe_customize_subscription():
     async def uses_a_custom_subscribe_field_resolver():
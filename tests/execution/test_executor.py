@@ -8,8 +8,11 @@ import pytest
 
 from graphql.error import GraphQLError
 from graphql.execution import (
+    CompiledOperation,
     Executor,
+    compile_operation,
     execute,
+    execute_compiled_operation,
     execute_root_selection_set,
     execute_sync,
 )
@@ -275,12 +278,15 @@ def describe_execute_handles_basic_execution_tasks():
         assert len(resolved_infos) == 1
         async_helpers = resolved_infos[0].async_helpers
         assert isinstance(async_helpers, GraphQLResolveInfoHelpers)
-        assert async_helpers._fields == ("gather", "track")
+        assert async_helpers._fields == ("gather", "track", "run_blocking")
         gather = async_helpers.gather
         assert callable(gather)
         track = async_helpers.track
         assert callable(track)
         track(["not awaitable"])  # non-awaitable values are ignored
+        run_blocking = async_helpers.run_blocking
+        assert callable(run_blocking)
+        assert run_blocking(str.upper, "called directly") == "CALLED DIRECTLY"
 
         operation = cast("OperationDefinitionNode", document.definitions[0])
         assert operation
@@ -1367,6 +1373,113 @@ def describe_execute_handles_basic_execution_tasks():
 
         assert third is not first
 
+    def memoizes_argument_values_for_lists():
+        parsed_values: list[Any] = []
+
+        def parse_value(value: Any) -> Any:
+            parsed_values.append(value)
+            return value
+
+        counting_scalar = GraphQLScalarType("Counting", parse_value=parse_value)
+        item_type = GraphQLObjectType(
+            "Item",
+            {
+                "echo": GraphQLField(
+                    GraphQLString,
+                    args={"value": GraphQLArgument(counting_scalar)},
+                    resolve=lambda _obj, _info, value: value,
+                )
+            },
+        )
+        schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "items": GraphQLField(
+                        GraphQLList(item_type), resolve=lambda *_args: [1, 2, 3]
+                    )
+                },
+            )
+        )
+        document = parse('{ items { echo(value: "v") } }')
+
+        for execution in range(1, 3):
+            assert execute_sync(schema, document) == (
+                {"items": [{"echo": "v"}, {"echo": "v"}, {"echo": "v"}]},
+                None,
+            )
+            # coerced once per execution, not once per list item
+            assert parsed_values == ["v"] * execution
+
+    def does_not_share_mutable_argument_values_between_resolver_calls():
+        class Filter:
+            def __init__(self, tags: list[str]) -> None:
+                self.tags = tags
+
+        filter_type = GraphQLInputObjectType(
+            "Filter",
+            {"tags": GraphQLInputField(GraphQLList(GraphQLString))},
+            out_type=lambda value: Filter(**value),
+        )
+        options_type = GraphQLInputObjectType(
+            "Options", {"flags": GraphQLInputField(GraphQLList(GraphQLBoolean))}
+        )
+
+        def resolve_echo(_obj, _info, **args: Any) -> str:
+            echo = repr(
+                [
+                    args.get("extra"),
+                    args["numbers"],
+                    args["options"],
+                    args["filter"].tags,
+                ]
+            )
+            # resolvers are allowed to change their argument values
+            args["extra"] = True
+            args["numbers"].append(4)
+            args["options"]["flags"].append(False)
+            args["filter"].tags.append("d")
+            return echo
+
+        item_type = GraphQLObjectType(
+            "Item",
+            {
+                "echo": GraphQLField(
+                    GraphQLString,
+                    args={
+                        "numbers": GraphQLArgument(GraphQLList(GraphQLInt)),
+                        "options": GraphQLArgument(options_type),
+                        "filter": GraphQLArgument(filter_type),
+                    },
+                    resolve=resolve_echo,
+                )
+            },
+        )
+        schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "items": GraphQLField(
+                        GraphQLList(item_type), resolve=lambda *_args: [1, 2]
+                    )
+                },
+            )
+        )
+        document = parse(
+            "{ items { echo(numbers: [1, 2, 3], options: {flags: [true]},"
+            ' filter: {tags: ["a", "b", "c"]}) } }'
+        )
+        echo = "[None, [1, 2, 3], {'flags': [True]}, ['a', 'b', 'c']]"
+        expected = ({"items": [{"echo": echo}, {"echo": echo}]}, None)
+
+        assert execute_sync(schema, document) == expected
+        assert execute_sync(schema, document) == expected
+
+        compiled_operation = compile_operation(schema, document)
+        assert isinstance(compiled_operation, CompiledOperation)
+        assert execute_compiled_operation(compiled_operation) == expected
+        assert execute_compiled_operation(compiled_operation) == expected
+
 
 def describe_base_executor_without_incremental_delivery():
     def deduplicates_errors_at_nulled_positions():
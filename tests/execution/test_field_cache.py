@@ -0,0 +1,442 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from graphql.execution import (
+    BreadthFirstExecutor,
+    FieldCache,
+    JitExecutor,
+    SyncExecutor,
+    default_field_cache_key,
+    execute,
+    execute_sync,
+)
+from graphql.language import parse
+from graphql.pyutils import Undefined
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLCachedDirective,
+    GraphQLField,
+    GraphQLID,
+    GraphQLList,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+    specified_directives,
+)
+from graphql.utilities import build_schema, extend_schema
+
+pytestmark = pytest.mark.anyio
+
+
+class Author:
+    def __init__(self, id_: str, name: str) -> None:
+        self.id = id_
+        self.name = name
+
+
+authors = [Author("1", "Alice"), Author("2", "Bob")]
+
+
+def build_test_schema(
+    field_cache: FieldCache, calls: list[str], name_cache: FieldCache | None = None
+) -> GraphQLSchema:
+    def resolve_greeting(author: Author, _info: Any, greeting: str = "Hello") -> str:
+        calls.append(f"{greeting} {author.name}")
+        return f"{greeting}, {author.name}!"
+
+    async def resolve_async_greeting(author: Author, info: Any) -> str:
+        return resolve_greeting(author, info)
+
+    def resolve_error(author: Author, _info: Any) -> Exception:
+        calls.append(f"error {author.name}")
+        return RuntimeError("Oops")
+
+    async def resolve_async_error(author: Author, info: Any) -> Exception:
+        return resolve_error(author, info)
+
+    author_type = GraphQLObjectType(
+        "Author",
+        {
+            "id": GraphQLField(GraphQLID),
+            "name": GraphQLField(GraphQLString, cache=name_cache),
+            "greeting": GraphQLField(
+                GraphQLString,
+                args={"greeting": GraphQLArgument(GraphQLString)},
+                resolve=resolve_greeting,
+                cache=field_cache,
+            ),
+            "asyncGreeting": GraphQLField(
+                GraphQLString,
+                resolve=resolve_async_greeting,
+                cache=FieldCache(field_cache.max_age),
+            ),
+            "error": GraphQLField(
+                GraphQLString, resolve=resolve_error, cache=FieldCache(60)
+            ),
+            "asyncError": GraphQLField(
+                GraphQLString, resolve=resolve_async_error, cache=FieldCache(60)
+            ),
+        },
+    )
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "authors": GraphQLField(
+                    GraphQLList(author_type), resolve=lambda *_args: authors
+                )
+            },
+        )
+    )
+
+
+def describe_field_cache():
+    def caches_results_under_keys():
+        field_cache = FieldCache(max_age=60)
+        assert field_cache.get("key") is Undefined
+        field_cache.set("key", "value")
+        assert field_cache.get("key") == "value"
+        assert len(field_cache) == 1
+        assert (field_cache.hits, field_cache.misses) == (1, 1)
+
+    def expires_results(monkeypatch: pytest.MonkeyPatch):
+        now = 100.0
+        monkeypatch.setattr("graphql.execution.field_cache.monotonic", lambda: now)
+        field_cache = FieldCache(max_age=10)
+        field_cache.set("key", "value")
+        now = 109.0
+        assert field_cache.get("key") == "value"
+        now = 110.0
+        assert field_cache.get("key") is Undefined
+        assert len(field_cache) == 0
+        assert (field_cache.hits, field_cache.misses) == (1, 1)
+
+    def discards_least_recently_used_results():
+        field_cache = FieldCache(max_age=60, max_size=2)
+        field_cache.set("a", 1)
+        field_cache.set("b", 2)
+        assert field_cache.get("a") == 1
+        field_cache.set("c", 3)
+        assert len(field_cache) == 2
+        assert field_cache.get("b") is Undefined
+        assert field_cache.get("a") == 1
+        assert field_cache.get("c") == 3
+        field_cache.set("a", 4)
+        assert len(field_cache) == 2
+        assert field_cache.get("a") == 4
+
+    def clears_results():
+        field_cache = FieldCache(max_age=60)
+        field_cache.set("key", "value")
+        field_cache.clear()
+        assert len(field_cache) == 0
+        assert field_cache.get("key") is Undefined
+
+    def can_be_shared_by_threads():
+        field_cache = FieldCache(max_age=60, max_size=10)
+
+        def use_cache(thread: int) -> None:
+            for index in range(1000):
+                key = (thread, index % 20)
+                if field_cache.get(key) is Undefined:
+                    field_cache.set(key, index)
+
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(use_cache, range(4)))
+        assert len(field_cache) == 10
+        assert field_cache.hits + field_cache.misses == 4000
+
+
+def describe_default_field_cache_key():
+    def uses_ids_of_sources():
+        assert default_field_cache_key({"id": 1}, {}) == (1, None)
+        assert default_field_cache_key(Author("2", "Bob"), {}) == ("2", None)
+
+    def accepts_root_values_of_none():
+        assert default_field_cache_key(None, {}) == (None, None)
+
+    def serializes_arguments():
+        assert default_field_cache_key({"id": 1}, {"b": 2, "a": 1}) == (
+            1,
+            '{"a": 1, "b": 2}',
+        )
+
+    def returns_none_for_sources_without_id():
+        assert default_field_cache_key({"name": "Alice"}, {}) is None
+
+    def returns_none_for_unserializable_arguments():
+        assert default_field_cache_key(None, {"a": object()}) is None
+
+
+def describe_executing_cached_fields():
+    def skips_resolvers_for_cached_results():
+        field_cache = FieldCache(max_age=60)
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls)
+        document = parse("{ authors { greeting } }")
+        expected = (
+            {"authors": [{"greeting": "Hello, Alice!"}, {"greeting": "Hello, Bob!"}]},
+            None,
+        )
+        assert execute_sync(schema, document) == expected
+        assert execute_sync(schema, document) == expected
+        assert calls == ["Hello Alice", "Hello Bob"]
+        assert (field_cache.hits, field_cache.misses) == (2, 2)
+
+    def caches_results_by_arguments():
+        field_cache = FieldCache(max_age=60)
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls)
+        document = parse(
+            "query ($greeting: String) { authors { greeting(greeting: $greeting) } }"
+        )
+        execute_sync(schema, document, variable_values={"greeting": "Hi"})
+        execute_sync(schema, document, variable_values={"greeting": "Hey"})
+        result = execute_sync(schema, document, variable_values={"greeting": "Hi"})
+        assert result == (
+            {"authors": [{"greeting": "Hi, Alice!"}, {"greeting": "Hi, Bob!"}]},
+            None,
+        )
+        assert calls == ["Hi Alice", "Hi Bob", "Hey Alice", "Hey Bob"]
+
+    def caches_results_of_default_resolvers():
+        name_cache = FieldCache(max_age=60)
+        schema = build_test_schema(FieldCache(max_age=60), [], name_cache)
+        document = parse("{ authors { name } }")
+        execute_sync(schema, document)
+        result = execute_sync(schema, document)
+        assert result == ({"authors": [{"name": "Alice"}, {"name": "Bob"}]}, None)
+        assert (name_cache.hits, name_cache.misses) == (2, 2)
+
+    def uses_custom_keys():
+        field_cache = FieldCache(max_age=60, get_key=lambda _source, _args: "same")
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls)
+        result = execute_sync(schema, parse("{ authors { greeting } }"))
+        assert result == (
+            {"authors": [{"greeting": "Hello, Alice!"}, {"greeting": "Hello, Alice!"}]},
+            None,
+        )
+        assert calls == ["Hello Alice"]
+
+    def does_not_cache_results_without_key():
+        field_cache = FieldCache(max_age=60, get_key=lambda _source, _args: None)
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls)
+        document = parse("{ authors { greeting } }")
+        execute_sync(schema, document)
+        execute_sync(schema, document)
+        assert len(calls) == 4
+        assert len(field_cache) == 0
+        assert (field_cache.hits, field_cache.misses) == (0, 0)
+
+    def does_not_cache_errors():
+        field_cache = FieldCache(max_age=60)
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls)
+        document = parse("{ authors { error } }")
+        execute_sync(schema, document)
+        result = execute_sync(schema, document)
+        assert result.errors
+        assert len(calls) == 4
+        assert len(field_cache) == 0
+
+    async def caches_results_of_async_resolvers():
+        field_cache = FieldCache(max_age=60)
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls)
+        document = parse("{ authors { asyncGreeting } }")
+        expected = (
+            {
+                "authors": [
+                    {"asyncGreeting": "Hello, Alice!"},
+                    {"asyncGreeting": "Hello, Bob!"},
+                ]
+            },
+            None,
+        )
+        result = execute(schema, document)
+        assert result != expected
+        assert await result == expected  # type: ignore
+        assert execute(schema, document) == expected
+        assert calls == ["Hello Alice", "Hello Bob"]
+
+    async def does_not_cache_errors_of_async_resolvers():
+        field_cache = FieldCache(max_age=60)
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls)
+        document = parse("{ authors { asyncError } }")
+        await execute(schema, document)  # type: ignore
+        result = await execute(schema, document)  # type: ignore
+        assert result.errors
+        assert len(calls) == 4
+        assert len(field_cache) == 0
+
+    def skips_middleware_for_cached_results():
+        field_cache = FieldCache(max_age=60)
+        schema = build_test_schema(field_cache, [])
+        middleware_calls: list[str] = []
+
+        def middleware(next_: Any, source: Any, info: Any, **args: Any) -> Any:
+            middleware_calls.append(info.field_name)
+            return next_(source, info, **args)
+
+        document = parse("{ authors { greeting } }")
+        execute_sync(schema, document, middleware=[middleware])
+        execute_sync(schema, document, middleware=[middleware])
+        assert middleware_calls == ["authors", "greeting", "greeting", "authors"]
+
+    @pytest.mark.parametrize(
+        "executor_class",
+        [SyncExecutor, JitExecutor, BreadthFirstExecutor],
+        ids=["sync", "jit", "breadth_first"],
+    )
+    def caches_results_with_other_executors(executor_class: Any):
+        field_cache = FieldCache(max_age=60)
+        name_cache = FieldCache(max_age=60)
+        calls: list[str] = []
+        schema = build_test_schema(field_cache, calls, name_cache)
+        document = parse("{ authors { name greeting } }")
+        expected = (
+            {
+                "authors": [
+                    {"name": "Alice", "greeting": "Hello, Alice!"},
+                    {"name": "Bob", "greeting": "Hello, Bob!"},
+                ]
+            },
+            None,
+        )
+        for _ in range(2):
+            result = execute_sync(schema, document, executor_class=executor_class)
+            assert result == expected
+        assert calls == ["Hello Alice", "Hello Bob"]
+        assert (field_cache.hits, field_cache.misses) == (2, 2)
+        assert (name_cache.hits, name_cache.misses) == (2, 2)
+
+
+def describe_cached_directive():
+    def builds_field_caches_from_the_directive():
+        schema = build_schema(
+            """
+            directive @cached(maxAge: Float!, maxSize: Int! = 1000)
+              on FIELD_DEFINITION
+
+            type Query {
+              default: String @cached(maxAge: 60)
+              small: String @cached(maxAge: 10, maxSize: 2)
+              uncached: String
+            }
+            """
+        )
+        fields = schema.query_type.fields  # type: ignore
+        default_cache = fields["default"].cache
+        assert isinstance(default_cache, FieldCache)
+        assert (default_cache.max_age, default_cache.max_size) == (60, 1000)
+        small_cache = fields["small"].cache
+        assert isinstance(small_cache, FieldCache)
+        assert (small_cache.max_age, small_cache.max_size) == (10, 2)
+        assert fields["uncached"].cache is None
+
+    def caches_root_fields_declared_with_the_directive():
+        schema = build_schema(
+            """
+            directive @cached(maxAge: Float!, maxSize: Int! = 1000)
+              on FIELD_DEFINITION
+
+            type Query {
+              greeting: String @cached(maxAge: 60)
+            }
+            """
+        )
+        calls: list[str] = []
+
+        def resolve_greeting(_root: Any, _info: Any) -> str:
+            calls.append("greeting")
+            return "Hello!"
+
+        schema.query_type.fields["greeting"].resolve = resolve_greeting  # type: ignore
+        document = parse("{ greeting }")
+        for _ in range(2):
+            assert execute_sync(schema, document) == ({"greeting": "Hello!"}, None)
+        assert calls == ["greeting"]
+
+    def ignores_custom_directives_with_the_same_name():
+        schema = build_schema(
+            """
+            directive @cached(ttl: Int) on FIELD_DEFINITION
+
+            type Query {
+              greeting: String @cached(ttl: 60)
+            }
+            """
+        )
+        assert schema.query_type.fields["greeting"].cache is None  # type: ignore
+
+    def ignores_directives_with_other_default_values():
+        schema = build_schema(
+            """
+            directive @cached(maxAge: Float!, maxSize: Int! = 10)
+              on FIELD_DEFINITION
+
+            type Query {
+              greeting: String @cached(maxAge: 60)
+            }
+            """
+        )
+        assert schema.query_type.fields["greeting"].cache is None  # type: ignore
+
+    def builds_field_caches_when_extending_schemas():
+        extension = parse("extend type Query { greeting: String @cached(maxAge: 60) }")
+        schema = GraphQLSchema(
+            GraphQLObjectType("Query", {"hello": GraphQLField(GraphQLString)}),
+            directives=[*specified_directives, GraphQLCachedDirective],
+        )
+        extended_schema = extend_schema(schema, extension)
+        cache = extended_schema.query_type.fields["greeting"].cache  # type: ignore
+        assert isinstance(cache, FieldCache)
+        assert (cache.max_age, cache.max_size) == (60, 1000)
+
+        schema = build_schema(
+            """
+            directive @cached(maxAge: Float!, maxSize: Int! = 1000)
+              on FIELD_DEFINITION
+
+            type Query {
+              hello: String
+            }
+            """
+        )
+        extended_schema = extend_schema(schema, extension)
+        cache = extended_schema.query_type.fields["greeting"].cache  # type: ignore
+        assert isinstance(cache, FieldCache)
+
+        schema = build_schema(
+            """
+            directive @cached(maxAge: Float!) on FIELD_DEFINITION
+
+            type Query {
+              hello: String
+            }
+            """
+        )
+        extended_schema = extend_schema(schema, extension)
+        assert extended_schema.query_type.fields["greeting"].cache is None  # type: ignore
+
+    def does_not_build_field_caches_if_the_directive_is_not_declared():
+        schema = GraphQLSchema(
+            GraphQLObjectType("Query", {"hello": GraphQLField(GraphQLString)})
+        )
+        extended_schema = extend_schema(
+            schema,
+            parse("extend type Query { greeting: String @cached(maxAge: 60) }"),
+            assume_valid_sdl=True,
+        )
+        assert extended_schema.query_type.fields["greeting"].cache is None  # type: ignore
+
+    def defines_the_directive():
+        assert GraphQLCachedDirective.name == "cached"
+        assert list(GraphQLCachedDirective.args) == ["maxAge", "maxSize"]
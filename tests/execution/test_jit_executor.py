@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from graphql.execution import ExecutionResult, JitExecutor, execute, execute_sync
+from graphql.execution.jit_executor import generate_execute_fields
+from graphql.language import parse
+from graphql.pyutils import is_awaitable
+from graphql.type import GraphQLScalarType
+from graphql.utilities import build_schema
+
+if TYPE_CHECKING:
+    from graphql.type import GraphQLObjectType, GraphQLResolveInfo
+
+pytestmark = pytest.mark.anyio
+
+schema = build_schema(
+    """
+    enum Color { RED, GREEN }
+
+    type Query {
+      user: User
+      users: [User]
+      greeting(name: String): String
+    }
+
+    type User {
+      id: ID!
+      name: String
+      age: Int
+      color: Color
+      tag: String!
+      friend: User
+      greeting(name: String): String
+    }
+    """
+)
+
+user_type: GraphQLObjectType = schema.get_type("User")  # type: ignore
+
+
+class User:
+    def __init__(self, id_: int, name: Any = None, age: Any = None) -> None:
+        self.id = id_
+        self.name = name
+        self.age = age
+        self.color = "RED"
+        self.tag = f"tag{id_}"
+
+    @property
+    def friend(self) -> User:
+        return User(self.id + 1, "friend")
+
+    def greeting(self, _info: GraphQLResolveInfo, name: str = "World") -> str:
+        return f"Hello, {name}!"
+
+
+def execute_both(query: str, root_value: Any = None) -> ExecutionResult:
+    document = parse(query)
+    result = execute_sync(schema, document, root_value)
+    assert execute_sync(schema, document, root_value, executor_class=JitExecutor) == (
+        result
+    )
+    return result
+
+
+async def execute_both_async(query: str, root_value: Any = None) -> ExecutionResult:
+    document = parse(query)
+    result = execute(schema, document, root_value)
+    if is_awaitable(result):
+        result = await result
+    jit_result = execute(schema, document, root_value, executor_class=JitExecutor)
+    if is_awaitable(jit_result):
+        jit_result = await jit_result
+    assert jit_result == result
+    return result  # type: ignore
+
+
+def describe_jit_executor():
+    def executes_leaf_fields_of_objects_and_dicts():
+        root_value = {"users": [User(1, "Alice", 42), {"id": 2, "name": "Bob"}]}
+        assert execute_both(
+            "{ users { __typename id name age color tag } }", root_value
+        ) == (
+            {
+                "users": [
+                    {
+                        "__typename": "User",
+                        "id": "1",
+                        "name": "Alice",
+                        "age": 42,
+                        "color": "RED",
+                        "tag": "tag1",
+                    },
+                    None,
+                ]
+            },
+            [
+                {
+                    "message": "Cannot return null for non-nullable field User.tag.",
+                    "locations": [(1, 40)],
+                    "path": ["users", 1, "tag"],
+                }
+            ],
+        )
+
+    def executes_aliases_and_other_fields():
+        root_value = {"user": User(1)}
+        assert execute_both(
+            '{ user { a: id b: id friend { id name } greeting(name: "JIT") }'
+            " greeting }",
+            root_value,
+        ) == (
+            {
+                "user": {
+                    "a": "1",
+                    "b": "1",
+                    "friend": {"id": "2", "name": "friend"},
+                    "greeting": "Hello, JIT!",
+                },
+                "greeting": None,
+            },
+            None,
+        )
+
+    def executes_callable_values():
+        def get_name(info: GraphQLResolveInfo) -> str:
+            assert info.path.as_list() == ["user", "name"]
+            return "called"
+
+        root_value = {"user": {"id": lambda _info: 1, "name": get_name}}
+        assert execute_both("{ user { id name } }", root_value) == (
+            {"user": {"id": "1", "name": "called"}},
+            None,
+        )
+
+    def reports_errors_of_leaf_values():
+        root_value = {
+            "user": {
+                "id": ValueError("bad id"),
+                "name": lambda _info: ValueError("bad name"),
+                "age": "not an int",
+            }
+        }
+        assert execute_both("{ user { name age } }", root_value) == (
+            {"user": {"name": None, "age": None}},
+            [
+                {
+                    "message": "bad name",
+                    "locations": [(1, 10)],
+                    "path": ["user", "name"],
+                },
+                {
+                    "message": "Int cannot represent non-integer value: 'not an int'",
+                    "locations": [(1, 15)],
+                    "path": ["user", "age"],
+                },
+            ],
+        )
+        assert execute_both("{ user { name id } }", root_value) == (
+            {"user": None},
+            [
+                {
+                    "message": "bad name",
+                    "locations": [(1, 10)],
+                    "path": ["user", "name"],
+                },
+                {
+                    "message": "bad id",
+                    "locations": [(1, 15)],
+                    "path": ["user", "id"],
+                },
+            ],
+        )
+
+    def generates_code_for_unknown_fields():
+        signature = (("unknown", "unknown"), ("name", "name"))
+        execute_fields = generate_execute_fields(schema, user_type, signature)
+        assert execute_fields.__code__.co_filename == (
+            "<generated execute_fields for User>"
+        )
+
+    def reuses_generated_code_across_executions():
+        document = parse("{ user { id name } }")
+        root_value = {"user": User(1, "Alice")}
+        executors: list[JitExecutor] = []
+
+        class RecordingJitExecutor(JitExecutor):
+            def __init__(self, *args: Any, **kwargs: Any) -> None:
+                super().__init__(*args, **kwargs)
+                executors.append(self)
+
+        for _ in range(2):
+            assert execute_sync(
+                schema, document, root_value, executor_class=RecordingJitExecutor
+            ) == ({"user": {"id": "1", "name": "Alice"}}, None)
+        generated = [
+            list(executor._generated_fields.values())  # noqa: SLF001
+            for executor in executors
+        ]
+        assert len(generated[0]) == 2
+        assert generated[0] == generated[1]
+
+    def uses_replaced_output_coercion_functions():
+        scalar_schema = build_schema("scalar Custom type Query { custom: Custom }")
+        custom_type = scalar_schema.get_type("Custom")
+        assert isinstance(custom_type, GraphQLScalarType)
+        document = parse("{ custom }")
+        root_value = {"custom": 1}
+
+        def execute_jit() -> ExecutionResult:
+            result = execute_sync(
+                scalar_schema, document, root_value, executor_class=JitExecutor
+            )
+            assert result == execute_sync(scalar_schema, document, root_value)
+            return result
+
+        assert execute_jit() == ({"custom": 1}, None)
+        custom_type.coerce_output_value = lambda value: value * 10
+        assert execute_jit() == ({"custom": 10}, None)
+
+    def falls_back_without_default_resolvers():
+        document = parse("{ user { id name } }")
+        root_value = {"user": {"id": 1, "name": "Alice"}}
+
+        def upper_middleware(next_, *args: Any, **kwargs: Any) -> Any:
+            result = next_(*args, **kwargs)
+            return result.upper() if isinstance(result, str) else result
+
+        def field_resolver(source: Any, info: GraphQLResolveInfo) -> Any:
+            return source[info.field_name]
+
+        assert execute(
+            schema,
+            document,
+            root_value,
+            middleware=[upper_middleware],
+            executor_class=JitExecutor,
+        ) == ({"user": {"id": "1", "name": "ALICE"}}, None)
+        assert execute(
+            schema,
+            document,
+            root_value,
+            field_resolver=field_resolver,
+            executor_class=JitExecutor,
+        ) == ({"user": {"id": "1", "name": "Alice"}}, None)
+
+    async def executes_awaitable_values():
+        async def get_id(_info: GraphQLResolveInfo) -> int:
+            await asyncio.sleep(0)
+            return 1
+
+        async def get_name() -> str:
+            await asyncio.sleep(0)
+            return "Alice"
+
+        async def get_user(_info: GraphQLResolveInfo) -> dict[str, Any]:
+            return {"id": get_id, "name": get_name(), "age": 42}
+
+        jit_result = execute(
+            schema,
+            parse("{ user { id name age } }"),
+            {"user": get_user},
+            executor_class=JitExecutor,
+        )
+        assert asyncio.iscoroutine(jit_result)
+        assert await jit_result == (
+            {"user": {"id": "1", "name": "Alice", "age": 42}},
+            None,
+        )
+
+    async def settles_awaitable_values_when_a_field_fails():
+        async def get_name(_info: GraphQLResolveInfo) -> str:
+            await asyncio.sleep(0)
+            return "Alice"
+
+        async def get_age(_info: GraphQLResolveInfo) -> int:
+            await asyncio.sleep(0)
+            return 42
+
+        assert await execute_both_async(
+            "{ user { name tag } }", {"user": {"name": get_name}}
+        ) == (
+            {"user": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field User.tag.",
+                    "locations": [(1, 15)],
+                    "path": ["user", "tag"],
+                }
+            ],
+        )
+        assert await execute_both_async(
+            "{ user { name age } }", {"user": {"name": get_name, "age": get_age}}
+        ) == ({"user": {"name": "Alice", "age": 42}}, None)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import json
+from enum import IntEnum
+from io import BytesIO
+from types import MappingProxyType
+from typing import Any
+
+import pytest
+
+from graphql.error import GraphQLError
+from graphql.execution import (
+    CompletedResult,
+    ExecutionResult,
+    ExperimentalIncrementalExecutionResults,
+    IncrementalDeferResult,
+    IncrementalStreamResult,
+    InitialIncrementalExecutionResult,
+    PendingResult,
+    RawJSON,
+    SubsequentIncrementalExecutionResult,
+    encode_json,
+    encode_result,
+    experimental_execute_incrementally,
+    write_result,
+)
+from graphql.execution.json_encoder import FLUSH_SIZE, encode_any_value
+from graphql.language import Source, parse
+from graphql.utilities import build_schema
+
+pytestmark = pytest.mark.anyio
+
+
+class Color(IntEnum):
+    RED = 1
+
+
+class Name(str):
+    __slots__ = ()
+
+
+class Number(float):
+    __slots__ = ()
+
+
+class CachedJSON(RawJSON):
+    __slots__ = ()
+
+
+def dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+error = GraphQLError(
+    "Error ❤",
+    source=Source("{ a }"),
+    positions=[2],
+    path=["a", 0],
+    extensions={"code": "E"},
+)
+
+
+def encode_json_both_ways(value: Any) -> str:
+    """Encode with and without the fast encoder of the standard library."""
+    encoded = encode_json(value)
+    encoded_with_raw_json = encode_json([value, RawJSON("0")])
+    assert encoded_with_raw_json == f"[{encoded},0]"
+    return encoded
+
+
+def describe_encode_json():
+    def encodes_like_compact_json_dumps():
+        value = {
+            "data": {
+                "string": 'Unicode ❤ "quoted"\n',
+                "int": 42,
+                "big": 2**64,
+                "float": 1.5,
+                "true": True,
+                "false": False,
+                "null": None,
+                "list": [1, "a", None, True, 0.5, [2, []], {}],
+                "tuple": ("a", "b"),
+            }
+        }
+        assert encode_json_both_ways(value) == dumps(value).decode()
+        for leaf in ("a", 1, None, True, False, 0.25):
+            assert encode_json_both_ways(leaf) == dumps(leaf).decode()
+            chunks: list[str] = []
+            encode_any_value(leaf, chunks)
+            assert chunks == [dumps(leaf).decode()]
+
+    def encodes_subclasses_of_basic_types():
+        value = [Color.RED, Name("name"), Number(0.5), MappingProxyType({"a": 1})]
+        assert encode_json_both_ways(value) == '[1,"name",0.5,{"a":1}]'
+
+    def splices_in_raw_json():
+        value = {
+            "data": {
+                "raw": RawJSON('{"a": [1, 2]}'),
+                "list": [RawJSON("3"), CachedJSON("{}")],
+            }
+        }
+        assert encode_json(value) == '{"data":{"raw":{"a": [1, 2]},"list":[3,{}]}}'
+
+    def encodes_keys_that_are_not_strings():
+        value = {None: 0, True: 1, 2: 2, 0.5: 3, Name("a"): 4}
+        assert encode_json_both_ways(value) == dumps(value).decode()
+
+    def rejects_values_that_are_not_json_compliant():
+        with pytest.raises(
+            ValueError, match=r"^Out of range float values are not JSON compliant"
+        ):
+            encode_json_both_ways(float("nan"))
+        with pytest.raises(
+            ValueError, match=r"^Out of range float values are not JSON compliant"
+        ):
+            encode_json([RawJSON("0"), float("inf")])
+        with pytest.raises(
+            TypeError, match=r"^Object of type set is not JSON serializable\.$"
+        ):
+            encode_json_both_ways({"set": {1}})
+        with pytest.raises(
+            TypeError, match=r"^Object of type set is not JSON serializable\.$"
+        ):
+            encode_json([RawJSON("0"), {1}])
+        with pytest.raises(
+            TypeError,
+            match=r"^keys must be str, int, float, bool or None, not tuple$",
+        ):
+            encode_json_both_ways({(1, 2): 3})
+        with pytest.raises(
+            TypeError,
+            match=r"^keys must be str, int, float, bool or None, not tuple$",
+        ):
+            encode_json([RawJSON("0"), {(1, 2): 3}])
+
+
+def describe_encode_result():
+    def encodes_execution_results_like_their_formatted_version():
+        for result in (
+            ExecutionResult({"a": [1, 2]}),
+            ExecutionResult(None, [error, GraphQLError("")]),
+            ExecutionResult({"a": None}, [error], {"cost": 1}),
+        ):
+            assert encode_result(result) == dumps(result.formatted)
+
+    def encodes_raw_json_and_non_ascii_characters():
+        result = ExecutionResult({"a": RawJSON('"❤"')})
+        assert encode_result(result) == '{"data":{"a":"❤"}}'.encode()
+
+    def encodes_incremental_results_like_their_formatted_version():
+        results: list[Any] = [
+            InitialIncrementalExecutionResult(
+                {"a": 1},
+                [error],
+                [PendingResult("0", ["a"]), PendingResult("1", ["b", 0], "label")],
+                True,
+                {"cost": 1},
+            ),
+            InitialIncrementalExecutionResult({}),
+            SubsequentIncrementalExecutionResult(
+                has_next=True,
+                pending=[PendingResult("2", [])],
+                incremental=[
+                    IncrementalDeferResult({"b": 2}, "0"),
+                    IncrementalDeferResult({"c": 3}, "1", ["c"], [error], {"cost": 2}),
+                    IncrementalStreamResult([1, 2], "2"),
+                    IncrementalStreamResult([3], "2", ["d"], [error], {"cost": 3}),
+                ],
+                completed=[CompletedResult("0"), CompletedResult("1", [error])],
+                extensions={"cost": 4},
+            ),
+            SubsequentIncrementalExecutionResult(),
+        ]
+        for result in results:
+            assert encode_result(result) == dumps(result.formatted)
+
+    async def encodes_payloads_of_incremental_execution():
+        schema = build_schema(
+            """
+            type Query {
+              hero: Hero
+            }
+            type Hero {
+              name: String
+              friends: [String]
+            }
+            """
+        )
+        document = parse('{ hero { ... @defer(label: "D") { name } friends @stream } }')
+        root_value = {"hero": {"name": "Luke", "friends": ["Han", "Leia"]}}
+        result = experimental_execute_incrementally(schema, document, root_value)
+        assert isinstance(result, ExperimentalIncrementalExecutionResults)
+        payloads = [result.initial_result] + [
+            payload async for payload in result.subsequent_results
+        ]
+        assert len(payloads) > 1
+        for payload in payloads:
+            assert encode_result(payload) == dumps(payload.formatted)
+
+    def rejects_other_objects():
+        with pytest.raises(
+            TypeError, match=r"^Cannot encode dict as an execution result\.$"
+        ):
+            encode_result({"data": None})  # type: ignore
+
+
+def describe_write_result():
+    def writes_small_results_at_once():
+        for result in (ExecutionResult({"a": 1}, [error]), ExecutionResult()):
+            stream = BytesIO()
+            write_result(result, stream)
+            assert stream.getvalue() == dumps(result.formatted)
+
+    def writes_large_results_in_pieces():
+        writes: list[bytes] = []
+
+        class Stream:
+            @staticmethod
+            def write(data: bytes) -> None:
+                writes.append(data)
+
+        data = {
+            "items": [{"id": str(i), "score": i / 2} for i in range(FLUSH_SIZE)],
+            "lists": [[i, i + 1] for i in range(FLUSH_SIZE)],
+        }
+        result = ExecutionResult(data, extensions={"items": data["items"]})
+        write_result(result, Stream())
+        assert len(writes) > 2
+        assert b"".join(writes) == dumps(result.formatted)
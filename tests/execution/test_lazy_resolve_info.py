@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from graphql.execution import (
+    Executor,
+    JitExecutor,
+    LazyResolveInfo,
+    MiddlewareManager,
+    SyncExecutor,
+    execute,
+    execute_sync,
+    get_resolve_info,
+    lazy_resolve_info,
+)
+from graphql.language import parse
+from graphql.type import (
+    GraphQLField,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLResolveInfo,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+pytestmark = pytest.mark.anyio
+
+infos: list[Any] = []
+
+
+@lazy_resolve_info
+def lazy_resolver(_source: Any, info: Any) -> str:
+    infos.append(info)
+    return info.field_name
+
+
+def resolver(_source: Any, info: Any) -> str:
+    infos.append(info)
+    return info.field_name
+
+
+@lazy_resolve_info
+def failing_resolver(_source: Any, _info: Any) -> str:
+    msg = "Failed!"
+    raise ValueError(msg)
+
+
+@lazy_resolve_info
+async def async_failing_resolver(_source: Any, _info: Any) -> str:
+    msg = "Failed async!"
+    raise ValueError(msg)
+
+
+item_type = GraphQLObjectType(
+    "Item",
+    {
+        "name": GraphQLField(GraphQLString),
+        "failing": GraphQLField(GraphQLString, resolve=failing_resolver),
+        "asyncFailing": GraphQLField(GraphQLString, resolve=async_failing_resolver),
+    },
+)
+
+
+nested_type = GraphQLObjectType(
+    "Nested", {"lazy": GraphQLField(GraphQLString, resolve=lazy_resolver)}
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        {
+            "lazy": GraphQLField(GraphQLString, resolve=lazy_resolver),
+            "eager": GraphQLField(GraphQLString, resolve=resolver),
+            "nested": GraphQLField(
+                nested_type, resolve=lazy_resolve_info(lambda *_args: {})
+            ),
+            "nonNull": GraphQLField(
+                GraphQLNonNull(GraphQLString),
+                resolve=lazy_resolve_info(lambda *_args: None),
+            ),
+            "method": GraphQLField(GraphQLString),
+            "items": GraphQLField(
+                GraphQLList(item_type), resolve=lambda *_args: [{"name": "a"}] * 2
+            ),
+        },
+    )
+)
+
+
+def describe_lazy_resolve_info():
+    def passes_lazy_info_to_marked_resolvers_of_leaf_fields():
+        infos.clear()
+        assert execute_sync(schema, parse("{ lazy eager }")) == (
+            {"lazy": "lazy", "eager": "eager"},
+            None,
+        )
+        lazy_info, eager_info = infos
+        assert isinstance(lazy_info, LazyResolveInfo)
+        assert repr(lazy_info) == "<LazyResolveInfo Query.lazy>"
+        assert isinstance(eager_info, GraphQLResolveInfo)
+        assert get_resolve_info(eager_info) is eager_info
+
+    def builds_complete_info_when_needed():
+        infos.clear()
+        assert execute_sync(schema, parse("{ lazy }"), "root") == (
+            {"lazy": "lazy"},
+            None,
+        )
+        (lazy_info,) = infos
+        assert lazy_info.path.as_list() == ["lazy"]
+        assert lazy_info.root_value == "root"
+        resolve_info = get_resolve_info(lazy_info)
+        assert isinstance(resolve_info, GraphQLResolveInfo)
+        assert resolve_info is lazy_info.resolve_info
+        assert resolve_info.field_name == "lazy"
+        assert resolve_info.parent_type is schema.query_type
+        assert resolve_info.field_nodes[0].name.value == "lazy"
+
+    def passes_complete_info_for_non_leaf_fields():
+        infos.clear()
+        nested_infos: list[Any] = []
+
+        def is_type_of(_value: Any, info: Any) -> bool:
+            nested_infos.append(info)
+            return True
+
+        nested_type.is_type_of = is_type_of
+        try:
+            assert execute_sync(schema, parse("{ nested { lazy } }")) == (
+                {"nested": {"lazy": "lazy"}},
+                None,
+            )
+        finally:
+            nested_type.is_type_of = None
+        (info,) = nested_infos
+        assert isinstance(info, GraphQLResolveInfo)
+        (lazy_info,) = infos
+        assert isinstance(lazy_info, LazyResolveInfo)
+        assert lazy_info.path.as_list() == ["nested", "lazy"]
+
+    def reports_errors_with_lazy_info():
+        assert execute_sync(schema, parse("{ nonNull }")) == (
+            None,
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Query.nonNull.",
+                    "locations": [(1, 3)],
+                    "path": ["nonNull"],
+                }
+            ],
+        )
+
+    def passes_complete_info_to_methods_called_by_default_resolver():
+        method_infos: list[Any] = []
+
+        class Root:
+            def method(self, info: Any) -> str:
+                method_infos.append(info)
+                return info.field_name
+
+        assert execute_sync(schema, parse("{ method }"), Root()) == (
+            {"method": "method"},
+            None,
+        )
+        (info,) = method_infos
+        assert isinstance(info, GraphQLResolveInfo)
+
+    def passes_lazy_info_only_if_all_middleware_is_marked():
+        @lazy_resolve_info
+        def lazy_middleware(next_: Any, *args: Any, **kwargs: Any) -> Any:
+            return next_(*args, **kwargs)
+
+        def middleware(next_: Any, *args: Any, **kwargs: Any) -> Any:
+            return next_(*args, **kwargs)
+
+        for middlewares, is_lazy in (
+            ((lazy_middleware,), True),
+            ((lazy_middleware, middleware), False),
+        ):
+            infos.clear()
+            assert execute_sync(
+                schema,
+                parse("{ lazy eager }"),
+                middleware=MiddlewareManager(*middlewares),
+            ) == ({"lazy": "lazy", "eager": "eager"}, None)
+            lazy_info, eager_info = infos
+            assert isinstance(lazy_info, LazyResolveInfo) is is_lazy
+            assert isinstance(eager_info, GraphQLResolveInfo)
+
+
+def describe_lazy_paths():
+    def builds_paths_of_leaf_fields_only_when_needed():
+        infos.clear()
+        assert execute_sync(schema, parse("{ nested { lazy } }")) == (
+            {"nested": {"lazy": "lazy"}},
+            None,
+        )
+        (lazy_info,) = infos
+        assert lazy_info._path.as_list() == ["nested"]  # noqa: SLF001
+        path = lazy_info.path
+        assert path.as_list() == ["nested", "lazy"]
+        assert path.typename == "Nested"
+        assert lazy_info.path is path
+        assert lazy_info.resolve_info.path is path
+
+    def reports_errors_of_leaf_fields_with_their_paths():
+        query = parse("{ items { name failing } }")
+        expected = (
+            {
+                "items": [
+                    {"name": "a", "failing": None},
+                    {"name": "a", "failing": None},
+                ]
+            },
+            [
+                {
+                    "message": "Failed!",
+                    "locations": [(1, 16)],
+                    "path": ["items", index, "failing"],
+                }
+                for index in range(2)
+            ],
+        )
+        assert execute_sync(schema, query) == expected
+        assert execute_sync(schema, query, executor_class=JitExecutor) == expected
+
+    async def reports_errors_of_async_leaf_fields_with_their_paths():
+        result = execute(schema, parse("{ items { asyncFailing } }"))
+        assert await result == (  # type: ignore
+            {"items": [{"asyncFailing": None}, {"asyncFailing": None}]},
+            [
+                {
+                    "message": "Failed async!",
+                    "locations": [(1, 11)],
+                    "path": ["items", index, "asyncFailing"],
+                }
+                for index in range(2)
+            ],
+        )
+
+    def passes_complete_paths_if_execute_field_is_overridden():
+        paths: list[Any] = []
+
+        class CustomExecutor(Executor):
+            def execute_field(
+                self, parent_type, source, field_details_list, path, position_context
+            ):
+                paths.append(path.as_list())
+                return super().execute_field(
+                    parent_type, source, field_details_list, path, position_context
+                )
+
+        assert Executor.lazy_paths
+        assert not CustomExecutor.lazy_paths
+        infos.clear()
+        assert execute_sync(
+            schema, parse("{ nested { lazy } }"), executor_class=CustomExecutor
+        ) == ({"nested": {"lazy": "lazy"}}, None)
+        assert paths == [["nested"], ["nested", "lazy"]]
+        (lazy_info,) = infos
+        assert lazy_info._path.as_list() == ["nested", "lazy"]  # noqa: SLF001
+        assert lazy_info.path.as_list() == ["nested", "lazy"]
+
+    @pytest.mark.parametrize(
+        "method", ["complete_value", "complete_leaf_value", "handle_field_error"]
+    )
+    def passes_complete_paths_if_other_methods_are_overridden(method: str):
+        paths: list[Any] = []
+
+        def complete_value(self, return_type, field_details_list, info, path, *args):
+            paths.append(path.as_list())
+            return Executor.complete_value(
+                self, return_type, field_details_list, info, path, *args
+            )
+
+        def complete_leaf_value(return_type, result):
+            return Executor.complete_leaf_value(return_type, result)
+
+        def handle_field_error(self, raw_error, return_type, field_details_list, path):
+            paths.append(path.as_list())
+            Executor.handle_field_error(
+                self, raw_error, return_type, field_details_list, path
+            )
+
+        overrides = {
+            "complete_value": complete_value,
+            "complete_leaf_value": staticmethod(complete_leaf_value),
+            "handle_field_error": handle_field_error,
+        }
+        CustomExecutor: type[Executor] = type(
+            "CustomExecutor", (Executor,), {method: overrides[method]}
+        )
+
+        assert not CustomExecutor.lazy_paths
+        infos.clear()
+        assert execute_sync(
+            schema, parse("{ nested { lazy } }"), executor_class=CustomExecutor
+        ) == ({"nested": {"lazy": "lazy"}}, None)
+        (lazy_info,) = infos
+        assert lazy_info._path.as_list() == ["nested", "lazy"]  # noqa: SLF001
+        if method == "complete_value":
+            assert ["nested", "lazy"] in paths
+        assert execute_sync(
+            schema, parse("{ items { failing } }"), executor_class=CustomExecutor
+        ).errors
+        if method == "handle_field_error":
+            assert paths == [["items", 0, "failing"], ["items", 1, "failing"]]
+
+    def keeps_lazy_paths_if_explicitly_enabled():
+        class CustomExecutor(Executor):
+            lazy_paths = True
+
+            def handle_field_error(self, *args):
+                super().handle_field_error(*args)
+
+        class SubExecutor(CustomExecutor):
+            pass
+
+        class OtherSubExecutor(CustomExecutor):
+            def complete_value(self, *args):
+                return super().complete_value(*args)  # pragma: no cover
+
+        assert CustomExecutor.lazy_paths
+        assert SubExecutor.lazy_paths
+        assert not OtherSubExecutor.lazy_paths
+        assert SyncExecutor.lazy_paths
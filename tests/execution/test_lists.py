@@ -1,23 +1,28 @@
-from asyncio import sleep
-from collections.abc import AsyncGenerator, AsyncIterable, Callable
+from array import array
+from asyncio import CancelledError, Event, ensure_future, sleep
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Iterator
+from math import nan
 from typing import Any, TypeGuard
 
 import pytest
 
-from graphql.execution import ExecutionResult, execute, execute_sync
+from graphql.execution import ExecutionResult, ListChunk, execute, execute_sync
+from graphql.execution.executor import prepend_items
 from graphql.language import parse
-from graphql.pyutils import is_awaitable
+from graphql.pyutils import Undefined, is_awaitable, merge_kwargs
 from graphql.type import (
     GraphQLField,
     GraphQLFieldResolver,
+    GraphQLInt,
     GraphQLList,
     GraphQLNonNull,
     GraphQLObjectType,
     GraphQLResolveInfo,
+    GraphQLScalarType,
     GraphQLSchema,
     GraphQLString,
 )
-from graphql.utilities import build_schema
+from graphql.utilities import build_schema, extend_schema
 
 pytestmark = pytest.mark.anyio
 
@@ -700,3 +705,484 @@ def describe_execute_handles_list_nullability():
             None,
             errors,
         )
+
+
+def describe_execute_completes_lists_of_leaf_values_in_bulk():
+    schema = build_schema(
+        """
+        enum Color { RED, GREEN }
+        scalar Odd
+
+        type Query {
+          ints: [Int]
+          strictInts: [Int!]
+          colors: [Color]
+          odds: [Odd]
+        }
+        """
+    )
+    odd_type = schema.get_type("Odd")
+    assert odd_type
+    odd_type.coerce_output_value = lambda value: value if value % 2 else None  # type: ignore
+
+    async def _complete(query: str, **values: Any) -> Any:
+        result = execute(schema, parse(query), values)
+        if is_awaitable(result):
+            result = await result
+        return result
+
+    async def completes_scalars_and_enums():
+        assert await _complete("{ ints }", ints=[1, 2, 3.0]) == (
+            {"ints": [1, 2, 3]},
+            None,
+        )
+        assert await _complete("{ ints }", ints=(n for n in (1, 2))) == (
+            {"ints": [1, 2]},
+            None,
+        )
+        assert await _complete("{ colors }", colors=["RED", "GREEN"]) == (
+            {"colors": ["RED", "GREEN"]},
+            None,
+        )
+
+    async def completes_remaining_items_normally_after_null():
+        assert await _complete("{ ints }", ints=(n for n in (1, None, 2))) == (
+            {"ints": [1, None, 2]},
+            None,
+        )
+        assert await _complete("{ strictInts }", strictInts=[1, None, 2]) == (
+            {"strictInts": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Query.strictInts.",
+                    "locations": [(1, 3)],
+                    "path": ["strictInts", 1],
+                }
+            ],
+        )
+
+    async def completes_remaining_items_normally_after_invalid_value():
+        assert await _complete("{ ints }", ints=[1, "two", 3]) == (
+            {"ints": [1, None, 3]},
+            [
+                {
+                    "message": "Int cannot represent non-integer value: 'two'",
+                    "locations": [(1, 3)],
+                    "path": ["ints", 1],
+                }
+            ],
+        )
+        assert await _complete("{ odds }", odds=[1, 2, 3]) == (
+            {"odds": [1, None, 3]},
+            [
+                {
+                    "message": "Expected `Odd.coerce_output_value(2)`"
+                    " to return non-nullable value, returned: None",
+                    "locations": [(1, 3)],
+                    "path": ["odds", 1],
+                }
+            ],
+        )
+
+    async def completes_remaining_items_normally_after_error_or_undefined():
+        assert await _complete(
+            "{ colors }", colors=["RED", RuntimeError("bad"), Undefined, "GREEN"]
+        ) == (
+            {"colors": ["RED", None, None, "GREEN"]},
+            [{"message": "bad", "locations": [(1, 3)], "path": ["colors", 1]}],
+        )
+
+    async def completes_remaining_items_normally_after_awaitable():
+        assert await _complete("{ ints }", ints=[1, get_async(2), 3]) == (
+            {"ints": [1, 2, 3]},
+            None,
+        )
+
+
+coerce_calls: list[str] = []
+
+
+def coerce_custom_value(value: Any) -> Any:
+    coerce_calls.append("one")
+    return value
+
+
+def coerce_custom_values(values: Any) -> list[Any]:
+    coerce_calls.append("all")
+    values = list(values)
+    if "bad" in values:
+        raise ValueError("bad")
+    return values
+
+
+class ArrayLike:
+    def __init__(self, values: list[Any]) -> None:
+        self.values = values
+
+    def __array__(self) -> Any:  # pragma: no cover
+        return self.values
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.values)
+
+    def tolist(self) -> list[Any]:
+        return self.values
+
+
+def describe_execute_coerces_lists_of_leaf_values_at_once():
+    schema = build_schema(
+        """
+        scalar Custom
+
+        type Query {
+          floats: [Float!]
+          ints: [Int]
+          customs: [Custom]
+        }
+        """
+    )
+    custom_type = schema.get_type("Custom")
+    assert isinstance(custom_type, GraphQLScalarType)
+    custom_type.coerce_output_value = coerce_custom_value
+    custom_type.coerce_output_values = coerce_custom_values
+
+    def _complete(query: str, **values: Any) -> Any:
+        coerce_calls.clear()
+        return execute_sync(schema, parse(query), values)
+
+    def coerces_arrays_at_once():
+        assert _complete("{ floats }", floats=array("d", [1.5, 2.5])) == (
+            {"floats": [1.5, 2.5]},
+            None,
+        )
+        assert _complete("{ ints }", ints=ArrayLike([1, 2])) == (
+            {"ints": [1, 2]},
+            None,
+        )
+        assert _complete("{ customs }", customs=array("i", [1, 2])) == (
+            {"customs": [1, 2]},
+            None,
+        )
+        assert coerce_calls == ["all"]
+
+    def coerces_lists_and_tuples_at_once():
+        for values in ([1, 2], (1, 2)):
+            assert _complete("{ customs }", customs=values) == (
+                {"customs": [1, 2]},
+                None,
+            )
+            assert coerce_calls == ["all"]
+
+    def does_not_coerce_other_iterables_at_once():
+        assert _complete("{ customs }", customs=(n for n in (1, 2))) == (
+            {"customs": [1, 2]},
+            None,
+        )
+        assert coerce_calls == ["one", "one"]
+
+    def coerces_at_once_in_extended_schemas():
+        extended_schema = extend_schema(schema, parse("type Other { other: Int }"))
+        coerce_calls.clear()
+        assert execute_sync(
+            extended_schema, parse("{ customs }"), {"customs": [1, 2]}
+        ) == ({"customs": [1, 2]}, None)
+        assert coerce_calls == ["all"]
+
+    def does_not_coerce_at_once_after_replacing_the_coercion():
+        int_type = GraphQLScalarType(
+            **merge_kwargs(GraphQLInt.to_kwargs(), name="MyInt")
+        )
+        assert int_type.coerce_output_values is GraphQLInt.coerce_output_values
+        int_type.coerce_output_value = lambda value: value * 10
+        int_schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "x": GraphQLField(int_type),
+                    "l": GraphQLField(GraphQLList(int_type)),
+                },
+            )
+        )
+        assert execute_sync(int_schema, parse("{ x l }"), {"x": 1, "l": [1, 2]}) == (
+            {"x": 10, "l": [10, 20]},
+            None,
+        )
+
+    def does_not_coerce_at_once_with_scalars_derived_without_bulk_coercion():
+        derived_type = GraphQLScalarType(
+            **merge_kwargs(
+                GraphQLInt.to_kwargs(),
+                name="MyInt",
+                coerce_output_value=lambda value: value * 10,
+                coerce_output_values=None,
+            )
+        )
+        derived_schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "x": GraphQLField(derived_type),
+                    "l": GraphQLField(GraphQLList(derived_type)),
+                },
+            )
+        )
+        assert execute_sync(
+            derived_schema, parse("{ x l }"), {"x": 1, "l": [1, 2]}
+        ) == ({"x": 10, "l": [10, 20]}, None)
+
+    def coerces_values_separately_to_report_errors():
+        assert _complete("{ customs }", customs=[1, "bad", 3]) == (
+            {"customs": [1, "bad", 3]},
+            None,
+        )
+        assert coerce_calls == ["all", "one", "one", "one"]
+        assert _complete("{ floats }", floats=array("d", [1.5, nan])) == (
+            {"floats": None},
+            [
+                {
+                    "message": "Float cannot represent non numeric value: nan",
+                    "locations": [(1, 3)],
+                    "path": ["floats", 1],
+                }
+            ],
+        )
+        assert _complete("{ ints }", ints=ArrayLike([1, 2**31])) == (
+            {"ints": [1, None]},
+            [
+                {
+                    "message": "Int cannot represent non 32-bit signed integer"
+                    " value: 2147483648",
+                    "locations": [(1, 3)],
+                    "path": ["ints", 1],
+                }
+            ],
+        )
+
+
+def describe_execute_accepts_list_chunks_from_async_iterables():
+    async def _complete(list_field, as_: str = "[String]", **kwargs: Any):
+        result = execute(
+            build_schema(f"type Query {{ listField: {as_} }}"),
+            parse("{ listField }"),
+            Data(list_field),
+            **kwargs,
+        )
+        assert is_awaitable(result)
+        return await result
+
+    def has_a_representation():
+        assert repr(ListChunk(iter([1, 2]))) == "ListChunk([1, 2])"
+        assert repr(ListChunk((1, 2))) == "ListChunk((1, 2))"
+
+    @pytest.mark.parametrize("read_ahead", [None, 1])
+    async def completes_the_items_of_list_chunks(read_ahead: int | None):
+        async def list_field():
+            yield ListChunk(["one", get_async("two")])
+            yield "three"
+            yield ListChunk([])
+            yield ListChunk(iter([get_async(4), False]))
+
+        assert await _complete(list_field(), read_ahead=read_ahead) == (
+            {"listField": ["one", "two", "three", "4", "false"]},
+            None,
+        )
+
+    async def prepends_remaining_items_of_list_chunks():
+        class ListField:
+            def __init__(self):
+                self.values = iter(["three", "four"])
+
+            def __aiter__(self):
+                return self
+
+            async def __anext__(self):
+                try:
+                    return next(self.values)
+                except StopIteration:
+                    raise StopAsyncIteration from None
+
+        class ClosableListField(ListField):
+            closed = False
+
+            async def aclose(self):
+                self.closed = True
+
+        items = prepend_items(["one", "two"], ListField())
+        assert [item async for item in items] == ["one", "two", "three", "four"]
+        list_field = ClosableListField()
+        items = prepend_items(["one", "two"], list_field)
+        assert await anext(items) == "one"
+        await items.aclose()
+        assert list_field.closed
+
+    async def reports_errors_of_items_of_list_chunks():
+        async def list_field():
+            yield ListChunk(["one", None])
+            yield "three"  # pragma: no cover
+
+        assert await _complete(list_field(), "[String!]") == (
+            {"listField": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Query.listField.",
+                    "locations": [(1, 3)],
+                    "path": ["listField", 1],
+                }
+            ],
+        )
+
+
+def describe_execute_reads_async_iterables_ahead():
+    class _Item:
+        def __init__(self, value: int, events: list[str], release: Event):
+            self.value = value
+            self.events = events
+            self.release = release
+
+        async def resolve_value(self, _info: GraphQLResolveInfo) -> int:
+            self.events.append(f"start {self.value}")
+            await self.release.wait()
+            self.events.append(f"end {self.value}")
+            return self.value
+
+    schema = GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "items": GraphQLField(
+                    GraphQLList(
+                        GraphQLObjectType(
+                            "Item",
+                            {
+                                "value": GraphQLField(
+                                    GraphQLNonNull(GraphQLInt),
+                                    resolve=lambda item, info: item.resolve_value(info),
+                                )
+                            },
+                        )
+                    )
+                )
+            },
+        )
+    )
+
+    async def _execute(items: Any, read_ahead: int | None) -> Any:
+        result = execute(
+            schema,
+            parse("{ items { value } }"),
+            {"items": items},
+            read_ahead=read_ahead,
+        )
+        assert is_awaitable(result)
+        return await result
+
+    @pytest.mark.parametrize("read_ahead", [None, 2])
+    async def completes_items_while_reading_ahead(read_ahead: int | None):
+        events: list[str] = []
+        release = Event()
+        release.set()
+
+        async def items():
+            for value in range(3):
+                events.append(f"read {value}")
+                yield _Item(value, events, release)
+                await sleep(0)
+
+        assert await _execute(items(), read_ahead) == (
+            {"items": [{"value": 0}, {"value": 1}, {"value": 2}]},
+            None,
+        )
+        if read_ahead is None:
+            assert events[:4] == ["read 0", "read 1", "read 2", "start 0"]
+        else:
+            assert events[:4] == ["read 0", "start 0", "end 0", "read 1"]
+
+    async def limits_the_number_of_items_read_ahead():
+        events: list[str] = []
+        release = Event()
+
+        async def items():
+            for value in range(5):
+                events.append(f"read {value}")
+                yield _Item(value, events, release)
+
+        result = ensure_future(_execute(items(), 1))
+        for _i in range(5):
+            await sleep(0)
+        assert events == ["read 0", "read 1", "start 0", "start 1"]
+        release.set()
+        assert await result == (
+            {"items": [{"value": value} for value in range(5)]},
+            None,
+        )
+        assert events.count("end 4") == 1
+
+    async def cancels_items_read_ahead_when_the_execution_is_cancelled():
+        events: list[str] = []
+        release = Event()
+        closed = False
+
+        async def items():
+            nonlocal closed
+            try:
+                for value in range(5):
+                    events.append(f"read {value}")
+                    yield _Item(value, events, release)
+                await Event().wait()  # pragma: no cover
+            finally:
+                closed = True
+
+        result = ensure_future(_execute(items(), 3))
+        for _i in range(5):
+            await sleep(0)
+        assert events == [
+            "read 0",
+            "read 1",
+            "read 2",
+            "read 3",
+            "start 0",
+            "start 1",
+            "start 2",
+            "start 3",
+        ]
+        result.cancel()
+        with pytest.raises(CancelledError):
+            await result
+        assert closed
+        release.set()
+        await sleep(0)
+        assert not any(event.startswith("end") for event in events)
+
+    async def stops_reading_ahead_on_errors_propagated_to_the_list():
+        closed = False
+
+        async def items():
+            nonlocal closed
+            try:
+                yield get_async(None)
+                yield ListChunk(["two", "three"])
+                yield "four"  # pragma: no cover
+            finally:
+                closed = True
+
+        result = execute(
+            build_schema("type Query { listField: [String!] }"),
+            parse("{ listField }"),
+            Data(items()),
+            read_ahead=0,
+        )
+        assert is_awaitable(result)
+        assert await result == (
+            {"listField": None},
+            [
+                {
+                    "message": "Cannot return null for non-nullable field"
+                    " Query.listField.",
+                    "locations": [(1, 3)],
+                    "path": ["listField", 0],
+                }
+            ],
+        )
+        assert closed
@@ -5,6 +5,7 @@ import pytest
 
 from graphql.execution import execute
 from graphql.language import parse
+from graphql.pyutils.eager_gather_with_cancel import eager_task_factory
 from graphql.type import (
     GraphQLBoolean,
     GraphQLField,
@@ -17,6 +18,8 @@ from graphql.type import (
     GraphQLString,
 )
 
+from ..fixtures import cleanup
+
 pytestmark = pytest.mark.anyio
 
 
@@ -55,7 +58,8 @@ def describe_parallel_execution():
 
         assert result == ({"foo": True}, None)
 
-    async def resolve_fields_in_parallel():
+    @pytest.mark.parametrize("eager_awaiting", [False, True])
+    async def resolve_fields_in_parallel(eager_awaiting: bool):
         barrier = Barrier(2)
 
         async def resolve(*_args):
@@ -74,7 +78,7 @@ def describe_parallel_execution():
         ast = parse("{foo, bar}")
 
         # raises TimeoutError if not parallel
-        awaitable_result = execute(schema, ast)
+        awaitable_result = execute(schema, ast, eager_awaiting=eager_awaiting)
         assert isinstance(awaitable_result, Awaitable)
         result = await asyncio.wait_for(awaitable_result, 1)
 
@@ -98,7 +102,8 @@ def describe_parallel_execution():
 
         assert result == ({"foo": [True]}, None)
 
-    async def resolve_list_in_parallel():
+    @pytest.mark.parametrize("eager_awaiting", [False, True])
+    async def resolve_list_in_parallel(eager_awaiting: bool):
         barrier = Barrier(2)
 
         async def resolve(*_args):
@@ -121,7 +126,7 @@ def describe_parallel_execution():
         ast = parse("{foo}")
 
         # raises TimeoutError if not parallel
-        awaitable_result = execute(schema, ast)
+        awaitable_result = execute(schema, ast, eager_awaiting=eager_awaiting)
         assert isinstance(awaitable_result, Awaitable)
         result = await asyncio.wait_for(awaitable_result, 1)
 
@@ -192,18 +197,91 @@ def describe_parallel_execution():
             None,
         )
 
+    @pytest.mark.parametrize("eager_awaiting", [False, True])
+    async def resolve_fields_in_their_own_tasks(eager_awaiting: bool):
+        tasks = []
+
+        async def resolve(*_args):
+            task = asyncio.current_task()
+            await asyncio.sleep(0)
+            assert asyncio.current_task() is task
+            tasks.append(task)
+            return True
+
+        schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "foo": GraphQLField(GraphQLBoolean, resolve=resolve),
+                    "bar": GraphQLField(
+                        GraphQLList(GraphQLBoolean),
+                        resolve=lambda *args: [resolve(*args), resolve(*args)],
+                    ),
+                },
+            )
+        )
+
+        awaitable_result = execute(
+            schema, parse("{foo, bar}"), eager_awaiting=eager_awaiting
+        )
+        assert isinstance(awaitable_result, Awaitable)
+        result = await awaitable_result
+
+        assert result == ({"foo": True, "bar": [True, True]}, None)
+        assert len(set(tasks)) == 3
+        assert asyncio.current_task() not in tasks
+
+    @pytest.mark.parametrize("eager_awaiting", [False, True])
+    async def support_timeouts_in_resolvers(eager_awaiting: bool):
+        async def resolve(*_args):
+            try:
+                async with asyncio.timeout(0.01):
+                    await asyncio.sleep(1)
+            except TimeoutError:
+                return "timed out"
+            return "not timed out"  # pragma: no cover
+
+        schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "a": GraphQLField(GraphQLString, resolve=resolve),
+                    "b": GraphQLField(GraphQLString, resolve=resolve),
+                },
+            )
+        )
+
+        awaitable_result = execute(
+            schema, parse("{a, b}"), eager_awaiting=eager_awaiting
+        )
+        assert isinstance(awaitable_result, Awaitable)
+        result = await asyncio.wait_for(awaitable_result, 1)
+
+        assert result == ({"a": "timed out", "b": "timed out"}, None)
+
+    # Awaitables that are not started after an error are closed when awaiting them
+    # with eager tasks, so the coroutines returned by the resolvers are never awaited.
+    eagerly_not_awaited = pytest.param(
+        True,
+        marks=pytest.mark.filterwarnings(
+            "ignore:coroutine .* was never awaited:RuntimeWarning"
+        ),
+    )
+
     def describe_cancel_on_exception():
         """Tests for cancellation of parallel execution on exception.
 
         These tests are specifically targeted at the Python asyncio implementation.
         """
 
-        async def cancel_selection_sets():
+        @pytest.mark.parametrize("eager_awaiting", [False, eagerly_not_awaited])
+        async def cancel_selection_sets(eager_awaiting: bool):
             barrier = Barrier(2)
-            completed = False
+            started = completed = False
 
             async def succeed(*_args):
-                nonlocal completed
+                nonlocal started, completed
+                started = True
                 await barrier.wait()
                 completed = True  # pragma: no cover
 
@@ -224,7 +302,7 @@ def describe_parallel_execution():
 
             ast = parse("{foo, bar}")
 
-            awaitable_result = execute(schema, ast)
+            awaitable_result = execute(schema, ast, eager_awaiting=eager_awaiting)
             assert isinstance(awaitable_result, Awaitable)
             result = await asyncio.wait_for(awaitable_result, 1)
 
@@ -235,17 +313,25 @@ def describe_parallel_execution():
 
             assert not completed
 
-            # Unblock succeed() and check that it does not complete
-            await barrier.wait()
-            await asyncio.sleep(0)
-            assert not completed
+            if eager_awaiting and eager_task_factory:
+                # Awaitables after the failing one are not started eagerly
+                assert not started
+                del awaitable_result, result
+                cleanup()
+            else:
+                # Unblock succeed() and check that it does not complete
+                await barrier.wait()
+                await asyncio.sleep(0)
+                assert not completed
 
-        async def cancel_lists():
+        @pytest.mark.parametrize("eager_awaiting", [False, eagerly_not_awaited])
+        async def cancel_lists(eager_awaiting: bool):
             barrier = Barrier(2)
-            completed = False
+            started = completed = False
 
             async def succeed(*_args):
-                nonlocal completed
+                nonlocal started, completed
+                started = True
                 await barrier.wait()
                 completed = True  # pragma: no cover
 
@@ -269,7 +355,7 @@ def describe_parallel_execution():
 
             ast = parse("{foo}")
 
-            awaitable_result = execute(schema, ast)
+            awaitable_result = execute(schema, ast, eager_awaiting=eager_awaiting)
             assert isinstance(awaitable_result, Awaitable)
             result = await asyncio.wait_for(awaitable_result, 1)
 
@@ -280,17 +366,25 @@ def describe_parallel_execution():
 
             assert not completed
 
-            # Unblock succeed() and check that it does not complete
-            await barrier.wait()
-            await asyncio.sleep(0)
-            assert not completed
+            if eager_awaiting and eager_task_factory:
+                # Awaitables after the failing one are not started eagerly
+                assert not started
+                del awaitable_result, result
+                cleanup()
+            else:
+                # Unblock succeed() and check that it does not complete
+                await barrier.wait()
+                await asyncio.sleep(0)
+                assert not completed
 
-        async def cancel_async_iterators():
+        @pytest.mark.parametrize("eager_awaiting", [False, eagerly_not_awaited])
+        async def cancel_async_iterators(eager_awaiting: bool):
             barrier = Barrier(2)
-            completed = False
+            started = completed = False
 
             async def succeed(*_args):
-                nonlocal completed
+                nonlocal started, completed
+                started = True
                 await barrier.wait()
                 completed = True  # pragma: no cover
 
@@ -315,7 +409,7 @@ def describe_parallel_execution():
 
             ast = parse("{foo}")
 
-            awaitable_result = execute(schema, ast)
+            awaitable_result = execute(schema, ast, eager_awaiting=eager_awaiting)
             assert isinstance(awaitable_result, Awaitable)
             result = await asyncio.wait_for(awaitable_result, 1)
 
@@ -326,10 +420,16 @@ def describe_parallel_execution():
 
             assert not completed
 
-            # Unblock succeed() and check that it does not complete
-            await barrier.wait()
-            await asyncio.sleep(0)
-            assert not completed
+            if eager_awaiting and eager_task_factory:
+                # Awaitables after the failing one are not started eagerly
+                assert not started
+                del awaitable_result, result
+                cleanup()
+            else:
+                # Unblock succeed() and check that it does not complete
+                await barrier.wait()
+                await asyncio.sleep(0)
+                assert not completed
 
         async def cancel_type_resolver():
             FooType = GraphQLInterfaceType("Foo", {"foo": GraphQLField(GraphQLString)})
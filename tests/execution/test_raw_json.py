@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+from graphql.execution import (
+    BreadthFirstExecutor,
+    JitExecutor,
+    RawJSON,
+    encode_json,
+    execute,
+    execute_sync,
+)
+from graphql.language import parse
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+async def resolve_async_raw(_source: Any, _info: Any) -> RawJSON:
+    return RawJSON('{"name":"async"}')
+
+
+async def resolve_async_item(_source: Any, _info: Any) -> dict[str, Any]:
+    return {"name": "plain"}
+
+
+item_type = GraphQLObjectType(
+    "Item",
+    {
+        "name": GraphQLField(GraphQLString),
+        "tags": GraphQLField(GraphQLList(GraphQLString), allow_raw_json=True),
+    },
+)
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        {
+            "raw": GraphQLField(
+                item_type,
+                resolve=lambda *_args: RawJSON('{"name":"raw"}'),
+                allow_raw_json=True,
+            ),
+            "rawBytes": GraphQLField(
+                GraphQLNonNull(item_type),
+                resolve=lambda *_args: RawJSON(b'{"name":"bytes"}'),
+                allow_raw_json=True,
+            ),
+            "rawList": GraphQLField(
+                GraphQLList(item_type),
+                resolve=lambda *_args: RawJSON('[{"name":"a"},{"name":"b"}]'),
+                allow_raw_json=True,
+            ),
+            "rawLeaf": GraphQLField(
+                GraphQLInt,
+                resolve=lambda *_args: RawJSON("42"),
+                allow_raw_json=True,
+            ),
+            "asyncRaw": GraphQLField(
+                item_type, resolve=resolve_async_raw, allow_raw_json=True
+            ),
+            "asyncItem": GraphQLField(
+                item_type, resolve=resolve_async_item, allow_raw_json=True
+            ),
+            "notAllowed": GraphQLField(
+                item_type, resolve=lambda *_args: RawJSON('{"name":"raw"}')
+            ),
+            "items": GraphQLField(
+                GraphQLList(item_type),
+                resolve=lambda *_args: [
+                    {"name": "a", "tags": RawJSON('["x","y"]')},
+                    {"name": "b", "tags": ["z"]},
+                ],
+            ),
+        },
+    )
+)
+
+
+def describe_raw_json():
+    def can_be_created_from_str_or_bytes():
+        raw = RawJSON('{"a":1}')
+        assert raw.json == '{"a":1}'
+        assert RawJSON(b'{"a":1}') == raw
+        assert raw != RawJSON("{}")
+        assert raw != '{"a":1}'
+        assert hash(RawJSON(b'{"a":1}')) == hash(raw)
+        assert repr(raw) == """RawJSON('{"a":1}')"""
+
+
+def describe_execute_passes_through_raw_json():
+    def passes_through_raw_json_values_of_fields_that_allow_it():
+        result = execute_sync(
+            schema,
+            parse("{ raw { name } rawBytes { name } rawList { name } rawLeaf }"),
+        )
+        assert result == (
+            {
+                "raw": RawJSON('{"name":"raw"}'),
+                "rawBytes": RawJSON('{"name":"bytes"}'),
+                "rawList": RawJSON('[{"name":"a"},{"name":"b"}]'),
+                "rawLeaf": RawJSON("42"),
+            },
+            None,
+        )
+        assert json.loads(encode_json(result.formatted)) == {
+            "data": {
+                "raw": {"name": "raw"},
+                "rawBytes": {"name": "bytes"},
+                "rawList": [{"name": "a"}, {"name": "b"}],
+                "rawLeaf": 42,
+            }
+        }
+
+    def passes_through_raw_json_values_of_nested_fields():
+        query = parse("{ items { name tags } }")
+        expected = (
+            {
+                "items": [
+                    {"name": "a", "tags": RawJSON('["x","y"]')},
+                    {"name": "b", "tags": ["z"]},
+                ]
+            },
+            None,
+        )
+        assert execute_sync(schema, query) == expected
+        assert execute_sync(schema, query, executor_class=JitExecutor) == expected
+        assert (
+            execute_sync(schema, query, executor_class=BreadthFirstExecutor) == expected
+        )
+
+    async def passes_through_raw_json_values_of_async_resolvers():
+        result = execute(schema, parse("{ asyncRaw { name } asyncItem { name } }"))
+        assert await result == (  # type: ignore
+            {
+                "asyncRaw": RawJSON('{"name":"async"}'),
+                "asyncItem": {"name": "plain"},
+            },
+            None,
+        )
+
+    def reports_raw_json_values_of_fields_that_do_not_allow_it():
+        assert execute_sync(schema, parse("{ notAllowed { name } }")) == (
+            {"notAllowed": None},
+            [
+                {
+                    "message": "Field 'Query.notAllowed'"
+                    " does not allow pre-serialized JSON values.",
+                    "locations": [(1, 3)],
+                    "path": ["notAllowed"],
+                }
+            ],
+        )
+
+
+def describe_allow_raw_json_on_field():
+    def is_part_of_field_kwargs_and_equality():
+        field = GraphQLField(GraphQLString, allow_raw_json=True)
+        assert field.allow_raw_json is True
+        assert field.to_kwargs()["allow_raw_json"] is True
+        assert GraphQLField(**field.to_kwargs()) == field
+        assert field != GraphQLField(GraphQLString)
@@ -55,6 +55,57 @@ def describe_execute_resolve_function():
             root_value=root_value,
         ) == ({"test": "testValue"}, None)
 
+    def default_function_handles_sources_of_different_classes():
+        class Item:
+            def __init__(self, test: Any) -> None:
+                self.test = test
+
+        class SlottedItem:
+            __slots__ = ("test",)
+
+        schema = GraphQLSchema(
+            GraphQLObjectType(
+                "Query",
+                {
+                    "items": GraphQLField(
+                        GraphQLList(
+                            GraphQLObjectType(
+                                "Item", {"test": GraphQLField(GraphQLString)}
+                            )
+                        )
+                    )
+                },
+            )
+        )
+        root_value = {
+            "items": [
+                Item("a"),
+                Item("b"),
+                {"test": "c"},
+                {},
+                ChainMap({"test": "d"}),
+                SlottedItem(),
+                Item(lambda _info: "e"),
+                object(),
+            ]
+        }
+
+        assert execute_sync(schema, parse("{ items { test } }"), root_value) == (
+            {
+                "items": [
+                    {"test": "a"},
+                    {"test": "b"},
+                    {"test": "c"},
+                    {"test": None},
+                    {"test": "d"},
+                    {"test": None},
+                    {"test": "e"},
+                    {"test": None},
+                ]
+            },
+            None,
+        )
+
     def default_function_calls_methods():
         class RootValue:
             _secret = "secretValue"  # noqa: S105
@@ -71,6 +122,47 @@ def describe_execute_resolve_function():
             None,
         )
 
+    def default_function_calls_other_kinds_of_callables():
+        class Base:
+            def method(self, _info, suffix: str = ""):
+                return "method" + suffix
+
+        class RootValue(Base):
+            static = staticmethod(lambda _info, suffix="": "static" + suffix)
+
+            @classmethod
+            def klass(cls, _info, suffix: str = "") -> str:
+                return cls.__name__ + suffix
+
+            @property
+            def prop(self):
+                return lambda _info, suffix="": "prop" + suffix
+
+        fields = {
+            name: GraphQLField(
+                GraphQLString, args={"suffix": GraphQLArgument(GraphQLString)}
+            )
+            for name in ("method", "static", "klass", "prop")
+        }
+        schema = GraphQLSchema(GraphQLObjectType("Query", fields))
+        document = parse(
+            "{ method static klass prop"
+            ' suffixed: method(suffix: "!") other: prop(suffix: "?") }'
+        )
+
+        for _ in range(2):  # the second time, the accessors are reused
+            assert execute_sync(schema, document, RootValue()) == (
+                {
+                    "method": "method",
+                    "static": "static",
+                    "klass": "RootValue",
+                    "prop": "prop",
+                    "suffixed": "method!",
+                    "other": "prop?",
+                },
+                None,
+            )
+
     def default_function_passes_args_and_context():
         class Adder:
             _num: int
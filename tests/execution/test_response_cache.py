@@ -0,0 +1,437 @@
+from __future__ import annotations
+
+from asyncio import sleep
+from collections import ChainMap
+from typing import Any
+
+import pytest
+
+from graphql.execution import (
+    CachedResponse,
+    CacheHints,
+    ExecutionResult,
+    JitExecutor,
+    LRUResponseCacheBackend,
+    ResponseCache,
+    SyncExecutor,
+    default_entity_id,
+    execute,
+    execute_sync,
+)
+from graphql.language import parse
+from graphql.pyutils import is_awaitable
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLID,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class Author:
+    def __init__(self, id_: str, name: str) -> None:
+        self.id = id_
+        self.name = name
+
+
+authors = {"1": Author("1", "Alice"), "2": Author("2", "Bob")}
+
+articles = {
+    "1": {"id": "1", "title": "GraphQL", "author": authors["1"]},
+    "2": {"id": "2", "title": "Python", "author": authors["2"]},
+}
+
+calls: list[str] = []
+
+
+def resolve_article(_root: Any, _info: Any, id: str) -> Any:  # noqa: A002
+    calls.append(f"article {id}")
+    return articles.get(id)
+
+
+async def resolve_async_article(_root: Any, info: Any, id: str) -> Any:  # noqa: A002
+    return resolve_article(_root, info, id)
+
+
+def resolve_fail(_root: Any, _info: Any) -> str:
+    msg = "Oops"
+    raise RuntimeError(msg)
+
+
+author_type = GraphQLObjectType(
+    "Author",
+    {
+        "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+        "name": GraphQLField(GraphQLString, max_age=30),
+    },
+)
+
+article_type = GraphQLObjectType(
+    "Article",
+    {
+        "id": GraphQLField(GraphQLNonNull(GraphQLID)),
+        "title": GraphQLField(GraphQLString, max_age=60),
+        "author": GraphQLField(author_type),
+    },
+)
+
+id_args = {"id": GraphQLArgument(GraphQLNonNull(GraphQLID))}
+
+schema = GraphQLSchema(
+    GraphQLObjectType(
+        "Query",
+        {
+            "article": GraphQLField(
+                article_type, args=id_args, resolve=resolve_article
+            ),
+            "asyncArticle": GraphQLField(
+                article_type, args=id_args, resolve=resolve_async_article
+            ),
+            "articles": GraphQLField(
+                GraphQLList(article_type),
+                resolve=lambda *_args: list(articles.values()),
+            ),
+            "uncached": GraphQLField(GraphQLString, max_age=0),
+            "volatile": GraphQLField(
+                GraphQLString, resolve=lambda *_args: "now", max_age=0.01
+            ),
+            "fail": GraphQLField(GraphQLString, resolve=resolve_fail),
+        },
+    ),
+    GraphQLObjectType(
+        "Mutation",
+        {
+            "touchArticle": GraphQLField(
+                article_type, args=id_args, resolve=resolve_article
+            )
+        },
+    ),
+)
+
+
+def describe_default_entity_id():
+    def gets_the_id_of_dictionaries():
+        assert default_entity_id(article_type, {"id": "1"}) == "1"
+        assert default_entity_id(article_type, {"name": "foo"}) is None
+
+    def gets_the_id_of_other_mappings():
+        assert default_entity_id(article_type, ChainMap({"id": "1"})) == "1"
+        assert default_entity_id(article_type, ChainMap({"name": "foo"})) is None
+
+    def gets_the_id_of_objects():
+        assert default_entity_id(author_type, Author("1", "Alice")) == "1"
+        assert default_entity_id(author_type, object()) is None
+
+
+def describe_cache_hints():
+    def records_types_entities_and_max_age():
+        cache_hints = CacheHints()
+        result = execute(
+            schema,
+            parse('{ article(id: "1") { title author { name } } }'),
+            cache_hints=cache_hints,
+        )
+        assert result == (
+            {"article": {"title": "GraphQL", "author": {"name": "Alice"}}},
+            None,
+        )
+        assert cache_hints.types == {"Query", "Article", "Author"}
+        assert cache_hints.entities == {("Article", "1"), ("Author", "1")}
+        assert cache_hints.max_age == 30
+
+    def records_the_entities_of_lists():
+        cache_hints = CacheHints()
+        execute(
+            schema, parse("{ articles { id __typename } }"), cache_hints=cache_hints
+        )
+        assert cache_hints.types == {"Query", "Article"}
+        assert cache_hints.entities == {("Article", "1"), ("Article", "2")}
+        assert cache_hints.max_age is None
+
+    def uses_the_smallest_max_age():
+        cache_hints = CacheHints()
+        execute(
+            schema,
+            parse('{ article(id: "1") { title } uncached }'),
+            cache_hints=cache_hints,
+        )
+        assert cache_hints.max_age == 0
+
+    def uses_the_given_entity_ids():
+        cache_hints = CacheHints(lambda _type, source: getattr(source, "name", None))
+        execute(
+            schema,
+            parse('{ article(id: "2") { author { name } } }'),
+            cache_hints=cache_hints,
+        )
+        assert cache_hints.entities == {("Author", "Bob")}
+
+    def ignores_entity_ids_that_cannot_be_recorded():
+        def get_entity_id(type_: Any, source: Any) -> Any:
+            if type_ is author_type:
+                msg = "No id"
+                raise RuntimeError(msg)
+            return [source["id"]]
+
+        cache_hints = CacheHints(get_entity_id)
+        result = execute(
+            schema,
+            parse('{ article(id: "1") { title author { name } } }'),
+            cache_hints=cache_hints,
+        )
+        assert result == (
+            {"article": {"title": "GraphQL", "author": {"name": "Alice"}}},
+            None,
+        )
+        assert cache_hints.types == {"Query", "Article", "Author"}
+        assert cache_hints.entities == set()
+        assert cache_hints.max_age == 30
+
+    def ignores_callable_entity_ids():
+        def get_entity_id(_type: Any, source: Any) -> Any:
+            # gets a bound method for the articles, which are dictionaries
+            return getattr(source, "get", None) or getattr(source, "name", None)
+
+        cache_hints = CacheHints(get_entity_id)
+        result = execute(
+            schema,
+            parse('{ article(id: "1") { id author { id } } }'),
+            cache_hints=cache_hints,
+        )
+        assert result == ({"article": {"id": "1", "author": {"id": "1"}}}, None)
+        assert cache_hints.entities == {("Author", "Alice")}
+
+    def records_fields_executed_serially():
+        cache_hints = CacheHints()
+        execute(
+            schema,
+            parse('mutation { touchArticle(id: "2") { title } }'),
+            cache_hints=cache_hints,
+        )
+        assert cache_hints.types == {"Mutation", "Article"}
+        assert cache_hints.entities == {("Article", "2")}
+        assert cache_hints.max_age == 60
+
+    def records_with_the_sync_executor():
+        cache_hints = CacheHints()
+        result = execute(
+            schema,
+            parse('{ article(id: "1") { author { name } } }'),
+            executor_class=SyncExecutor,
+            cache_hints=cache_hints,
+        )
+        assert result == ({"article": {"author": {"name": "Alice"}}}, None)
+        assert cache_hints.entities == {("Article", "1"), ("Author", "1")}
+        assert cache_hints.max_age == 30
+
+    def records_with_the_jit_executor():
+        cache_hints = CacheHints()
+        result = execute(
+            schema,
+            parse("{ articles { title } }"),
+            executor_class=JitExecutor,
+            cache_hints=cache_hints,
+        )
+        assert result == (
+            {"articles": [{"title": "GraphQL"}, {"title": "Python"}]},
+            None,
+        )
+        assert cache_hints.entities == {("Article", "1"), ("Article", "2")}
+        assert cache_hints.max_age == 60
+
+
+def cached_response(result: Any = None, *tags: Any) -> CachedResponse:
+    return CachedResponse(result, 0, frozenset(tags))
+
+
+def describe_lru_response_cache_backend():
+    def stores_and_deletes_responses():
+        backend = LRUResponseCacheBackend()
+        response = cached_response()
+        backend.set("a", response)
+        assert len(backend) == 1
+        assert backend.get("a") is response
+        assert backend.get("b") is None
+        backend.delete("a")
+        backend.delete("b")
+        assert len(backend) == 0
+        assert backend.get("a") is None
+
+    def replaces_responses():
+        backend = LRUResponseCacheBackend()
+        backend.set("a", cached_response(1, "foo"))
+        backend.set("a", cached_response(2, "bar"))
+        assert len(backend) == 1
+        backend.invalidate("foo")
+        assert backend.get("a") == cached_response(2, "bar")
+        backend.invalidate("bar")
+        assert backend.get("a") is None
+
+    def discards_the_least_recently_used_responses():
+        backend = LRUResponseCacheBackend(max_size=2)
+        backend.set("a", cached_response(1, "foo"))
+        backend.set("b", cached_response(2, "foo"))
+        assert backend.get("a")
+        backend.set("c", cached_response(3, "foo"))
+        assert len(backend) == 2
+        assert backend.get("b") is None
+        assert backend.get("a")
+        assert backend.get("c")
+
+    def invalidates_responses_by_tag():
+        backend = LRUResponseCacheBackend()
+        backend.set("a", cached_response(1, "foo", ("Foo", 1)))
+        backend.set("b", cached_response(2, "foo", ("Foo", 2)))
+        backend.set("c", cached_response(3, "bar"))
+        backend.invalidate(("Foo", 1))
+        assert backend.get("a") is None
+        assert backend.get("b")
+        backend.invalidate("foo")
+        assert backend.get("b") is None
+        backend.invalidate("baz")
+        assert len(backend) == 1
+        assert backend.get("c")
+
+
+def execute_cached(
+    response_cache: ResponseCache, query: str, **kwargs: Any
+) -> ExecutionResult:
+    result = response_cache.execute(schema, parse(query), **kwargs)
+    assert isinstance(result, ExecutionResult)
+    return result
+
+
+def describe_response_cache():
+    def caches_results_of_queries():
+        calls.clear()
+        response_cache = ResponseCache()
+        query = '{ article(id: "1") { title } }'
+        result = execute_cached(response_cache, query)
+        assert result == ({"article": {"title": "GraphQL"}}, None)
+        assert execute_cached(response_cache, query) is result
+        assert calls == ["article 1"]
+
+    async def caches_results_of_asynchronous_queries():
+        calls.clear()
+        response_cache = ResponseCache()
+        document = parse('{ asyncArticle(id: "1") { title } }')
+        result = response_cache.execute(schema, document)
+        assert is_awaitable(result)
+        result = await result
+        assert result == ({"asyncArticle": {"title": "GraphQL"}}, None)
+        assert response_cache.execute(schema, document) is result
+        assert calls == ["article 1"]
+
+    def caches_results_per_variables_and_scope():
+        calls.clear()
+        response_cache = ResponseCache()
+        query = "query ($id: ID!) { article(id: $id) { title } }"
+        for variable_values, cache_scope in [
+            ({"id": "1"}, None),
+            ({"id": "2"}, None),
+            ({"id": "1"}, "user"),
+            ({"id": "1"}, None),
+        ]:
+            execute_cached(
+                response_cache,
+                query,
+                variable_values=variable_values,
+                cache_scope=cache_scope,
+            )
+        assert calls == ["article 1", "article 2", "article 1"]
+
+    def does_not_cache_results_with_errors():
+        response_cache = ResponseCache(default_max_age=60)
+        result = execute_cached(response_cache, "{ fail }")
+        assert result.errors
+        assert execute_cached(response_cache, "{ fail }") is not result
+
+    def does_not_cache_mutations():
+        calls.clear()
+        response_cache = ResponseCache()
+        query = 'mutation { touchArticle(id: "1") { title } }'
+        execute_cached(response_cache, query)
+        execute_cached(response_cache, query)
+        assert calls == ["article 1", "article 1"]
+
+    def does_not_cache_results_without_max_age():
+        response_cache = ResponseCache()
+        result = execute_cached(response_cache, "{ articles { id } }")
+        assert execute_cached(response_cache, "{ articles { id } }") is not result
+
+    def caches_results_for_the_default_max_age():
+        response_cache = ResponseCache(default_max_age=60)
+        result = execute_cached(response_cache, "{ articles { id } }")
+        assert execute_cached(response_cache, "{ articles { id } }") is result
+
+    def does_not_cache_results_with_zero_max_age():
+        response_cache = ResponseCache(default_max_age=60)
+        result = execute_cached(response_cache, "{ uncached }")
+        assert execute_cached(response_cache, "{ uncached }") is not result
+
+    async def expires_results_after_their_max_age():
+        response_cache = ResponseCache()
+        result = execute_cached(response_cache, "{ volatile }")
+        assert result == ({"volatile": "now"}, None)
+        assert execute_cached(response_cache, "{ volatile }") is result
+        await sleep(0.02)
+        assert execute_cached(response_cache, "{ volatile }") is not result
+        assert len(response_cache.backend) == 1  # type: ignore
+
+    def invalidates_results_by_type():
+        calls.clear()
+        response_cache = ResponseCache()
+        first_query = '{ article(id: "1") { author { name } } }'
+        second_query = '{ article(id: "2") { title } }'
+        execute_cached(response_cache, first_query)
+        execute_cached(response_cache, second_query)
+        response_cache.invalidate_type("Author")
+        execute_cached(response_cache, first_query)
+        execute_cached(response_cache, second_query)
+        assert calls == ["article 1", "article 2", "article 1"]
+
+    def invalidates_results_by_entity():
+        calls.clear()
+        response_cache = ResponseCache()
+        first_query = '{ article(id: "1") { title } }'
+        second_query = '{ article(id: "2") { title } }'
+        execute_cached(response_cache, first_query)
+        execute_cached(response_cache, second_query)
+        response_cache.invalidate_entity("Article", "2")
+        execute_cached(response_cache, first_query)
+        execute_cached(response_cache, second_query)
+        assert calls == ["article 1", "article 2", "article 2"]
+
+    async def does_not_cache_results_executed_while_invalidating():
+        calls.clear()
+        response_cache = ResponseCache()
+        document = parse('{ asyncArticle(id: "1") { title } }')
+        result = response_cache.execute(schema, document)
+        response_cache.invalidate_entity("Article", "1")
+        await result  # type: ignore
+        await sleep(0)
+        await response_cache.execute(schema, document)  # type: ignore
+        assert calls == ["article 1", "article 1"]
+
+    def uses_the_given_backend_and_entity_ids():
+        calls.clear()
+        backend = LRUResponseCacheBackend(max_size=1)
+        response_cache = ResponseCache(
+            backend, get_entity_id=lambda _type, source: getattr(source, "name", None)
+        )
+        query = '{ article(id: "1") { author { name } } }'
+        execute_cached(response_cache, query)
+        assert len(backend) == 1
+        response_cache.invalidate_entity("Author", "Alice")
+        assert len(backend) == 0
+
+    def can_be_used_with_execute_sync_results():
+        response_cache = ResponseCache(default_max_age=60)
+        result = execute_cached(response_cache, "{ articles { id } }")
+        assert result == execute_sync(schema, parse("{ articles { id } }"))
@@ -0,0 +1,376 @@
+from __future__ import annotations
+
+from asyncio import CancelledError, Event, Future, ensure_future, gather, sleep
+from typing import Any
+
+import pytest
+
+from graphql.execution import (
+    AbortedGraphQLExecutionError,
+    ExecutionResult,
+    SingleFlight,
+)
+from graphql.execution.single_flight import retrieve_exception
+from graphql.language import parse
+from graphql.pyutils import AbortController
+from graphql.type import (
+    GraphQLArgument,
+    GraphQLField,
+    GraphQLInt,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+)
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.filterwarnings("error:coroutine .* was never awaited:RuntimeWarning"),
+]
+
+
+class Backend:
+    """Backend counting the calls and holding them back until they are released."""
+
+    def __init__(self) -> None:
+        self.release = Event()
+        self.calls = 0
+        self.cancelled = 0
+
+    async def fetch(self, value: Any) -> Any:
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except CancelledError:
+            self.cancelled += 1
+            raise
+        return value
+
+
+def build_test_schema(backend: Backend) -> GraphQLSchema:
+    async def resolve_greeting(_obj: Any, _info: Any, name: str = "World") -> str:
+        return await backend.fetch(f"Hello, {name}!")
+
+    async def resolve_fail(_obj: Any, _info: Any) -> str:
+        await backend.fetch(None)
+        msg = "Oops"
+        raise RuntimeError(msg)
+
+    def resolve_count(_obj: Any, _info: Any) -> int:
+        backend.calls += 1
+        return backend.calls
+
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "greeting": GraphQLField(
+                    GraphQLString,
+                    args={"name": GraphQLArgument(GraphQLString)},
+                    resolve=resolve_greeting,
+                ),
+                "fail": GraphQLField(GraphQLString, resolve=resolve_fail),
+                "count": GraphQLField(GraphQLInt, resolve=resolve_count),
+            },
+        ),
+        GraphQLObjectType(
+            "Mutation",
+            {"greeting": GraphQLField(GraphQLString, resolve=resolve_greeting)},
+        ),
+    )
+
+
+def describe_single_flight():
+    async def shares_identical_concurrent_executions():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        tasks = [
+            ensure_future(single_flight.execute(schema, parse("{ greeting }")))
+            for _ in range(3)
+        ]
+        await sleep(0)
+        backend.release.set()
+        results = await gather(*tasks)
+        assert backend.calls == 1
+        assert results[0] == ({"greeting": "Hello, World!"}, None)
+        assert results[1] is results[0]
+        assert results[2] is results[0]
+
+    async def shares_executions_of_documents_without_location():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        tasks = [
+            ensure_future(
+                single_flight.execute(schema, parse("{ greeting }", no_location=True))
+            )
+            for _ in range(2)
+        ]
+        await sleep(0)
+        backend.release.set()
+        results = await gather(*tasks)
+        assert backend.calls == 1
+        assert results[1] is results[0]
+
+    async def shares_executions_with_the_same_variables():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        document = parse("query ($name: String) { greeting(name: $name) }")
+        tasks = [
+            ensure_future(
+                single_flight.execute(schema, document, variable_values=variables)
+            )
+            for variables in ({"name": "Foo"}, {"name": "Bar"}, {"name": "Foo"})
+        ]
+        await sleep(0)
+        backend.release.set()
+        results = await gather(*tasks)
+        assert backend.calls == 2
+        assert results[0] == ({"greeting": "Hello, Foo!"}, None)
+        assert results[1] == ({"greeting": "Hello, Bar!"}, None)
+        assert results[2] is results[0]
+
+    async def executes_requests_with_different_context_keys_separately():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        document = parse("{ greeting }")
+        tasks = [
+            ensure_future(single_flight.execute(schema, document, context_key=key))
+            for key in ("alice", "bob", "alice")
+        ]
+        await sleep(0)
+        backend.release.set()
+        results = await gather(*tasks)
+        assert backend.calls == 2
+        assert results[2] is results[0]
+        assert results[1] is not results[0]
+
+    async def executes_different_operations_separately():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        document = parse("query A { greeting } query B { greeting }")
+        tasks = [
+            ensure_future(
+                single_flight.execute(schema, document, operation_name=operation_name)
+            )
+            for operation_name in ("A", "B", "A")
+        ]
+        await sleep(0)
+        backend.release.set()
+        results = await gather(*tasks)
+        assert backend.calls == 2
+        assert results[2] is results[0]
+
+    async def starts_a_new_execution_after_the_previous_one_finished():
+        backend = Backend()
+        backend.release.set()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        document = parse("{ greeting }")
+        first_result = await single_flight.execute(schema, document)
+        second_result = await single_flight.execute(schema, document)
+        assert backend.calls == 2
+        assert second_result == first_result
+        assert second_result is not first_result
+
+    async def executes_synchronous_operations_directly():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        document = parse("{ count }")
+        results = await gather(
+            single_flight.execute(schema, document),
+            single_flight.execute(schema, document),
+        )
+        assert results == [({"count": 1}, None), ({"count": 2}, None)]
+
+    async def does_not_share_mutations():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        document = parse("mutation { greeting }")
+        tasks = [
+            ensure_future(single_flight.execute(schema, document)) for _ in range(2)
+        ]
+        await sleep(0)
+        backend.release.set()
+        results = await gather(*tasks)
+        assert backend.calls == 2
+        assert results[0] == results[1] == ({"greeting": "Hello, World!"}, None)
+
+    async def does_not_share_operations_with_unserializable_variables():
+        backend = Backend()
+        backend.release.set()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        document = parse("query ($name: String) { greeting(name: $name) }")
+        result = await single_flight.execute(
+            schema, document, variable_values={"name": "Foo", "other": object()}
+        )
+        assert result == ({"greeting": "Hello, Foo!"}, None)
+
+    async def does_not_share_unknown_operations():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        result = await single_flight.execute(
+            schema, parse("{ greeting }"), operation_name="Unknown"
+        )
+        assert result == (
+            None,
+            [{"message": "Unknown operation named 'Unknown'."}],
+        )
+
+    async def shares_field_errors():
+        backend = Backend()
+        schema = build_test_schema(backend)
+        single_flight = SingleFlight()
+        tasks = [
+            ensure_future(single_flight.execute(schema, parse("{ fail }")))
+            for _ in range(2)
+        ]
+        await sleep(0)
+        backend.release.set()
+        results = await gather(*tasks)
+        assert backend.calls == 1
+        assert results[0] == (
+            {"fail": None},
+            [{"message": "Oops", "locations": [(1, 3)], "path": ["fail"]}],
+        )
+        assert results[1] is results[0]
+
+    def describe_cancellation():
+        async def keeps_executing_when_one_waiter_is_cancelled():
+            backend = Backend()
+            schema = build_test_schema(backend)
+            single_flight = SingleFlight()
+            document = parse("{ greeting }")
+            first = ensure_future(single_flight.execute(schema, document))
+            second = ensure_future(single_flight.execute(schema, document))
+            await sleep(0)
+            first.cancel()
+            await sleep(0)
+            assert first.cancelled()
+            backend.release.set()
+            assert await second == ({"greeting": "Hello, World!"}, None)
+            assert backend.calls == 1
+            assert backend.cancelled == 0
+
+        async def cancels_the_execution_when_all_waiters_are_cancelled():
+            backend = Backend()
+            schema = build_test_schema(backend)
+            single_flight = SingleFlight()
+            document = parse("{ greeting }")
+            tasks = [
+                ensure_future(single_flight.execute(schema, document)) for _ in range(2)
+            ]
+            await sleep(0.01)
+            assert backend.calls == 1
+            for task in tasks:
+                task.cancel()
+            await sleep(0.01)
+            assert all(task.cancelled() for task in tasks)
+            assert backend.cancelled == 1
+            backend.release.set()
+            result = await single_flight.execute(schema, document)
+            assert result == ({"greeting": "Hello, World!"}, None)
+            assert backend.calls == 2
+
+    def describe_abort_signals():
+        async def aborts_waiting_without_aborting_the_shared_execution():
+            backend = Backend()
+            schema = build_test_schema(backend)
+            single_flight = SingleFlight()
+            document = parse("{ greeting }")
+            abort_controller = AbortController()
+            first = ensure_future(
+                single_flight.execute(
+                    schema, document, abort_signal=abort_controller.signal
+                )
+            )
+            second = ensure_future(single_flight.execute(schema, document))
+            await sleep(0)
+            abort_controller.abort(RuntimeError("Aborted"))
+            with pytest.raises(AbortedGraphQLExecutionError, match="Aborted") as exc:
+                await first
+            backend.release.set()
+            result = await second
+            assert result == ({"greeting": "Hello, World!"}, None)
+            assert await exc.value.aborted_result is result
+            assert backend.cancelled == 0
+
+        async def returns_results_to_waiters_with_abort_signals():
+            backend = Backend()
+            schema = build_test_schema(backend)
+            single_flight = SingleFlight()
+            document = parse("{ greeting }")
+            abort_controller = AbortController()
+            task = ensure_future(
+                single_flight.execute(
+                    schema, document, abort_signal=abort_controller.signal
+                )
+            )
+            await sleep(0)
+            backend.release.set()
+            assert await task == ({"greeting": "Hello, World!"}, None)
+
+        async def aborts_the_execution_when_all_waiters_are_aborted():
+            backend = Backend()
+            schema = build_test_schema(backend)
+            single_flight = SingleFlight()
+            document = parse("{ greeting }")
+            abort_controllers = [AbortController(), AbortController()]
+            tasks = [
+                ensure_future(
+                    single_flight.execute(
+                        schema, document, abort_signal=abort_controller.signal
+                    )
+                )
+                for abort_controller in abort_controllers
+            ]
+            await sleep(0)
+            for index, abort_controller in enumerate(abort_controllers):
+                abort_controller.abort(RuntimeError(f"Aborted {index}"))
+            with pytest.raises(AbortedGraphQLExecutionError, match="Aborted 0"):
+                await tasks[0]
+            with pytest.raises(AbortedGraphQLExecutionError, match="Aborted 1"):
+                await tasks[1]
+            await sleep(0)
+            assert backend.cancelled == 1
+
+        async def starts_a_new_execution_after_all_waiters_are_aborted():
+            backend = Backend()
+            schema = build_test_schema(backend)
+            single_flight = SingleFlight()
+            document = parse("{ greeting }")
+            abort_controller = AbortController()
+            task = ensure_future(
+                single_flight.execute(
+                    schema, document, abort_signal=abort_controller.signal
+                )
+            )
+            await sleep(0)
+            abort_controller.abort()
+            with pytest.raises(AbortedGraphQLExecutionError):
+                await task
+            backend.release.set()
+            result: ExecutionResult = await single_flight.execute(schema, document)
+            assert result == ({"greeting": "Hello, World!"}, None)
+            assert backend.calls == 2
+
+
+def describe_retrieve_exception():
+    async def retrieves_exceptions_of_failed_tasks():
+        task: Future[None] = Future()
+        task.set_exception(RuntimeError("Oops"))
+        retrieve_exception(task)
+        assert task._log_traceback is False  # noqa: SLF001
+
+    async def ignores_cancelled_tasks():
+        task: Future[None] = Future()
+        task.cancel()
+        retrieve_exception(task)
+        assert task.cancelled()
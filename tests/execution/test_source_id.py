@@ -0,0 +1,33 @@
+from collections import ChainMap
+
+from graphql.execution import get_source_id
+
+
+class Author:
+    def __init__(self, id_: str) -> None:
+        self.id = id_
+
+
+def describe_get_source_id():
+    def gets_the_id_of_dictionaries():
+        assert get_source_id({"id": "1"}) == "1"
+        assert get_source_id({"name": "foo"}) is None
+
+    def gets_the_id_of_other_mappings():
+        assert get_source_id(ChainMap({"id": "1"})) == "1"
+        assert get_source_id(ChainMap({"name": "foo"})) is None
+
+    def gets_the_id_of_objects():
+        assert get_source_id(Author("1")) == "1"
+        assert get_source_id(object()) is None
+
+    def ignores_callable_ids():
+        class Entity:
+            def id(self) -> str:
+                return "1"
+
+        assert get_source_id(Entity()) is None
+        assert get_source_id({"id": lambda: "1"}) is None
+
+    def returns_none_for_none():
+        assert get_source_id(None) is None
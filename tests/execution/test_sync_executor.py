@@ -0,0 +1,489 @@
+from __future__ import annotations
+
+from array import array
+from inspect import CORO_CLOSED, getcoroutinestate
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from graphql import graphql_sync
+from graphql.execution import (
+    CompiledOperation,
+    ExecutionResult,
+    SyncExecutor,
+    SynchronousExecutionError,
+    compile_operation,
+    execute_compiled_operation,
+    execute_sync,
+    lazy_resolve_info,
+)
+from graphql.language import parse
+from graphql.pyutils import AbortController, AbortError
+from graphql.utilities import build_schema
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Coroutine
+
+    from graphql.execution.collect_fields import FieldDetailsList
+    from graphql.pyutils import Path
+    from graphql.type import (
+        GraphQLInterfaceType,
+        GraphQLObjectType,
+        GraphQLUnionType,
+    )
+
+pytestmark = pytest.mark.anyio
+
+schema = build_schema(
+    """
+    interface Node {
+      id: ID!
+    }
+
+    union Item = User | Post
+
+    type Query {
+      users: [User]
+      strictUsers: [User!]
+      user: User
+      nodes: [Node]
+      items: [Item]
+      scores: [Int]
+      weights: [Float!]
+      tags: [String]
+      notAList: [Int]
+      asyncValue: String
+      asyncItems: [Int]
+      asyncIterable: [Int]
+    }
+
+    type Mutation {
+      first: Int
+      second: Int
+    }
+
+    type User implements Node {
+      id: ID!
+      name: String
+      strict: String!
+      fail: String
+      greeting(name: String): String
+      posts: [Post!]
+      batchedName: String
+    }
+
+    type Post implements Node {
+      id: ID!
+      title: String
+    }
+    """
+)
+
+user_type: GraphQLObjectType = schema.get_type("User")  # type: ignore
+post_type: GraphQLObjectType = schema.get_type("Post")  # type: ignore
+node_type: GraphQLInterfaceType = schema.get_type("Node")  # type: ignore
+item_type: GraphQLUnionType = schema.get_type("Item")  # type: ignore
+node_type.resolve_type = lambda obj, *_args: type(obj).__name__
+item_type.resolve_type = lambda obj, *_args: type(obj).__name__
+user_type.fields["fail"].resolve = lambda user, _info: user.fail
+user_type.fields["batchedName"].batch_resolve = lambda users, _info: [
+    user.name for user in users
+]
+
+
+@lazy_resolve_info
+def resolve_title(post: Post, _info: Any) -> str:
+    return post.title
+
+
+post_type.fields["title"].resolve = resolve_title
+
+coroutines: list[Coroutine] = []
+
+
+async def get_async_value() -> str:
+    return "async"  # pragma: no cover
+
+
+def resolve_async_value(*_args: Any) -> Any:
+    coroutine = get_async_value()
+    coroutines.append(coroutine)
+    return coroutine
+
+
+async def get_async_iterable() -> AsyncGenerator[int, None]:
+    yield 1  # pragma: no cover
+
+
+class Post:
+    def __init__(self, id_: str) -> None:
+        self.id = id_
+        self.title = f"Post {id_}"
+
+
+class User:
+    def __init__(self, id_: str, strict: str | None = "strict") -> None:
+        self.id = id_
+        self.name = f"User {id_}"
+        self.strict = strict
+        self._posts = [Post(f"{id_}a"), Post(f"{id_}b")]
+
+    @property
+    def fail(self) -> str:
+        msg = f"Failure {self.id}"
+        raise RuntimeError(msg)
+
+    def greeting(self, _info: Any, name: str = "World") -> str:
+        return f"Hello, {name}, from {self.name}!"
+
+    @property
+    def posts(self) -> Any:
+        # return a generator to check that it is iterated only once
+        return (post for post in self._posts)
+
+
+def get_root() -> dict[str, Any]:
+    user1, user2 = User("1"), User("2")
+    return {
+        "users": [user1, None, user2],
+        "strictUsers": [user1, User("3", strict=None)],
+        "user": user1,
+        "nodes": [user1, Post("2a")],
+        "items": [user2, Post("1a"), user1],
+        "scores": [1, None, 3, "4", "x"],
+        "weights": array("d", [0.5, 1.5]),
+        "tags": ["a", 2, True],
+        "notAList": 42,
+        "asyncValue": resolve_async_value,
+        "asyncItems": lambda *_args: [1, resolve_async_value()],
+        "asyncIterable": lambda *_args: get_async_iterable(),
+        "first": 1,
+        "second": 2,
+    }
+
+
+def execute_both(query: str, root_value: Any = None, **kwargs: Any) -> ExecutionResult:
+    document = parse(query)
+    result = execute_sync(schema, document, root_value or get_root(), **kwargs)
+    assert (
+        execute_sync(
+            schema,
+            document,
+            root_value or get_root(),
+            executor_class=SyncExecutor,
+            **kwargs,
+        )
+        == result
+    )
+    return result
+
+
+def execute_with_check(query: str) -> ExecutionResult:
+    return execute_sync(
+        schema, parse(query), get_root(), executor_class=SyncExecutor, check_sync=True
+    )
+
+
+class NonLazySyncExecutor(SyncExecutor):
+    """Synchronous executor that builds all paths in advance."""
+
+    def execute_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_details_list: FieldDetailsList,
+        path: Path,
+        position_context: None,
+    ) -> Any:
+        return super().execute_field(
+            parent_type, source, field_details_list, path, position_context
+        )
+
+
+def describe_sync_executor():
+    def resolves_nested_objects_and_lists():
+        assert execute_both(
+            '{ users { id name posts { title } } user { greeting(name: "Joe") } }'
+        ) == (
+            {
+                "users": [
+                    {
+                        "id": "1",
+                        "name": "User 1",
+                        "posts": [{"title": "Post 1a"}, {"title": "Post 1b"}],
+                    },
+                    None,
+                    {
+                        "id": "2",
+                        "name": "User 2",
+                        "posts": [{"title": "Post 2a"}, {"title": "Post 2b"}],
+                    },
+                ],
+                "user": {"greeting": "Hello, Joe, from User 1!"},
+            },
+            None,
+        )
+
+    def resolves_lists_of_leaf_values():
+        assert execute_both("{ scores weights tags }") == (
+            {
+                "scores": [1, None, 3, 4, None],
+                "weights": [0.5, 1.5],
+                "tags": ["a", "2", "true"],
+            },
+            [
+                {
+                    "message": "Int cannot represent non-integer value: 'x'",
+                    "locations": [(1, 3)],
+                    "path": ["scores", 4],
+                }
+            ],
+        )
+
+    def keeps_error_paths_and_null_propagation():
+        assert execute_both("{ strictUsers { name strict fail } notAList }") == (
+            {"strictUsers": None, "notAList": None},
+            [
+                {
+                    "message": "Failure 1",
+                    "locations": [(1, 29)],
+                    "path": ["strictUsers", 0, "fail"],
+                },
+                {
+                    "message": "Cannot return null for non-nullable field User.strict.",
+                    "locations": [(1, 22)],
+                    "path": ["strictUsers", 1, "strict"],
+                },
+                {
+                    "message": "Expected Iterable, but did not find one"
+                    " for field 'Query.notAList'.",
+                    "locations": [(1, 36)],
+                    "path": ["notAList"],
+                },
+            ],
+        )
+
+    def resolves_abstract_types():
+        query = "{ nodes { id } items { ... on User { name } ... on Post { title } } }"
+        result = execute_both(query)
+        assert result == (
+            {
+                "nodes": [{"id": "1"}, {"id": "2a"}],
+                "items": [
+                    {"name": "User 2"},
+                    {"title": "Post 1a"},
+                    {"name": "User 1"},
+                ],
+            },
+            None,
+        )
+        item_type.cache_resolved_types = True
+        schema.clear_resolved_types()
+        try:
+            # check both when resolving and when using the cached types
+            assert (
+                execute_sync(
+                    schema, parse(query), get_root(), executor_class=SyncExecutor
+                )
+                == result
+            )
+            assert execute_both(query) == result
+        finally:
+            item_type.cache_resolved_types = False
+
+    def resolves_types_with_is_type_of():
+        user_type.is_type_of = lambda obj, _info: isinstance(obj, User)
+        try:
+            assert execute_both("{ users { name } }")
+            assert execute_both("{ user { name } }", {"user": Post("1")}) == (
+                {"user": None},
+                [
+                    {
+                        "message": "Expected value of type 'User' but got:"
+                        " <Post instance>.",
+                        "locations": [(1, 3)],
+                        "path": ["user"],
+                    }
+                ],
+            )
+        finally:
+            user_type.is_type_of = None
+
+    def resolves_batched_fields():
+        result = execute_both("{ users { batchedName } }")
+        assert result == (
+            {
+                "users": [
+                    {"batchedName": "User 1"},
+                    None,
+                    {"batchedName": "User 2"},
+                ]
+            },
+            None,
+        )
+        root_value = get_root()
+        root_value["users"] = iter(root_value["users"])
+        assert (
+            execute_sync(
+                schema,
+                parse("{ users { batchedName } }"),
+                root_value,
+                executor_class=SyncExecutor,
+            )
+            == result
+        )
+
+    def uses_middleware_and_compiled_operations():
+        def middleware(next_: Any, *args: Any, **kwargs: Any) -> Any:
+            result = next_(*args, **kwargs)
+            return result.upper() if isinstance(result, str) else result
+
+        assert execute_both("{ user { name } }", middleware=[middleware]) == (
+            {"user": {"name": "USER 1"}},
+            None,
+        )
+
+        compiled_operation = compile_operation(
+            schema, parse("{ user { name unknown posts { title } } }")
+        )
+        assert isinstance(compiled_operation, CompiledOperation)
+        assert execute_compiled_operation(
+            compiled_operation, get_root(), executor_class=SyncExecutor
+        ) == (
+            {
+                "user": {
+                    "name": "User 1",
+                    "posts": [{"title": "Post 1a"}, {"title": "Post 1b"}],
+                }
+            },
+            None,
+        )
+
+    def ignores_unknown_fields():
+        assert execute_both("{ user { name unknown } }") == (
+            {"user": {"name": "User 1"}},
+            None,
+        )
+
+    def builds_paths_in_advance_when_executing_fields_is_customized():
+        document = parse(
+            "{ user { name unknown posts { title } } strictUsers { strict } }"
+        )
+        result = execute_sync(schema, document, get_root())
+        assert (
+            execute_sync(
+                schema, document, get_root(), executor_class=NonLazySyncExecutor
+            )
+            == result
+        )
+        assert result.errors
+
+    def executes_mutations_serially():
+        assert execute_both("mutation { first second }") == (
+            {"first": 1, "second": 2},
+            None,
+        )
+        abort_controller = AbortController()
+        assert execute_both(
+            "mutation { first second }", abort_signal=abort_controller.signal
+        ) == ({"first": 1, "second": 2}, None)
+
+    @pytest.mark.parametrize("executor_class", [None, SyncExecutor])
+    def stops_serial_execution_when_aborted(executor_class: Any):
+        abort_controller = AbortController()
+        second_executed = False
+
+        def abort(*_args: Any) -> int:
+            abort_controller.abort()
+            return 1
+
+        def second(*_args: Any) -> int:
+            nonlocal second_executed
+            second_executed = True  # pragma: no cover
+            return 2  # pragma: no cover
+
+        with pytest.raises(AbortError, match=r"^This operation was aborted$"):
+            execute_sync(
+                schema,
+                parse("mutation { first second }"),
+                {"first": abort, "second": second},
+                executor_class=executor_class,
+                abort_signal=abort_controller.signal,
+            )
+        assert not second_executed
+
+    def works_with_graphql_sync():
+        assert graphql_sync(
+            schema, "{ user { name } }", get_root(), executor_class=SyncExecutor
+        ) == ({"user": {"name": "User 1"}}, None)
+
+    def describe_asynchronous_values():
+        def raises_for_an_asynchronous_field_value():
+            coroutines.clear()
+            with pytest.raises(
+                SynchronousExecutionError,
+                match=r"^GraphQL execution failed to complete synchronously:"
+                r" field 'Query.asyncValue' returned an asynchronous value.$",
+            ):
+                execute_with_check("{ asyncValue }")
+            assert len(coroutines) == 1
+            assert getcoroutinestate(coroutines[0]) == CORO_CLOSED
+
+        def raises_for_an_asynchronous_list_item():
+            coroutines.clear()
+            with pytest.raises(
+                SynchronousExecutionError, match=r"field 'Query.asyncItems'"
+            ):
+                execute_with_check("{ asyncItems }")
+            assert len(coroutines) == 1
+            assert getcoroutinestate(coroutines[0]) == CORO_CLOSED
+
+        def raises_for_an_asynchronous_object_list_item():
+            root_value = get_root()
+            root_value["users"] = [User("1"), resolve_async_value()]
+            with pytest.raises(SynchronousExecutionError, match=r"field 'Query.users'"):
+                execute_sync(
+                    schema,
+                    parse("{ users { name } }"),
+                    root_value,
+                    executor_class=SyncExecutor,
+                    check_sync=True,
+                )
+
+        def raises_for_an_asynchronous_iterable():
+            with pytest.raises(
+                SynchronousExecutionError, match=r"field 'Query.asyncIterable'"
+            ):
+                execute_with_check("{ asyncIterable }")
+
+        def raises_for_an_asynchronous_type_resolver():
+            async def resolve_type(*_args: Any) -> str:
+                return "User"  # pragma: no cover
+
+            node_type.resolve_type = resolve_type
+            try:
+                with pytest.raises(
+                    SynchronousExecutionError, match=r"field 'Query.nodes'"
+                ):
+                    execute_with_check("{ nodes { id } }")
+            finally:
+                node_type.resolve_type = lambda obj, *_args: type(obj).__name__
+
+        def raises_for_an_asynchronous_is_type_of():
+            async def is_type_of(*_args: Any) -> bool:
+                return True  # pragma: no cover
+
+            user_type.is_type_of = is_type_of
+            try:
+                with pytest.raises(
+                    SynchronousExecutionError, match=r"field 'Query.user'"
+                ):
+                    execute_with_check("{ user { name } }")
+            finally:
+                user_type.is_type_of = None
+
+        def raises_through_non_null_fields():
+            with pytest.raises(
+                SynchronousExecutionError, match=r"field 'Query.asyncValue'"
+            ):
+                execute_with_check("{ user { strict } asyncValue }")
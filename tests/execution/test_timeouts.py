@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+from asyncio import Event, Future, ensure_future, sleep
+from typing import Any
+
+import pytest
+
+from graphql import graphql
+from graphql.execution import AbortedGraphQLExecutionError, execute
+from graphql.execution.executor import set_timed_out
+from graphql.language import parse
+from graphql.pyutils import AbortController
+from graphql.type import (
+    GraphQLField,
+    GraphQLInt,
+    GraphQLList,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLSchema,
+    GraphQLString,
+    GraphQLTimeoutDirective,
+    specified_directives,
+)
+from graphql.utilities import build_schema
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.filterwarnings("error:coroutine .* was never awaited:RuntimeWarning"),
+]
+
+
+class Backend:
+    """Backend with resolvers that are fast or that hang until they are released."""
+
+    def __init__(self) -> None:
+        self.release = Event()
+        self.cancelled: list[Any] = []
+
+    async def fast(self, value: Any) -> Any:
+        await sleep(0)
+        return value
+
+    async def slow(self, value: Any) -> Any:
+        try:
+            await self.release.wait()
+        except BaseException:
+            self.cancelled.append(value)
+            raise
+        return value  # pragma: no cover
+
+
+def build_test_schema(
+    backend: Backend, timeout: float | None = None, with_directive: bool = False
+) -> GraphQLSchema:
+    return GraphQLSchema(
+        GraphQLObjectType(
+            "Query",
+            {
+                "fast": GraphQLField(
+                    GraphQLString, resolve=lambda *_args: backend.fast("fast")
+                ),
+                "slow": GraphQLField(
+                    GraphQLString,
+                    resolve=lambda *_args: backend.slow("slow"),
+                    timeout=timeout,
+                ),
+                "slowNonNull": GraphQLField(
+                    GraphQLNonNull(GraphQLString),
+                    resolve=lambda *_args: backend.slow("slowNonNull"),
+                    timeout=timeout,
+                ),
+                "items": GraphQLField(
+                    GraphQLList(GraphQLInt),
+                    resolve=lambda *_args: [backend.fast(1), backend.slow(2)],
+                    timeout=timeout,
+                ),
+            },
+        ),
+        directives=[*specified_directives, GraphQLTimeoutDirective]
+        if with_directive
+        else None,
+    )
+
+
+def describe_execution_timeouts():
+    async def does_not_time_out_without_time_budgets():
+        backend = Backend()
+        result = ensure_future(execute(build_test_schema(backend), parse("{ slow }")))  # type: ignore
+        await sleep(0.05)
+        assert not result.done()
+        backend.release.set()
+        assert await result == ({"slow": "slow"}, None)
+
+    def describe_field_timeouts():
+        async def times_out_nullable_fields():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend, timeout=0.01), parse("{ fast slow }")
+            )
+            assert await result == (  # type: ignore
+                {"fast": "fast", "slow": None},
+                [
+                    {
+                        "message": "Field 'Query.slow' timed out.",
+                        "locations": [(1, 8)],
+                        "path": ["slow"],
+                    }
+                ],
+            )
+            await sleep(0)
+            assert backend.cancelled == ["slow"]
+
+        async def propagates_timeouts_of_non_null_fields():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend, timeout=0.01),
+                parse("{ fast slowNonNull }"),
+            )
+            assert await result == (  # type: ignore
+                None,
+                [
+                    {
+                        "message": "Field 'Query.slowNonNull' timed out.",
+                        "locations": [(1, 8)],
+                        "path": ["slowNonNull"],
+                    }
+                ],
+            )
+
+        async def times_out_list_items_separately():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend, timeout=0.01), parse("{ items }")
+            )
+            assert await result == (  # type: ignore
+                {"items": [1, None]},
+                [
+                    {
+                        "message": "Field 'Query.items' timed out.",
+                        "locations": [(1, 3)],
+                        "path": ["items", 1],
+                    }
+                ],
+            )
+
+        async def returns_values_settling_within_the_time_budget():
+            backend = Backend()
+            result = ensure_future(
+                execute(build_test_schema(backend, timeout=1), parse("{ slow }"))  # type: ignore
+            )
+            await sleep(0)
+            backend.release.set()
+            assert await result == ({"slow": "slow"}, None)
+
+        async def returns_values_settling_in_the_tick_of_the_timeout():
+            async def resolve(*_args: Any) -> str:
+                return "instant"
+
+            schema = GraphQLSchema(
+                GraphQLObjectType(
+                    "Query",
+                    {
+                        "instant": GraphQLField(
+                            GraphQLString, resolve=resolve, timeout=0
+                        )
+                    },
+                )
+            )
+            result = execute(schema, parse("{ instant }"))
+            assert await result == ({"instant": "instant"}, None)  # type: ignore
+
+    def describe_timeout_directive():
+        async def times_out_fields_with_the_timeout_directive():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend, with_directive=True),
+                parse("{ fast @timeout(seconds: 1) slow @timeout(seconds: 0.01) }"),
+            )
+            assert await result == (  # type: ignore
+                {"fast": "fast", "slow": None},
+                [
+                    {
+                        "message": "Field 'Query.slow' timed out.",
+                        "locations": [(1, 29)],
+                        "path": ["slow"],
+                    }
+                ],
+            )
+
+        async def accepts_variables_in_the_timeout_directive():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend, with_directive=True),
+                parse("query ($seconds: Float!) { items @timeout(seconds: $seconds) }"),
+                variable_values={"seconds": 0.01},
+            )
+            assert await result == (  # type: ignore
+                {"items": [1, None]},
+                [
+                    {
+                        "message": "Field 'Query.items' timed out.",
+                        "locations": [(1, 28)],
+                        "path": ["items", 1],
+                    }
+                ],
+            )
+
+        async def uses_the_smaller_of_field_and_directive_timeouts():
+            backend = Backend()
+            schema = build_test_schema(backend, timeout=0.01, with_directive=True)
+            result = execute(schema, parse("{ slow @timeout(seconds: 10) }"))
+            assert (await result).errors  # type: ignore
+            result = execute(
+                build_test_schema(backend, timeout=10, with_directive=True),
+                parse("{ slow @timeout(seconds: 0.01) }"),
+            )
+            assert (await result).errors  # type: ignore
+
+        async def ignores_the_directive_if_not_supported_by_the_schema():
+            backend = Backend()
+            result = ensure_future(
+                execute(  # type: ignore
+                    build_test_schema(backend),
+                    parse("{ slow @timeout(seconds: 0.01) }"),
+                )
+            )
+            await sleep(0.05)
+            assert not result.done()
+            backend.release.set()
+            assert await result == ({"slow": "slow"}, None)
+
+        async def supports_the_directive_declared_in_sdl():
+            backend = Backend()
+            schema = build_schema(
+                """
+                directive @timeout(seconds: Float!) on FIELD
+
+                type Query {
+                  slow: String
+                }
+                """
+            )
+            result = execute(
+                schema,
+                parse("{ slow @timeout(seconds: 0.01) }"),
+                {"slow": lambda _info: backend.slow("slow")},
+            )
+            assert await result == (  # type: ignore
+                {"slow": None},
+                [
+                    {
+                        "message": "Field 'Query.slow' timed out.",
+                        "locations": [(1, 3)],
+                        "path": ["slow"],
+                    }
+                ],
+            )
+
+        async def ignores_custom_directives_with_the_same_name():
+            backend = Backend()
+            schema = build_schema(
+                """
+                directive @timeout(ms: Int!) on FIELD
+
+                type Query {
+                  slow: String
+                }
+                """
+            )
+            result = ensure_future(
+                execute(  # type: ignore
+                    schema,
+                    parse("{ slow @timeout(ms: 10) }"),
+                    {"slow": lambda _info: backend.slow("slow")},
+                )
+            )
+            await sleep(0.05)
+            assert not result.done()
+            backend.release.set()
+            assert await result == ({"slow": "slow"}, None)
+
+    def describe_operation_deadline():
+        async def times_out_fields_exceeding_the_deadline():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend), parse("{ fast slow items }"), timeout=0.01
+            )
+            data, errors = await result  # type: ignore
+            assert data == {"fast": "fast", "slow": None, "items": [1, None]}
+            # the order in which the timeouts are reported is not defined
+            assert sorted(
+                (error.formatted for error in errors or ()),
+                key=lambda error: error["locations"][0]["column"],
+            ) == [
+                {
+                    "message": "Field 'Query.slow' timed out.",
+                    "locations": [{"line": 1, "column": 8}],
+                    "path": ["slow"],
+                },
+                {
+                    "message": "Field 'Query.items' timed out.",
+                    "locations": [{"line": 1, "column": 13}],
+                    "path": ["items", 1],
+                },
+            ]
+            await sleep(0)
+            assert set(backend.cancelled) == {"slow", 2}
+
+        async def uses_the_time_remaining_until_the_deadline():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend, timeout=10), parse("{ slow }"), timeout=0.01
+            )
+            assert (await result).errors  # type: ignore
+
+        async def uses_smaller_field_timeouts_before_the_deadline():
+            backend = Backend()
+            result = execute(
+                build_test_schema(backend, timeout=0.01), parse("{ slow }"), timeout=10
+            )
+            assert (await result).errors  # type: ignore
+
+        async def can_be_passed_to_graphql():
+            backend = Backend()
+            result = await graphql(
+                build_test_schema(backend), "{ fast slow }", timeout=0.01
+            )
+            assert result == (
+                {"fast": "fast", "slow": None},
+                [
+                    {
+                        "message": "Field 'Query.slow' timed out.",
+                        "locations": [(1, 8)],
+                        "path": ["slow"],
+                    }
+                ],
+            )
+
+    def describe_timeouts_with_abort_signal():
+        async def times_out_fields_before_the_abort_signal_fires():
+            backend = Backend()
+            abort_controller = AbortController()
+            result = execute(
+                build_test_schema(backend, timeout=0.01),
+                parse("{ fast slow }"),
+                abort_signal=abort_controller.signal,
+            )
+            assert await result == (  # type: ignore
+                {"fast": "fast", "slow": None},
+                [
+                    {
+                        "message": "Field 'Query.slow' timed out.",
+                        "locations": [(1, 8)],
+                        "path": ["slow"],
+                    }
+                ],
+            )
+
+        async def aborts_fields_before_they_time_out():
+            backend = Backend()
+            abort_controller = AbortController()
+            result = ensure_future(
+                execute(  # type: ignore
+                    build_test_schema(backend, timeout=10),
+                    parse("{ fast slow }"),
+                    abort_signal=abort_controller.signal,
+                )
+            )
+            await sleep(0.01)
+            abort_controller.abort(RuntimeError("Aborted"))
+            with pytest.raises(AbortedGraphQLExecutionError, match="Aborted"):
+                await result
+            await sleep(0)
+            assert backend.cancelled == ["slow"]
+
+
+def describe_set_timed_out():
+    async def marks_pending_futures_as_timed_out():
+        settled: Future[bool] = Future()
+        set_timed_out(settled)
+        assert settled.result() is True
+
+    async def does_not_change_settled_futures():
+        settled: Future[bool] = Future()
+        settled.set_result(False)
+        set_timed_out(settled)
+        assert settled.result() is False
@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+from asyncio import (
+    CancelledError,
+    Event,
+    Future,
+    create_task,
+    current_task,
+    ensure_future,
+    gather,
+    sleep,
+    timeout,
+    wait_for,
+)
+from contextvars import ContextVar
+from importlib import import_module
+from inspect import CORO_CLOSED, CORO_CREATED, getcoroutinestate
+from types import coroutine
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from graphql.pyutils import eager_gather_with_cancel, is_awaitable
+from graphql.pyutils.eager_gather_with_cancel import eager_task_factory
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+pytestmark = pytest.mark.anyio
+
+
+class Controller:
+    def reset(self, wait=False):
+        self.event = Event()
+        if not wait:
+            self.event.set()
+        self.returned = []
+
+
+controller = Controller()
+
+
+async def coroutine_returning(value: int) -> int:
+    """Simple coroutine that returns a value."""
+    if value > 2:
+        raise RuntimeError("Oops")
+    await controller.event.wait()
+    controller.returned.append(value)
+    return value
+
+
+class CustomAwaitable:
+    """Custom awaitable that return a value."""
+
+    def __init__(self, value: int):
+        self.value = value
+        self.coroutine = coroutine_returning(value)
+
+    def __await__(self):
+        return self.coroutine.__await__()
+
+
+@coroutine
+def generator_based_coroutine(value: int) -> Generator[Any, Any, int]:
+    """Generator based coroutine that returns a value."""
+    return (yield from coroutine_returning(value).__await__())
+
+
+awaitable_factories: dict[str, Callable] = {
+    "coroutine": coroutine_returning,
+    "task": lambda value: create_task(coroutine_returning(value)),
+    "custom": CustomAwaitable,
+    "generator": generator_based_coroutine,
+}
+
+with_all_types_of_awaitables = pytest.mark.parametrize(
+    "type_of_awaitable", awaitable_factories
+)
+
+current_value: ContextVar[int] = ContextVar("current_value", default=0)
+
+
+@pytest.fixture(
+    params=["eager tasks", "fallback"] if eager_task_factory else ["fallback"]
+)
+def eager_start(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    """Run the test with eager tasks if available, and with the fallback."""
+    if request.param != "eager tasks":
+        module = import_module("graphql.pyutils.eager_gather_with_cancel")
+        monkeypatch.setattr(module, "eager_task_factory", None)
+    return request.param
+
+
+requires_eager_tasks = pytest.mark.skipif(
+    eager_task_factory is None, reason="Eager tasks need Python 3.12 or newer."
+)
+
+
+@pytest.mark.usefixtures("eager_start")
+def describe_eager_gather_with_cancel():
+    @with_all_types_of_awaitables
+    async def gathers_all_values(type_of_awaitable: str):
+        factory = awaitable_factories[type_of_awaitable]
+        values = list(range(3))
+
+        controller.reset()
+        aws = [factory(i) for i in values]
+
+        result = eager_gather_with_cancel(*aws)
+        assert is_awaitable(result)
+
+        awaited = await wait_for(result, 1)
+        assert awaited == values
+        assert controller.returned == values
+
+    @with_all_types_of_awaitables
+    async def gathers_all_values_when_blocking(type_of_awaitable: str):
+        factory = awaitable_factories[type_of_awaitable]
+        values = list(range(3))
+
+        controller.reset(wait=True)
+        aws = [factory(i) for i in values]
+
+        result = ensure_future(eager_gather_with_cancel(*aws))
+        await sleep(0)
+        assert not controller.returned
+        controller.event.set()
+
+        awaited = await wait_for(result, 1)
+        assert awaited == values
+        assert controller.returned == values
+
+    @with_all_types_of_awaitables
+    async def raises_on_exception(type_of_awaitable: str):
+        factory = awaitable_factories[type_of_awaitable]
+        values = list(range(4))
+
+        controller.reset()
+        aws = [factory(i) for i in values]
+
+        result = eager_gather_with_cancel(*aws)
+        assert is_awaitable(result)
+
+        with pytest.raises(RuntimeError, match="Oops"):
+            await wait_for(result, 1)
+        assert controller.returned == values[:-1]
+
+    @with_all_types_of_awaitables
+    async def cancels_on_exception(type_of_awaitable: str):
+        factory = awaitable_factories[type_of_awaitable]
+        values = list(range(4))
+
+        controller.reset(wait=True)
+        aws = [factory(i) for i in values]
+
+        result = eager_gather_with_cancel(*aws)
+        assert is_awaitable(result)
+
+        with pytest.raises(RuntimeError, match="Oops"):
+            await wait_for(result, 1)
+        assert not controller.returned
+
+        # check that eager_gather_with_cancel stops producing results
+        controller.event.set()
+        await sleep(0)
+        assert not controller.returned
+
+    async def cancels_on_exception_after_blocking():
+        controller.reset(wait=True)
+
+        async def fail_later() -> None:
+            await sleep(0)
+            raise RuntimeError("Oops")
+
+        aws = [coroutine_returning(0), fail_later(), coroutine_returning(1)]
+
+        with pytest.raises(RuntimeError, match="Oops"):
+            await wait_for(eager_gather_with_cancel(*aws), 1)
+
+        controller.event.set()
+        await sleep(0)
+        assert not controller.returned
+
+    async def runs_awaitables_in_their_own_tasks():
+        outer_task = current_task()
+
+        async def get_task() -> Any:
+            task = current_task()
+            await sleep(0)
+            assert current_task() is task
+            return task
+
+        tasks = await eager_gather_with_cancel(get_task(), get_task())
+        assert outer_task not in tasks
+        assert tasks[0] is not tasks[1]
+
+    async def supports_timeouts_in_awaitables():
+        async def time_out() -> str:
+            try:
+                async with timeout(0.01):
+                    await sleep(1)
+            except TimeoutError:
+                return "timed out"
+            return "not timed out"  # pragma: no cover
+
+        assert await wait_for(eager_gather_with_cancel(time_out(), time_out()), 1) == [
+            "timed out",
+            "timed out",
+        ]
+
+    async def runs_awaitables_in_copies_of_the_context():
+        async def set_value(value: int) -> int:
+            current_value.set(value)
+            await sleep(0)
+            return current_value.get()
+
+        async def get_value() -> int:
+            await sleep(0)
+            return current_value.get()
+
+        assert await eager_gather_with_cancel(
+            set_value(1), set_value(2), get_value()
+        ) == [1, 2, 0]
+        assert current_value.get() == 0
+
+    async def supports_awaiting_the_same_future_in_several_awaitables():
+        future: Future[int] = Future()
+
+        async def get_value(offset: int) -> int:
+            return await future + offset
+
+        result = ensure_future(
+            eager_gather_with_cancel(get_value(0), get_value(1), get_value(2))
+        )
+        await sleep(0)
+        future.set_result(1)
+        assert await result == [1, 2, 3]
+
+    async def cancels_pending_awaitables_when_cancelled():
+        future: Future[int] = Future()
+        event = Event()
+
+        async def wait_for_future() -> int:
+            return await future
+
+        async def wait_for_event() -> bool:
+            return await event.wait()
+
+        task = ensure_future(
+            eager_gather_with_cancel(wait_for_future(), wait_for_event())
+        )
+        for _i in range(2):  # the fallback starts the tasks one step later
+            await sleep(0)
+        task.cancel()
+        results = await gather(task, return_exceptions=True)
+        assert len(results) == 1
+        assert future.cancelled()
+
+
+@requires_eager_tasks
+def describe_eager_gather_with_cancel_using_eager_tasks():
+    async def does_not_start_awaitables_after_an_exception():
+        controller.reset(wait=True)
+        future: Future[int] = Future()
+        started = []
+
+        async def wait_for_future() -> int:
+            started.append(True)  # pragma: no cover
+            return await future  # pragma: no cover
+
+        blocking = coroutine_returning(0)
+        not_started = wait_for_future()
+        task = create_task(coroutine_returning(1))
+        aws = [blocking, coroutine_returning(3), not_started, task]
+
+        with pytest.raises(RuntimeError, match="Oops"):
+            await eager_gather_with_cancel(*aws)
+
+        assert not started
+        assert getcoroutinestate(blocking) == CORO_CLOSED
+        assert getcoroutinestate(not_started) == CORO_CLOSED
+        assert task.cancelled()
+        assert not future.cancelled()
+
+    async def cancels_yielding_awaitables_and_skips_others_after_an_exception():
+        controller.reset()
+        yielding = sleep(0)
+        custom = CustomAwaitable(0)
+
+        with pytest.raises(RuntimeError, match="Oops"):
+            await eager_gather_with_cancel(yielding, coroutine_returning(3), custom)
+
+        assert getcoroutinestate(yielding) == CORO_CLOSED
+        assert getcoroutinestate(custom.coroutine) == CORO_CREATED
+        custom.coroutine.close()
+
+    async def cancels_and_closes_awaitables_on_base_exceptions():
+        controller.reset(wait=True)
+
+        async def cancelled() -> None:
+            raise CancelledError
+
+        blocking = coroutine_returning(0)
+        not_started = coroutine_returning(1)
+
+        with pytest.raises(CancelledError):
+            await eager_gather_with_cancel(blocking, cancelled(), not_started)
+
+        assert getcoroutinestate(blocking) == CORO_CLOSED
+        assert getcoroutinestate(not_started) == CORO_CLOSED
+        controller.event.set()
+        await sleep(0)
+        assert not controller.returned
+
+    async def returns_results_of_awaitables_that_do_not_block_right_away():
+        async def get_value(value: int) -> int:
+            return value
+
+        gathering = eager_gather_with_cancel(get_value(1), get_value(2))
+        with pytest.raises(StopIteration) as exc_info:
+            gathering.send(None)
+        assert exc_info.value.value == [1, 2]
+
+    async def does_not_schedule_tasks_for_awaitables_that_do_not_block():
+        tasks = []
+
+        async def get_task() -> Any:
+            tasks.append(current_task())
+            return len(tasks)
+
+        assert await eager_gather_with_cancel(get_task(), get_task()) == [1, 2]
+        assert current_task() not in tasks
+        assert all(task and task.done() for task in tasks)
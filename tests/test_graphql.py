@@ -4,6 +4,7 @@ import pytest
 
 from graphql import default_harness, execute, graphql, graphql_sync
 from graphql.error import GraphQLError
+from graphql.execution import CacheHints
 from graphql.language import Source
 from graphql.type import (
     GraphQLField,
@@ -106,6 +107,35 @@ def describe_graphql():
 
         assert result == ({"b": "B"}, None)
 
+    async def passes_execution_options_through_to_execute():
+        execute_kwargs: dict = {}
+
+        def custom_execute(*args, **kwargs):
+            execute_kwargs.update(kwargs)
+            return execute(*args, **kwargs)
+
+        cache_hints = CacheHints()
+        result = await graphql(
+            schema,
+            "{ a }",
+            harness=default_harness._replace(execute=custom_execute),
+            max_concurrent_resolvers=2,
+            eager_awaiting=True,
+            read_ahead=3,
+            cache_hints=cache_hints,
+        )
+
+        assert result == ({"a": "A"}, None)
+        assert execute_kwargs == {
+            "hide_suggestions": False,
+            "abort_signal": None,
+            "max_concurrent_resolvers": 2,
+            "eager_awaiting": True,
+            "read_ahead": 3,
+            "cache_hints": cache_hints,
+        }
+        assert cache_hints.types == {"Query"}
+
     async def returns_schema_validation_errors():
         bad_schema = GraphQLSchema()
         result = await graphql(bad_schema, "{ __typename }")
@@ -243,6 +273,13 @@ def describe_graphql_sync():
 
         assert result == ({"syncField": "rootValue"}, None)
 
+    def passes_cache_hints_through_to_execute():
+        cache_hints = CacheHints()
+        result = graphql_sync(schema, "{ a }", cache_hints=cache_hints)
+
+        assert result == ({"a": "A"}, None)
+        assert cache_hints.types == {"Query"}
+
     async def throws_for_asynchronous_execution():
         # Unlike graphql-js, graphql_sync only detects asynchronous execution when
         # check_sync is set; without it, the coroutine is treated as a plain value.
@@ -44,8 +44,10 @@ from graphql.pyutils import (
     Undefined,
     gather_with_cancel,
     is_awaitable,
+    merge_kwargs,
 )
 from graphql.type import (
+    CompletionKind,
     GraphQLArgument,
     GraphQLDefaultInput,
     GraphQLEnumType,
@@ -118,6 +120,7 @@ def describe_type_system_scalars():
             "coerce_input_value": None,
             "coerce_input_literal": None,
             "value_to_literal": None,
+            "coerce_output_values": None,
             "extensions": {},
             "ast_node": None,
             "extension_ast_nodes": (),
@@ -137,13 +140,50 @@ def describe_type_system_scalars():
             "coerce_input_value": pass_through,
             "coerce_input_literal": pass_through,
             "value_to_literal": pass_through,
+            "coerce_output_values": pass_through,
             "extensions": {"some_extension": "extension"},
             "ast_node": ast_node,
             "extension_ast_nodes": (extension_ast_node,),
         }
         some_scalar = GraphQLScalarType(**some_scalar_kwargs)  # type: ignore
+        assert some_scalar.coerce_output_values is pass_through
         assert some_scalar.to_kwargs() == some_scalar_kwargs
 
+    def keeps_the_bulk_coercion_when_copying_scalars():
+        copied_scalar = GraphQLScalarType(
+            **merge_kwargs(GraphQLInt.to_kwargs(), name="MyInt")
+        )
+        assert copied_scalar.coerce_output_values is GraphQLInt.coerce_output_values
+
+    def ignores_the_bulk_coercion_after_replacing_the_coercion():
+        def coerce_output_value(value: Any) -> Any:
+            return value * 10
+
+        def coerce_output_values(values: Any) -> list[Any]:
+            return [value * 10 for value in values]
+
+        scalar = GraphQLScalarType(**merge_kwargs(GraphQLInt.to_kwargs(), name="MyInt"))
+        scalar.coerce_output_value = coerce_output_value
+        assert scalar.coerce_output_values is None
+        assert scalar.to_kwargs()["coerce_output_values"] is None
+        scalar.coerce_output_values = coerce_output_values
+        assert scalar.coerce_output_values is coerce_output_values
+
+    def can_derive_scalars_with_other_coercions():
+        def coerce_output_value(value: Any) -> Any:
+            return value * 10
+
+        derived_scalar = GraphQLScalarType(
+            **merge_kwargs(
+                GraphQLInt.to_kwargs(),
+                name="MyInt",
+                coerce_output_value=coerce_output_value,
+                coerce_output_values=None,
+            )
+        )
+        assert derived_scalar.coerce_output_value is coerce_output_value
+        assert derived_scalar.coerce_output_values is None
+
     def supports_non_string_extension_keys():
         # Python has no equivalent of JavaScript Symbols (graphql/graphql-js#4234),
         # but extensions are stored as a plain dict, so keys of any hashable type
@@ -334,6 +374,12 @@ def describe_type_system_fields():
             "deprecation_reason": None,
             "extensions": {},
             "ast_node": None,
+            "batch_resolve": None,
+            "allow_raw_json": False,
+            "max_concurrency": None,
+            "timeout": None,
+            "max_age": None,
+            "cache": None,
         }
 
     def defines_a_field_with_args():
@@ -383,6 +429,7 @@ def describe_type_system_objects():
             "fields": fields,
             "interfaces": interfaces,
             "is_type_of": None,
+            "source_classes": (),
             "extensions": {},
             "ast_node": None,
             "extension_ast_nodes": (),
@@ -419,6 +466,7 @@ def describe_type_system_objects():
                 )
             },
             "is_type_of": pass_through,
+            "source_classes": (dict,),
             "extensions": {"some_extension": "extension"},
             "ast_node": ast_node,
             "extension_ast_nodes": (extension_ast_node,),
@@ -673,6 +721,7 @@ def describe_type_system_interfaces():
             "extensions": {},
             "ast_node": None,
             "extension_ast_nodes": (),
+            "cache_resolved_types": False,
         }
 
     def can_be_converted_to_a_configuration_object():
@@ -710,6 +759,7 @@ def describe_type_system_interfaces():
             "extensions": {},
             "ast_node": ast_node,
             "extension_ast_nodes": (),
+            "cache_resolved_types": True,
         }
         some_interface = GraphQLInterfaceType(**some_interface_kwargs)  # type: ignore
         assert some_interface.to_kwargs() == some_interface_kwargs
@@ -837,6 +887,7 @@ def describe_type_system_unions():
             "extensions": {},
             "ast_node": None,
             "extension_ast_nodes": (),
+            "cache_resolved_types": False,
         }
 
     def can_be_converted_to_a_configuration_object():
@@ -849,6 +900,7 @@ def describe_type_system_unions():
             "extensions": {},
             "ast_node": ast_node,
             "extension_ast_nodes": (),
+            "cache_resolved_types": True,
         }
         some_union = GraphQLUnionType(**some_union_kwargs)  # type: ignore
         assert some_union.to_kwargs() == some_union_kwargs
@@ -1579,6 +1631,16 @@ def describe_type_system_test_utility_methods():
             == "<GraphQLList <GraphQLList <GraphQLScalarType 'Scalar'>>>"
         )
 
+    def output_types_have_completion_kinds():
+        assert ScalarType.completion_kind is CompletionKind.LEAF
+        assert EnumType.completion_kind is CompletionKind.LEAF
+        assert ObjectType.completion_kind is CompletionKind.OBJECT
+        assert InterfaceType.completion_kind is CompletionKind.ABSTRACT
+        assert UnionType.completion_kind is CompletionKind.ABSTRACT
+        assert ListOfScalarsType.completion_kind is CompletionKind.LIST
+        assert NonNullScalarType.completion_kind is CompletionKind.NON_NULL
+        assert InputObjectType.completion_kind is None
+
     def stringifies_fields():
         assert str(GraphQLField(GraphQLNonNull(GraphQLString))) == "Field: String!"
         assert str(GraphQLField(GraphQLList(GraphQLInt))) == "Field: [Int]"
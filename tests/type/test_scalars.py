@@ -1,4 +1,5 @@
 import pickle
+from array import array
 from math import inf, nan, pi
 from typing import Any
 
@@ -200,6 +201,34 @@ def describe_type_system_specified_scalar_types():
                 coerce_output_value([5])
             assert str(exc_info.value) == "Int cannot represent non-integer value: [5]"
 
+        def coerce_output_values():
+            coerce_output_values = GraphQLInt.coerce_output_values
+            assert coerce_output_values
+
+            assert coerce_output_values([]) == []
+            assert coerce_output_values([1, -2, 3]) == [1, -2, 3]
+            assert coerce_output_values((1, 2)) == [1, 2]
+            assert coerce_output_values(array("i", [1, 2])) == [1, 2]
+            assert coerce_output_values(memoryview(array("h", [3, 4]))) == [3, 4]
+            assert coerce_output_values([-(2**31), 2**31 - 1]) == [
+                -(2**31),
+                2**31 - 1,
+            ]
+
+            for values in (
+                [1, 2**31],
+                [-(2**31) - 1],
+                [1, 2.0],
+                [True],
+                [1, None],
+                array("d", [1.0]),
+            ):
+                with pytest.raises(GraphQLError) as exc_info:
+                    coerce_output_values(values)
+                assert str(exc_info.value) == (
+                    "Int cannot represent all values of the list."
+                )
+
         def cannot_be_redefined():
             with pytest.raises(TypeError, match="Redefinition of reserved type 'Int'"):
                 GraphQLScalarType(name="Int")
@@ -378,6 +407,33 @@ def describe_type_system_specified_scalar_types():
                 str(exc_info.value) == "Float cannot represent non numeric value: [5]"
             )
 
+        def coerce_output_values():
+            coerce_output_values = GraphQLFloat.coerce_output_values
+            assert coerce_output_values
+
+            assert coerce_output_values([]) == []
+            assert coerce_output_values([1.5, -2.5]) == [1.5, -2.5]
+            assert coerce_output_values(array("d", [0.5, 1e300])) == [0.5, 1e300]
+            result = coerce_output_values((1, 2.5, 2**53))
+            assert result == [1.0, 2.5, 9007199254740992.0]
+            assert all(isinstance(value, float) for value in result)
+
+            for values in (
+                [1.0, nan],
+                array("d", [inf, 1.0]),
+                [-inf],
+                [1e308, 1e308],  # sum overflows, coerced separately
+                [1.0, 2**53 + 1],
+                [1.0, "2.0"],
+                [True],
+                [1.0, None],
+            ):
+                with pytest.raises(GraphQLError) as exc_info:
+                    coerce_output_values(values)
+                assert str(exc_info.value) == (
+                    "Float cannot represent all values of the list."
+                )
+
         def cannot_be_redefined():
             with pytest.raises(
                 TypeError, match="Redefinition of reserved type 'Float'"